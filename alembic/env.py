@@ -8,6 +8,7 @@ from alembic import context
 # Import our models for autogenerate support
 from src.database.url_resolver import resolve_sync_database_url
 from src.models.database import Base
+from src.models.database.full_text import FULL_TEXT_INDEXES, SEARCH_VECTOR_COLUMN
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -26,6 +27,22 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Full-text search columns, indexes and FTS5 shadow tables are raw DDL that
+# the models do not declare; keep autogenerate from dropping them.
+_FULL_TEXT_TABLES = tuple(index.fts_table for index in FULL_TEXT_INDEXES.values())
+
+
+def include_object(_obj, name, type_, reflected, compare_to) -> bool:
+    if not reflected or compare_to is not None or name is None:
+        return True
+    if type_ == "column":
+        return name != SEARCH_VECTOR_COLUMN
+    if type_ == "index":
+        return not name.endswith(f"_{SEARCH_VECTOR_COLUMN}")
+    if type_ == "table":
+        return not name.startswith(_FULL_TEXT_TABLES)
+    return True
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -43,6 +60,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -65,7 +83,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
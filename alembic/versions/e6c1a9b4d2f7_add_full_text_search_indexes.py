@@ -0,0 +1,37 @@
+"""add_full_text_search_indexes
+
+Revision ID: e6c1a9b4d2f7
+Revises: d2a4f7e3c1b9
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from alembic import op
+from src.models.database.full_text import FULL_TEXT_INDEXES
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# revision identifiers, used by Alembic.
+revision: str = "e6c1a9b4d2f7"
+down_revision: str | Sequence[str] | None = "d2a4f7e3c1b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    for index in FULL_TEXT_INDEXES.values():
+        index.create(bind, rebuild=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    for index in FULL_TEXT_INDEXES.values():
+        index.drop(bind)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from sqlalchemy.orm import Session
 
     from src.models.database.audit import AuditLog
@@ -11,6 +13,8 @@ if TYPE_CHECKING:
 class AuditRepository(Protocol):
     def record(self, db: Session, log: AuditLog) -> AuditLog: ...
 
+    def record_many(self, db: Session, logs: Sequence[AuditLog]) -> None: ...
+
 
 class SqlAlchemyAuditRepository:
     def record(self, db: Session, log: AuditLog) -> AuditLog:
@@ -19,5 +23,10 @@ class SqlAlchemyAuditRepository:
         db.refresh(log)
         return log
 
+    def record_many(self, db: Session, logs: Sequence[AuditLog]) -> None:
+        """Persist ``logs`` in a single transaction."""
+        db.add_all(logs)
+        db.commit()
+
 
 __all__ = ["AuditRepository", "SqlAlchemyAuditRepository"]
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from src.application.curation.repositories.review_repository import (
@@ -22,11 +24,18 @@ if TYPE_CHECKING:
         VariantApplicationService,
     )
     from src.domain.entities.evidence import Evidence
+    from src.domain.entities.phenotype import Phenotype
     from src.domain.entities.variant import Variant
     from src.type_definitions.curation import ReviewRecordLike
 from src.type_definitions.common import FilterValue, JSONObject, QueryFilters
 from src.type_definitions.json_utils import to_json_value
 
+# Evidence records and phenotypes summarized on each review queue card
+CARD_EVIDENCE_LIMIT = 50
+CARD_PHENOTYPE_LIMIT = 3
+# Phenotypes listed in the variant detail view
+DETAIL_PHENOTYPE_LIMIT = 10
+
 ClinicalFilterValue = FilterValue | list[FilterValue]
 ClinicalFilters = Mapping[str, ClinicalFilterValue]
 
@@ -95,14 +104,16 @@ class CurationService:
         )
 
         # Enrich with clinical data
+        if request.entity_type == "variants":
+            enriched_variants = self._enrich_variant_reviews(
+                review_records,
+                request.clinical_filters,
+            )
+            return enriched_variants, len(enriched_variants)
+
         enriched_items = []
         for review_record in review_records:
-            if request.entity_type == "variants":
-                enriched_item = self._enrich_variant_review(
-                    review_record,
-                    request.clinical_filters,
-                )
-            elif request.entity_type == "genes":
+            if request.entity_type == "genes":
                 enriched_item = self._enrich_gene_review(
                     review_record,
                     request.clinical_filters,
@@ -151,36 +162,20 @@ class CurationService:
         )
 
         # Get phenotypes associated with evidence
-        phenotype_ids = list(
-            {ev.phenotype_id for ev in evidence_records if ev.phenotype_id is not None},
+        phenotype_ids = self._distinct_phenotype_ids(
+            evidence_records,
+            DETAIL_PHENOTYPE_LIMIT,
         )
-        phenotypes: list[JSONObject] = []
-        for phenotype_id in phenotype_ids[:10]:  # Limit to 10 phenotypes
-            phenotype_filters: QueryFilters | None = self._build_filter(
-                "id",
-                phenotype_id,
-            )
-            if phenotype_filters is None:
-                continue
-            phenotype_list, _ = self._phenotype_service.list_phenotypes(
-                page=1,
-                per_page=1,
-                sort_by="id",
-                sort_order="asc",
-                filters=phenotype_filters,
-            )
-            if not phenotype_list:
-                continue
-            phenotype_data = phenotype_list[0]
-            phenotypes.append(
-                {
-                    "id": phenotype_id,
-                    "name": phenotype_data.name,
-                    "hpo_id": phenotype_data.identifier.hpo_id,
-                    "definition": phenotype_data.definition,
-                    "category": phenotype_data.category,
-                },
-            )
+        phenotypes: list[JSONObject] = [
+            {
+                "id": phenotype.id,
+                "name": phenotype.name,
+                "hpo_id": phenotype.identifier.hpo_id,
+                "definition": phenotype.definition,
+                "category": phenotype.category,
+            }
+            for phenotype in self._ordered_phenotypes(phenotype_ids)
+        ]
 
         max_publications = 5
         abstract_snippet_length = 300
@@ -248,77 +243,89 @@ class CurationService:
             },
         )
 
-    def _enrich_variant_review(
+    def _enrich_variant_reviews(
         self,
-        review_record: ReviewRecordLike,
+        review_records: Sequence[ReviewRecordLike],
         clinical_filters: ClinicalFilters | None = None,
-    ) -> JSONObject | None:
-        """Enrich a variant review record with clinical data."""
-        # Get variant details
-        raw_entity_id = review_record.get("entity_id")
-        entity_identifier: str | int | None
-        if isinstance(raw_entity_id, str | int):
-            entity_identifier = raw_entity_id
-        else:
-            entity_identifier = None
-
-        variant_filters = self._build_filter("id", entity_identifier)
-        variants, _ = self._variant_service.list_variants(
-            page=1,
-            per_page=1,
-            sort_by="id",
-            sort_order="asc",
-            filters=variant_filters,
-        )
-
-        if not variants:
-            return None
-
-        variant = variants[0]
-
-        # Get evidence summary
-        evidence_filters = self._build_filter("variant_id", entity_identifier)
-        evidence_records = self._evidence_service.search_evidence(
-            query="",
-            limit=50,
-            filters=evidence_filters,
-        )
+    ) -> list[JSONObject]:
+        """
+        Enrich a page of variant review records with clinical data.
 
-        # Extract evidence levels
-        evidence_levels = list({ev.evidence_level.value for ev in evidence_records})
+        Variants, their evidence and the phenotypes shown on the cards are
+        each fetched for the whole page in one lookup and matched up in
+        memory, so the number of queries does not grow with the page size.
+        """
+        entity_ids = {
+            index: variant_id
+            for index, record in enumerate(review_records)
+            if (variant_id := self._variant_database_id(record)) is not None
+        }
+        variants = {
+            variant.id: variant
+            for variant in self._variant_service.get_variants_by_ids(
+                entity_ids.values(),
+            )
+            if variant.id is not None
+        }
 
-        # Get phenotype summary (simplified)
-        phenotype_ids = list({ev.phenotype_id for ev in evidence_records})
-        phenotypes: list[JSONObject] = []
-        for phenotype_id in phenotype_ids[:3]:  # Limit for card display
-            phenotype_filters = self._build_filter("id", phenotype_id)
-            if phenotype_filters is None:
+        evidence_by_variant: dict[int, list[Evidence]] = defaultdict(list)
+        for evidence in self._evidence_service.get_evidence_by_variants(variants):
+            records = evidence_by_variant[evidence.variant_id]
+            if len(records) < CARD_EVIDENCE_LIMIT:
+                records.append(evidence)
+
+        # Apply clinical filters before looking up phenotypes for the cards
+        matches: list[tuple[ReviewRecordLike, Variant, list[Evidence]]] = []
+        for index, variant_id in entity_ids.items():
+            variant = variants.get(variant_id)
+            if variant is None:
                 continue
-            phenotype_list, _ = self._phenotype_service.list_phenotypes(
-                page=1,
-                per_page=1,
-                sort_by="id",
-                sort_order="asc",
-                filters=phenotype_filters,
+            evidence_records = evidence_by_variant.get(variant_id, [])
+            if clinical_filters is not None and not self._passes_clinical_filters(
+                variant,
+                evidence_records,
+                clinical_filters,
+            ):
+                continue
+            matches.append((review_records[index], variant, evidence_records))
+
+        card_phenotype_ids = [
+            self._distinct_phenotype_ids(evidence_records, CARD_PHENOTYPE_LIMIT)
+            for _record, _variant, evidence_records in matches
+        ]
+        phenotypes = {
+            phenotype.id: phenotype
+            for phenotype in self._phenotype_service.get_phenotypes_by_ids(
+                chain.from_iterable(card_phenotype_ids),
             )
-            if phenotype_list:
-                phenotype_data = phenotype_list[0]
-                phenotypes.append(
-                    {
-                        "id": phenotype_id,
-                        "name": phenotype_data.name,
-                        "hpo_id": phenotype_data.identifier.hpo_id,
-                    },
-                )
+        }
 
-        # Apply clinical filters if provided
-        if clinical_filters is not None and not self._passes_clinical_filters(
-            variant,
-            evidence_records,
-            clinical_filters,
-        ):
-            return None
+        return [
+            self._variant_review_card(
+                review_record,
+                variant,
+                evidence_records,
+                [
+                    phenotypes[phenotype_id]
+                    for phenotype_id in phenotype_ids
+                    if phenotype_id in phenotypes
+                ],
+            )
+            for (review_record, variant, evidence_records), phenotype_ids in zip(
+                matches,
+                card_phenotype_ids,
+                strict=True,
+            )
+        ]
 
+    def _variant_review_card(
+        self,
+        review_record: ReviewRecordLike,
+        variant: Variant,
+        evidence_records: list[Evidence],
+        phenotypes: list[Phenotype],
+    ) -> JSONObject:
+        """Build the review queue card for a variant."""
         lu = review_record.get("last_updated")
         last_updated_value = (
             lu.isoformat()
@@ -341,8 +348,17 @@ class CurationService:
                 "clinical_significance": variant.clinical_significance,
                 "confidence_score": self._calculate_confidence_score(evidence_records),
                 "evidence_count": len(evidence_records),
-                "evidence_levels": evidence_levels,
-                "phenotypes": phenotypes,
+                "evidence_levels": list(
+                    {ev.evidence_level.value for ev in evidence_records},
+                ),
+                "phenotypes": [
+                    {
+                        "id": phenotype.id,
+                        "name": phenotype.name,
+                        "hpo_id": phenotype.identifier.hpo_id,
+                    }
+                    for phenotype in phenotypes
+                ],
                 "gnomad_af": variant.gnomad_af,
                 "allele_frequency": variant.allele_frequency,
                 "quality_score": review_record.get("quality_score") or 0.85,
@@ -353,6 +369,33 @@ class CurationService:
             },
         )
 
+    def _ordered_phenotypes(self, phenotype_ids: list[int]) -> list[Phenotype]:
+        """Fetch phenotypes in one lookup, keeping the order of ``phenotype_ids``."""
+        found = {
+            phenotype.id: phenotype
+            for phenotype in self._phenotype_service.get_phenotypes_by_ids(
+                phenotype_ids,
+            )
+        }
+        return [found[pid] for pid in phenotype_ids if pid in found]
+
+    @staticmethod
+    def _distinct_phenotype_ids(
+        evidence_records: list[Evidence],
+        limit: int,
+    ) -> list[int]:
+        """First ``limit`` distinct phenotype IDs, in evidence order."""
+        phenotype_ids = dict.fromkeys(
+            ev.phenotype_id for ev in evidence_records if ev.phenotype_id is not None
+        )
+        return list(phenotype_ids)[:limit]
+
+    @staticmethod
+    def _variant_database_id(review_record: ReviewRecordLike) -> int | None:
+        """Database ID of the variant a review record refers to, if any."""
+        entity_id = review_record.get("entity_id", "").strip()
+        return int(entity_id) if entity_id.isdigit() else None
+
     def _enrich_gene_review(
         self,
         review_record: ReviewRecordLike,
@@ -5,7 +5,7 @@ Handles large dataset serialization and streaming export capabilities.
 """
 
 import tempfile
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,6 +13,7 @@ from uuid import UUID, uuid4
 
 from src.application.export.export_types import (
     CompressionFormat,
+    EntityItem,
     ExportFormat,
 )
 from src.application.export.formatters import (
@@ -21,12 +22,13 @@ from src.application.export.formatters import (
     export_as_jsonl,
 )
 from src.application.export.utils import (
-    collect_paginated,
     copy_filters,
     get_evidence_fields,
     get_gene_fields,
     get_phenotype_fields,
     get_variants_fields,
+    iter_keyset_batches,
+    pop_export_limit,
 )
 from src.application.services import (
     EvidenceApplicationService,
@@ -44,11 +46,19 @@ if TYPE_CHECKING:
     from src.application.services import StorageConfigurationService
 
 
+def _entity_key(item: object) -> int | None:
+    """Return the primary key used as the keyset cursor for an exported entity."""
+    entity_id = getattr(item, "id", None)
+    return entity_id if isinstance(entity_id, int) else None
+
+
 class BulkExportService:
     """
     Service for bulk data export with streaming and multiple format support.
 
-    Handles large dataset serialization efficiently to avoid memory issues.
+    Rows are read with keyset pagination on the primary key and serialized
+    batch by batch, so peak memory is bounded by ``chunk_size`` rather than
+    by the size of the exported table.
     """
 
     def __init__(
@@ -195,30 +205,26 @@ class BulkExportService:
         chunk_size: int,
     ) -> Generator[str | bytes]:
         filters_payload = copy_filters(filters)
+        limit = pop_export_limit(filters_payload)
         search_value = filters_payload.get("search")
         search_term = search_value if isinstance(search_value, str) else None
-        genes = collect_paginated(
-            lambda page, size: self._gene_service.list_genes(
-                page=page,
-                per_page=size,
-                sort_by="symbol",
-                sort_order="asc",
+        batches = iter_keyset_batches(
+            lambda after_id, size: self._gene_service.list_genes_keyset(
+                after_id=after_id,
+                limit=size,
                 search=search_term,
             ),
             chunk_size,
+            key=_entity_key,
+            limit=limit,
+        )
+        yield from self._format_batches(
+            batches,
+            export_format,
+            compression,
+            "genes",
+            get_gene_fields(),
         )
-
-        if export_format == ExportFormat.JSON:
-            yield from export_as_json(genes, compression, "genes")
-        elif export_format in (ExportFormat.CSV, ExportFormat.TSV):
-            yield from export_as_csv(
-                genes,
-                export_format,
-                compression,
-                get_gene_fields(),
-            )
-        elif export_format == ExportFormat.JSONL:
-            yield from export_as_jsonl(genes, compression)
 
     def _export_variants(
         self,
@@ -227,28 +233,25 @@ class BulkExportService:
         filters: QueryFilters | None,
         chunk_size: int,
     ) -> Generator[str | bytes]:
-        variants = collect_paginated(
-            lambda page, size: self._variant_service.list_variants(
-                page=page,
-                per_page=size,
-                sort_by="variant_id",
-                sort_order="asc",
-                filters=filters,
+        filters_payload = copy_filters(filters)
+        limit = pop_export_limit(filters_payload)
+        batches = iter_keyset_batches(
+            lambda after_id, size: self._variant_service.list_variants_keyset(
+                after_id=after_id,
+                limit=size,
+                filters=filters_payload,
             ),
             chunk_size,
+            key=_entity_key,
+            limit=limit,
+        )
+        yield from self._format_batches(
+            batches,
+            export_format,
+            compression,
+            "variants",
+            get_variants_fields(),
         )
-
-        if export_format == ExportFormat.JSON:
-            yield from export_as_json(variants, compression, "variants")
-        elif export_format in (ExportFormat.CSV, ExportFormat.TSV):
-            yield from export_as_csv(
-                variants,
-                export_format,
-                compression,
-                get_variants_fields(),
-            )
-        elif export_format == ExportFormat.JSONL:
-            yield from export_as_jsonl(variants, compression)
 
     def _export_phenotypes(
         self,
@@ -257,28 +260,25 @@ class BulkExportService:
         filters: QueryFilters | None,
         chunk_size: int,
     ) -> Generator[str | bytes]:
-        phenotypes = collect_paginated(
-            lambda page, size: self._phenotype_service.list_phenotypes(
-                page=page,
-                per_page=size,
-                sort_by="name",
-                sort_order="asc",
-                filters=filters,
+        filters_payload = copy_filters(filters)
+        limit = pop_export_limit(filters_payload)
+        batches = iter_keyset_batches(
+            lambda after_id, size: self._phenotype_service.list_phenotypes_keyset(
+                after_id=after_id,
+                limit=size,
+                filters=filters_payload,
             ),
             chunk_size,
+            key=_entity_key,
+            limit=limit,
+        )
+        yield from self._format_batches(
+            batches,
+            export_format,
+            compression,
+            "phenotypes",
+            get_phenotype_fields(),
         )
-
-        if export_format == ExportFormat.JSON:
-            yield from export_as_json(phenotypes, compression, "phenotypes")
-        elif export_format in (ExportFormat.CSV, ExportFormat.TSV):
-            yield from export_as_csv(
-                phenotypes,
-                export_format,
-                compression,
-                get_phenotype_fields(),
-            )
-        elif export_format == ExportFormat.JSONL:
-            yield from export_as_jsonl(phenotypes, compression)
 
     def _export_evidence(
         self,
@@ -287,28 +287,45 @@ class BulkExportService:
         filters: QueryFilters | None,
         chunk_size: int,
     ) -> Generator[str | bytes]:
-        evidence_list = collect_paginated(
-            lambda page, size: self._evidence_service.list_evidence(
-                page=page,
-                per_page=size,
-                sort_by="created_at",
-                sort_order="asc",
-                filters=filters,
+        filters_payload = copy_filters(filters)
+        limit = pop_export_limit(filters_payload)
+        batches = iter_keyset_batches(
+            lambda after_id, size: self._evidence_service.list_evidence_keyset(
+                after_id=after_id,
+                limit=size,
+                filters=filters_payload,
             ),
             chunk_size,
+            key=_entity_key,
+            limit=limit,
+        )
+        yield from self._format_batches(
+            batches,
+            export_format,
+            compression,
+            "evidence",
+            get_evidence_fields(),
         )
 
+    @staticmethod
+    def _format_batches(
+        batches: Iterator[list[EntityItem]],
+        export_format: ExportFormat,
+        compression: CompressionFormat,
+        entity_type: str,
+        field_names: list[str],
+    ) -> Generator[str | bytes]:
         if export_format == ExportFormat.JSON:
-            yield from export_as_json(evidence_list, compression, "evidence")
+            yield from export_as_json(batches, compression, entity_type)
         elif export_format in (ExportFormat.CSV, ExportFormat.TSV):
             yield from export_as_csv(
-                evidence_list,
+                batches,
                 export_format,
                 compression,
-                get_evidence_fields(),
+                field_names,
             )
         elif export_format == ExportFormat.JSONL:
-            yield from export_as_jsonl(evidence_list, compression)
+            yield from export_as_jsonl(batches, compression)
 
     def get_export_info(self, entity_type: str) -> JSONObject:
         # This would query the repositories for actual counts
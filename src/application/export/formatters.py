@@ -1,70 +1,138 @@
 """
 Output format helpers for bulk export operations.
+
+Formatters consume batches of entities and emit one chunk per batch so that
+large exports never materialize the full payload in memory. Gzip output is
+produced incrementally with a single ``zlib`` compressor per export.
 """
 
 from __future__ import annotations
 
 import csv
-import gzip
 import json
+import zlib
 from io import StringIO
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
-
-    from src.type_definitions.common import JSONObject
+    from collections.abc import Generator, Iterable, Iterator, Sequence
 
 from .export_types import CompressionFormat, EntityItem, ExportFormat
 from .serialization import item_to_csv_row, serialize_item
 
 __all__ = ["export_as_csv", "export_as_json", "export_as_jsonl"]
 
+# zlib window bits selecting a gzip container (16) with a 32KiB window (15).
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+# Compressed bytes to accumulate before yielding, avoiding tiny network writes.
+_GZIP_CHUNK_BYTES = 64 * 1024
+
 
 def export_as_json(
-    items: list[EntityItem],
+    batches: Iterable[Sequence[EntityItem]],
     compression: CompressionFormat,
     entity_type: str,
 ) -> Generator[str | bytes]:
-    """Serialize entity collections into a JSON object."""
-    data: JSONObject = {entity_type: [serialize_item(item) for item in items]}
-    json_str = json.dumps(data, indent=2, default=str)
-    if compression == CompressionFormat.GZIP:
-        yield gzip.compress(json_str.encode("utf-8"))
-    else:
-        yield json_str
+    """Serialize entity batches into a single JSON object, one chunk per batch."""
+
+    def render() -> Iterator[str]:
+        first_item = True
+        prefix = "{" + json.dumps(entity_type) + ": ["
+        for batch, is_last in _mark_last(batches):
+            parts: list[str] = [prefix]
+            prefix = ""
+            for item in batch:
+                separator = "\n  " if first_item else ",\n  "
+                first_item = False
+                parts.append(
+                    separator + json.dumps(serialize_item(item), default=str),
+                )
+            if is_last:
+                parts.append("]}" if first_item else "\n]}")
+            yield "".join(parts)
+
+    yield from _encode(render(), compression)
 
 
 def export_as_jsonl(
-    items: list[EntityItem],
+    batches: Iterable[Sequence[EntityItem]],
     compression: CompressionFormat,
 ) -> Generator[str | bytes]:
-    """Serialize entity collections into JSON Lines."""
-    lines = [json.dumps(serialize_item(item), default=str) for item in items]
-    payload = "\n".join(lines)
-    if compression == CompressionFormat.GZIP:
-        yield gzip.compress(payload.encode("utf-8"))
-    else:
-        yield payload
+    """Serialize entity batches into JSON Lines, one chunk per batch."""
+
+    def render() -> Iterator[str]:
+        first_item = True
+        for batch, _is_last in _mark_last(batches):
+            parts: list[str] = []
+            for item in batch:
+                separator = "" if first_item else "\n"
+                first_item = False
+                parts.append(
+                    separator + json.dumps(serialize_item(item), default=str),
+                )
+            yield "".join(parts)
+
+    yield from _encode(render(), compression)
 
 
 def export_as_csv(
-    items: list[EntityItem],
+    batches: Iterable[Sequence[EntityItem]],
     export_format: ExportFormat,
     compression: CompressionFormat,
     field_names: list[str],
 ) -> Generator[str | bytes]:
-    """Serialize entity collections into CSV/TSV data."""
+    """Serialize entity batches into CSV/TSV data, one chunk per batch."""
     delimiter = "\t" if export_format == ExportFormat.TSV else ","
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=field_names, delimiter=delimiter)
-
-    writer.writeheader()
-    for item in items:
-        writer.writerow(item_to_csv_row(item, field_names))
-
-    content = output.getvalue()
-    if compression == CompressionFormat.GZIP:
-        yield gzip.compress(content.encode("utf-8"))
-    else:
-        yield content
+
+    def render() -> Iterator[str]:
+        write_header = True
+        for batch, _is_last in _mark_last(batches):
+            output = StringIO()
+            writer = csv.DictWriter(
+                output,
+                fieldnames=field_names,
+                delimiter=delimiter,
+            )
+            if write_header:
+                writer.writeheader()
+                write_header = False
+            for item in batch:
+                writer.writerow(item_to_csv_row(item, field_names))
+            yield output.getvalue()
+
+    yield from _encode(render(), compression)
+
+
+def _mark_last(
+    batches: Iterable[Sequence[EntityItem]],
+) -> Iterator[tuple[Sequence[EntityItem], bool]]:
+    """Pair each batch with a flag marking the final one (looks ahead by one)."""
+    iterator = iter(batches)
+    current = next(iterator, None)
+    if current is None:
+        yield (), True
+        return
+    for upcoming in iterator:
+        yield current, False
+        current = upcoming
+    yield current, True
+
+
+def _encode(
+    parts: Iterable[str],
+    compression: CompressionFormat,
+) -> Generator[str | bytes]:
+    """Emit rendered text parts, compressing them incrementally when requested."""
+    if compression != CompressionFormat.GZIP:
+        yield from parts
+        return
+
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+    pending = bytearray()
+    for part in parts:
+        pending += compressor.compress(part.encode("utf-8"))
+        if len(pending) >= _GZIP_CHUNK_BYTES:
+            yield bytes(pending)
+            pending.clear()
+    pending += compressor.flush()
+    yield bytes(pending)
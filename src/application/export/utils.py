@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from src.type_definitions.common import QueryFilters, clone_query_filters
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from .export_types import EntityItem
 
@@ -20,6 +20,8 @@ __all__ = [
     "get_gene_fields",
     "get_phenotype_fields",
     "get_variants_fields",
+    "iter_keyset_batches",
+    "pop_export_limit",
 ]
 
 _GENE_FIELDS = [
@@ -118,11 +120,52 @@ def collect_paginated(
     return results
 
 
+def iter_keyset_batches(
+    fetch_after: Callable[[int | None, int], list[EntityItem]],
+    chunk_size: int,
+    key: Callable[[EntityItem], int | None],
+    limit: int | None = None,
+) -> Iterator[list[EntityItem]]:
+    """
+    Yield batches from a keyset (seek) paginated service call.
+
+    Only one batch is held at a time, so memory stays bounded by
+    ``chunk_size`` no matter how many rows the export covers.
+    """
+    batch_size = max(chunk_size, 1)
+    remaining = limit
+    after_id: int | None = None
+
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        items = fetch_after(after_id, size)
+        if not items:
+            break
+        yield items
+        if remaining is not None:
+            remaining -= len(items)
+        if len(items) < size or (remaining is not None and remaining <= 0):
+            break
+        last_key = key(items[-1])
+        if last_key is None:
+            msg = "Keyset pagination requires persisted items with an id"
+            raise ValueError(msg)
+        after_id = last_key
+
+
 def copy_filters(filters: QueryFilters | None) -> QueryFilters:
     """Clone query filters to avoid mutating caller state."""
     return clone_query_filters(filters) or {}
 
 
+def pop_export_limit(filters: QueryFilters) -> int | None:
+    """Remove and return the optional ``limit`` row cap from export filters."""
+    value = filters.pop("limit", None)
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return None
+
+
 def get_gene_fields() -> list[str]:
     return list(_GENE_FIELDS)
 
@@ -276,8 +276,11 @@ class UnifiedSearchService:
             return []
 
         results: list[SearchResult] = []
-        for phenotype in phenotypes:
-            score = self._calculate_phenotype_relevance(query, phenotype)
+        for position, phenotype in enumerate(phenotypes):
+            score = max(
+                self._calculate_phenotype_relevance(query, phenotype),
+                self._rank_relevance(position, len(phenotypes)),
+            )
             entity_id = phenotype.id if phenotype.id is not None else 0
             results.append(
                 SearchResult(
@@ -318,8 +321,11 @@ class UnifiedSearchService:
 
         snippet_len = 200
         results: list[SearchResult] = []
-        for evidence in evidence_list:
-            score = self._calculate_evidence_relevance(query, evidence)
+        for position, evidence in enumerate(evidence_list):
+            score = max(
+                self._calculate_evidence_relevance(query, evidence),
+                self._rank_relevance(position, len(evidence_list)),
+            )
             entity_id = evidence.id if evidence.id is not None else 0
             description = (
                 evidence.description[:snippet_len] + "..."
@@ -453,6 +459,16 @@ class UnifiedSearchService:
 
         return min(score, 1.0)
 
+    @staticmethod
+    def _rank_relevance(position: int, count: int) -> float:
+        """
+        Floor score for the result at ``position`` of a database-ranked list.
+
+        Phenotype and evidence searches return full-text matches best first;
+        a match on stemmed or separated words scores nothing as a substring.
+        """
+        return 0.5 * (count - position) / count
+
     def _get_entity_breakdown(self, results: list[SearchResult]) -> dict[str, int]:
         """Get count breakdown by entity type."""
         breakdown: dict[str, int] = {}
@@ -9,6 +9,7 @@ from src.application.search.search_service import UnifiedSearchService
 
 from . import (
     audit_service,
+    authentication_cache,
     authentication_service,
     authorization_service,
     dashboard_service,
@@ -21,6 +22,7 @@ from . import (
     extraction_queue_service,
     extraction_runner_service,
     gene_service,
+    genomic_region_service,
     ingestion_scheduling_service,
     mechanism_service,
     phenotype_service,
@@ -41,6 +43,7 @@ from . import (
     variant_service,
 )
 
+ActivationRuleCache = data_source_activation_service.ActivationRuleCache
 AuthenticationService = authentication_service.AuthenticationService
 AuthorizationService = authorization_service.AuthorizationService
 AuditTrailService = audit_service.AuditTrailService
@@ -69,6 +72,8 @@ ExtractionQueueService = extraction_queue_service.ExtractionQueueService
 ExtractionRunSummary = extraction_runner_service.ExtractionRunSummary
 ExtractionRunnerService = extraction_runner_service.ExtractionRunnerService
 GeneApplicationService = gene_service.GeneApplicationService
+GenomicIndexCache = genomic_region_service.GenomicIndexCache
+GenomicRegionService = genomic_region_service.GenomicRegionService
 IngestionSchedulingService = ingestion_scheduling_service.IngestionSchedulingService
 PhenotypeApplicationService = phenotype_service.PhenotypeApplicationService
 MechanismApplicationService = mechanism_service.MechanismApplicationService
@@ -84,6 +89,7 @@ PubMedIngestionService = pubmed_ingestion_service.PubMedIngestionService
 PubMedQueryBuilder = pubmed_query_builder.PubMedQueryBuilder
 PubmedDownloadRequest = pubmed_discovery_service.PubmedDownloadRequest
 RunPubmedSearchRequest = pubmed_discovery_service.RunPubmedSearchRequest
+SessionActivityRecorder = authentication_cache.SessionActivityRecorder
 SessionRevocationContext = system_status_service.SessionRevocationContext
 SourceManagementService = source_management_service.SourceManagementService
 SpaceDataDiscoveryService = space_data_discovery_service.SpaceDataDiscoveryService
@@ -94,6 +100,7 @@ StorageConfigurationValidator = (
 StorageOperationCoordinator = storage_operation_coordinator.StorageOperationCoordinator
 SystemStatusService = system_status_service.SystemStatusService
 TemplateManagementService = template_management_service.TemplateManagementService
+TokenValidationCache = authentication_cache.TokenValidationCache
 UserManagementService = user_management_service.UserManagementService
 VariantApplicationService = variant_service.VariantApplicationService
 
@@ -110,6 +117,7 @@ UpdateTemplateRequest = template_management_service.UpdateTemplateRequest
 UserRole = data_source_authorization_service.UserRole
 
 __all__ = [
+    "ActivationRuleCache",
     "AuthenticationService",
     "AuthorizationService",
     "AuditTrailService",
@@ -133,6 +141,8 @@ __all__ = [
     "ExtractionRunSummary",
     "ExtractionRunnerService",
     "GeneApplicationService",
+    "GenomicIndexCache",
+    "GenomicRegionService",
     "IngestionSchedulingService",
     "MechanismApplicationService",
     "PhenotypeApplicationService",
@@ -144,6 +154,7 @@ __all__ = [
     "PublicationExtractionListResult",
     "PublicationExtractionService",
     "RunPubmedSearchRequest",
+    "SessionActivityRecorder",
     "SessionRevocationContext",
     "SourceManagementService",
     "SpaceDataDiscoveryService",
@@ -152,6 +163,7 @@ __all__ = [
     "StorageOperationCoordinator",
     "SystemStatusService",
     "TemplateManagementService",
+    "TokenValidationCache",
     "UnifiedSearchService",
     "UpdateSourceRequest",
     "UpdateStorageConfigurationRequest",
@@ -51,6 +51,27 @@ class AuditTrailService:
             context: Optional request metadata captured for audit logging
             success: Whether the action succeeded (None if unknown)
         """
+        log = self.build_log(
+            action=action,
+            target=target,
+            actor_id=actor_id,
+            details=details,
+            context=context,
+            success=success,
+        )
+        return self._repository.record(db, log)
+
+    @staticmethod
+    def build_log(  # noqa: PLR0913 - audit records require many fields
+        *,
+        action: str,
+        target: tuple[str, str],
+        actor_id: UUID | str | None,
+        details: Mapping[str, JSONValue] | None = None,
+        context: AuditContext | None = None,
+        success: bool | None = True,
+    ) -> AuditLog:
+        """Build an unsaved audit record; see ``record_action`` for arguments."""
         entity_type, entity_id = target
         normalized_actor = str(actor_id) if actor_id else None
         audit_details: dict[str, JSONValue] = {}
@@ -73,7 +94,7 @@ class AuditTrailService:
             if audit_details
             else None
         )
-        log = AuditLog(
+        return AuditLog(
             action=action,
             entity_type=entity_type,
             entity_id=entity_id,
@@ -84,7 +105,6 @@ class AuditTrailService:
             success=success,
             details=serialized_details,
         )
-        return self._repository.record(db, log)
 
 
 __all__ = ["AuditTrailService"]
@@ -0,0 +1,240 @@
+"""
+Caching for access-token validation.
+
+``TokenValidationCache`` remembers recently validated access tokens so repeat
+requests skip the JWT decode and the user and session lookups.
+``SessionActivityRecorder`` coalesces session activity in memory and writes
+it in batches from a background task, so each session is written at most
+once per flush interval instead of on every request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import TYPE_CHECKING
+
+from src.domain.repositories.session_repository import SessionActivityUpdate
+
+if TYPE_CHECKING:  # pragma: no cover - typing helpers only
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from src.domain.entities.session import UserSession
+    from src.domain.entities.user import User
+    from src.domain.repositories.session_repository import SessionRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_TTL_SECONDS = 30.0
+DEFAULT_TOKEN_CACHE_MAX_ENTRIES = 10_000
+DEFAULT_ACTIVITY_FLUSH_SECONDS = 30.0
+
+
+@dataclass
+class CachedTokenValidation:
+    """Result of a successful ``validate_token`` call."""
+
+    user: User
+    session: UserSession | None
+    expires_at: float
+
+
+@dataclass
+class TokenValidationCache:
+    """
+    Process-wide, short-lived cache of validated access tokens.
+
+    Entries live for ``ttl_seconds`` or until the token expires, whichever
+    comes first, and are dropped immediately when the session is revoked or
+    the user changes. The TTL bounds how long a change made by another
+    process can go unnoticed. Tokens are keyed by their SHA-256 digest.
+    """
+
+    ttl_seconds: float = DEFAULT_TOKEN_CACHE_TTL_SECONDS
+    max_entries: int = DEFAULT_TOKEN_CACHE_MAX_ENTRIES
+    clock: Callable[[], float] = time.monotonic
+    wall_clock: Callable[[], float] = time.time
+    _entries: OrderedDict[str, CachedTokenValidation] = field(
+        default_factory=OrderedDict,
+    )
+    # Revocations may arrive from worker threads (e.g. maintenance mode).
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> CachedTokenValidation | None:
+        """Return the cached validation for ``token`` if it is still fresh."""
+        key = _token_key(token)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self,
+        token: str,
+        user: User,
+        session: UserSession | None,
+        *,
+        token_expires_at: float | None = None,
+    ) -> None:
+        """
+        Cache a successful validation.
+
+        Args:
+            token: Validated access token
+            user: User the token belongs to
+            session: Session the token belongs to, if any
+            token_expires_at: Token ``exp`` claim as a Unix timestamp
+        """
+        lifetime = self.ttl_seconds
+        if token_expires_at is not None:
+            lifetime = min(lifetime, token_expires_at - self.wall_clock())
+        if lifetime <= 0:
+            return
+        entry = CachedTokenValidation(
+            user=user,
+            session=session,
+            expires_at=self.clock() + lifetime,
+        )
+        key = _token_key(token)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_token(self, token: str) -> None:
+        """Forget the validation of a single token."""
+        with self._lock:
+            self._entries.pop(_token_key(token), None)
+
+    def invalidate_session(self, session_id: UUID) -> None:
+        """Forget every token belonging to ``session_id``."""
+        self._invalidate_where(
+            lambda entry: entry.session is not None and entry.session.id == session_id,
+        )
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Forget every token belonging to ``user_id``."""
+        self._invalidate_where(lambda entry: entry.user.id == user_id)
+
+    def clear(self) -> None:
+        """Forget every cached validation."""
+        with self._lock:
+            self._entries.clear()
+
+    def _invalidate_where(
+        self,
+        predicate: Callable[[CachedTokenValidation], bool],
+    ) -> None:
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if predicate(entry)]
+            for key in stale:
+                del self._entries[key]
+
+
+class SessionActivityRecorder:
+    """
+    Write-behind buffer for session activity.
+
+    ``record`` keeps only the latest snapshot per session; a background task
+    persists the pending snapshots every ``flush_interval_seconds`` in one
+    batched repository call. ``close`` flushes whatever is still pending.
+    """
+
+    def __init__(
+        self,
+        session_repository: SessionRepository,
+        *,
+        flush_interval_seconds: float = DEFAULT_ACTIVITY_FLUSH_SECONDS,
+    ) -> None:
+        self._repository = session_repository
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: dict[UUID, SessionActivityUpdate] = {}
+        self._flusher: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def record(self, session: UserSession) -> None:
+        """Queue the session's current activity for the next flush."""
+        self._pending[session.id] = SessionActivityUpdate.from_session(session)
+        self._ensure_started()
+
+    def discard(self, session_id: UUID) -> None:
+        """Drop pending activity for a session that no longer needs it."""
+        self._pending.pop(session_id, None)
+
+    async def flush(self) -> int:
+        """Persist pending activity now; returns the number of sessions written."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        try:
+            await self._repository.record_activity(list(batch.values()))
+        except Exception:
+            # Keep the snapshots for the next attempt unless newer ones exist.
+            for session_id, update in batch.items():
+                self._pending.setdefault(session_id, update)
+            raise
+        return len(batch)
+
+    async def close(self) -> None:
+        """Stop the background flusher and persist pending activity."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and flusher.get_loop() is asyncio.get_running_loop():
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+        await self.flush()
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            self._flusher is not None
+            and not self._flusher.done()
+            and self._loop is loop
+        ):
+            return
+        self._loop = loop
+        self._flusher = loop.create_task(
+            self._run(),
+            name="session-activity-flusher",
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception(
+                    "Failed to flush activity for %d sessions",
+                    len(self._pending),
+                )
+
+
+def _token_key(token: str) -> str:
+    return sha256(token.encode()).hexdigest()
+
+
+__all__ = [
+    "CachedTokenValidation",
+    "SessionActivityRecorder",
+    "TokenValidationCache",
+]
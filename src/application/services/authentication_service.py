@@ -15,6 +15,10 @@ from src.application.dto.auth_responses import (
     TokenRefreshResponse,
     UserPublic,
 )
+from src.application.services.authentication_cache import (
+    SessionActivityRecorder,
+    TokenValidationCache,
+)
 from src.application.services.authentication_session_manager import (
     SessionLifecycleManager,
 )
@@ -60,12 +64,15 @@ class AuthenticationService:
         os.getenv("MED13_SLIDING_SESSION_EXPIRATION", "true").lower() == "true"
     )  # Default: enabled
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - caching collaborators are optional
         self,
         user_repository: UserRepository,
         session_repository: SessionRepository,
         jwt_provider: JWTProviderService,
         password_hasher: PasswordHasherService,
+        *,
+        token_cache: TokenValidationCache | None = None,
+        activity_recorder: SessionActivityRecorder | None = None,
     ):
         """
         Initialize authentication service.
@@ -75,16 +82,22 @@ class AuthenticationService:
             session_repository: Session data access
             jwt_provider: JWT token management
             password_hasher: Password security
+            token_cache: Shared cache of validated tokens (disabled if None)
+            activity_recorder: Write-behind session activity buffer; session
+                activity is written on every request if None
         """
         self.user_repository = user_repository
         self.session_repository = session_repository
         self.jwt_provider = jwt_provider
         self.password_hasher = password_hasher
+        self.token_cache = token_cache
+        self.activity_recorder = activity_recorder
         self.session_lifecycle = SessionLifecycleManager(
             user_repository=user_repository,
             session_repository=session_repository,
             access_token_expiry_minutes=self.ACCESS_TOKEN_EXPIRY_MINUTES,
             refresh_token_expiry_days=self.REFRESH_TOKEN_EXPIRY_DAYS,
+            token_cache=token_cache,
         )
 
     async def authenticate_user(
@@ -124,6 +137,8 @@ class AuthenticationService:
             # Record failed attempt for security monitoring
             if user:
                 await self.session_lifecycle.record_failed_login_attempt(user)
+                if self.token_cache is not None:
+                    self.token_cache.invalidate_user(user.id)
             msg = "Invalid email or password"
             raise InvalidCredentialsError(msg)
 
@@ -188,6 +203,7 @@ class AuthenticationService:
             if not user or not user.can_authenticate():
                 # Revoke session if user is invalid
                 await self.session_repository.revoke_session(session.id)
+                self._forget_session(session.id)
                 msg = "User session invalid"
                 raise AuthenticationError(msg)  # noqa: TRY301
 
@@ -210,6 +226,7 @@ class AuthenticationService:
             session.update_activity()
 
             await self.session_repository.update(session)
+            self._forget_session(session.id)
 
             return TokenRefreshResponse(
                 access_token=new_access_token,
@@ -229,9 +246,19 @@ class AuthenticationService:
         Args:
             access_token: Current access token
         """
+        if self.token_cache is not None:
+            self.token_cache.invalidate_token(access_token)
         session = await self.session_repository.get_by_access_token(access_token)
         if session:
             await self.session_repository.revoke_session(session.id)
+            self._forget_session(session.id)
+
+    def _forget_session(self, session_id: UUID) -> None:
+        """Drop cached validations and pending activity for a changed session."""
+        if self.token_cache is not None:
+            self.token_cache.invalidate_session(session_id)
+        if self.activity_recorder is not None:
+            self.activity_recorder.discard(session_id)
 
     def _extend_session_if_needed(self, session: UserSession) -> None:
         """
@@ -317,8 +344,12 @@ class AuthenticationService:
                 # Extend session if needed (sliding expiration)
                 self._extend_session_if_needed(session)
 
-                await self.session_repository.update(session)
-                logger.debug("[validate_token] Session activity updated")
+                if self.activity_recorder is not None:
+                    self.activity_recorder.record(session)
+                    logger.debug("[validate_token] Session activity queued")
+                else:
+                    await self.session_repository.update(session)
+                    logger.debug("[validate_token] Session activity updated")
         except Exception:
             logger.exception("[validate_token] Error checking session.is_active()")
             raise
@@ -338,6 +369,10 @@ class AuthenticationService:
         """
         logger = logging.getLogger(__name__)
 
+        cached_user = await self._validate_cached_token(token)
+        if cached_user is not None:
+            return cached_user
+
         try:
             logger.debug(
                 "[validate_token] Starting token validation for token: %s...",
@@ -391,6 +426,8 @@ class AuthenticationService:
             else:
                 logger.debug("[validate_token] No session found for token")
 
+            self._cache_validation(token, payload, user, session)
+
             logger.debug(
                 "[validate_token] Token validation successful for user: %s",
                 user_id,
@@ -408,6 +445,41 @@ class AuthenticationService:
             msg = f"Token validation failed: {exc!s}"
             raise AuthenticationError(msg) from exc
 
+    async def _validate_cached_token(self, token: str) -> User | None:
+        """Serve a repeat validation from the token cache, if possible."""
+        if self.token_cache is None:
+            return None
+        cached = self.token_cache.get(token)
+        if cached is None:
+            return None
+        logging.getLogger(__name__).debug(
+            "[validate_token] Token validation served from cache",
+        )
+        if cached.session is not None:
+            await self._update_session_activity(cached.session)
+        # Callers may mutate the user; keep the cached copy pristine.
+        return cached.user.model_copy()
+
+    def _cache_validation(
+        self,
+        token: str,
+        payload: dict[str, object],
+        user: User,
+        session: UserSession | None,
+    ) -> None:
+        """Remember a successful validation until the token or TTL expires."""
+        if self.token_cache is None:
+            return
+        expires_at = payload.get("exp")
+        self.token_cache.put(
+            token,
+            user.model_copy(),
+            session,
+            token_expires_at=(
+                float(expires_at) if isinstance(expires_at, int | float) else None
+            ),
+        )
+
     async def get_user_sessions(self, user_id: UUID) -> list[UserSession]:
         """
         Get all active sessions for a user.
@@ -432,6 +504,7 @@ class AuthenticationService:
         session = await self.session_repository.get_by_id(session_id)
         if session and session.user_id == user_id:
             await self.session_repository.revoke_session(session_id)
+            self._forget_session(session_id)
 
     async def revoke_all_user_sessions(self, user_id: UUID) -> int:
         """
@@ -443,7 +516,10 @@ class AuthenticationService:
         Returns:
             Number of sessions revoked
         """
-        return await self.session_repository.revoke_all_user_sessions(user_id)
+        revoked = await self.session_repository.revoke_all_user_sessions(user_id)
+        if self.token_cache is not None:
+            self.token_cache.invalidate_user(user_id)
+        return revoked
 
     async def revoke_expired_sessions(self) -> int:
         """
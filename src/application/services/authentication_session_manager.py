@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 from src.domain.entities.session import UserSession
 
 if TYPE_CHECKING:
+    from src.application.services.authentication_cache import TokenValidationCache
     from src.domain.entities.user import User
     from src.domain.repositories.session_repository import SessionRepository
     from src.domain.repositories.user_repository import UserRepository
@@ -30,6 +31,7 @@ class SessionLifecycleManager:
     max_sessions: int = 5
     max_failed_attempts: int = 5
     lockout_minutes: int = 30
+    token_cache: TokenValidationCache | None = None
 
     async def create_session(
         self,
@@ -50,6 +52,8 @@ class SessionLifecycleManager:
             if sessions:
                 oldest_session = min(sessions, key=lambda session: session.created_at)
                 await self.session_repository.revoke_session(oldest_session.id)
+                if self.token_cache is not None:
+                    self.token_cache.invalidate_session(oldest_session.id)
 
         session = UserSession(
             user_id=user.id,
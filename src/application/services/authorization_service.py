@@ -2,15 +2,25 @@
 Authorization service for MED13 Resource Library.
 
 Handles permission checking, role-based access control, and resource authorization.
+
+A user's role-derived permissions are resolved into an ``AuthorizationPrincipal``
+once per check. Inside an ``authorization_scope()`` (opened for every HTTP
+request by ``AuthorizationScopeMiddleware``) principals are additionally
+memoized, so any number of checks for the same user within one request cost a
+single user lookup.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from uuid import UUID
 
 from src.domain.entities.user import User, UserRole
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.value_objects.permission import (
     Permission,
-    PermissionChecker,
+    PermissionSet,
     RolePermissions,
 )
 from src.type_definitions.authorization import (
@@ -33,6 +43,68 @@ class ResourceNotFoundError(AuthorizationError):
     """Raised when requested resource doesn't exist."""
 
 
+@dataclass(frozen=True)
+class AuthorizationPrincipal:
+    """A user together with the permissions granted by their role."""
+
+    user_id: UUID
+    user: User | None
+    permissions: PermissionSet
+
+    @classmethod
+    def for_user(cls, user_id: UUID, user: User | None) -> "AuthorizationPrincipal":
+        permissions = PermissionSet.for_role(user.role) if user else PermissionSet()
+        return cls(user_id=user_id, user=user, permissions=permissions)
+
+
+@dataclass
+class AuthorizationContext:
+    """Principals resolved during one unit of work, keyed by user ID."""
+
+    principals: dict[UUID, AuthorizationPrincipal] = field(default_factory=dict)
+
+
+# Map resource+action to permission
+_RESOURCE_ACTION_PERMISSIONS: dict[tuple[str, str], Permission] = {
+    ("user", "create"): Permission.USER_CREATE,
+    ("user", "read"): Permission.USER_READ,
+    ("user", "update"): Permission.USER_UPDATE,
+    ("user", "delete"): Permission.USER_DELETE,
+    ("datasource", "create"): Permission.DATASOURCE_CREATE,
+    ("datasource", "read"): Permission.DATASOURCE_READ,
+    ("datasource", "update"): Permission.DATASOURCE_UPDATE,
+    ("datasource", "delete"): Permission.DATASOURCE_DELETE,
+    ("curation", "review"): Permission.CURATION_REVIEW,
+    ("curation", "approve"): Permission.CURATION_APPROVE,
+    ("curation", "reject"): Permission.CURATION_REJECT,
+    ("audit", "read"): Permission.AUDIT_READ,
+}
+
+_current_context: ContextVar[AuthorizationContext | None] = ContextVar(
+    "authorization_context",
+    default=None,
+)
+
+
+@contextmanager
+def authorization_scope() -> Iterator[AuthorizationContext]:
+    """
+    Memoize authorization principals for the duration of the block.
+
+    Nested scopes reuse the outer context.
+    """
+    context = _current_context.get()
+    if context is not None:
+        yield context
+        return
+    context = AuthorizationContext()
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
+
+
 class AuthorizationService:
     """
     Service for handling authorization and permission checking.
@@ -49,6 +121,31 @@ class AuthorizationService:
         """
         self.user_repository = user_repository
 
+    async def get_principal(self, user_id: UUID) -> AuthorizationPrincipal:
+        """
+        Resolve a user and their role permissions.
+
+        The principal is loaded with a single repository read and, inside an
+        ``authorization_scope()``, reused by every later check for the user.
+
+        Args:
+            user_id: User's unique identifier
+
+        Returns:
+            Principal with an empty permission set if the user does not exist
+        """
+        context = _current_context.get()
+        if context is not None:
+            principal = context.principals.get(user_id)
+            if principal is not None:
+                return principal
+
+        user = await self.user_repository.get_by_id(user_id)
+        principal = AuthorizationPrincipal.for_user(user_id, user)
+        if context is not None:
+            context.principals[user_id] = principal
+        return principal
+
     async def has_permission(self, user_id: UUID, permission: Permission) -> bool:
         """
         Check if user has a specific permission.
@@ -60,12 +157,8 @@ class AuthorizationService:
         Returns:
             True if user has permission, False otherwise
         """
-        user = await self.user_repository.get_by_id(user_id)
-        if not user:
-            return False
-
-        user_permissions = RolePermissions.get_permissions_for_role(user.role)
-        return PermissionChecker.has_permission(user_permissions, permission)
+        principal = await self.get_principal(user_id)
+        return permission in principal.permissions
 
     async def has_any_permission(
         self,
@@ -82,12 +175,8 @@ class AuthorizationService:
         Returns:
             True if user has at least one permission, False otherwise
         """
-        user = await self.user_repository.get_by_id(user_id)
-        if not user:
-            return False
-
-        user_permissions = RolePermissions.get_permissions_for_role(user.role)
-        return PermissionChecker.has_any_permission(user_permissions, permissions)
+        principal = await self.get_principal(user_id)
+        return principal.permissions.contains_any(permissions)
 
     async def has_all_permissions(
         self,
@@ -104,12 +193,8 @@ class AuthorizationService:
         Returns:
             True if user has all permissions, False otherwise
         """
-        user = await self.user_repository.get_by_id(user_id)
-        if not user:
-            return False
-
-        user_permissions = RolePermissions.get_permissions_for_role(user.role)
-        return PermissionChecker.has_all_permissions(user_permissions, permissions)
+        principal = await self.get_principal(user_id)
+        return principal.permissions.contains_all(permissions)
 
     async def get_user_permissions(self, user_id: UUID) -> list[Permission]:
         """
@@ -121,11 +206,11 @@ class AuthorizationService:
         Returns:
             List of user's permissions
         """
-        user = await self.user_repository.get_by_id(user_id)
-        if not user:
+        principal = await self.get_principal(user_id)
+        if principal.user is None:
             return []
 
-        return RolePermissions.get_permissions_for_role(user.role)
+        return RolePermissions.get_permissions_for_role(principal.user.role)
 
     async def get_missing_permissions(
         self,
@@ -142,11 +227,8 @@ class AuthorizationService:
         Returns:
             List of missing permissions
         """
-        user_permissions = await self.get_user_permissions(user_id)
-        return PermissionChecker.get_missing_permissions(
-            user_permissions,
-            required_permissions,
-        )
+        principal = await self.get_principal(user_id)
+        return principal.permissions.missing(required_permissions)
 
     async def require_permission(self, user_id: UUID, permission: Permission) -> None:
         """
@@ -198,8 +280,9 @@ class AuthorizationService:
         Raises:
             InsufficientPermissionsError: If user lacks any permission
         """
-        if not await self.has_all_permissions(user_id, permissions):
-            missing = await self.get_missing_permissions(user_id, permissions)
+        principal = await self.get_principal(user_id)
+        missing = principal.permissions.missing(permissions)
+        if missing:
             missing_names = [p.value for p in missing]
             msg = f"User lacks required permissions: {missing_names}"
             raise InsufficientPermissionsError(msg)
@@ -223,24 +306,9 @@ class AuthorizationService:
         Returns:
             True if access allowed, False otherwise
         """
-        # Map resource+action to permission
-        permission_map = {
-            ("user", "create"): Permission.USER_CREATE,
-            ("user", "read"): Permission.USER_READ,
-            ("user", "update"): Permission.USER_UPDATE,
-            ("user", "delete"): Permission.USER_DELETE,
-            ("datasource", "create"): Permission.DATASOURCE_CREATE,
-            ("datasource", "read"): Permission.DATASOURCE_READ,
-            ("datasource", "update"): Permission.DATASOURCE_UPDATE,
-            ("datasource", "delete"): Permission.DATASOURCE_DELETE,
-            ("curation", "review"): Permission.CURATION_REVIEW,
-            ("curation", "approve"): Permission.CURATION_APPROVE,
-            ("curation", "reject"): Permission.CURATION_REJECT,
-            ("audit", "read"): Permission.AUDIT_READ,
-        }
-
-        permission_key = (resource_type, action)
-        required_permission = permission_map.get(permission_key)
+        required_permission = _RESOURCE_ACTION_PERMISSIONS.get(
+            (resource_type, action),
+        )
 
         if not required_permission:
             # Unknown resource/action combination
@@ -291,18 +359,20 @@ class AuthorizationService:
         Returns:
             Access information dictionary
         """
-        user = await self.user_repository.get_by_id(user_id)
-        if not user:
+        principal = await self.get_principal(user_id)
+        if principal.user is None:
             return {"has_access": False, "reason": "User not found"}
 
-        has_access = await self.check_resource_access(
-            user,
-            resource_type,
-            None,  # General access check
-            action,
+        # General access check, answered from the already-loaded principal
+        required_permission = _RESOURCE_ACTION_PERMISSIONS.get(
+            (resource_type, action),
+        )
+        has_access = (
+            required_permission is not None
+            and required_permission in principal.permissions
         )
 
-        permissions = await self.get_user_permissions(user_id)
+        permissions = RolePermissions.get_permissions_for_role(principal.user.role)
 
         return {
             "has_access": has_access,
@@ -35,6 +35,19 @@ class CatalogPermissionMixin:
             research_space_id,
         )
 
+    def _resolve_permission_levels(
+        self,
+        catalog_entry_ids: list[str],
+        research_space_id: UUID | None,
+    ) -> dict[str, PermissionLevel]:
+        """Determine permission levels for many catalog entries in one pass."""
+        if not self._activation_service:
+            return dict.fromkeys(catalog_entry_ids, PermissionLevel.AVAILABLE)
+        return self._activation_service.get_effective_permission_levels(
+            catalog_entry_ids,
+            research_space_id,
+        )
+
     def _can_display_source(
         self,
         catalog_entry_id: str,
@@ -80,8 +93,10 @@ class CatalogPermissionMixin:
         else:
             entries = self._catalog_repo.find_all_active()
 
+        levels = self._resolve_permission_levels(
+            [entry.id for entry in entries],
+            research_space_id,
+        )
         return [
-            entry
-            for entry in entries
-            if self._can_display_source(entry.id, research_space_id)
+            entry for entry in entries if levels[entry.id] != PermissionLevel.BLOCKED
         ]
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 from uuid import UUID  # noqa: TC003
 
 from src.domain.entities.data_source_activation import (
@@ -14,7 +17,11 @@ from src.domain.repositories.data_source_activation_repository import (  # noqa:
     DataSourceActivationRepository,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
 DEFAULT_AVAILABLE_SOURCES: frozenset[str] = frozenset({"pubmed"})
+DEFAULT_RULE_CACHE_TTL_SECONDS = 30.0
 
 
 @dataclass(frozen=True)
@@ -28,11 +35,94 @@ class DataSourceAvailabilitySummary:
     project_rules: list[DataSourceActivation]
 
 
+@dataclass(frozen=True)
+class ScopedActivationRules:
+    """Permission levels set by global and research-space rules for one scope."""
+
+    global_levels: dict[str, PermissionLevel]
+    space_levels: dict[str, PermissionLevel]
+    loaded_at: float
+
+    @classmethod
+    def from_rules(
+        cls,
+        rules: Iterable[DataSourceActivation],
+        loaded_at: float,
+    ) -> ScopedActivationRules:
+        global_levels: dict[str, PermissionLevel] = {}
+        space_levels: dict[str, PermissionLevel] = {}
+        for rule in rules:
+            if rule.scope == ActivationScope.GLOBAL:
+                global_levels[rule.catalog_entry_id] = rule.permission_level
+            else:
+                space_levels[rule.catalog_entry_id] = rule.permission_level
+        return cls(global_levels, space_levels, loaded_at)
+
+    def level_for(self, catalog_entry_id: str) -> PermissionLevel | None:
+        """Return the explicit level for an entry, if any rule sets one."""
+        level = self.space_levels.get(catalog_entry_id)
+        if level is None:
+            level = self.global_levels.get(catalog_entry_id)
+        return level
+
+
+@dataclass
+class ActivationRuleCache:
+    """
+    Process-wide, versioned cache of activation rules per research space.
+
+    Every rule change bumps ``version`` and drops the cached scopes; a load
+    that started before the change is discarded instead of being stored, so
+    a stale rule set is never cached. Entries are also reloaded after
+    ``ttl_seconds`` to pick up changes made by other processes.
+    """
+
+    ttl_seconds: float = DEFAULT_RULE_CACHE_TTL_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    _entries: dict[UUID | None, ScopedActivationRules] = field(default_factory=dict)
+    _version: int = 0
+    # Sync services run in the threadpool, so scopes may load concurrently.
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get_or_load(
+        self,
+        research_space_id: UUID | None,
+        loader: Callable[[], list[DataSourceActivation]],
+    ) -> ScopedActivationRules:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(research_space_id)
+            version = self._version
+        if entry is not None and now - entry.loaded_at < self.ttl_seconds:
+            return entry
+
+        entry = ScopedActivationRules.from_rules(loader(), now)
+        with self._lock:
+            if self._version == version:
+                self._entries[research_space_id] = entry
+        return entry
+
+    def invalidate(self) -> None:
+        """Drop every cached scope after activation rules change."""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+
 class DataSourceActivationService:
     """Application-level coordinator for data source availability policies."""
 
-    def __init__(self, repository: DataSourceActivationRepository) -> None:
+    def __init__(
+        self,
+        repository: DataSourceActivationRepository,
+        rule_cache: ActivationRuleCache | None = None,
+    ) -> None:
         self._repository = repository
+        self._rule_cache = rule_cache
 
     def _default_permission(self, catalog_entry_id: str) -> PermissionLevel:
         """Return the default permission for catalog entries without explicit rules."""
@@ -49,12 +139,14 @@ class DataSourceActivationService:
     ) -> DataSourceActivation:
         """Create or update the global activation status for a data source."""
 
-        return self._repository.set_rule(
+        rule = self._repository.set_rule(
             catalog_entry_id=catalog_entry_id,
             scope=ActivationScope.GLOBAL,
             permission_level=permission_level,
             updated_by=updated_by,
         )
+        self._invalidate_rules()
+        return rule
 
     def clear_global_activation(self, catalog_entry_id: str) -> None:
         """Remove the global activation override for a data source."""
@@ -63,6 +155,7 @@ class DataSourceActivationService:
             catalog_entry_id=catalog_entry_id,
             scope=ActivationScope.GLOBAL,
         )
+        self._invalidate_rules()
 
     def set_project_activation(
         self,
@@ -74,13 +167,15 @@ class DataSourceActivationService:
     ) -> DataSourceActivation:
         """Create or update an activation override for a specific research space."""
 
-        return self._repository.set_rule(
+        rule = self._repository.set_rule(
             catalog_entry_id=catalog_entry_id,
             scope=ActivationScope.RESEARCH_SPACE,
             research_space_id=research_space_id,
             permission_level=permission_level,
             updated_by=updated_by,
         )
+        self._invalidate_rules()
+        return rule
 
     def clear_project_activation(
         self,
@@ -95,6 +190,7 @@ class DataSourceActivationService:
             scope=ActivationScope.RESEARCH_SPACE,
             research_space_id=research_space_id,
         )
+        self._invalidate_rules()
 
     def get_effective_permission_level(
         self,
@@ -103,6 +199,12 @@ class DataSourceActivationService:
     ) -> PermissionLevel:
         """Resolve the effective permission level for the provided context."""
 
+        if self._rule_cache is not None:
+            return self.get_effective_permission_levels(
+                [catalog_entry_id],
+                research_space_id,
+            )[catalog_entry_id]
+
         if research_space_id:
             project_rule = self._repository.get_rule(
                 catalog_entry_id,
@@ -121,6 +223,24 @@ class DataSourceActivationService:
 
         return self._default_permission(catalog_entry_id)
 
+    def get_effective_permission_levels(
+        self,
+        catalog_entry_ids: Iterable[str],
+        research_space_id: UUID | None = None,
+    ) -> dict[str, PermissionLevel]:
+        """
+        Resolve effective permission levels for many catalog entries at once.
+
+        All global rules and the rules of ``research_space_id`` are fetched in
+        a single query (or served from the rule cache) and resolved in memory.
+        """
+
+        rules = self._scoped_rules(research_space_id)
+        return {
+            entry_id: rules.level_for(entry_id) or self._default_permission(entry_id)
+            for entry_id in catalog_entry_ids
+        }
+
     def is_source_active(
         self,
         catalog_entry_id: str,
@@ -158,6 +278,18 @@ class DataSourceActivationService:
             for entry_id in unique_ids
         ]
 
+    def _scoped_rules(self, research_space_id: UUID | None) -> ScopedActivationRules:
+        def load() -> list[DataSourceActivation]:
+            return self._repository.list_rules_for_scope(research_space_id)
+
+        if self._rule_cache is None:
+            return ScopedActivationRules.from_rules(load(), time.monotonic())
+        return self._rule_cache.get_or_load(research_space_id, load)
+
+    def _invalidate_rules(self) -> None:
+        if self._rule_cache is not None:
+            self._rule_cache.invalidate()
+
     def _build_summary(
         self,
         catalog_entry_id: str,
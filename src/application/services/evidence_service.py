@@ -5,10 +5,15 @@ Coordinates domain services and repositories to implement evidence management
 use cases while preserving domain purity and strong typing.
 """
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from datetime import date
 
 from src.domain.entities.evidence import Evidence, EvidenceType
+from src.domain.repositories.base import (
+    SeekPage,
+    SeekPosition,
+    TotalCount,
+)
 from src.domain.repositories.evidence_repository import EvidenceRepository
 from src.domain.services.evidence_domain_service import EvidenceDomainService
 from src.domain.value_objects.confidence import Confidence, EvidenceLevel
@@ -140,6 +145,10 @@ class EvidenceApplicationService:
         """Find evidence records for a variant."""
         return self._evidence_repository.find_by_variant(variant_id)
 
+    def get_evidence_by_variants(self, variant_ids: Iterable[int]) -> list[Evidence]:
+        """Find evidence for several variants in one lookup, ordered by ID."""
+        return self._evidence_repository.find_by_variants(variant_ids)
+
     def get_evidence_by_gene(self, gene_id: int) -> list[Evidence]:
         """Find evidence records for a gene."""
         return self._evidence_repository.find_by_gene(gene_id)
@@ -209,7 +218,7 @@ class EvidenceApplicationService:
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Evidence], int]:
+    ) -> tuple[list[Evidence], TotalCount]:
         """Retrieve paginated evidence with optional filters."""
         normalized_filters = self._normalize_filters(filters)
         return self._evidence_repository.paginate_evidence(
@@ -220,6 +229,40 @@ class EvidenceApplicationService:
             normalized_filters,
         )
 
+    def list_evidence_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: QueryFilters | None = None,
+    ) -> list[Evidence]:
+        """Retrieve the next batch of evidence after ``after_id`` in key order."""
+        normalized_filters = self._normalize_filters(filters)
+        return self._evidence_repository.paginate_evidence_keyset(
+            after_id,
+            limit,
+            normalized_filters,
+        )
+
+    def list_evidence_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Evidence]:
+        """Retrieve a keyset page of evidence continuing after ``after``."""
+        return self._evidence_repository.paginate_evidence_seek(
+            after,
+            limit,
+            sort_by,
+            sort_order,
+            filters=self._normalize_filters(filters),
+            offset=offset,
+        )
+
     def update_evidence(self, evidence_id: int, updates: EvidenceUpdate) -> Evidence:
         """Update evidence fields."""
         if not updates:
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import tempfile
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from src.application.services.ports.extraction_processor_port import (
+    ExtractionProcessorPort,
+    ExtractionProcessorResult,
     ExtractionTextPayload,
 )
 from src.domain.entities.publication_extraction import (
@@ -21,12 +25,6 @@ from src.domain.entities.publication_extraction import (
 from src.type_definitions.storage import StorageUseCase
 
 if TYPE_CHECKING:
-    from uuid import UUID
-
-    from src.application.services.ports.extraction_processor_port import (
-        ExtractionProcessorPort,
-        ExtractionProcessorResult,
-    )
     from src.application.services.storage_operation_coordinator import (
         StorageOperationCoordinator,
     )
@@ -57,6 +55,13 @@ class ExtractionRunSummary:
     started_at: datetime
     completed_at: datetime
 
+    @property
+    def items_per_second(self) -> float:
+        elapsed = (self.completed_at - self.started_at).total_seconds()
+        if elapsed <= 0:
+            return float(self.processed)
+        return self.processed / elapsed
+
     def to_metadata(self) -> JSONObject:
         return {
             "source_id": str(self.source_id) if self.source_id else None,
@@ -70,11 +75,38 @@ class ExtractionRunSummary:
             "failed": self.failed,
             "started_at": self.started_at.isoformat(timespec="seconds"),
             "completed_at": self.completed_at.isoformat(timespec="seconds"),
+            "items_per_second": round(self.items_per_second, 3),
         }
 
 
+@dataclass(frozen=True)
+class _ProcessorCall:
+    """Picklable processor invocation, so process pools can run it."""
+
+    processor: ExtractionProcessorPort
+    queue_item: ExtractionQueueItem
+    publication: Publication | None
+    text_payload: ExtractionTextPayload | None
+
+    def __call__(self) -> ExtractionProcessorResult:
+        return self.processor.extract_publication(
+            queue_item=self.queue_item,
+            publication=self.publication,
+            text_payload=self.text_payload,
+        )
+
+
 class ExtractionRunnerService:
-    """Claims pending extraction queue items and processes them."""
+    """
+    Claims pending extraction queue items and processes them.
+
+    Each batch loads its publications in one query, stores text payloads
+    concurrently (at most ``storage_concurrency`` writes in flight), and runs
+    the processor on ``processor_executor`` or, when ``processor_workers`` is
+    greater than one, on a thread pool of that size. Results are persisted
+    sequentially in claim order. Claimed items are committed as processing
+    with ``SKIP LOCKED``, so several runner processes can drain one queue.
+    """
 
     def __init__(  # noqa: PLR0913 - explicit dependencies keep orchestration clear
         self,
@@ -85,6 +117,9 @@ class ExtractionRunnerService:
         processor: ExtractionProcessorPort,
         storage_coordinator: StorageOperationCoordinator | None = None,
         batch_size: int = 25,
+        storage_concurrency: int = 8,
+        processor_workers: int = 1,
+        processor_executor: Executor | None = None,
     ) -> None:
         self._queue_repository = queue_repository
         self._publication_repository = publication_repository
@@ -92,6 +127,9 @@ class ExtractionRunnerService:
         self._processor = processor
         self._storage_coordinator = storage_coordinator
         self._batch_size = max(batch_size, 1)
+        self._storage_concurrency = max(storage_concurrency, 1)
+        self._processor_workers = max(processor_workers, 1)
+        self._processor_executor = processor_executor
 
     async def run_for_ingestion_job(
         self,
@@ -178,45 +216,51 @@ class ExtractionRunnerService:
         if not items:
             return _BatchSummary()
 
+        publications = {
+            publication.id: publication
+            for publication in self._publication_repository.find_by_ids(
+                [item.publication_id for item in items],
+            )
+        }
+        batch_publications = [publications.get(item.publication_id) for item in items]
+        text_payloads = await self._store_text_payloads(items, batch_publications)
+        outcomes = await self._extract_batch(
+            items,
+            batch_publications,
+            text_payloads,
+        )
+
         completed = 0
         skipped = 0
         failed = 0
 
-        for item in items:
-            publication = self._publication_repository.get_by_id(item.publication_id)
-            text_payload = self._build_text_payload(publication)
-            if text_payload is not None:
-                text_payload = await self._store_text_payload(
-                    item=item,
-                    publication=publication,
-                    payload=text_payload,
-                )
-            try:
-                result = self._processor.extract_publication(
-                    queue_item=item,
-                    publication=publication,
-                    text_payload=text_payload,
-                )
-            except Exception as exc:  # pragma: no cover - defensive
+        for item, publication, outcome in zip(
+            items,
+            batch_publications,
+            outcomes,
+            strict=True,
+        ):
+            if isinstance(outcome, BaseException):
                 failed += 1
                 self._queue_repository.mark_failed(
                     item.id,
-                    error_message=str(exc),
+                    error_message=str(outcome),
                 )
-                logger.exception(
+                logger.error(
                     "Extraction processor failed for item %s",
                     item.id,
+                    exc_info=outcome,
                 )
                 continue
 
             failed_increment = self._handle_result(
                 item=item,
                 publication=publication,
-                result=result,
+                result=outcome,
             )
             if failed_increment:
                 failed += 1
-            elif result.status == "skipped":
+            elif outcome.status == "skipped":
                 skipped += 1
             else:
                 completed += 1
@@ -228,6 +272,78 @@ class ExtractionRunnerService:
             failed=failed,
         )
 
+    async def _store_text_payloads(
+        self,
+        items: list[ExtractionQueueItem],
+        publications: list[Publication | None],
+    ) -> list[ExtractionTextPayload | None]:
+        semaphore = asyncio.Semaphore(self._storage_concurrency)
+
+        async def prepare(
+            item: ExtractionQueueItem,
+            publication: Publication | None,
+        ) -> ExtractionTextPayload | None:
+            payload = self._build_text_payload(publication)
+            if payload is None:
+                return None
+            async with semaphore:
+                return await self._store_text_payload(
+                    item=item,
+                    publication=publication,
+                    payload=payload,
+                )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    prepare(item, publication)
+                    for item, publication in zip(items, publications, strict=True)
+                ),
+            ),
+        )
+
+    async def _extract_batch(
+        self,
+        items: list[ExtractionQueueItem],
+        publications: list[Publication | None],
+        text_payloads: list[ExtractionTextPayload | None],
+    ) -> list[ExtractionProcessorResult | BaseException]:
+        calls = [
+            _ProcessorCall(
+                processor=self._processor,
+                queue_item=item,
+                publication=publication,
+                text_payload=text_payload,
+            )
+            for item, publication, text_payload in zip(
+                items,
+                publications,
+                text_payloads,
+                strict=True,
+            )
+        ]
+        executor = self._processor_executor
+        if executor is None and self._processor_workers == 1:
+            outcomes: list[ExtractionProcessorResult | BaseException] = []
+            for call in calls:
+                try:
+                    outcomes.append(call())
+                except Exception as exc:  # noqa: BLE001 - reported per item
+                    outcomes.append(exc)
+            return outcomes
+
+        loop = asyncio.get_running_loop()
+        if executor is not None:
+            return await asyncio.gather(
+                *(loop.run_in_executor(executor, call) for call in calls),
+                return_exceptions=True,
+            )
+        with ThreadPoolExecutor(max_workers=self._processor_workers) as pool:
+            return await asyncio.gather(
+                *(loop.run_in_executor(pool, call) for call in calls),
+                return_exceptions=True,
+            )
+
     def _build_text_payload(
         self,
         publication: Publication | None,
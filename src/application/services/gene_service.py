@@ -2,8 +2,14 @@
 
 from typing import Literal
 
+from src.application.services.genomic_region_service import GenomicIndexCache
 from src.domain.entities.gene import Gene
 from src.domain.entities.variant import VariantSummary
+from src.domain.repositories.base import (
+    SeekPage,
+    SeekPosition,
+    TotalCount,
+)
 from src.domain.repositories.gene_repository import GeneRepository
 from src.domain.repositories.variant_repository import VariantRepository
 from src.domain.services.gene_domain_service import GeneDomainService
@@ -38,6 +44,7 @@ class GeneApplicationService:
         gene_repository: GeneRepository,
         gene_domain_service: GeneDomainService,
         variant_repository: VariantRepository,
+        index_cache: GenomicIndexCache | None = None,
     ):
         """
         Initialize the gene application service.
@@ -46,10 +53,12 @@ class GeneApplicationService:
             gene_repository: Domain repository for genes
             gene_domain_service: Domain service for gene business logic
             variant_repository: Domain repository for variants
+            index_cache: Region query indexes to invalidate after writes
         """
         self._gene_repository = gene_repository
         self._gene_domain_service = gene_domain_service
         self._variant_repository = variant_repository
+        self._index_cache = index_cache
 
     def create_gene(
         self,
@@ -124,7 +133,9 @@ class GeneApplicationService:
             raise ValueError(msg)
 
         # Persist the entity
-        return self._gene_repository.create(gene_entity)
+        created = self._gene_repository.create(gene_entity)
+        self._invalidate_region_index(created.chromosome)
+        return created
 
     def list_genes(
         self,
@@ -133,7 +144,7 @@ class GeneApplicationService:
         sort_by: str,
         sort_order: str,
         search: str | None = None,
-    ) -> tuple[list[Gene], int]:
+    ) -> tuple[list[Gene], TotalCount]:
         """Retrieve paginated genes with optional search."""
         return self._gene_repository.paginate_genes(
             page=page,
@@ -143,6 +154,39 @@ class GeneApplicationService:
             search=search,
         )
 
+    def list_genes_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        search: str | None = None,
+    ) -> list[Gene]:
+        """Retrieve the next batch of genes after ``after_id`` in key order."""
+        return self._gene_repository.paginate_genes_keyset(
+            after_id=after_id,
+            limit=limit,
+            search=search,
+        )
+
+    def list_genes_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        search: str | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Gene]:
+        """Retrieve a keyset page of genes continuing after ``after``."""
+        return self._gene_repository.paginate_genes_seek(
+            after,
+            limit,
+            sort_by,
+            sort_order,
+            search=search,
+            offset=offset,
+        )
+
     def get_gene_by_id(self, gene_id: str) -> Gene | None:
         """Retrieve a gene by its public gene identifier."""
         return self._gene_repository.find_by_gene_id(gene_id)
@@ -251,6 +295,7 @@ class GeneApplicationService:
 
         gene_db_id = self._require_gene_db_id(gene)
         updated_gene = self._gene_repository.update(gene_db_id, sanitized_updates)
+        self._invalidate_region_index(gene.chromosome, updated_gene.chromosome)
 
         # Apply domain business logic to updated entity
         return self._gene_domain_service.apply_business_logic(
@@ -301,13 +346,19 @@ class GeneApplicationService:
             msg = "No location updates provided"
             raise ValueError(msg)
 
-        return self._gene_repository.update(gene_id, updates)
+        updated = self._gene_repository.update(gene_id, updates)
+        if "chromosome" in updates and self._index_cache is not None:
+            # The previous chromosome is unknown here
+            self._index_cache.invalidate()
+        self._invalidate_region_index(updated.chromosome)
+        return updated
 
     def delete_gene(self, gene_id: str) -> None:
         """Delete a gene by its gene identifier."""
         gene = self._gene_repository.find_by_gene_id_or_fail(gene_id)
         gene_db_id = self._require_gene_db_id(gene)
         self._gene_repository.delete(gene_db_id)
+        self._invalidate_region_index(gene.chromosome)
 
     def get_gene_variants(self, gene_id: str) -> list[VariantSummary]:
         """Return serialized variants associated with a gene."""
@@ -432,6 +483,12 @@ class GeneApplicationService:
             "updated_at": gene.updated_at.isoformat() if gene.updated_at else None,
         }
 
+    def _invalidate_region_index(self, *chromosomes: str | None) -> None:
+        if self._index_cache is None:
+            return
+        for chromosome in {chromosome for chromosome in chromosomes if chromosome}:
+            self._index_cache.invalidate(chromosome)
+
     def _require_gene_db_id(self, gene: Gene) -> int:
         if gene.id is None:
             msg = "Gene is not persisted and lacks a database id"
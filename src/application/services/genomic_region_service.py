@@ -0,0 +1,165 @@
+"""Application service answering genomic region queries from in-memory indexes."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.domain.entities.variant import CHROMOSOME_PATTERN
+from src.domain.services.genomic_index import (
+    GenomicIntervalIndex,
+    GenomicPositionIndex,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.domain.entities.gene import Gene
+    from src.domain.entities.variant import VariantSummary
+    from src.domain.repositories.gene_repository import GeneRepository
+    from src.domain.repositories.variant_repository import VariantRepository
+
+DEFAULT_INDEX_TTL_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class ChromosomeIndex:
+    """Gene and variant indexes for a single chromosome."""
+
+    genes: GenomicIntervalIndex[Gene]
+    variants: GenomicPositionIndex[VariantSummary]
+    loaded_at: float
+
+
+@dataclass(frozen=True)
+class GenomicRegionResult:
+    """Genes and variants found within a queried region."""
+
+    chromosome: str
+    start: int
+    end: int
+    genes: list[Gene]
+    variants: list[VariantSummary]
+    variant_count: int
+
+
+@dataclass
+class GenomicIndexCache:
+    """
+    Process-wide cache of per-chromosome genomic indexes.
+
+    Each chromosome is bulk-loaded from the repositories on first use and
+    reloaded once ``ttl_seconds`` have elapsed. The gene and variant
+    application services call ``invalidate`` after every write, so the TTL
+    only covers writes made by other processes.
+    """
+
+    ttl_seconds: float = DEFAULT_INDEX_TTL_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    _entries: dict[str, ChromosomeIndex] = field(default_factory=dict)
+
+    def get_or_load(
+        self,
+        chromosome: str,
+        loader: Callable[[], tuple[list[Gene], list[VariantSummary]]],
+    ) -> ChromosomeIndex:
+        now = self.clock()
+        entry = self._entries.get(chromosome)
+        if entry is not None and now - entry.loaded_at < self.ttl_seconds:
+            return entry
+
+        genes, variants = loader()
+        gene_index: GenomicIntervalIndex[Gene] = GenomicIntervalIndex()
+        for gene in genes:
+            if gene.start_position is None or gene.end_position is None:
+                continue
+            gene_index.add(chromosome, gene.start_position, gene.end_position, gene)
+        variant_index: GenomicPositionIndex[VariantSummary] = GenomicPositionIndex(
+            (chromosome, variant.position, variant) for variant in variants
+        )
+        entry = ChromosomeIndex(gene_index, variant_index, now)
+        self._entries[chromosome] = entry
+        return entry
+
+    def invalidate(self, chromosome: str | None = None) -> None:
+        """Drop cached indexes for ``chromosome`` or for every chromosome."""
+        if chromosome is None:
+            self._entries.clear()
+            return
+        try:
+            normalized = normalize_chromosome(chromosome)
+        except ValueError:
+            return  # Never cached under an invalid label
+        self._entries.pop(normalized, None)
+
+
+def normalize_chromosome(chromosome: str) -> str:
+    """Normalize a chromosome label to the ``CHR<id>`` form stored by entities."""
+    cleaned = chromosome.strip()
+    if not CHROMOSOME_PATTERN.fullmatch(cleaned):
+        msg = "chromosome must match pattern chr<id>"
+        raise ValueError(msg)
+    if not cleaned.lower().startswith("chr"):
+        cleaned = f"chr{cleaned}"
+    return cleaned.upper()
+
+
+class GenomicRegionService:
+    """
+    Application service for region queries over genes and variants.
+
+    Overlap lookups are served from ``GenomicIndexCache`` so repeated region
+    queries cost ``O(log n + k)`` instead of a database range scan each time.
+    """
+
+    def __init__(
+        self,
+        gene_repository: GeneRepository,
+        variant_repository: VariantRepository,
+        index_cache: GenomicIndexCache,
+    ):
+        self._gene_repository = gene_repository
+        self._variant_repository = variant_repository
+        self._index_cache = index_cache
+
+    def query_region(
+        self,
+        chromosome: str,
+        start: int,
+        end: int,
+        variant_limit: int | None = None,
+    ) -> GenomicRegionResult:
+        """Find genes overlapping and variants positioned within a region."""
+        if start < 1 or end < start:
+            msg = "Region must satisfy 1 <= start <= end"
+            raise ValueError(msg)
+        normalized = normalize_chromosome(chromosome)
+        index = self._index_cache.get_or_load(
+            normalized,
+            lambda: (
+                self._gene_repository.find_by_chromosome(normalized),
+                self._variant_repository.get_variant_summaries_by_chromosome(
+                    normalized,
+                ),
+            ),
+        )
+        genes = [hit.payload for hit in index.genes.overlapping(normalized, start, end)]
+        variants = index.variants.in_region(normalized, start, end)
+        return GenomicRegionResult(
+            chromosome=normalized,
+            start=start,
+            end=end,
+            genes=genes,
+            variants=variants[:variant_limit] if variant_limit else variants,
+            variant_count=len(variants),
+        )
+
+
+__all__ = [
+    "ChromosomeIndex",
+    "GenomicIndexCache",
+    "GenomicRegionResult",
+    "GenomicRegionService",
+    "normalize_chromosome",
+]
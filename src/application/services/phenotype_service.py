@@ -1,9 +1,14 @@
 """Application-level orchestration for phenotype use cases."""
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 
 from src.domain.entities.phenotype import Phenotype, PhenotypeCategory
+from src.domain.repositories.base import (
+    SeekPage,
+    SeekPosition,
+    TotalCount,
+)
 from src.domain.repositories.phenotype_repository import PhenotypeRepository
 from src.domain.value_objects.identifiers import PhenotypeIdentifier
 from src.type_definitions.common import FilterValue, PhenotypeUpdate, QueryFilters
@@ -71,6 +76,10 @@ class PhenotypeApplicationService:
         """Find a phenotype by its HPO ID."""
         return self._phenotype_repository.find_by_hpo_id(hpo_id)
 
+    def get_phenotypes_by_ids(self, phenotype_ids: Iterable[int]) -> list[Phenotype]:
+        """Find the phenotypes with the given database IDs in one lookup."""
+        return self._phenotype_repository.find_by_ids(phenotype_ids)
+
     def search_phenotypes_by_name(
         self,
         name: str,
@@ -118,7 +127,7 @@ class PhenotypeApplicationService:
         sort_by: str,
         sort_order: str,
         filters: Mapping[str, FilterValue] | QueryFilters | None = None,
-    ) -> tuple[list[Phenotype], int]:
+    ) -> tuple[list[Phenotype], TotalCount]:
         """Retrieve paginated phenotypes with optional filters."""
         normalized_filters = self._normalize_filters(filters)
         return self._phenotype_repository.paginate_phenotypes(
@@ -129,6 +138,40 @@ class PhenotypeApplicationService:
             normalized_filters,
         )
 
+    def list_phenotypes_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: Mapping[str, FilterValue] | QueryFilters | None = None,
+    ) -> list[Phenotype]:
+        """Retrieve the next batch of phenotypes after ``after_id`` in key order."""
+        normalized_filters = self._normalize_filters(filters)
+        return self._phenotype_repository.paginate_phenotypes_keyset(
+            after_id,
+            limit,
+            normalized_filters,
+        )
+
+    def list_phenotypes_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: Mapping[str, FilterValue] | QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Phenotype]:
+        """Retrieve a keyset page of phenotypes continuing after ``after``."""
+        return self._phenotype_repository.paginate_phenotypes_seek(
+            after,
+            limit,
+            sort_by,
+            sort_order,
+            filters=self._normalize_filters(filters),
+            offset=offset,
+        )
+
     def update_phenotype(
         self,
         phenotype_id: int,
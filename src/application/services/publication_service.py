@@ -6,6 +6,7 @@ use cases while preserving strong typing.
 """
 
 from src.domain.entities.publication import Publication, PublicationType
+from src.domain.repositories.base import TotalCount
 from src.domain.repositories.evidence_repository import EvidenceRepository
 from src.domain.repositories.publication_repository import PublicationRepository
 from src.domain.value_objects.identifiers import PublicationIdentifier
@@ -156,7 +157,7 @@ class PublicationApplicationService:
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Publication], int]:
+    ) -> tuple[list[Publication], TotalCount]:
         """Retrieve paginated publications with optional filters."""
         normalized_filters = self._normalize_filters(filters)
         return self._publication_repository.paginate_publications(
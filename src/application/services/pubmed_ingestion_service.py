@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import shutil
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from src.domain.entities import data_source_configs, publication, user_data_source
+from src.domain.repositories.publication_repository import DEFAULT_UPSERT_BATCH_SIZE
 from src.domain.services.pubmed_ingestion import PubMedGateway, PubMedIngestionSummary
+from src.domain.transform.raw_spool import SPOOL_CONTENT_TYPE, RawRecordSpool
 from src.domain.transform.transformers.pubmed_record_transformer import (
     PubMedRecordTransformer,
 )
@@ -20,15 +22,16 @@ from src.type_definitions.storage import StorageUseCase
 LOW_CONFIDENCE_THRESHOLD = 0.5
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterator, Iterable
 
     from src.application.services.storage_configuration_service import (
         StorageConfigurationService,
     )
     from src.domain.agents.ports.query_agent_port import QueryAgentPort
+    from src.domain.entities.storage_configuration import StorageConfiguration
     from src.domain.repositories import PublicationRepository, ResearchSpaceRepository
+    from src.domain.transform.raw_spool import RawSpoolSegment
     from src.type_definitions.common import (
-        PublicationUpdate,
         RawRecord,
         SourceMetadata,
     )
@@ -36,6 +39,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+async def _chunked(
+    records: AsyncIterator[RawRecord],
+    size: int,
+) -> AsyncIterator[list[RawRecord]]:
+    chunk: list[RawRecord] = []
+    async for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _RawSegmentUpload:
+    """Raw records spooled to a temporary directory and uploaded per segment."""
+
+    def __init__(self, backend: StorageConfiguration, run_key: str) -> None:
+        self.backend = backend
+        self.run_key = run_key
+        self._directory = Path(tempfile.mkdtemp(prefix="pubmed-raw-"))
+        self.spool = RawRecordSpool(self._directory, "records")
+
+    def cleanup(self) -> None:
+        self.spool.discard()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+
 class PubMedIngestionService:
     """Coordinate fetching, transforming, and persisting PubMed data per source."""
 
@@ -104,68 +135,103 @@ class PubMedIngestionService:
                     contract.rationale,
                 )
 
-        raw_records = await self._gateway.fetch_records(config)
+        return await self._ingest_records(source, config)
 
-        # Persist raw records if a storage backend is configured
-        if self._storage_service:
-            await self._persist_raw_records(raw_records, source)
+    async def _ingest_records(
+        self,
+        source: user_data_source.UserDataSource,
+        config: data_source_configs.PubMedQueryConfig,
+    ) -> PubMedIngestionSummary:
+        """
+        Transform and persist records in chunks as the gateway yields them.
 
-        publications = self._transform_records(raw_records)
-        created, updated, created_ids, updated_ids = self._persist_publications(
-            publications,
-        )
+        Each chunk is one upsert batch, so memory stays flat regardless of
+        how many articles match the query.
+        """
+        raw_upload = self._open_raw_upload(source)
+        fetched = parsed = created = updated = 0
+        created_ids: list[int] = []
+        updated_ids: list[int] = []
+        try:
+            chunks = _chunked(
+                self._gateway.stream_records(config),
+                DEFAULT_UPSERT_BATCH_SIZE,
+            )
+            async for raw_records in chunks:
+                fetched += len(raw_records)
+                if raw_upload is not None:
+                    for segment in raw_upload.spool.write_many(raw_records):
+                        await self._persist_raw_segment(raw_upload, segment, source)
+                publications = self._transform_records(raw_records)
+                parsed += len(publications)
+                chunk_created, chunk_updated, chunk_created_ids, chunk_updated_ids = (
+                    self._persist_publications(publications)
+                )
+                created += chunk_created
+                updated += chunk_updated
+                created_ids.extend(chunk_created_ids)
+                updated_ids.extend(chunk_updated_ids)
+
+            # Persist the last raw segment if a storage backend is configured
+            if raw_upload is not None:
+                last_segment = raw_upload.spool.close()
+                if last_segment is not None:
+                    await self._persist_raw_segment(raw_upload, last_segment, source)
+        finally:
+            if raw_upload is not None:
+                raw_upload.cleanup()
 
         return PubMedIngestionSummary(
             source_id=source.id,
-            fetched_records=len(raw_records),
-            parsed_publications=len(publications),
+            fetched_records=fetched,
+            parsed_publications=parsed,
             created_publications=created,
             updated_publications=updated,
-            created_publication_ids=created_ids,
-            updated_publication_ids=updated_ids,
+            created_publication_ids=tuple(created_ids),
+            updated_publication_ids=tuple(updated_ids),
             executed_query=config.query,
         )
 
-    async def _persist_raw_records(
+    def _open_raw_upload(
         self,
-        records: Iterable[RawRecord],
         source: user_data_source.UserDataSource,
-    ) -> None:
-        """Persist raw records to storage if backend is available."""
+    ) -> _RawSegmentUpload | None:
+        """Start spooling raw records if a raw-source backend is configured."""
         if not self._storage_service:
-            return
-
+            return None
         backend = self._storage_service.resolve_backend_for_use_case(
             StorageUseCase.RAW_SOURCE,
         )
         if not backend:
-            return
+            return None
+        # Generate a unique key prefix for this ingestion run
+        timestamp = source.updated_at.strftime("%Y%m%d_%H%M%S")
+        run_key = f"pubmed/{source.id}/raw/{timestamp}_{uuid4().hex[:8]}"
+        return _RawSegmentUpload(backend, run_key)
 
-        # Create a temporary file to store the raw records
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            json.dump(list(records), tmp, default=str)
-            tmp_path = Path(tmp.name)
+    async def _persist_raw_segment(
+        self,
+        upload: _RawSegmentUpload,
+        segment: RawSpoolSegment,
+        source: user_data_source.UserDataSource,
+    ) -> None:
+        """Upload a sealed raw spool segment and drop the local copy."""
+        if not self._storage_service:
+            return
 
-        try:
-            # Generate a unique key for this ingestion run
-            timestamp = source.updated_at.strftime("%Y%m%d_%H%M%S")
-            key = f"pubmed/{source.id}/raw/{timestamp}_{uuid4().hex[:8]}.json"
-
-            await self._storage_service.record_store_operation(
-                configuration=backend,
-                key=key,
-                file_path=tmp_path,
-                content_type="application/json",
-                user_id=source.owner_id,
-                metadata={
-                    "source_id": str(source.id),
-                    "record_count": len(list(records)),
-                },
-            )
-        finally:
-            # clean up temp file
-            if tmp_path.exists():
-                tmp_path.unlink()
+        await self._storage_service.record_store_operation(
+            configuration=upload.backend,
+            key=f"{upload.run_key}/{segment.path.name}",
+            file_path=segment.path,
+            content_type=SPOOL_CONTENT_TYPE,
+            user_id=source.owner_id,
+            metadata={
+                "source_id": str(source.id),
+                "record_count": segment.record_count,
+                "sha256": segment.sha256,
+            },
+        )
+        segment.path.unlink(missing_ok=True)
 
     def _transform_records(
         self,
@@ -184,43 +250,13 @@ class PubMedIngestionService:
         self,
         publications: Iterable[publication.Publication],
     ) -> tuple[int, int, tuple[int, ...], tuple[int, ...]]:
-        created = 0
-        updated = 0
-        created_ids: list[int] = []
-        updated_ids: list[int] = []
-        for publication_record in publications:
-            pmid = publication_record.identifier.pubmed_id
-            if pmid and (existing := self._publication_repository.find_by_pmid(pmid)):
-                if existing.id is None:
-                    continue
-                updates = self._build_update_payload(publication_record)
-                updated_entity = self._publication_repository.update_publication(
-                    existing.id,
-                    updates,
-                )
-                if updated_entity.id is not None:
-                    updated_ids.append(updated_entity.id)
-                updated += 1
-            else:
-                created_entity = self._publication_repository.create(publication_record)
-                if created_entity.id is not None:
-                    created_ids.append(created_entity.id)
-                created += 1
-        return created, updated, tuple(created_ids), tuple(updated_ids)
-
-    @staticmethod
-    def _build_update_payload(
-        publication: publication.Publication,
-    ) -> PublicationUpdate:
-        return {
-            "title": publication.title,
-            "authors": list(publication.authors),
-            "journal": publication.journal,
-            "publication_year": publication.publication_year,
-            "abstract": publication.abstract,
-            "doi": publication.identifier.doi,
-            "pmid": publication.identifier.pubmed_id,
-        }
+        result = self._publication_repository.upsert_many(publications)
+        return (
+            result.created,
+            result.updated,
+            result.created_ids,
+            result.updated_ids,
+        )
 
     @staticmethod
     def _build_config(
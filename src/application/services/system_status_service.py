@@ -19,6 +19,7 @@ if TYPE_CHECKING:
 
     from sqlalchemy.orm import Session
 
+    from src.application.services.authentication_cache import TokenValidationCache
     from src.domain.repositories.system_status_repository import SystemStatusRepository
     from src.type_definitions.system_status import (
         EnableMaintenanceRequest,
@@ -52,9 +53,11 @@ class SystemStatusService:
         self,
         repository: SystemStatusRepository,
         session_revoker: SessionRevocationContext,
+        token_cache: TokenValidationCache | None = None,
     ) -> None:
         self._repository = repository
         self._session_revoker = session_revoker
+        self._token_cache = token_cache
 
     async def get_maintenance_state(self) -> MaintenanceModeState:
         return await anyio.to_thread.run_sync(self._repository.get_maintenance_state)
@@ -79,6 +82,8 @@ class SystemStatusService:
             await anyio.to_thread.run_sync(
                 lambda: self._session_revoker.revoke_all(exclude_user_ids=exclude),
             )
+            if self._token_cache is not None:
+                self._token_cache.clear()
 
         return new_state
 
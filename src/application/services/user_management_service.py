@@ -19,6 +19,7 @@ from src.application.dto.auth_responses import (
     UserPublic,
     UserStatisticsResponse,
 )
+from src.application.services.authentication_cache import TokenValidationCache
 from src.domain.entities.user import User, UserRole, UserStatus
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.services.security.password_hasher import PasswordHasherService
@@ -59,9 +60,11 @@ class UserManagementService:
         self,
         user_repository: UserRepository,
         password_hasher: PasswordHasherService,
+        token_cache: TokenValidationCache | None = None,
     ):
         self.user_repository = user_repository
         self.password_hasher = password_hasher
+        self.token_cache = token_cache
 
     async def register_user(self, request: RegisterUserRequest) -> User:
         logger.debug("Starting register_user for %s", request.email)
@@ -163,7 +166,9 @@ class UserManagementService:
 
         user.updated_at = datetime.now(UTC)
 
-        return await self.user_repository.update(user)
+        updated = await self.user_repository.update(user)
+        self._forget_user(user_id)
+        return updated
 
     async def admin_update_user(
         self,
@@ -192,7 +197,9 @@ class UserManagementService:
 
         user.updated_at = datetime.now(UTC)
 
-        return await self.user_repository.update(user)
+        updated = await self.user_repository.update(user)
+        self._forget_user(user_id)
+        return updated
 
     async def change_password(
         self,
@@ -220,6 +227,7 @@ class UserManagementService:
         user.updated_at = datetime.now(UTC)
 
         await self.user_repository.update(user)
+        self._forget_user(user_id)
 
         # TODO: Send password changed notification
 
@@ -270,6 +278,7 @@ class UserManagementService:
         user.updated_at = datetime.now(UTC)
 
         await self.user_repository.update(user)
+        self._forget_user(user.id)
 
         # Revoke all sessions for security
         # TODO: await self.session_repository.revoke_all_user_sessions(user.id)
@@ -294,6 +303,7 @@ class UserManagementService:
         # Verify email
         user.mark_email_verified()
         await self.user_repository.update(user)
+        self._forget_user(user.id)
 
         # TODO: Send welcome email
 
@@ -307,6 +317,7 @@ class UserManagementService:
 
         # For now, hard delete
         await self.user_repository.delete(user_id)
+        self._forget_user(user_id)
 
         # TODO: Clean up related data (sessions, audit logs)
 
@@ -386,16 +397,23 @@ class UserManagementService:
             user_id,
             datetime.now(UTC) + timedelta(days=30),  # 30 day lock
         )
+        self._forget_user(user_id)
 
         # TODO: Log security event
         # TODO: Send notification email
 
     async def unlock_user_account(self, user_id: UUID) -> None:
         await self.user_repository.unlock_account(user_id)
+        self._forget_user(user_id)
 
         # TODO: Log security event
         # TODO: Send notification email
 
+    def _forget_user(self, user_id: UUID) -> None:
+        """Make the next request re-read the user instead of a cached copy."""
+        if self.token_cache is not None:
+            self.token_cache.invalidate_user(user_id)
+
     def _mask_email(self, email: str) -> str:
         try:
             local, domain = email.split("@", 1)
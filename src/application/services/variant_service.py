@@ -1,9 +1,15 @@
 """Application-level orchestration for variant workflows."""
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 
+from src.application.services.genomic_region_service import GenomicIndexCache
 from src.domain.entities.evidence import Evidence
 from src.domain.entities.variant import EvidenceSummary, Variant
+from src.domain.repositories.base import (
+    SeekPage,
+    SeekPosition,
+    TotalCount,
+)
 from src.domain.repositories.evidence_repository import EvidenceRepository
 from src.domain.repositories.variant_repository import VariantRepository
 from src.domain.services.variant_domain_service import VariantDomainService
@@ -28,6 +34,7 @@ class VariantApplicationService:
         variant_repository: VariantRepository,
         variant_domain_service: VariantDomainService,
         evidence_repository: EvidenceRepository,
+        index_cache: GenomicIndexCache | None = None,
     ):
         """
         Initialize the variant application service.
@@ -36,10 +43,12 @@ class VariantApplicationService:
             variant_repository: Domain repository for variants
             variant_domain_service: Domain service for variant business logic
             evidence_repository: Domain repository for evidence
+            index_cache: Region query indexes to invalidate after writes
         """
         self._variant_repository = variant_repository
         self._variant_domain_service = variant_domain_service
         self._evidence_repository = evidence_repository
+        self._index_cache = index_cache
 
     def create_variant(  # noqa: PLR0913 - explicit variant creation fields
         self,
@@ -121,12 +130,18 @@ class VariantApplicationService:
             raise ValueError(msg)
 
         # Persist the entity
-        return self._variant_repository.create(variant_entity)
+        created = self._variant_repository.create(variant_entity)
+        self._invalidate_region_index(created.chromosome)
+        return created
 
     def get_variant_by_id(self, variant_id: str) -> Variant | None:
         """Retrieve a variant by its variant_id."""
         return self._variant_repository.find_by_variant_id(variant_id)
 
+    def get_variants_by_ids(self, variant_ids: Iterable[int]) -> list[Variant]:
+        """Retrieve the variants with the given database IDs in one lookup."""
+        return self._variant_repository.find_by_ids(variant_ids)
+
     def get_variant_by_clinvar_id(self, clinvar_id: str) -> Variant | None:
         """Retrieve a variant by its ClinVar ID."""
         return self._variant_repository.find_by_clinvar_id(clinvar_id)
@@ -189,7 +204,7 @@ class VariantApplicationService:
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Variant], int]:
+    ) -> tuple[list[Variant], TotalCount]:
         """Retrieve paginated variants with optional filters."""
         normalized_filters = self._normalize_filters(filters)
         return self._variant_repository.paginate_variants(
@@ -200,6 +215,40 @@ class VariantApplicationService:
             normalized_filters,
         )
 
+    def list_variants_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: QueryFilters | None = None,
+    ) -> list[Variant]:
+        """Retrieve the next batch of variants after ``after_id`` in key order."""
+        normalized_filters = self._normalize_filters(filters)
+        return self._variant_repository.paginate_variants_keyset(
+            after_id,
+            limit,
+            normalized_filters,
+        )
+
+    def list_variants_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Variant]:
+        """Retrieve a keyset page of variants continuing after ``after``."""
+        return self._variant_repository.paginate_variants_seek(
+            after,
+            limit,
+            sort_by,
+            sort_order,
+            filters=self._normalize_filters(filters),
+            offset=offset,
+        )
+
     def update_variant(self, variant_id: int, updates: VariantUpdate) -> Variant:
         """Update variant fields."""
         if not updates:
@@ -207,6 +256,10 @@ class VariantApplicationService:
             raise ValueError(msg)
 
         updated_variant = self._variant_repository.update(variant_id, updates)
+        if "chromosome" in updates and self._index_cache is not None:
+            # The previous chromosome is unknown here
+            self._index_cache.invalidate()
+        self._invalidate_region_index(updated_variant.chromosome)
         return self._variant_domain_service.apply_business_logic(
             updated_variant,
             "update",
@@ -248,13 +301,15 @@ class VariantApplicationService:
             raise ValueError(msg)
 
         # Persist the changes
-        return self._variant_repository.update(
+        updated = self._variant_repository.update(
             variant_id,
             {
                 "variant_type": variant.variant_type,
                 "clinical_significance": variant.clinical_significance,
             },
         )
+        self._invalidate_region_index(updated.chromosome)
+        return updated
 
     def get_variant_with_evidence(self, variant_id: int) -> Variant | None:
         """
@@ -343,6 +398,10 @@ class VariantApplicationService:
         """
         return self._variant_repository.exists(variant_id)
 
+    def _invalidate_region_index(self, chromosome: str | None) -> None:
+        if self._index_cache is not None and chromosome:
+            self._index_cache.invalidate(chromosome)
+
     @staticmethod
     def _normalize_filters(
         filters: QueryFilters | None,
@@ -8,6 +8,7 @@ separation of concerns and dependency inversion.
 import types
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import date, datetime
 
 from src.type_definitions.common import QueryFilters
 
@@ -23,6 +24,43 @@ class QuerySpecification:
     offset: int | None = None
 
 
+@dataclass(frozen=True)
+class TotalCount:
+    """
+    Number of rows matching a paginated query.
+
+    ``exact`` is False when the value is a planner estimate rather than the
+    result of a ``COUNT``.
+    """
+
+    value: int
+    exact: bool = True
+
+
+type SortValue = str | int | float | bool | date | datetime | None
+
+
+@dataclass(frozen=True)
+class SeekPosition:
+    """Sort key and ID of the row a keyset page continues after."""
+
+    sort_value: SortValue
+    id: int
+
+
+@dataclass(frozen=True)
+class SeekPage[TEntity]:
+    """
+    One page of a keyset-paginated query.
+
+    ``next_position`` is None on the last page.
+    """
+
+    items: list[TEntity]
+    total: TotalCount
+    next_position: SeekPosition | None
+
+
 class Repository[TEntity, TId, TUpdate](ABC):
     """
     Abstract base repository interface.
@@ -109,5 +147,9 @@ class UnitOfWork(ABC):
 __all__ = [
     "QuerySpecification",
     "Repository",
+    "SeekPage",
+    "SeekPosition",
+    "SortValue",
+    "TotalCount",
     "UnitOfWork",
 ]
@@ -38,6 +38,13 @@ class DataSourceActivationRepository(ABC):
     ) -> dict[str, list[DataSourceActivation]]:
         """List activation rules for multiple catalog entries."""
 
+    @abstractmethod
+    def list_rules_for_scope(
+        self,
+        research_space_id: UUID | None = None,
+    ) -> list[DataSourceActivation]:
+        """List every global rule plus the rules of one research space."""
+
     @abstractmethod
     def set_rule(
         self,
@@ -6,9 +6,15 @@ the underlying implementation.
 """
 
 from abc import abstractmethod
+from collections.abc import Iterable
 
 from src.domain.entities.evidence import Evidence
-from src.domain.repositories.base import Repository
+from src.domain.repositories.base import (
+    Repository,
+    SeekPage,
+    SeekPosition,
+    TotalCount,
+)
 from src.type_definitions.common import EvidenceUpdate, QueryFilters
 
 
@@ -24,6 +30,18 @@ class EvidenceRepository(Repository[Evidence, int, EvidenceUpdate]):
     def find_by_variant(self, variant_id: int) -> list[Evidence]:
         """Find evidence records for a variant."""
 
+    def find_by_variants(self, variant_ids: Iterable[int]) -> list[Evidence]:
+        """
+        Find evidence records for any of the given variants, in ID order.
+
+        This default looks up each variant separately; persistent adapters
+        override it with a single query.
+        """
+        evidence: list[Evidence] = []
+        for variant_id in dict.fromkeys(variant_ids):
+            evidence.extend(self.find_by_variant(variant_id))
+        return sorted(evidence, key=lambda record: record.id or 0)
+
     @abstractmethod
     def find_by_phenotype(self, phenotype_id: int) -> list[Evidence]:
         """Find evidence records for a phenotype."""
@@ -85,9 +103,31 @@ class EvidenceRepository(Repository[Evidence, int, EvidenceUpdate]):
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Evidence], int]:
+    ) -> tuple[list[Evidence], TotalCount]:
         """Retrieve paginated evidence with optional filters."""
 
+    @abstractmethod
+    def paginate_evidence_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: QueryFilters | None = None,
+    ) -> list[Evidence]:
+        """Retrieve evidence ordered by primary key, starting after ``after_id``."""
+
+    @abstractmethod
+    def paginate_evidence_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Evidence]:
+        """Retrieve evidence in ``(sort_by, id)`` order, starting after ``after``."""
+
     @abstractmethod
     def get_evidence_statistics(self) -> dict[str, int | float | bool | str | None]:
         """Get statistics about evidence in the repository."""
@@ -8,7 +8,12 @@ the underlying implementation.
 from abc import abstractmethod
 
 from src.domain.entities.gene import Gene
-from src.domain.repositories.base import Repository
+from src.domain.repositories.base import (
+    Repository,
+    SeekPage,
+    SeekPosition,
+    TotalCount,
+)
 from src.domain.value_objects.identifiers import GeneIdentifier
 from src.type_definitions.common import GeneUpdate, JSONObject
 
@@ -49,9 +54,35 @@ class GeneRepository(Repository[Gene, int, GeneUpdate]):
         sort_by: str,
         sort_order: str,
         search: str | None = None,
-    ) -> tuple[list[Gene], int]:
+    ) -> tuple[list[Gene], TotalCount]:
         """Retrieve paginated genes with optional search and sorting."""
 
+    @abstractmethod
+    def paginate_genes_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        search: str | None = None,
+    ) -> list[Gene]:
+        """Retrieve genes ordered by primary key, starting after ``after_id``."""
+
+    @abstractmethod
+    def paginate_genes_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        search: str | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Gene]:
+        """Retrieve genes in ``(sort_by, id)`` order, starting after ``after``."""
+
+    @abstractmethod
+    def find_by_chromosome(self, chromosome: str) -> list[Gene]:
+        """Find genes with known coordinates on a chromosome, ordered by start."""
+
     @abstractmethod
     def find_with_variants(self, gene_id: int) -> Gene | None:
         """Find a gene with its associated variants loaded."""
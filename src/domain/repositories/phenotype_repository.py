@@ -6,9 +6,15 @@ the underlying implementation.
 """
 
 from abc import abstractmethod
+from collections.abc import Iterable
 
 from src.domain.entities.phenotype import Phenotype
-from src.domain.repositories.base import Repository
+from src.domain.repositories.base import (
+    Repository,
+    SeekPage,
+    SeekPosition,
+    TotalCount,
+)
 from src.type_definitions.common import PhenotypeUpdate, QueryFilters
 
 
@@ -24,6 +30,20 @@ class PhenotypeRepository(Repository[Phenotype, int, PhenotypeUpdate]):
     def find_by_hpo_id(self, hpo_id: str) -> Phenotype | None:
         """Find a phenotype by its HPO ID."""
 
+    def find_by_ids(self, phenotype_ids: Iterable[int]) -> list[Phenotype]:
+        """
+        Find the phenotypes with the given IDs; missing IDs are skipped.
+
+        This default looks up each ID separately; persistent adapters override
+        it with a single query.
+        """
+        phenotypes: list[Phenotype] = []
+        for phenotype_id in dict.fromkeys(phenotype_ids):
+            phenotype = self.get_by_id(phenotype_id)
+            if phenotype is not None:
+                phenotypes.append(phenotype)
+        return phenotypes
+
     @abstractmethod
     def find_by_name(self, name: str, *, fuzzy: bool = False) -> list[Phenotype]:
         """Find phenotypes by name (exact or fuzzy match)."""
@@ -61,9 +81,31 @@ class PhenotypeRepository(Repository[Phenotype, int, PhenotypeUpdate]):
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Phenotype], int]:
+    ) -> tuple[list[Phenotype], TotalCount]:
         """Retrieve paginated phenotypes with optional filters."""
 
+    @abstractmethod
+    def paginate_phenotypes_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: QueryFilters | None = None,
+    ) -> list[Phenotype]:
+        """Retrieve phenotypes ordered by primary key, starting after ``after_id``."""
+
+    @abstractmethod
+    def paginate_phenotypes_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Phenotype]:
+        """Retrieve phenotypes in ``(sort_by, id)`` order, starting after ``after``."""
+
     @abstractmethod
     def get_phenotype_statistics(self) -> dict[str, int | float | bool | str | None]:
         """Get statistics about phenotypes in the repository."""
@@ -6,11 +6,31 @@ the underlying implementation.
 """
 
 from abc import abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
 
 from src.domain.entities.publication import Publication
-from src.domain.repositories.base import Repository
+from src.domain.repositories.base import Repository, TotalCount
 from src.type_definitions.common import PublicationUpdate, QueryFilters
 
+DEFAULT_UPSERT_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class PublicationUpsertResult:
+    """
+    Publications created or updated by a bulk upsert.
+
+    ``skipped`` counts publications rejected because another publication
+    already holds their DOI or PMC ID.
+    """
+
+    created: int = 0
+    updated: int = 0
+    created_ids: tuple[int, ...] = ()
+    updated_ids: tuple[int, ...] = ()
+    skipped: int = 0
+
 
 class PublicationRepository(Repository[Publication, int, PublicationUpdate]):
     """
@@ -24,6 +44,20 @@ class PublicationRepository(Repository[Publication, int, PublicationUpdate]):
     def find_by_pmid(self, pmid: str) -> Publication | None:
         """Find a publication by PubMed ID."""
 
+    def find_by_ids(self, publication_ids: Iterable[int]) -> list[Publication]:
+        """
+        Find the publications with the given IDs; missing IDs are skipped.
+
+        This default looks up each ID separately; persistent adapters override
+        it with a single query.
+        """
+        publications: list[Publication] = []
+        for publication_id in dict.fromkeys(publication_ids):
+            publication = self.get_by_id(publication_id)
+            if publication is not None:
+                publications.append(publication)
+        return publications
+
     @abstractmethod
     def find_by_doi(self, doi: str) -> Publication | None:
         """Find a publication by DOI."""
@@ -65,7 +99,7 @@ class PublicationRepository(Repository[Publication, int, PublicationUpdate]):
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Publication], int]:
+    ) -> tuple[list[Publication], TotalCount]:
         """Retrieve paginated publications with optional filters."""
 
     @abstractmethod
@@ -92,5 +126,64 @@ class PublicationRepository(Repository[Publication, int, PublicationUpdate]):
     ) -> Publication:
         """Update a publication with type-safe update parameters."""
 
-
-__all__ = ["PublicationRepository"]
+    def upsert_many(
+        self,
+        publications: Iterable[Publication],
+        batch_size: int = DEFAULT_UPSERT_BATCH_SIZE,
+    ) -> PublicationUpsertResult:
+        """
+        Create or update publications keyed by PubMed ID.
+
+        Existing publications receive the citation fields of
+        ``upsert_update_payload``. This default issues one lookup and one write
+        per publication; persistent adapters override it with batched writes
+        that commit once per ``batch_size`` publications.
+        """
+        _ = batch_size
+        created = 0
+        updated = 0
+        created_ids: list[int] = []
+        updated_ids: list[int] = []
+        for publication in publications:
+            pmid = publication.identifier.pubmed_id
+            existing = self.find_by_pmid(pmid) if pmid else None
+            if existing is None:
+                created_entity = self.create(publication)
+                if created_entity.id is not None:
+                    created_ids.append(created_entity.id)
+                created += 1
+            elif existing.id is not None:
+                updated_entity = self.update_publication(
+                    existing.id,
+                    upsert_update_payload(publication),
+                )
+                if updated_entity.id is not None:
+                    updated_ids.append(updated_entity.id)
+                updated += 1
+        return PublicationUpsertResult(
+            created=created,
+            updated=updated,
+            created_ids=tuple(created_ids),
+            updated_ids=tuple(updated_ids),
+        )
+
+
+def upsert_update_payload(publication: Publication) -> PublicationUpdate:
+    """Fields refreshed on an existing publication when it is upserted."""
+    return {
+        "title": publication.title,
+        "authors": list(publication.authors),
+        "journal": publication.journal,
+        "publication_year": publication.publication_year,
+        "abstract": publication.abstract,
+        "doi": publication.identifier.doi,
+        "pmid": publication.identifier.pubmed_id,
+    }
+
+
+__all__ = [
+    "DEFAULT_UPSERT_BATCH_SIZE",
+    "PublicationRepository",
+    "PublicationUpsertResult",
+    "upsert_update_payload",
+]
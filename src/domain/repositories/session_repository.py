@@ -5,10 +5,31 @@ Defines the contract for session data persistence operations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from src.domain.entities.session import UserSession
+from src.domain.entities.session import SessionStatus, UserSession
+
+
+@dataclass(frozen=True)
+class SessionActivityUpdate:
+    """Latest activity timestamp and (possibly extended) expiry of a session."""
+
+    session_id: UUID
+    last_activity: datetime
+    expires_at: datetime
+    refresh_expires_at: datetime
+
+    @classmethod
+    def from_session(cls, session: UserSession) -> "SessionActivityUpdate":
+        return cls(
+            session_id=session.id,
+            last_activity=session.last_activity,
+            expires_at=session.expires_at,
+            refresh_expires_at=session.refresh_expires_at,
+        )
 
 
 class SessionRepository(ABC):
@@ -210,3 +231,23 @@ class SessionRepository(ABC):
         Args:
             session_id: Session's unique identifier
         """
+
+    async def record_activity(self, updates: Sequence[SessionActivityUpdate]) -> None:
+        """
+        Persist coalesced activity for many sessions.
+
+        Only sessions that are still active are touched, so a late write
+        cannot revive a revoked session. Implementations should override
+        this with a single batched statement.
+
+        Args:
+            updates: Activity snapshots, at most one per session
+        """
+        for update in updates:
+            session = await self.get_by_id(update.session_id)
+            if session is None or session.status != SessionStatus.ACTIVE:
+                continue
+            session.last_activity = update.last_activity
+            session.expires_at = update.expires_at
+            session.refresh_expires_at = update.refresh_expires_at
+            await self.update(session)
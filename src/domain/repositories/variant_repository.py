@@ -6,9 +6,15 @@ the underlying implementation.
 """
 
 from abc import abstractmethod
+from collections.abc import Iterable
 
 from src.domain.entities.variant import Variant, VariantSummary
-from src.domain.repositories.base import Repository
+from src.domain.repositories.base import (
+    Repository,
+    SeekPage,
+    SeekPosition,
+    TotalCount,
+)
 from src.type_definitions.common import JSONObject, QueryFilters, VariantUpdate
 
 
@@ -24,6 +30,20 @@ class VariantRepository(Repository[Variant, int, VariantUpdate]):
     def find_by_variant_id(self, variant_id: str) -> Variant | None:
         """Find a variant by its variant_id."""
 
+    def find_by_ids(self, variant_ids: Iterable[int]) -> list[Variant]:
+        """
+        Find the variants with the given IDs; missing IDs are skipped.
+
+        This default looks up each ID separately; persistent adapters override
+        it with a single query.
+        """
+        variants: list[Variant] = []
+        for variant_id in dict.fromkeys(variant_ids):
+            variant = self.get_by_id(variant_id)
+            if variant is not None:
+                variants.append(variant)
+        return variants
+
     @abstractmethod
     def find_by_clinvar_id(self, clinvar_id: str) -> Variant | None:
         """Find a variant by its ClinVar ID."""
@@ -65,13 +85,42 @@ class VariantRepository(Repository[Variant, int, VariantUpdate]):
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Variant], int]:
+    ) -> tuple[list[Variant], TotalCount]:
         """Retrieve paginated variants with optional filters."""
 
+    @abstractmethod
+    def paginate_variants_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: QueryFilters | None = None,
+    ) -> list[Variant]:
+        """Retrieve variants ordered by primary key, starting after ``after_id``."""
+
+    @abstractmethod
+    def paginate_variants_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Variant]:
+        """Retrieve variants in ``(sort_by, id)`` order, starting after ``after``."""
+
     @abstractmethod
     def get_variant_summaries_by_gene(self, gene_id: int) -> list[VariantSummary]:
         """Get variant summaries for a gene."""
 
+    @abstractmethod
+    def get_variant_summaries_by_chromosome(
+        self,
+        chromosome: str,
+    ) -> list[VariantSummary]:
+        """Get summaries of every variant on a chromosome, ordered by position."""
+
     @abstractmethod
     def get_variant_statistics(self) -> JSONObject:
         """Get statistics about variants in the repository."""
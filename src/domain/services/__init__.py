@@ -8,11 +8,15 @@ that operate purely on domain entities and value objects.
 from .base import DomainService
 from .evidence_domain_service import EvidenceDomainService
 from .gene_domain_service import GeneDomainService
+from .genomic_index import GenomicInterval, GenomicIntervalIndex, GenomicPositionIndex
 from .variant_domain_service import VariantDomainService
 
 __all__ = [
     "DomainService",
     "EvidenceDomainService",
     "GeneDomainService",
+    "GenomicInterval",
+    "GenomicIntervalIndex",
+    "GenomicPositionIndex",
     "VariantDomainService",
 ]
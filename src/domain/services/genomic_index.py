@@ -0,0 +1,225 @@
+"""
+In-memory genomic indexes for overlap and region queries.
+
+Two structures are provided, both partitioned per chromosome and built lazily
+from sorted arrays the first time a chromosome is queried after a change:
+
+* ``GenomicIntervalIndex`` stores closed intervals (for example gene bodies)
+  in an implicit augmented interval tree: intervals are sorted by start and
+  the array itself is read as a balanced binary tree whose nodes carry the
+  maximum end coordinate of their subtree. Overlap queries run in
+  ``O(log n + k)`` without allocating tree nodes.
+* ``GenomicPositionIndex`` stores single positions (for example variants) in a
+  sorted array answered with ``bisect`` in ``O(log n + k)``.
+
+Coordinates are 1-based and inclusive on both ends, matching the gene and
+variant entities.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Subtrees at or below this height are scanned linearly; descending further
+# costs more in Python than checking the handful of remaining entries.
+_LINEAR_SCAN_LEVEL = 3
+
+
+@dataclass(frozen=True)
+class GenomicInterval[T]:
+    """Closed genomic interval carrying an arbitrary payload."""
+
+    chromosome: str
+    start: int
+    end: int
+    payload: T
+
+
+class _IntervalTree[T]:
+    """Implicit augmented interval tree over intervals of one chromosome."""
+
+    def __init__(self, intervals: list[GenomicInterval[T]]) -> None:
+        self.intervals = sorted(intervals, key=lambda item: (item.start, item.end))
+        self.starts = [item.start for item in self.intervals]
+        self.ends = [item.end for item in self.intervals]
+        self.max_ends = list(self.ends)
+        self.max_level = self._augment()
+
+    def _augment(self) -> int:
+        """Annotate each implicit node with the largest end in its subtree."""
+        size = len(self.intervals)
+        if size == 0:
+            return -1
+        max_ends = self.max_ends
+        last_index = 0
+        last_max = max_ends[0]
+        for index in range(0, size, 2):
+            last_index = index
+            last_max = max_ends[index]
+        level = 1
+        while (1 << level) <= size:
+            half = 1 << (level - 1)
+            for index in range((half << 1) - 1, size, half << 2):
+                left = max_ends[index - half]
+                right = max_ends[index + half] if index + half < size else last_max
+                max_ends[index] = max(max_ends[index], left, right)
+            last_index = (
+                last_index - half if (last_index >> level) & 1 else last_index + half
+            )
+            if last_index < size:
+                last_max = max(last_max, max_ends[last_index])
+            level += 1
+        return level - 1
+
+    def overlapping(self, start: int, end: int) -> list[GenomicInterval[T]]:
+        """Return intervals intersecting ``[start, end]`` ordered by start."""
+        size = len(self.intervals)
+        if size == 0:
+            return []
+        hits: list[int] = []
+        # Stack entries: (level, node index, left subtree already visited).
+        stack = [(self.max_level, (1 << self.max_level) - 1, False)]
+        while stack:
+            level, node, visited_left = stack.pop()
+            if level <= _LINEAR_SCAN_LEVEL:
+                first = node >> level << level
+                last = min(first + (1 << (level + 1)) - 1, size)
+                self._scan(first, last, start, end, hits)
+            elif not visited_left:
+                stack.append((level, node, True))
+                left = node - (1 << (level - 1))
+                if left >= size or self.max_ends[left] >= start:
+                    stack.append((level - 1, left, False))
+            elif node < size and self.starts[node] <= end:
+                if self.ends[node] >= start:
+                    hits.append(node)
+                stack.append((level - 1, node + (1 << (level - 1)), False))
+        hits.sort()
+        return [self.intervals[index] for index in hits]
+
+    def _scan(
+        self,
+        first: int,
+        last: int,
+        start: int,
+        end: int,
+        hits: list[int],
+    ) -> None:
+        """Linearly collect overlapping intervals in ``[first, last)``."""
+        for index in range(first, last):
+            if self.starts[index] > end:
+                break
+            if self.ends[index] >= start:
+                hits.append(index)
+
+
+class GenomicIntervalIndex[T]:
+    """Per-chromosome index answering interval overlap queries."""
+
+    def __init__(self, intervals: Iterable[GenomicInterval[T]] = ()) -> None:
+        self._pending: dict[str, list[GenomicInterval[T]]] = {}
+        self._trees: dict[str, _IntervalTree[T]] = {}
+        self._size = 0
+        self.extend(intervals)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, chromosome: str, start: int, end: int, payload: T) -> None:
+        """Index the closed interval ``[start, end]`` on ``chromosome``."""
+        if end < start:
+            msg = "Interval end must be greater than or equal to start"
+            raise ValueError(msg)
+        interval = GenomicInterval(chromosome, start, end, payload)
+        tree = self._trees.pop(chromosome, None)
+        bucket = self._pending.setdefault(
+            chromosome,
+            tree.intervals if tree is not None else [],
+        )
+        bucket.append(interval)
+        self._size += 1
+
+    def extend(self, intervals: Iterable[GenomicInterval[T]]) -> None:
+        """Bulk-load intervals; trees are rebuilt once on the next query."""
+        for interval in intervals:
+            self.add(
+                interval.chromosome,
+                interval.start,
+                interval.end,
+                interval.payload,
+            )
+
+    def chromosomes(self) -> list[str]:
+        """Chromosomes holding at least one interval."""
+        return sorted(set(self._trees) | set(self._pending))
+
+    def overlapping(
+        self,
+        chromosome: str,
+        start: int,
+        end: int,
+    ) -> list[GenomicInterval[T]]:
+        """Intervals on ``chromosome`` intersecting ``[start, end]``."""
+        tree = self._tree(chromosome)
+        return tree.overlapping(start, end) if tree is not None else []
+
+    def containing(self, chromosome: str, position: int) -> list[GenomicInterval[T]]:
+        """Intervals on ``chromosome`` that cover ``position``."""
+        return self.overlapping(chromosome, position, position)
+
+    def _tree(self, chromosome: str) -> _IntervalTree[T] | None:
+        pending = self._pending.pop(chromosome, None)
+        if pending is not None:
+            self._trees[chromosome] = _IntervalTree(pending)
+        return self._trees.get(chromosome)
+
+
+class GenomicPositionIndex[T]:
+    """Per-chromosome sorted index of single positions answered via bisect."""
+
+    def __init__(self, positions: Iterable[tuple[str, int, T]] = ()) -> None:
+        self._entries: dict[str, list[tuple[int, T]]] = {}
+        self._positions: dict[str, list[int]] = {}
+        self._dirty: set[str] = set()
+        self._size = 0
+        self.extend(positions)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, chromosome: str, position: int, payload: T) -> None:
+        """Index ``payload`` at ``position`` on ``chromosome``."""
+        self._entries.setdefault(chromosome, []).append((position, payload))
+        self._dirty.add(chromosome)
+        self._size += 1
+
+    def extend(self, positions: Iterable[tuple[str, int, T]]) -> None:
+        """Bulk-load ``(chromosome, position, payload)`` triples."""
+        for chromosome, position, payload in positions:
+            self.add(chromosome, position, payload)
+
+    def chromosomes(self) -> list[str]:
+        """Chromosomes holding at least one position."""
+        return sorted(self._entries)
+
+    def in_region(self, chromosome: str, start: int, end: int) -> list[T]:
+        """Payloads positioned within ``[start, end]`` ordered by position."""
+        entries = self._entries.get(chromosome)
+        if not entries or end < start:
+            return []
+        if chromosome in self._dirty:
+            entries.sort(key=lambda entry: entry[0])
+            self._positions[chromosome] = [entry[0] for entry in entries]
+            self._dirty.discard(chromosome)
+        positions = self._positions[chromosome]
+        first = bisect_left(positions, start)
+        last = bisect_right(positions, end, lo=first)
+        return [entries[index][1] for index in range(first, last)]
+
+
+__all__ = ["GenomicInterval", "GenomicIntervalIndex", "GenomicPositionIndex"]
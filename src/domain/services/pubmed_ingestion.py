@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator  # noqa: TCH003
 from dataclasses import dataclass
 from typing import Protocol
 from uuid import UUID  # noqa: TCH003
@@ -16,6 +17,9 @@ class PubMedGateway(Protocol):
     async def fetch_records(self, config: PubMedQueryConfig) -> list[RawRecord]:
         """Fetch raw PubMed records according to per-source configuration."""
 
+    def stream_records(self, config: PubMedQueryConfig) -> AsyncIterator[RawRecord]:
+        """Yield raw PubMed records as they are fetched, without buffering them."""
+
 
 @dataclass(frozen=True)
 class PubMedIngestionSummary:
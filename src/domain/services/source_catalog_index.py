@@ -0,0 +1,252 @@
+"""
+In-memory search index over the data source catalog.
+
+The catalog is small and read-mostly, so the whole of it is indexed in
+process and every catalog query is answered without touching the database:
+
+* Entry text (name, tags, description) is split into lowercase word tokens.
+  Each token maps to the entries containing it together with the weight of
+  the best field it appears in (name > tags > description).
+* Query tokens match vocabulary tokens exactly, by prefix (``bisect`` over
+  the sorted vocabulary), as an infix (candidates from a trigram index,
+  verified with ``in``), or approximately for typos (trigram similarity).
+* Every query token has to match for an entry to be returned; entries are
+  ranked by the summed match scores, then by usage and name length.
+
+Indexes are immutable snapshots, so readers never need a lock. ``with_entry``
+returns a new index reflecting an updated entry.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.domain.entities.data_discovery_session import SourceCatalogEntry
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+NAME_WEIGHT = 3.0
+TAG_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.8
+INFIX_MATCH = 0.5
+# Typo matches score at most this, scaled by trigram similarity.
+FUZZY_MATCH = 0.4
+MIN_FUZZY_SIMILARITY = 0.4
+MIN_FUZZY_TOKEN_LENGTH = 4
+PHRASE_BONUS = 2.0
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(token: str) -> frozenset[str]:
+    """Character trigrams of a token, padded so short tokens still have some."""
+    padded = f"  {token} "
+    return frozenset(padded[index : index + 3] for index in range(len(padded) - 2))
+
+
+@dataclass(frozen=True)
+class _SearchableText:
+    """The fields of an entry that the index is built from."""
+
+    name: str
+    category: str
+    description: str
+    tags: tuple[str, ...]
+    is_active: bool
+
+    @classmethod
+    def of(cls, entry: SourceCatalogEntry) -> _SearchableText:
+        return cls(
+            name=entry.name,
+            category=entry.category,
+            description=entry.description,
+            tags=tuple(entry.tags),
+            is_active=entry.is_active,
+        )
+
+
+class SourceCatalogIndex:
+    """Immutable, typo-tolerant search index over catalog entries."""
+
+    def __init__(self, entries: Iterable[SourceCatalogEntry] = ()) -> None:
+        self._entries: dict[str, SourceCatalogEntry] = {
+            entry.id: entry for entry in entries
+        }
+        self._text: dict[str, _SearchableText] = {}
+        self._phrases: dict[str, str] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        for entry in self._entries.values():
+            self._add(entry)
+        self._vocabulary = sorted(self._postings)
+        self._trigram_tokens: dict[str, list[str]] = {}
+        self._gram_counts: dict[str, int] = {}
+        for token in self._vocabulary:
+            grams = trigrams(token)
+            self._gram_counts[token] = len(grams)
+            for gram in grams:
+                self._trigram_tokens.setdefault(gram, []).append(token)
+
+    def _add(self, entry: SourceCatalogEntry) -> None:
+        self._text[entry.id] = _SearchableText.of(entry)
+        self._phrases[entry.id] = " ".join(tokenize(entry.name))
+        fields = (
+            (entry.name, NAME_WEIGHT),
+            (" ".join(entry.tags), TAG_WEIGHT),
+            (entry.description, DESCRIPTION_WEIGHT),
+        )
+        for text, weight in fields:
+            for token in tokenize(text):
+                postings = self._postings.setdefault(token, {})
+                if postings.get(entry.id, 0.0) < weight:
+                    postings[entry.id] = weight
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, entry_id: str) -> SourceCatalogEntry | None:
+        return self._entries.get(entry_id)
+
+    def with_entry(self, entry: SourceCatalogEntry) -> SourceCatalogIndex:
+        """
+        Return an index with ``entry`` added or replaced.
+
+        When only non-searchable fields changed (for example usage
+        statistics) the token structures are shared with this index.
+        """
+        text = self._text.get(entry.id)
+        if text is None or text != _SearchableText.of(entry):
+            entries = dict(self._entries)
+            entries[entry.id] = entry
+            return SourceCatalogIndex(entries.values())
+        updated = copy.copy(self)
+        updated._entries = {**self._entries, entry.id: entry}  # noqa: SLF001 - own copy
+        return updated
+
+    def all(self, *, active_only: bool = False) -> list[SourceCatalogEntry]:
+        """Entries ordered by category and name."""
+        entries = [
+            entry
+            for entry in self._entries.values()
+            if entry.is_active or not active_only
+        ]
+        return sorted(entries, key=lambda entry: (entry.category, entry.name))
+
+    def by_category(self, category: str) -> list[SourceCatalogEntry]:
+        """Active entries in ``category`` ordered by name."""
+        entries = [
+            entry
+            for entry in self._entries.values()
+            if entry.is_active and entry.category == category
+        ]
+        return sorted(entries, key=lambda entry: entry.name)
+
+    def search(
+        self,
+        query: str,
+        category: str | None = None,
+        *,
+        limit: int | None = None,
+    ) -> list[SourceCatalogEntry]:
+        """
+        Rank active entries matching every token of ``query``.
+
+        Args:
+            query: Free-text query; may be partial or misspelled
+            category: Optional category filter
+            limit: Maximum number of entries to return
+
+        Returns:
+            Matching entries, best match first
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+
+        first, *rest = dict.fromkeys(query_tokens)
+        scores = self._score_token(first)
+        for query_token in rest:
+            if not scores:
+                break
+            token_scores = self._score_token(query_token)
+            scores = {
+                entry_id: score + token_scores[entry_id]
+                for entry_id, score in scores.items()
+                if entry_id in token_scores
+            }
+
+        phrase = " ".join(query_tokens)
+        ranked: list[tuple[float, int, SourceCatalogEntry]] = []
+        for entry_id, score in scores.items():
+            entry = self._entries[entry_id]
+            if not entry.is_active or (category and entry.category != category):
+                continue
+            name = self._phrases[entry_id]
+            bonus = PHRASE_BONUS if phrase in name else 0.0
+            ranked.append((score + bonus, name.count(" "), entry))
+        # Ties go to the most used entry, then to the shortest name.
+        ranked.sort(
+            key=lambda item: (
+                -item[0],
+                -item[2].usage_count,
+                item[1],
+                item[2].category,
+                item[2].name,
+            ),
+        )
+        results = [entry for _score, _length, entry in ranked]
+        return results[:limit] if limit is not None else results
+
+    def _score_token(self, query_token: str) -> dict[str, float]:
+        """Best score per entry for a single query token."""
+        matches: dict[str, float] = {}
+        for token, quality in self._matching_tokens(query_token).items():
+            for entry_id, weight in self._postings[token].items():
+                score = quality * weight
+                if score > matches.get(entry_id, 0.0):
+                    matches[entry_id] = score
+        return matches
+
+    def _matching_tokens(self, query_token: str) -> dict[str, float]:
+        """Vocabulary tokens matching ``query_token`` with their match quality."""
+        matched: dict[str, float] = {}
+        vocabulary = self._vocabulary
+        index = bisect_left(vocabulary, query_token)
+        while index < len(vocabulary) and vocabulary[index].startswith(query_token):
+            token = vocabulary[index]
+            matched[token] = EXACT_MATCH if token == query_token else PREFIX_MATCH
+            index += 1
+
+        query_grams = trigrams(query_token)
+        candidates: dict[str, int] = {}
+        for gram in query_grams:
+            for token in self._trigram_tokens.get(gram, ()):
+                candidates[token] = candidates.get(token, 0) + 1
+        for token, shared in candidates.items():
+            if token in matched:
+                continue
+            if query_token in token:
+                matched[token] = INFIX_MATCH
+                continue
+            if len(query_token) < MIN_FUZZY_TOKEN_LENGTH:
+                continue
+            # Jaccard similarity of the two trigram sets.
+            similarity = shared / (len(query_grams) + self._gram_counts[token] - shared)
+            if similarity >= MIN_FUZZY_SIMILARITY:
+                matched[token] = FUZZY_MATCH * similarity
+        return matched
+
+
+__all__ = ["SourceCatalogIndex", "tokenize", "trigrams"]
@@ -7,10 +7,12 @@ creating a unified view of related biomedical information.
 
 from .cross_reference_mapper import CrossReferenceMapper
 from .gene_variant_mapper import GeneVariantMapper
+from .variant_phenotype_index import VariantPhenotypeCandidateIndex
 from .variant_phenotype_mapper import VariantPhenotypeMapper
 
 __all__ = [
     "CrossReferenceMapper",
     "GeneVariantMapper",
+    "VariantPhenotypeCandidateIndex",
     "VariantPhenotypeMapper",
 ]
@@ -6,7 +6,11 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Protocol
 
+from src.domain.services.genomic_index import GenomicIntervalIndex
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from src.domain.transform.normalizers.variant_normalizer import GenomicLocation
     from src.type_definitions.common import JSONValue
 else:
@@ -54,6 +58,7 @@ class GeneVariantMapper:
         self.gene_coordinates: dict[str, tuple[str, int, int]] = {}
         self.gene_to_variants: dict[str, list[GeneVariantLink]] = {}
         self.variant_to_genes: dict[str, list[GeneVariantLink]] = {}
+        self._gene_index: GenomicIntervalIndex[str] | None = None
 
     def add_gene_coordinates(
         self,
@@ -63,6 +68,49 @@ class GeneVariantMapper:
         end_pos: int,
     ) -> None:
         self.gene_coordinates[gene_id] = (chromosome, start_pos, end_pos)
+        self._gene_index = None
+
+    def load_gene_coordinates(
+        self,
+        coordinates: Iterable[tuple[str, str, int, int]],
+    ) -> None:
+        """Bulk-load ``(gene_id, chromosome, start, end)`` rows."""
+        for gene_id, chromosome, start_pos, end_pos in coordinates:
+            self.gene_coordinates[gene_id] = (chromosome, start_pos, end_pos)
+        self._gene_index = None
+
+    def find_genes_near(self, chromosome: str, position: int) -> list[str]:
+        """
+        Gene IDs whose body or flanking window covers ``position``.
+
+        The window extends ``UPSTREAM_PADDING_BP`` before the gene start and
+        ``DOWNSTREAM_PADDING_BP`` after its end, so the query interval is
+        padded the opposite way round. Results are ordered by gene start.
+        """
+        hits = self._genes_index().overlapping(
+            chromosome,
+            position - DOWNSTREAM_PADDING_BP,
+            position + UPSTREAM_PADDING_BP,
+        )
+        return [hit.payload for hit in hits]
+
+    def map_variant_to_genes(self, variant: VariantLike) -> list[GeneVariantLink]:
+        """Link ``variant`` to every indexed gene overlapping or flanking it."""
+        variant_location = variant.genomic_location
+        if variant_location is None:
+            return []
+        chromosome = variant_location.chromosome
+        position = variant_location.position
+        if chromosome is None or position is None:
+            return []
+
+        links: list[GeneVariantLink] = []
+        for gene_id in self.find_genes_near(chromosome, position):
+            _gene_chrom, gene_start, gene_end = self.gene_coordinates[gene_id]
+            link = self._build_link(gene_id, gene_start, gene_end, position, variant)
+            if link is not None:
+                links.append(link)
+        return links
 
     def map_gene_variant_relationship(
         self,
@@ -84,6 +132,22 @@ class GeneVariantMapper:
         if chromosome != gene_chrom:
             return None
 
+        return self._build_link(
+            gene.primary_id,
+            gene_start,
+            gene_end,
+            position,
+            variant,
+        )
+
+    def _build_link(
+        self,
+        gene_id: str,
+        gene_start: int,
+        gene_end: int,
+        position: int,
+        variant: VariantLike,
+    ) -> GeneVariantLink | None:
         relationship = self._determine_relationship_type(
             gene_start,
             gene_end,
@@ -94,7 +158,7 @@ class GeneVariantMapper:
             return None
 
         link = GeneVariantLink(
-            gene_id=gene.primary_id,
+            gene_id=gene_id,
             variant_id=variant.primary_id,
             relationship_type=relationship,
             confidence_score=0.8,
@@ -107,6 +171,14 @@ class GeneVariantMapper:
         self.variant_to_genes.setdefault(link.variant_id, []).append(link)
         return link
 
+    def _genes_index(self) -> GenomicIntervalIndex[str]:
+        if self._gene_index is None:
+            index: GenomicIntervalIndex[str] = GenomicIntervalIndex()
+            for gene_id, (chromosome, start, end) in self.gene_coordinates.items():
+                index.add(chromosome, start, end, gene_id)
+            self._gene_index = index
+        return self._gene_index
+
     def find_variants_for_gene(self, gene_id: str) -> list[GeneVariantLink]:
         return list(self.gene_to_variants.get(gene_id, []))
 
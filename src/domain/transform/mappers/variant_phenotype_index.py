@@ -0,0 +1,57 @@
+"""
+Candidate generation for variant-phenotype linking.
+
+Builds inverted indexes over normalized phenotypes so the mapping stage only
+scores variant/phenotype pairs that the relationship rules can accept, rather
+than evaluating the full variant x phenotype cross product.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from src.domain.transform.normalizers.phenotype_normalizer import (
+        NormalizedPhenotype,
+    )
+
+
+class VariantPhenotypeCandidateIndex:
+    """
+    Inverted index of phenotypes keyed by the attributes linking rules consult.
+
+    ``VariantPhenotypeMapper`` decides a relationship from the variant's
+    clinical significance, falling back to a source match between variant
+    and phenotype. The index therefore keys phenotypes by source and keeps
+    the original insertion order so generated links match the nested-loop
+    ordering exactly.
+    """
+
+    def __init__(self, phenotypes: Iterable[NormalizedPhenotype]) -> None:
+        self._phenotypes: list[NormalizedPhenotype] = []
+        self._by_source: dict[str, list[NormalizedPhenotype]] = defaultdict(list)
+        for phenotype in phenotypes:
+            self._phenotypes.append(phenotype)
+            self._by_source[phenotype.source].append(phenotype)
+
+    def __len__(self) -> int:
+        return len(self._phenotypes)
+
+    @property
+    def phenotypes(self) -> Sequence[NormalizedPhenotype]:
+        """All indexed phenotypes in insertion order."""
+        return self._phenotypes
+
+    def phenotypes_from_source(self, source: str) -> Sequence[NormalizedPhenotype]:
+        """Phenotypes originating from ``source`` in insertion order."""
+        return self._by_source.get(source, ())
+
+    def source_counts(self) -> dict[str, int]:
+        """Number of indexed phenotypes per source."""
+        return {source: len(items) for source, items in self._by_source.items()}
+
+
+__all__ = ["VariantPhenotypeCandidateIndex"]
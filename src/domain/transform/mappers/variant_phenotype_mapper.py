@@ -7,9 +7,13 @@ correlation analysis.
 """
 
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 
+from src.domain.transform.mappers.variant_phenotype_index import (
+    VariantPhenotypeCandidateIndex,
+)
 from src.domain.transform.normalizers.phenotype_normalizer import (
     NormalizedPhenotype,
     PhenotypeNormalizer,
@@ -55,6 +59,9 @@ class VariantPhenotypeMapper:
     between genetic variants and phenotypic manifestations.
     """
 
+    # Source for which matching variant/phenotype origins imply an association.
+    _SOURCE_MATCH_FALLBACK = "clinvar"
+
     def __init__(
         self,
         variant_normalizer: VariantNormalizer | None = None,
@@ -94,40 +101,96 @@ class VariantPhenotypeMapper:
         )
 
         if relationship:
-            link = VariantPhenotypeLink(
-                variant_id=variant.primary_id,
-                phenotype_id=phenotype.primary_id,
-                relationship_type=relationship,
-                confidence_score=self._calculate_confidence(
-                    variant,
-                    phenotype,
-                    evidence_data,
-                ),
-                evidence_sources=self._collect_evidence_sources(
-                    variant,
-                    phenotype,
-                    evidence_data,
-                ),
-                clinical_significance=variant.clinical_significance,
-                inheritance_pattern=self._infer_inheritance_pattern(
-                    variant,
-                    evidence_data,
-                ),
-                penetrance=self._infer_penetrance(variant, evidence_data),
+            return self._record_link(variant, phenotype, relationship, evidence_data)
+
+        return None
+
+    def map_variant_phenotype_relationships(
+        self,
+        variants: Sequence[NormalizedVariant],
+        phenotypes: Sequence[NormalizedPhenotype] | VariantPhenotypeCandidateIndex,
+    ) -> list[VariantPhenotypeLink]:
+        """
+        Link many variants to many phenotypes without scoring the cross product.
+
+        Produces the same links, in the same order, as calling
+        ``map_variant_phenotype_relationship`` for every (variant, phenotype)
+        pair, but only visits phenotypes that can satisfy the relationship
+        rules for each variant.
+
+        Args:
+            variants: Normalized variants to link
+            phenotypes: Normalized phenotypes, or a prebuilt candidate index
+
+        Returns:
+            List of created variant-phenotype links
+        """
+        index = (
+            phenotypes
+            if isinstance(phenotypes, VariantPhenotypeCandidateIndex)
+            else VariantPhenotypeCandidateIndex(phenotypes)
+        )
+        links: list[VariantPhenotypeLink] = []
+        if not len(index):
+            return links
+
+        for variant in variants:
+            relationship = self._relationship_from_significance(variant)
+            if relationship is not None:
+                candidates = index.phenotypes
+            elif variant.source == self._SOURCE_MATCH_FALLBACK:
+                relationship = VariantPhenotypeRelationship.ASSOCIATED
+                candidates = index.phenotypes_from_source(variant.source)
+            else:
+                continue
+
+            links.extend(
+                self._record_link(variant, phenotype, relationship, None)
+                for phenotype in candidates
             )
 
-            # Cache the mapping
-            if variant.primary_id not in self.variant_to_phenotypes:
-                self.variant_to_phenotypes[variant.primary_id] = []
-            self.variant_to_phenotypes[variant.primary_id].append(link)
+        return links
 
-            if phenotype.primary_id not in self.phenotype_to_variants:
-                self.phenotype_to_variants[phenotype.primary_id] = []
-            self.phenotype_to_variants[phenotype.primary_id].append(link)
+    def _record_link(
+        self,
+        variant: NormalizedVariant,
+        phenotype: NormalizedPhenotype,
+        relationship: VariantPhenotypeRelationship,
+        evidence_data: JSONObject | None,
+    ) -> VariantPhenotypeLink:
+        """Build a link and register it in both lookup caches."""
+        link = VariantPhenotypeLink(
+            variant_id=variant.primary_id,
+            phenotype_id=phenotype.primary_id,
+            relationship_type=relationship,
+            confidence_score=self._calculate_confidence(
+                variant,
+                phenotype,
+                evidence_data,
+            ),
+            evidence_sources=self._collect_evidence_sources(
+                variant,
+                phenotype,
+                evidence_data,
+            ),
+            clinical_significance=variant.clinical_significance,
+            inheritance_pattern=self._infer_inheritance_pattern(
+                variant,
+                evidence_data,
+            ),
+            penetrance=self._infer_penetrance(variant, evidence_data),
+        )
 
-            return link
+        # Cache the mapping
+        if variant.primary_id not in self.variant_to_phenotypes:
+            self.variant_to_phenotypes[variant.primary_id] = []
+        self.variant_to_phenotypes[variant.primary_id].append(link)
 
-        return None
+        if phenotype.primary_id not in self.phenotype_to_variants:
+            self.phenotype_to_variants[phenotype.primary_id] = []
+        self.phenotype_to_variants[phenotype.primary_id].append(link)
+
+        return link
 
     def _determine_relationship_type(
         self,
@@ -138,22 +201,9 @@ class VariantPhenotypeMapper:
         """Determine the type of relationship between variant and phenotype."""
 
         # Check clinical significance from variant
-        clinical_sig_raw = variant.clinical_significance
-        sig_lower = (
-            clinical_sig_raw.lower() if isinstance(clinical_sig_raw, str) else None
-        )
-        if sig_lower:
-            if any(term in sig_lower for term in ["pathogenic", "likely pathogenic"]):
-                return VariantPhenotypeRelationship.CAUSATIVE
-
-            if "benign" in sig_lower or "likely benign" in sig_lower:
-                return VariantPhenotypeRelationship.PROTECTIVE
-
-            if "uncertain" in sig_lower:
-                return VariantPhenotypeRelationship.UNCERTAIN
-
-            if "risk" in sig_lower:
-                return VariantPhenotypeRelationship.RISK_FACTOR
+        relationship = self._relationship_from_significance(variant)
+        if relationship is not None:
+            return relationship
 
         # Check evidence data
         if evidence_data:
@@ -173,11 +223,40 @@ class VariantPhenotypeMapper:
                 return VariantPhenotypeRelationship.MODIFIER
 
         # Default to associated if we have any evidence
-        if variant.source == "clinvar" and phenotype.source == "clinvar":
+        if (
+            variant.source == self._SOURCE_MATCH_FALLBACK
+            and phenotype.source == self._SOURCE_MATCH_FALLBACK
+        ):
             return VariantPhenotypeRelationship.ASSOCIATED
 
         return None
 
+    @staticmethod
+    def _relationship_from_significance(
+        variant: NormalizedVariant,
+    ) -> VariantPhenotypeRelationship | None:
+        """Derive a relationship from the variant's clinical significance alone."""
+        clinical_sig_raw = variant.clinical_significance
+        sig_lower = (
+            clinical_sig_raw.lower() if isinstance(clinical_sig_raw, str) else None
+        )
+        if not sig_lower:
+            return None
+
+        if any(term in sig_lower for term in ["pathogenic", "likely pathogenic"]):
+            return VariantPhenotypeRelationship.CAUSATIVE
+
+        if "benign" in sig_lower or "likely benign" in sig_lower:
+            return VariantPhenotypeRelationship.PROTECTIVE
+
+        if "uncertain" in sig_lower:
+            return VariantPhenotypeRelationship.UNCERTAIN
+
+        if "risk" in sig_lower:
+            return VariantPhenotypeRelationship.RISK_FACTOR
+
+        return None
+
     def _calculate_confidence(
         self,
         variant: NormalizedVariant,
@@ -0,0 +1,227 @@
+"""
+Append-only, compressed spool of raw source records.
+
+Ingestion writes records to the spool as they arrive instead of dumping the
+whole run at the end. Each segment is gzip-compressed JSON Lines, sealed once
+its uncompressed content reaches a size limit and named after the SHA-256 of
+that content, so identical pulls produce identical files. Transforms replay a
+snapshot with ``iter_raw_snapshot`` one record at a time.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from types import TracebackType
+
+    from src.type_definitions.common import RawRecord
+
+SPOOL_SUFFIX = ".jsonl.gz"
+SPOOL_CONTENT_TYPE = "application/gzip"
+DEFAULT_SEGMENT_BYTES = 256 * 1024 * 1024
+DIGEST_PREFIX_LENGTH = 16
+
+
+class RawSpoolIntegrityError(ValueError):
+    """A spool segment's content does not match the digest in its name."""
+
+
+@dataclass(frozen=True)
+class RawSpoolSegment:
+    """A sealed spool file."""
+
+    path: Path
+    sha256: str
+    record_count: int
+    size_bytes: int
+
+
+@dataclass
+class _OpenSegment:
+    partial_path: Path
+    raw: BinaryIO
+    stream: gzip.GzipFile
+    digest: hashlib._Hash
+    record_count: int = 0
+    content_bytes: int = 0
+
+    def close(self) -> None:
+        self.stream.close()
+        self.raw.close()
+
+
+class RawRecordSpool:
+    """
+    Write raw records to rotating gzip JSONL segments.
+
+    Segments are named ``{stem}.{index:05d}.{digest}.jsonl.gz``; the open
+    segment carries a ``.partial`` suffix until it is sealed. Rotation goes
+    by uncompressed bytes, so segment boundaries depend only on the records.
+    Empty segments are never sealed, so a run without records leaves no
+    files behind.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        stem: str,
+        *,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        compresslevel: int = 6,
+    ) -> None:
+        self.directory = directory
+        self.stem = stem
+        self.max_segment_bytes = max_segment_bytes
+        self.compresslevel = compresslevel
+        self.segments: list[RawSpoolSegment] = []
+        self.record_count = 0
+        self._open: _OpenSegment | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def write(self, record: RawRecord) -> RawSpoolSegment | None:
+        """Append a record; returns the segment sealed by this write, if any."""
+        line = json.dumps(record, default=str, separators=(",", ":")) + "\n"
+        data = line.encode("utf-8")
+        segment = self._open or self._open_segment()
+        segment.stream.write(data)
+        segment.digest.update(data)
+        segment.record_count += 1
+        segment.content_bytes += len(data)
+        self.record_count += 1
+        if segment.content_bytes >= self.max_segment_bytes:
+            return self._seal(segment)
+        return None
+
+    def write_many(self, records: Iterable[RawRecord]) -> list[RawSpoolSegment]:
+        """Append records; returns the segments sealed along the way."""
+        sealed: list[RawSpoolSegment] = []
+        for record in records:
+            segment = self.write(record)
+            if segment is not None:
+                sealed.append(segment)
+        return sealed
+
+    def close(self) -> RawSpoolSegment | None:
+        """Seal the open segment, if it holds any records."""
+        segment = self._open
+        if segment is None:
+            return None
+        if not segment.record_count:
+            self._discard_open_segment()
+            return None
+        return self._seal(segment)
+
+    def discard(self) -> None:
+        """Drop the open segment and every sealed one."""
+        self._discard_open_segment()
+        for segment in self.segments:
+            segment.path.unlink(missing_ok=True)
+        self.segments.clear()
+
+    def _open_segment(self) -> _OpenSegment:
+        partial_path = self.directory / f"{self.stem}.{len(self.segments):05d}.partial"
+        raw = partial_path.open("wb")
+        # mtime=0 keeps the compressed bytes reproducible for identical content.
+        stream = gzip.GzipFile(
+            fileobj=raw,
+            mode="wb",
+            compresslevel=self.compresslevel,
+            mtime=0,
+        )
+        self._open = _OpenSegment(partial_path, raw, stream, hashlib.sha256())
+        return self._open
+
+    def _discard_open_segment(self) -> None:
+        if self._open is not None:
+            self._open.close()
+            self._open.partial_path.unlink(missing_ok=True)
+            self._open = None
+
+    def _seal(self, segment: _OpenSegment) -> RawSpoolSegment:
+        segment.close()
+        self._open = None
+        sha256 = segment.digest.hexdigest()
+        index = len(self.segments)
+        name = f"{self.stem}.{index:05d}.{sha256[:DIGEST_PREFIX_LENGTH]}{SPOOL_SUFFIX}"
+        path = segment.partial_path.replace(self.directory / name)
+        sealed = RawSpoolSegment(
+            path=path,
+            sha256=sha256,
+            record_count=segment.record_count,
+            size_bytes=path.stat().st_size,
+        )
+        self.segments.append(sealed)
+        return sealed
+
+
+def snapshot_segments(directory: Path, stem: str) -> list[Path]:
+    """Sealed segments of the snapshot ``stem``, in write order."""
+    return sorted(directory.glob(f"{stem}.[0-9][0-9][0-9][0-9][0-9].*{SPOOL_SUFFIX}"))
+
+
+def iter_raw_records(
+    paths: Iterable[Path],
+    *,
+    verify: bool = True,
+) -> Iterator[RawRecord]:
+    """
+    Yield records from spool segments one line at a time.
+
+    With ``verify`` each segment's content is hashed while it is read and
+    ``RawSpoolIntegrityError`` is raised after its last record if the digest
+    does not match the one in the file name.
+    """
+    for path in paths:
+        expected = path.name.removesuffix(SPOOL_SUFFIX).rsplit(".", 1)[-1]
+        digest = hashlib.sha256()
+        with gzip.open(path, "rb") as handle:
+            for line in handle:
+                if verify:
+                    digest.update(line)
+                yield json.loads(line)
+        if verify and not digest.hexdigest().startswith(expected):
+            message = f"Raw spool segment {path.name} does not match its digest"
+            raise RawSpoolIntegrityError(message)
+
+
+def iter_raw_snapshot(
+    directory: Path,
+    stem: str,
+    *,
+    verify: bool = True,
+) -> Iterator[RawRecord]:
+    """Replay every record of the snapshot ``stem`` without loading it whole."""
+    return iter_raw_records(snapshot_segments(directory, stem), verify=verify)
+
+
+__all__ = [
+    "DEFAULT_SEGMENT_BYTES",
+    "SPOOL_CONTENT_TYPE",
+    "SPOOL_SUFFIX",
+    "RawRecordSpool",
+    "RawSpoolIntegrityError",
+    "RawSpoolSegment",
+    "iter_raw_records",
+    "iter_raw_snapshot",
+    "snapshot_segments",
+]
@@ -40,6 +40,7 @@ from .stage_models import (
     MappedDataBundle,
     NormalizedDataBundle,
     ParsedDataBundle,
+    PreparedSources,
     StageData,
     TransformationResult,
     TransformationStage,
@@ -99,6 +100,16 @@ def _build_parser_executor(
     return _CallableParserExecutor(_parse, _validate)
 
 
+def build_source_parsers() -> dict[str, ParserExecutor]:
+    """Parser executors for every supported source, keyed by source name."""
+    return {
+        "clinvar": _build_parser_executor(ClinVarParser(), ClinVarVariant),
+        "pubmed": _build_parser_executor(PubMedParser(), PubMedPublication),
+        "hpo": _build_parser_executor(HPOParser(), HPOTerm),
+        "uniprot": _build_parser_executor(UniProtParser(), UniProtProtein),
+    }
+
+
 class ETLTransformer:
     """
     Orchestrates the complete ETL transformation pipeline.
@@ -111,12 +122,7 @@ class ETLTransformer:
         self.output_dir = output_dir or Path("data/transformed")
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        self.parsers: dict[str, ParserExecutor] = {
-            "clinvar": _build_parser_executor(ClinVarParser(), ClinVarVariant),
-            "pubmed": _build_parser_executor(PubMedParser(), PubMedPublication),
-            "hpo": _build_parser_executor(HPOParser(), HPOTerm),
-            "uniprot": _build_parser_executor(UniProtParser(), UniProtProtein),
-        }
+        self.parsers: dict[str, ParserExecutor] = build_source_parsers()
 
         self.gene_normalizer = gene_normalizer.GeneNormalizer()
         self.variant_normalizer = variant_normalizer.VariantNormalizer()
@@ -135,6 +141,7 @@ class ETLTransformer:
         self._export_stage = ExportStageRunner(self.output_dir)
 
         self.results: dict[str, TransformationResult] = {}
+        self.last_mapped_data: MappedDataBundle | None = None
         self.metrics_tracker = TransformationMetricsTracker()
         # Backwards-compatible reference to metrics dataclass
         self.metrics: ETLTransformationMetrics = self.metrics_tracker.metrics
@@ -156,20 +163,62 @@ class ETLTransformer:
         """
         start_time = time.time()
         self.results = {}
+
+        total_input_records = sum(len(records) for records in raw_data.values())
+        parsed_data = await self._parse_all_sources(raw_data)
+        normalized_data = self._normalize_all_entities(parsed_data)
+
+        prepared = PreparedSources(
+            parsed=parsed_data,
+            normalized=normalized_data,
+            total_input_records=total_input_records,
+            started_at=start_time,
+        )
+        return self._complete_transformation(prepared, validate)
+
+    def transform_prepared(
+        self,
+        prepared: PreparedSources,
+        validate: bool = True,
+    ) -> StageData:
+        """
+        Map, validate, and export sources parsed and normalized elsewhere.
+
+        Used by parallel and incremental pipeline runs. When ``prepared``
+        carries a previous mapping it is reused instead of re-running the
+        mapping stage.
+        """
+        self.results = {}
+        for stage_result in prepared.stage_results:
+            self._store_stage_result(stage_result.stage, stage_result)
+        return self._complete_transformation(prepared, validate)
+
+    def _complete_transformation(
+        self,
+        prepared: PreparedSources,
+        validate: bool,
+    ) -> StageData:
         results: dict[str, object] = {}
         all_errors: list[str] = []
+        parsed_data = prepared.parsed
+        normalized_data = prepared.normalized
 
-        total_input_records = sum(len(records) for records in raw_data.values())
-        self.metrics_tracker.set_total_input_records(total_input_records)
+        self.metrics_tracker.set_total_input_records(prepared.total_input_records)
 
-        parsed_data = await self._parse_all_sources(raw_data)
         results["parsed"] = stage_to_dict(parsed_data)
-
-        normalized_data = self._normalize_all_entities(parsed_data)
         results["normalized"] = stage_to_dict(normalized_data)
         all_errors.extend(stage_errors(normalized_data))
 
-        mapped_data = self._create_cross_references(normalized_data)
+        if prepared.mapped is not None:
+            mapped_data = prepared.mapped
+            if prepared.mapping_result is not None:
+                self._store_stage_result(
+                    TransformationStage.MAPPING,
+                    prepared.mapping_result,
+                )
+        else:
+            mapped_data = self._create_cross_references(normalized_data)
+        self.last_mapped_data = mapped_data
         results["mapped"] = stage_to_dict(mapped_data)
 
         validation_summary: ValidationSummary | None = None
@@ -182,7 +231,7 @@ class ETLTransformer:
         results["export"] = stage_to_dict(export_report)
         all_errors.extend(stage_errors(export_report))
 
-        total_time = time.time() - start_time
+        total_time = time.time() - prepared.started_at
         self.metrics_tracker.update_metrics(
             artifacts=StageArtifacts(
                 parsed=parsed_data,
@@ -289,4 +338,5 @@ __all__ = [
     "TransformationResult",
     "TransformationStage",
     "TransformationStatus",
+    "build_source_parsers",
 ]
@@ -0,0 +1,245 @@
+"""
+Content-hash bookkeeping for incremental transformation runs.
+
+Every raw record is fingerprinted with a SHA-256 of its canonical JSON form.
+Parsed and normalized output is cached per fingerprint, so a later run only
+transforms records whose content is new or changed. Records missing from the
+latest input are dropped from the cache and from the merged bundles.
+
+The cache is saved between runs as a JSON file of fingerprints next to a
+pickle of the cached bundles; a pair that does not match is discarded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import pickle
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from src.type_definitions.common import JSONObject, RawRecord
+
+    from .source_batches import SourceUnitResult
+    from .stage_models import MappedDataBundle, TransformationResult
+
+logger = logging.getLogger(__name__)
+
+# Directory under the ETL output directory holding the saved state
+STATE_DIRNAME = "incremental_state"
+_FINGERPRINTS_FILE = "fingerprints.json"
+_BUNDLES_FILE = "bundles.pickle"
+_STATE_VERSION = 1
+
+
+def record_fingerprint(record: RawRecord) -> str:
+    """Stable content hash of a raw record, independent of key order."""
+    payload = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class IncrementalPlan:
+    """Work required to bring the cache up to date with a new input."""
+
+    fingerprints: dict[str, list[str]]
+    pending: list[tuple[str, str, RawRecord]] = field(default_factory=list)
+    uncached_sources: dict[str, list[RawRecord]] = field(default_factory=dict)
+    reused_records: int = 0
+
+    @property
+    def pending_records(self) -> int:
+        return len(self.pending)
+
+    def pending_batches(self, batch_size: int) -> list[tuple[str, list[RawRecord]]]:
+        """Pending records chunked per source, in the order of ``pending``."""
+        size = max(batch_size, 1)
+        batches: list[tuple[str, list[RawRecord]]] = []
+        for source, _fingerprint, record in self.pending:
+            if not batches or batches[-1][0] != source or len(batches[-1][1]) >= size:
+                batches.append((source, []))
+            batches[-1][1].append(record)
+        return batches
+
+
+@dataclass
+class IncrementalTransformState:
+    """
+    Per-record transformation cache carried between incremental runs.
+
+    The state only holds picklable dataclasses; ``save`` and ``load`` carry
+    it between processes.
+    """
+
+    units: dict[str, dict[str, SourceUnitResult]] = field(default_factory=dict)
+    fingerprints: dict[str, list[str]] = field(default_factory=dict)
+    mapped: MappedDataBundle | None = None
+    mapping_result: TransformationResult | None = None
+
+    def plan(
+        self,
+        raw_data: dict[str, list[RawRecord]],
+        supported_sources: frozenset[str],
+    ) -> IncrementalPlan:
+        """Fingerprint ``raw_data`` and list the records that need transforming."""
+        plan = IncrementalPlan(fingerprints={})
+        for source, records in raw_data.items():
+            if source not in supported_sources:
+                plan.uncached_sources[source] = records
+                continue
+            cached = self.units.get(source, {})
+            source_fingerprints: list[str] = []
+            queued: set[str] = set()
+            for record in records:
+                fingerprint = record_fingerprint(record)
+                source_fingerprints.append(fingerprint)
+                if fingerprint in cached:
+                    plan.reused_records += 1
+                elif fingerprint not in queued:
+                    queued.add(fingerprint)
+                    plan.pending.append((source, fingerprint, record))
+            plan.fingerprints[source] = source_fingerprints
+        return plan
+
+    def apply(
+        self,
+        plan: IncrementalPlan,
+        fresh_units: Sequence[SourceUnitResult],
+    ) -> tuple[list[SourceUnitResult], int]:
+        """
+        Store freshly transformed units and return this run's units in order.
+
+        ``fresh_units`` must align one-to-one with ``plan.pending``. Returns
+        the ordered units together with the number of evicted fingerprints.
+        """
+        if len(fresh_units) != len(plan.pending):
+            msg = "Transformed units do not match the pending incremental records"
+            raise ValueError(msg)
+        for (source, fingerprint, _record), unit in zip(
+            plan.pending,
+            fresh_units,
+            strict=True,
+        ):
+            self.units.setdefault(source, {})[fingerprint] = unit
+
+        removed = 0
+        ordered: list[SourceUnitResult] = []
+        for source in list(self.units):
+            live = set(plan.fingerprints.get(source, ()))
+            cached = self.units[source]
+            for fingerprint in [key for key in cached if key not in live]:
+                del cached[fingerprint]
+                removed += 1
+            if not cached:
+                del self.units[source]
+        for source, source_fingerprints in plan.fingerprints.items():
+            cached = self.units.get(source, {})
+            ordered.extend(cached[fingerprint] for fingerprint in source_fingerprints)
+        return ordered, removed
+
+    def is_unchanged(self, plan: IncrementalPlan) -> bool:
+        """Whether ``plan`` describes exactly the input of the previous run."""
+        return (
+            self.mapped is not None
+            and not plan.pending
+            and plan.fingerprints == self.fingerprints
+        )
+
+    def remember(
+        self,
+        plan: IncrementalPlan,
+        mapped: MappedDataBundle | None,
+        mapping_result: TransformationResult | None,
+    ) -> None:
+        """Record the input fingerprints and mapping produced by this run."""
+        self.fingerprints = {
+            source: list(values) for source, values in plan.fingerprints.items()
+        }
+        self.mapped = mapped
+        self.mapping_result = mapping_result
+
+    @classmethod
+    def load(cls, directory: Path) -> IncrementalTransformState:
+        """State saved under ``directory``, or an empty state if none is usable."""
+        try:
+            saved = json.loads((directory / _FINGERPRINTS_FILE).read_text("utf-8"))
+            # Written by ``save`` into the pipeline's own output directory
+            bundles = pickle.loads(  # noqa: S301  # nosec B301
+                (directory / _BUNDLES_FILE).read_bytes(),
+            )
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError) as exc:
+            logger.warning("Ignoring unreadable incremental state: %s", exc)
+            return cls()
+        if (
+            not isinstance(saved, dict)
+            or saved.get("version") != _STATE_VERSION
+            or not isinstance(bundles, tuple)
+            or len(bundles) != 3  # noqa: PLR2004 - units, mapped, mapping result
+        ):
+            logger.warning("Ignoring incremental state in an unknown format")
+            return cls()
+        units, mapped, mapping_result = bundles
+        if saved.get("cached") != _cached_fingerprints(units):
+            # The two files were written by different runs
+            logger.warning("Ignoring incremental state from an interrupted save")
+            return cls()
+        return cls(
+            units=units,
+            fingerprints=saved["fingerprints"],
+            mapped=mapped,
+            mapping_result=mapping_result,
+        )
+
+    def save(self, directory: Path) -> None:
+        """Write the state under ``directory`` for the next run to ``load``."""
+        directory.mkdir(parents=True, exist_ok=True)
+        bundles = pickle.dumps(
+            (self.units, self.mapped, self.mapping_result),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        saved = {
+            "version": _STATE_VERSION,
+            "fingerprints": self.fingerprints,
+            "cached": _cached_fingerprints(self.units),
+        }
+        _replace_file(directory / _BUNDLES_FILE, bundles)
+        _replace_file(
+            directory / _FINGERPRINTS_FILE,
+            json.dumps(saved, separators=(",", ":")).encode("utf-8"),
+        )
+
+    def summary(self, plan: IncrementalPlan, removed_records: int) -> JSONObject:
+        return {
+            "reused_records": plan.reused_records,
+            "transformed_records": plan.pending_records,
+            "removed_records": removed_records,
+            "cached_records": sum(len(units) for units in self.units.values()),
+        }
+
+
+def _cached_fingerprints(
+    units: dict[str, dict[str, SourceUnitResult]],
+) -> dict[str, list[str]]:
+    return {source: sorted(cached) for source, cached in units.items()}
+
+
+def _replace_file(path: Path, content: bytes) -> None:
+    """Write ``content`` to ``path`` without leaving a partial file behind."""
+    partial = path.with_name(f"{path.name}.partial")
+    partial.write_bytes(content)
+    partial.replace(path)
+
+
+__all__ = [
+    "STATE_DIRNAME",
+    "IncrementalPlan",
+    "IncrementalTransformState",
+    "record_fingerprint",
+]
@@ -0,0 +1,236 @@
+"""
+Independent parse/normalize work units for parallel and incremental runs.
+
+A work unit parses and normalizes records from a single source without
+consulting any other source, so units can run in worker processes and their
+outputs can be cached per record. ``prepare_sources`` merges unit outputs back
+into the bundles the sequential stages would have produced, preserving the
+category ordering and gene de-duplication of ``NormalizationStageRunner``.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from ..normalizers.gene_normalizer import GeneNormalizer
+from ..normalizers.phenotype_normalizer import PhenotypeNormalizer
+from ..normalizers.publication_normalizer import PublicationNormalizer
+from ..normalizers.variant_normalizer import VariantNormalizer
+from .etl_transformer import build_source_parsers
+from .stage_handlers import NormalizationStageRunner
+from .stage_models import (
+    NormalizedDataBundle,
+    ParsedDataBundle,
+    PreparedSources,
+    StageData,
+    TransformationResult,
+    TransformationStage,
+    TransformationStatus,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from src.type_definitions.common import RawRecord
+
+    from .stage_handlers import ParserExecutor
+
+# Order in which the sequential normalization stage emits each category.
+_CATEGORY_SOURCE_ORDER: dict[str, tuple[str, ...]] = {
+    "genes": ("uniprot", "clinvar"),
+    "phenotypes": ("clinvar", "hpo"),
+    "publications": ("pubmed", "uniprot"),
+}
+
+
+@dataclass
+class SourceUnitResult:
+    """Parsed and normalized output of one work unit."""
+
+    source: str
+    parsed: ParsedDataBundle = field(default_factory=ParsedDataBundle)
+    normalized: NormalizedDataBundle = field(default_factory=NormalizedDataBundle)
+    parse_errors: list[str] = field(default_factory=list)
+
+
+@lru_cache(maxsize=1)
+def _unit_components() -> tuple[dict[str, ParserExecutor], NormalizationStageRunner]:
+    """Parsers and normalizers, built once per (worker) process."""
+    normalizer = NormalizationStageRunner(
+        GeneNormalizer(),
+        VariantNormalizer(),
+        PhenotypeNormalizer(),
+        PublicationNormalizer(),
+    )
+    return build_source_parsers(), normalizer
+
+
+def supported_sources() -> frozenset[str]:
+    """Source names that have a registered parser."""
+    parsers, _normalizer = _unit_components()
+    return frozenset(parsers)
+
+
+def transform_source_records(
+    source: str,
+    records: list[RawRecord],
+    per_record: bool = False,
+) -> list[SourceUnitResult]:
+    """
+    Parse and normalize ``records`` from ``source``.
+
+    Runs in worker processes, so it only takes picklable arguments. With
+    ``per_record`` every record yields its own result, which lets callers
+    cache outputs by record; otherwise the records form a single unit.
+    """
+    parsers, normalizer = _unit_components()
+    parser = parsers.get(source)
+    if parser is None:
+        message = f"No parser available for source: {source}"
+        return [SourceUnitResult(source, parse_errors=[message])]
+
+    groups = [[record] for record in records] if per_record else [records]
+    return [_transform_group(source, parser, normalizer, group) for group in groups]
+
+
+def _transform_group(
+    source: str,
+    parser: ParserExecutor,
+    normalizer: NormalizationStageRunner,
+    records: list[RawRecord],
+) -> SourceUnitResult:
+    result = SourceUnitResult(source)
+    try:
+        parsed_records = parser.parse_batch(records)
+    except Exception as exc:  # pragma: no cover - defensive
+        result.parse_errors.append(f"Failed to parse {source}: {exc}")
+        return result
+
+    result.parsed.add(source, parsed_records)
+    for record in parsed_records:
+        result.parse_errors.extend(parser.validate_parsed_data(record))
+    result.normalized = normalizer.normalize(result.parsed)
+    return result
+
+
+def split_source_batches(
+    raw_data: dict[str, list[RawRecord]],
+    batch_size: int,
+) -> Iterator[tuple[str, list[RawRecord]]]:
+    """Split each supported source into ``batch_size`` chunks, in source order."""
+    size = max(batch_size, 1)
+    known_sources = supported_sources()
+    for source, records in raw_data.items():
+        if source not in known_sources:
+            # One unit reports the missing parser once, as the sequential stage does.
+            yield source, records
+            continue
+        for offset in range(0, len(records), size):
+            yield source, records[offset : offset + size]
+
+
+def prepare_sources(
+    units: Sequence[SourceUnitResult],
+    total_input_records: int,
+    started_at: float,
+) -> PreparedSources:
+    """Merge unit outputs into bundles plus parsing/normalization stage results."""
+    merge_started = time.time()
+    parsed = ParsedDataBundle()
+    parse_errors: list[str] = []
+    for unit in units:
+        parsed.extend(unit.parsed)
+        parse_errors.extend(unit.parse_errors)
+    normalized = merge_normalized(units)
+    duration = merge_started - started_at
+
+    return PreparedSources(
+        parsed=parsed,
+        normalized=normalized,
+        total_input_records=total_input_records,
+        stage_results=[
+            _stage_result(
+                TransformationStage.PARSING,
+                parsed.total_records(),
+                parsed.as_dict(),
+                parse_errors,
+                duration,
+            ),
+            _stage_result(
+                TransformationStage.NORMALIZATION,
+                normalized.total_records(),
+                normalized.as_dict(),
+                normalized.errors,
+                duration,
+            ),
+        ],
+        started_at=started_at,
+    )
+
+
+def merge_normalized(units: Sequence[SourceUnitResult]) -> NormalizedDataBundle:
+    """Concatenate normalized unit outputs in sequential category order."""
+    merged = NormalizedDataBundle()
+    seen_genes: set[str] = set()
+    for unit in _ordered_units(units, "genes"):
+        for gene in unit.normalized.genes:
+            if gene.primary_id not in seen_genes:
+                seen_genes.add(gene.primary_id)
+                merged.genes.append(gene)
+    for unit in units:
+        merged.variants.extend(unit.normalized.variants)
+        merged.errors.extend(unit.normalized.errors)
+    for unit in _ordered_units(units, "phenotypes"):
+        merged.phenotypes.extend(unit.normalized.phenotypes)
+    for unit in _ordered_units(units, "publications"):
+        merged.publications.extend(unit.normalized.publications)
+    return merged
+
+
+def _ordered_units(
+    units: Sequence[SourceUnitResult],
+    category: str,
+) -> list[SourceUnitResult]:
+    order = _CATEGORY_SOURCE_ORDER[category]
+    return sorted(
+        units,
+        key=lambda unit: (
+            order.index(unit.source) if unit.source in order else len(order)
+        ),
+    )
+
+
+def _stage_result(
+    stage: TransformationStage,
+    records_processed: int,
+    data: StageData,
+    errors: list[str],
+    duration: float,
+) -> TransformationResult:
+    return TransformationResult(
+        stage=stage,
+        status=(
+            TransformationStatus.COMPLETED
+            if not errors
+            else TransformationStatus.PARTIAL
+        ),
+        records_processed=records_processed,
+        records_failed=len(errors),
+        data=data,
+        errors=list(errors),
+        duration_seconds=duration,
+        timestamp=time.time(),
+    )
+
+
+__all__ = [
+    "SourceUnitResult",
+    "merge_normalized",
+    "prepare_sources",
+    "split_source_batches",
+    "supported_sources",
+    "transform_source_records",
+]
@@ -22,8 +22,11 @@ from .stage_models import (
 from .stage_post_processors import ExportStageRunner, ValidationStageRunner
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from src.type_definitions.common import RawRecord
 
+    from ..mappers.gene_variant_mapper import GeneVariantLink
     from ..normalizers.gene_normalizer import GeneNormalizer, NormalizedGene
     from ..normalizers.phenotype_normalizer import PhenotypeNormalizer
     from ..normalizers.publication_normalizer import PublicationNormalizer
@@ -113,16 +116,7 @@ class NormalizationStageRunner:
         parsed_data: ParsedDataBundle,
     ) -> tuple[NormalizedDataBundle, TransformationResult]:
         start_time = time.time()
-        normalized = NormalizedDataBundle()
-        seen_genes: set[str] = set()
-
-        self._normalize_uniprot_genes(parsed_data, normalized, seen_genes)
-        self._normalize_clinvar_genes(parsed_data, normalized, seen_genes)
-        self._normalize_clinvar_variants(parsed_data, normalized)
-        self._normalize_clinvar_phenotypes(parsed_data, normalized)
-        self._normalize_hpo_terms(parsed_data, normalized)
-        self._normalize_pubmed_publications(parsed_data, normalized)
-        self._normalize_uniprot_publications(parsed_data, normalized)
+        normalized = self.normalize(parsed_data)
 
         result = TransformationResult(
             stage=TransformationStage.NORMALIZATION,
@@ -140,6 +134,20 @@ class NormalizationStageRunner:
         )
         return normalized, result
 
+    def normalize(self, parsed_data: ParsedDataBundle) -> NormalizedDataBundle:
+        """Normalize parsed records without building a stage result."""
+        normalized = NormalizedDataBundle()
+        seen_genes: set[str] = set()
+
+        self._normalize_uniprot_genes(parsed_data, normalized, seen_genes)
+        self._normalize_clinvar_genes(parsed_data, normalized, seen_genes)
+        self._normalize_clinvar_variants(parsed_data, normalized)
+        self._normalize_clinvar_phenotypes(parsed_data, normalized)
+        self._normalize_hpo_terms(parsed_data, normalized)
+        self._normalize_pubmed_publications(parsed_data, normalized)
+        self._normalize_uniprot_publications(parsed_data, normalized)
+        return normalized
+
     def _normalize_uniprot_genes(
         self,
         parsed_data: ParsedDataBundle,
@@ -357,7 +365,16 @@ class NormalizationStageRunner:
 
 @dataclass
 class MappingStageRunner:
-    """Create cross-references between normalized entities."""
+    """
+    Create cross-references between normalized entities.
+
+    Normalized genes carry no coordinates, so variants are linked to the gene
+    their record names. When annotation coordinates are supplied as
+    ``(gene_id, chromosome, start, end)`` rows, variants are instead linked to
+    every gene whose padded window covers them.
+    """
+
+    gene_coordinates: Sequence[tuple[str, str, int, int]] = ()
 
     def run(
         self,
@@ -374,48 +391,20 @@ class MappingStageRunner:
         errors: list[str] = []
 
         try:
-            gene_lookup = {
-                gene.primary_id.lower(): gene for gene in normalized_data.genes
-            }
-            for gene in normalized_data.genes:
-                if gene.symbol:
-                    gene_lookup[gene.symbol.lower()] = gene
+            for gene_link in self._link_genes(gene_mapper, normalized_data):
+                mapped.gene_variant_links.append(gene_link)
+                cross_mapper.add_reference(gene_link.gene_id, gene_link.variant_id)
 
-            for variant in normalized_data.variants:
-                variant_gene_symbol = (
-                    variant.gene_symbol.lower() if variant.gene_symbol else None
+            phenotype_links = variant_mapper.map_variant_phenotype_relationships(
+                normalized_data.variants,
+                normalized_data.phenotypes,
+            )
+            for phenotype_link in phenotype_links:
+                mapped.variant_phenotype_links.append(phenotype_link)
+                cross_mapper.add_reference(
+                    phenotype_link.variant_id,
+                    phenotype_link.phenotype_id,
                 )
-                if variant_gene_symbol and variant_gene_symbol in gene_lookup:
-                    gene = gene_lookup[variant_gene_symbol]
-                    location = variant.genomic_location
-                    if (
-                        location is not None
-                        and location.position is not None
-                        and location.chromosome
-                    ):
-                        gene_mapper.add_gene_coordinates(
-                            gene.primary_id,
-                            location.chromosome,
-                            location.position,
-                            location.position,
-                        )
-                    gene_link = gene_mapper.map_gene_variant_relationship(gene, variant)
-                    if gene_link:
-                        mapped.gene_variant_links.append(gene_link)
-                        cross_mapper.add_reference(gene.primary_id, variant.primary_id)
-
-            for variant in normalized_data.variants:
-                for phenotype in normalized_data.phenotypes:
-                    phenotype_link = variant_mapper.map_variant_phenotype_relationship(
-                        variant,
-                        phenotype,
-                    )
-                    if phenotype_link:
-                        mapped.variant_phenotype_links.append(phenotype_link)
-                        cross_mapper.add_reference(
-                            variant.primary_id,
-                            phenotype.primary_id,
-                        )
 
             for gene in normalized_data.genes:
                 network = cross_mapper.build_cross_reference_network(gene.primary_id)
@@ -441,6 +430,49 @@ class MappingStageRunner:
         )
         return mapped, result
 
+    def _link_genes(
+        self,
+        gene_mapper: GeneVariantMapper,
+        normalized_data: NormalizedDataBundle,
+    ) -> Iterator[GeneVariantLink]:
+        if not self.gene_coordinates:
+            yield from _link_genes_by_symbol(gene_mapper, normalized_data)
+            return
+        gene_mapper.load_gene_coordinates(self.gene_coordinates)
+        for variant in normalized_data.variants:
+            yield from gene_mapper.map_variant_to_genes(variant)
+
+
+def _link_genes_by_symbol(
+    gene_mapper: GeneVariantMapper,
+    normalized_data: NormalizedDataBundle,
+) -> Iterator[GeneVariantLink]:
+    """Link each variant to the gene its record names, by primary ID or symbol."""
+    gene_lookup = {gene.primary_id.lower(): gene for gene in normalized_data.genes}
+    for gene in normalized_data.genes:
+        if gene.symbol:
+            gene_lookup[gene.symbol.lower()] = gene
+
+    for variant in normalized_data.variants:
+        owner = gene_lookup.get((variant.gene_symbol or "").lower())
+        if owner is None:
+            continue
+        location = variant.genomic_location
+        if (
+            location is not None
+            and location.position is not None
+            and location.chromosome
+        ):
+            gene_mapper.add_gene_coordinates(
+                owner.primary_id,
+                location.chromosome,
+                location.position,
+                location.position,
+            )
+        gene_link = gene_mapper.map_gene_variant_relationship(owner, variant)
+        if gene_link:
+            yield gene_link
+
 
 __all__ = [
     "BatchParser",
@@ -7,6 +7,7 @@ and exported artefacts that flow through the ETL pipeline.
 
 from __future__ import annotations
 
+import time
 from collections.abc import Sequence
 from dataclasses import asdict, dataclass, field
 from enum import Enum
@@ -60,6 +61,15 @@ class ParsedDataBundle:
         else:
             self.extras[source] = records
 
+    def extend(self, other: ParsedDataBundle) -> None:
+        """Append every collection of ``other`` to this bundle."""
+        self.clinvar.extend(other.clinvar)
+        self.pubmed.extend(other.pubmed)
+        self.hpo.extend(other.hpo)
+        self.uniprot.extend(other.uniprot)
+        for source, records in other.extras.items():
+            self.extras.setdefault(source, []).extend(records)
+
     def total_records(self) -> int:
         """Count the total number of parsed records."""
         return (
@@ -203,6 +213,26 @@ class TransformationResult:
     timestamp: float
 
 
+@dataclass
+class PreparedSources:
+    """
+    Parsed and normalized sources produced outside the ETL transformer.
+
+    Parallel and incremental pipeline runs parse and normalize records in
+    independent units, merge them, and hand the result to the transformer for
+    mapping, validation, and export. ``mapped`` may carry a previous mapping
+    to reuse when the normalized entities are known to be unchanged.
+    """
+
+    parsed: ParsedDataBundle
+    normalized: NormalizedDataBundle
+    total_input_records: int
+    stage_results: list[TransformationResult] = field(default_factory=list)
+    mapped: MappedDataBundle | None = None
+    mapping_result: TransformationResult | None = None
+    started_at: float = field(default_factory=time.time)
+
+
 @dataclass
 class ETLTransformationMetrics:
     """Metrics collected during ETL transformation."""
@@ -222,6 +252,7 @@ __all__ = [
     "MappedDataBundle",
     "NormalizedDataBundle",
     "ParsedDataBundle",
+    "PreparedSources",
     "StageData",
     "TransformationResult",
     "TransformationStage",
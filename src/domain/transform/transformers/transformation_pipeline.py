@@ -7,7 +7,12 @@ including parallel processing, error recovery, and progress tracking.
 
 import asyncio
 import logging
+import multiprocessing
+import pickle
+import time
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -15,6 +20,14 @@ from pathlib import Path
 from src.type_definitions.common import RawRecord
 
 from .etl_transformer import ETLTransformer
+from .incremental_state import STATE_DIRNAME, IncrementalTransformState
+from .source_batches import (
+    SourceUnitResult,
+    prepare_sources,
+    split_source_batches,
+    supported_sources,
+    transform_source_records,
+)
 
 RawSourceData = dict[str, list[RawRecord]]
 
@@ -38,6 +51,8 @@ class PipelineConfig:
     enable_metrics: bool = True
     error_recovery: bool = True
     progress_callback: Callable[[str, float], None] | None = None
+    # ETL output directory; INCREMENTAL runs keep their cache under it
+    output_dir: Path | None = None
 
 
 @dataclass
@@ -68,12 +83,17 @@ class TransformationPipeline:
         self.logger = logging.getLogger(__name__)
 
         # Initialize ETL transformer
-        self.transformer = ETLTransformer()
+        self.transformer = ETLTransformer(self.config.output_dir)
 
         # Execution state
         self.is_running = False
         self.current_progress = 0.0
 
+        # Per-record cache reused across INCREMENTAL runs; loaded from the
+        # output directory by the first one
+        self.incremental_state = IncrementalTransformState()
+        self._incremental_state_loaded = False
+
     async def execute_pipeline(
         self,
         raw_data: RawSourceData,
@@ -174,31 +194,142 @@ class TransformationPipeline:
         self,
         raw_data: RawSourceData,
     ) -> dict[str, object]:
-        """Execute pipeline in parallel mode."""
+        """
+        Execute pipeline in parallel mode.
+
+        Each source is split into ``batch_size`` chunks that are parsed and
+        normalized concurrently in up to ``max_concurrent_sources`` worker
+        processes. The merged bundles are then mapped, validated, and
+        exported in this process.
+        """
         self._update_progress("Starting parallel transformation", 0.0)
+        started_at = time.time()
 
-        # For parallel execution, we would need to modify the ETL transformer
-        # to support parallel processing of different sources
-        # For now, fall back to sequential
-        self.logger.warning(
-            "Parallel mode not yet implemented, falling back to sequential",
+        work = list(split_source_batches(raw_data, self.config.batch_size))
+        units = await self._transform_units(work, per_record=False)
+        self._update_progress("Sources parsed and normalized", 50.0)
+
+        prepared = prepare_sources(
+            units,
+            total_input_records=_count_records(raw_data),
+            started_at=started_at,
+        )
+        result = self.transformer.transform_prepared(
+            prepared,
+            validate=self.config.enable_validation,
         )
-        return await self._execute_sequential(raw_data)
+
+        self._update_progress("Transformation completed", 100.0)
+        return result
 
     async def _execute_incremental(
         self,
         raw_data: RawSourceData,
         gene_symbol: str | None = None,
     ) -> dict[str, object]:
-        """Execute pipeline in incremental mode."""
-        self._update_progress("Starting incremental transformation", 0.0)
+        """
+        Execute pipeline in incremental mode.
 
-        # Incremental mode would only process new/changed data
-        # For now, fall back to full transformation
-        self.logger.warning(
-            "Incremental mode not yet implemented, falling back to full transformation",
+        Only records whose content hash is not cached from a previous run
+        are parsed and normalized; cached outputs are merged back in input
+        order. The previous mapping is reused when the input is unchanged.
+        The cache is saved under the output directory for later runs.
+        """
+        self._update_progress("Starting incremental transformation", 0.0)
+        started_at = time.time()
+        state_dir = self.transformer.output_dir / STATE_DIRNAME
+        if not self._incremental_state_loaded:
+            self.incremental_state = IncrementalTransformState.load(state_dir)
+            self._incremental_state_loaded = True
+        state = self.incremental_state
+
+        plan = state.plan(raw_data, supported_sources())
+        fresh_units = await self._transform_units(
+            plan.pending_batches(self.config.batch_size),
+            per_record=True,
+        )
+        unchanged = state.is_unchanged(plan)
+        units, removed_records = state.apply(plan, fresh_units)
+        for source, records in plan.uncached_sources.items():
+            units.extend(transform_source_records(source, records))
+        self._update_progress("Changed records parsed and normalized", 50.0)
+
+        prepared = prepare_sources(
+            units,
+            total_input_records=_count_records(raw_data),
+            started_at=started_at,
         )
-        return await self._execute_sequential(raw_data)
+        if unchanged:
+            prepared.mapped = state.mapped
+            prepared.mapping_result = state.mapping_result
+        result = self.transformer.transform_prepared(
+            prepared,
+            validate=self.config.enable_validation,
+        )
+        state.remember(
+            plan,
+            self.transformer.last_mapped_data,
+            self.transformer.results.get("mapping"),
+        )
+
+        try:
+            state.save(state_dir)
+        except OSError as exc:
+            # The next run in a new process starts from scratch
+            self.logger.warning("Could not save incremental state: %s", exc)
+
+        metadata = result.get("metadata")
+        if isinstance(metadata, dict):
+            metadata["incremental"] = state.summary(plan, removed_records)
+
+        self._update_progress("Transformation completed", 100.0)
+        return result
+
+    async def _transform_units(
+        self,
+        work: list[tuple[str, list[RawRecord]]],
+        *,
+        per_record: bool,
+    ) -> list[SourceUnitResult]:
+        """Parse and normalize work units, in a process pool when worthwhile."""
+        workers = min(self.config.max_concurrent_sources, len(work))
+        if workers <= 1:
+            return [
+                unit
+                for source, records in work
+                for unit in transform_source_records(source, records, per_record)
+            ]
+
+        loop = asyncio.get_running_loop()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                batches = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool,
+                            transform_source_records,
+                            source,
+                            records,
+                            per_record,
+                        )
+                        for source, records in work
+                    ),
+                )
+        except (BrokenProcessPool, OSError, pickle.PicklingError) as exc:
+            if not self.config.error_recovery:
+                raise
+            self.logger.warning(
+                "Process pool unavailable (%s); transforming in-process",
+                exc,
+            )
+            batches = [
+                transform_source_records(source, records, per_record)
+                for source, records in work
+            ]
+        return [unit for batch in batches for unit in batch]
 
     def _update_progress(self, message: str, progress: float) -> None:
         """Update progress and notify callback if configured."""
@@ -306,6 +437,10 @@ class TransformationPipeline:
         return metrics_json
 
 
+def _count_records(raw_data: RawSourceData) -> int:
+    return sum(len(records) for records in raw_data.values())
+
+
 # Convenience functions for common pipeline operations
 
 
@@ -4,6 +4,7 @@ Permission value objects for MED13 Resource Library authorization system.
 Defines permissions, roles, and access control rules using domain-driven design.
 """
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
 
 from src.domain.entities.user import UserRole
@@ -183,6 +184,97 @@ class RolePermissions:
         return True
 
 
+_PERMISSION_BITS: dict[Permission, int] = {
+    permission: 1 << index for index, permission in enumerate(Permission)
+}
+
+
+class PermissionSet:
+    """
+    Immutable set of permissions stored as a bitmask.
+
+    Each ``Permission`` owns one bit, so membership, subset and difference
+    checks are single integer operations regardless of how many permissions
+    are involved.
+    """
+
+    __slots__ = ("_mask",)
+
+    def __init__(self, mask: int = 0) -> None:
+        self._mask = mask
+
+    @classmethod
+    def from_permissions(cls, permissions: Iterable[Permission]) -> "PermissionSet":
+        """Build a set from an iterable of permissions."""
+        mask = 0
+        for permission in permissions:
+            mask |= _PERMISSION_BITS[permission]
+        return cls(mask)
+
+    @classmethod
+    def for_role(cls, role: UserRole) -> "PermissionSet":
+        """Return the (cached) permission set granted to ``role``."""
+        permission_set = _ROLE_PERMISSION_SETS.get(role)
+        if permission_set is None:
+            permission_set = cls.from_permissions(
+                RolePermissions.get_permissions_for_role(role),
+            )
+            _ROLE_PERMISSION_SETS[role] = permission_set
+        return permission_set
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    def __contains__(self, permission: object) -> bool:
+        bit = _PERMISSION_BITS.get(permission)  # type: ignore[call-overload]
+        return bit is not None and self._mask & bit != 0
+
+    def __iter__(self) -> Iterator[Permission]:
+        return (
+            permission
+            for permission, bit in _PERMISSION_BITS.items()
+            if self._mask & bit
+        )
+
+    def __len__(self) -> int:
+        return self._mask.bit_count()
+
+    def __bool__(self) -> bool:
+        return self._mask != 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PermissionSet):
+            return NotImplemented
+        return self._mask == other._mask
+
+    def __hash__(self) -> int:
+        return hash(self._mask)
+
+    def __repr__(self) -> str:
+        return f"PermissionSet({[permission.value for permission in self]})"
+
+    def contains_all(self, permissions: Iterable[Permission]) -> bool:
+        """Check that every permission in ``permissions`` is present."""
+        required = PermissionSet.from_permissions(permissions).mask
+        return self._mask & required == required
+
+    def contains_any(self, permissions: Iterable[Permission]) -> bool:
+        """Check that at least one permission in ``permissions`` is present."""
+        return self._mask & PermissionSet.from_permissions(permissions).mask != 0
+
+    def missing(self, permissions: Iterable[Permission]) -> list[Permission]:
+        """Return the permissions from ``permissions`` that are absent, in order."""
+        return [
+            permission
+            for permission in permissions
+            if not self._mask & _PERMISSION_BITS[permission]
+        ]
+
+
+_ROLE_PERMISSION_SETS: dict[UserRole, PermissionSet] = {}
+
+
 class PermissionChecker:
     """
     Utility class for permission checking operations.
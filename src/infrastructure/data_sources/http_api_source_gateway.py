@@ -2,7 +2,9 @@
 Infrastructure implementation for API source operations.
 
 Uses httpx to execute API requests while conforming to the
-domain-level `APISourceGateway` protocol.
+domain-level `APISourceGateway` protocol. Requests go through the shared
+`HttpClientRegistry`, so repeated tests and fetches reuse pooled connections,
+and fetches draw from the per-host request budget shared with the ingestors.
 """
 
 from __future__ import annotations
@@ -22,6 +24,12 @@ from src.domain.services.api_source_service import (
     APIRequestResult,
     APISourceGateway,
 )
+from src.infrastructure.http import (
+    HostRateLimiters,
+    HttpClientRegistry,
+    get_host_rate_limiters,
+    get_http_client_registry,
+)
 from src.type_definitions.common import (  # noqa: TCH001
     JSONObject,
     JSONValue,
@@ -42,9 +50,22 @@ AuthMethod = Callable[[AuthConfig], AuthHeaders | None]
 class HttpxAPISourceGateway(APISourceGateway):
     """httpx-powered implementation of the API source gateway."""
 
-    def __init__(self, timeout_seconds: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        timeout_seconds: int = 30,
+        max_retries: int = 3,
+        *,
+        http_clients: HttpClientRegistry | None = None,
+        rate_limiters: HostRateLimiters | None = None,
+    ):
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
+        self._http_clients = (
+            http_clients if http_clients is not None else get_http_client_registry()
+        )
+        self._rate_limiters = (
+            rate_limiters if rate_limiters is not None else get_host_rate_limiters()
+        )
         self.auth_methods: dict[str, AuthMethod] = {
             "none": self._auth_none,
             "bearer": self._auth_bearer,
@@ -63,60 +84,60 @@ class HttpxAPISourceGateway(APISourceGateway):
         start_time = datetime.now(UTC)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                headers = self._prepare_headers(configuration)
-                auth_headers = self._prepare_auth(configuration)
-                if auth_headers:
-                    headers.update(auth_headers)
-
-                params: QueryParamsDict = {}
-                metadata = self._metadata(configuration)
-                params["limit"] = self._coerce_limit(metadata.get("limit"), default=1)
-
-                response = await client.request(
-                    method="HEAD",
+            client = self._http_clients.client_for(configuration.url)
+            headers = self._prepare_headers(configuration)
+            auth_headers = self._prepare_auth(configuration)
+            if auth_headers:
+                headers.update(auth_headers)
+
+            params: QueryParamsDict = {}
+            metadata = self._metadata(configuration)
+            params["limit"] = self._coerce_limit(metadata.get("limit"), default=1)
+
+            response = await client.request(
+                method="HEAD",
+                url=configuration.url,
+                headers=headers,
+                params=params,
+                timeout=self.timeout_seconds,
+            )
+
+            response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
+
+            method_not_allowed = 405
+            if response.status_code == method_not_allowed:
+                response = await client.get(
                     url=configuration.url,
                     headers=headers,
                     params=params,
+                    timeout=self.timeout_seconds,
                 )
-
                 response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
-                method_not_allowed = 405
-                if response.status_code == method_not_allowed:
-                    response = await client.get(
-                        url=configuration.url,
-                        headers=headers,
-                        params=params,
-                    )
-                    response_time = (
-                        datetime.now(UTC) - start_time
-                    ).total_seconds() * 1000
-
-                http_ok = 200
-                http_multiple_choices = 300
-                success = http_ok <= response.status_code < http_multiple_choices
-
-                sample_data = None
-                if success and response.headers.get("content-type", "").startswith(
-                    "application/json",
-                ):
-                    with contextlib.suppress(Exception):
-                        sample_payload = response.json()
-                        sample_data = self._ensure_json_object(sample_payload)
-
-                return APIConnectionTest(
-                    success=success,
-                    response_time_ms=response_time,
-                    status_code=response.status_code,
-                    error_message=(
-                        None
-                        if success
-                        else f"HTTP {response.status_code}: {response.text[:200]}"
-                    ),
-                    response_headers=dict(response.headers),
-                    sample_data=sample_data,
-                )
+            http_ok = 200
+            http_multiple_choices = 300
+            success = http_ok <= response.status_code < http_multiple_choices
+
+            sample_data = None
+            if success and response.headers.get("content-type", "").startswith(
+                "application/json",
+            ):
+                with contextlib.suppress(Exception):
+                    sample_payload = response.json()
+                    sample_data = self._ensure_json_object(sample_payload)
+
+            return APIConnectionTest(
+                success=success,
+                response_time_ms=response_time,
+                status_code=response.status_code,
+                error_message=(
+                    None
+                    if success
+                    else f"HTTP {response.status_code}: {response.text[:200]}"
+                ),
+                response_headers=dict(response.headers),
+                sample_data=sample_data,
+            )
 
         except Exception as exc:  # noqa: BLE001
             response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
@@ -141,70 +162,68 @@ class HttpxAPISourceGateway(APISourceGateway):
         params: QueryParamsDict = self._normalize_params(base_params)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                headers = self._prepare_headers(configuration)
-                auth_headers = self._prepare_auth(configuration)
-                if auth_headers:
-                    headers.update(auth_headers)
-
-                metadata = self._metadata(configuration)
-                url = configuration.url
-                method_value = metadata.get("method")
-                method = (
-                    method_value.upper() if isinstance(method_value, str) else "GET"
-                )
-                query_params = metadata.get("query_params", {})
-                if isinstance(query_params, dict):
-                    params.update(self._normalize_params(query_params))
-
-                await self._apply_rate_limiting(configuration)
+            client = self._http_clients.client_for(configuration.url)
+            headers = self._prepare_headers(configuration)
+            auth_headers = self._prepare_auth(configuration)
+            if auth_headers:
+                headers.update(auth_headers)
+
+            metadata = self._metadata(configuration)
+            url = configuration.url
+            method_value = metadata.get("method")
+            method = method_value.upper() if isinstance(method_value, str) else "GET"
+            query_params = metadata.get("query_params", {})
+            if isinstance(query_params, dict):
+                params.update(self._normalize_params(query_params))
+
+            await self._apply_rate_limiting(configuration)
+
+            response = await self._make_request_with_retries(
+                client=client,
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+            )
 
-                response = await self._make_request_with_retries(
-                    client=client,
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
+            if response is None:
+                return APIRequestResult(
+                    success=False,
+                    errors=["Failed to receive response after retries"],
                 )
 
-                if response is None:
-                    return APIRequestResult(
-                        success=False,
-                        errors=["Failed to receive response after retries"],
-                    )
+            response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
-                response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
+            data: JSONObject | None = None
+            if response.headers.get("content-type", "").startswith(
+                "application/json",
+            ):
+                payload = response.json()
+                data = self._ensure_json_object(payload)
+
+            errors: list[str] = []
+            success = response.is_success and data is not None
+            if not success:
+                errors.append(
+                    f"HTTP {response.status_code}: {response.text[:200]}",
+                )
 
-                data: JSONObject | None = None
-                if response.headers.get("content-type", "").startswith(
-                    "application/json",
-                ):
-                    payload = response.json()
-                    data = self._ensure_json_object(payload)
-
-                errors: list[str] = []
-                success = response.is_success and data is not None
-                if not success:
-                    errors.append(
-                        f"HTTP {response.status_code}: {response.text[:200]}",
-                    )
-
-                metadata_payload: JSONObject = {
-                    "request_url": url,
-                    "params": {str(k): str(v) for k, v in params.items()},
-                    "method": method,
-                    "headers": dict(headers),
-                }
+            metadata_payload: JSONObject = {
+                "request_url": url,
+                "params": {str(k): str(v) for k, v in params.items()},
+                "method": method,
+                "headers": dict(headers),
+            }
 
-                return APIRequestResult(
-                    success=success,
-                    data=data if success else None,
-                    record_count=self._count_records(data),
-                    response_time_ms=response_time,
-                    status_code=response.status_code,
-                    errors=errors,
-                    metadata=metadata_payload,
-                )
+            return APIRequestResult(
+                success=success,
+                data=data if success else None,
+                record_count=self._count_records(data),
+                response_time_ms=response_time,
+                status_code=response.status_code,
+                errors=errors,
+                metadata=metadata_payload,
+            )
 
         except Exception as exc:  # noqa: BLE001
             response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
@@ -261,10 +280,11 @@ class HttpxAPISourceGateway(APISourceGateway):
         self,
         configuration: SourceConfiguration,
     ) -> None:
-        rate_limit = configuration.requests_per_minute or 60
-        delay_seconds = 60.0 / rate_limit
-        if delay_seconds > 0:
-            await asyncio.sleep(delay_seconds)
+        if configuration.url:
+            await self._rate_limiters.acquire(
+                configuration.url,
+                configuration.requests_per_minute,
+            )
 
     async def _make_request_with_retries(
         self,
@@ -281,6 +301,7 @@ class HttpxAPISourceGateway(APISourceGateway):
                     url=url,
                     headers=headers,
                     params=params,
+                    timeout=self.timeout_seconds,
                 )
             except (httpx.TimeoutException, httpx.ConnectError):
                 if attempt == self.max_retries - 1:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator  # noqa: TCH003
+
 from src.domain.entities.data_source_configs import PubMedQueryConfig  # noqa: TCH001
 from src.domain.services.pubmed_ingestion import PubMedGateway
 from src.infrastructure.ingest.pubmed_ingestor import PubMedIngestor
@@ -16,7 +18,24 @@ class PubMedSourceGateway(PubMedGateway):
 
     async def fetch_records(self, config: PubMedQueryConfig) -> list[RawRecord]:
         """Fetch PubMed records using per-source query parameters."""
-        params: dict[str, JSONValue] = {
+        raw_records = await self._ingestor.fetch_data(**self._query_params(config))
+        return self._apply_relevance_threshold(raw_records, config.relevance_threshold)
+
+    async def stream_records(
+        self,
+        config: PubMedQueryConfig,
+    ) -> AsyncIterator[RawRecord]:
+        """Yield PubMed records as the ingestor parses them."""
+        threshold = config.relevance_threshold
+        async for record in self._ingestor.stream_records(
+            **self._query_params(config),
+        ):
+            if self._meets_threshold(record, threshold):
+                yield record
+
+    @staticmethod
+    def _query_params(config: PubMedQueryConfig) -> dict[str, JSONValue]:
+        return {
             "query": config.query,
             "publication_types": config.publication_types,
             "mindate": config.date_from,
@@ -25,9 +44,6 @@ class PubMedSourceGateway(PubMedGateway):
             "max_results": config.max_results,
         }
 
-        raw_records = await self._ingestor.fetch_data(**params)
-        return self._apply_relevance_threshold(raw_records, config.relevance_threshold)
-
     def _apply_relevance_threshold(
         self,
         records: list[RawRecord],
@@ -35,15 +51,18 @@ class PubMedSourceGateway(PubMedGateway):
     ) -> list[RawRecord]:
         if threshold <= 0:
             return records
+        return [
+            record for record in records if self._meets_threshold(record, threshold)
+        ]
 
-        filtered: list[RawRecord] = []
-        for record in records:
-            relevance = record.get("med13_relevance")
-            score = None
-            if isinstance(relevance, dict):
-                score_value = relevance.get("score")
-                if isinstance(score_value, int | float):
-                    score = int(score_value)
-            if score is None or score >= threshold:
-                filtered.append(record)
-        return filtered
+    @staticmethod
+    def _meets_threshold(record: RawRecord, threshold: int) -> bool:
+        if threshold <= 0:
+            return True
+        relevance = record.get("med13_relevance")
+        score = None
+        if isinstance(relevance, dict):
+            score_value = relevance.get("score")
+            if isinstance(score_value, int | float):
+                score = int(score_value)
+        return score is None or score >= threshold
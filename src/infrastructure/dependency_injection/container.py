@@ -33,6 +33,8 @@ from src.infrastructure.dependency_injection.db_utils import (
     resolve_async_database_url,
 )
 from src.infrastructure.repositories import (
+    EntityCountCache,
+    SourceCatalogIndexCache,
     SqlAlchemySessionRepository,
     SqlAlchemySystemStatusRepository,
     SqlAlchemyUserRepository,
@@ -112,11 +114,20 @@ class DependencyContainer(ApplicationServiceFactoryMixin):
         self._authorization_service_loop: asyncio.AbstractEventLoop | None = None
         self._user_management_service: app_services.UserManagementService | None = None
         self._user_management_service_loop: asyncio.AbstractEventLoop | None = None
+        self._token_validation_cache = app_services.TokenValidationCache()
+        self._session_activity_recorder: app_services.SessionActivityRecorder | None = (
+            None
+        )
 
         # Initialize Legacy domain services (pure business logic, no dependencies)
         self._gene_domain_service: GeneDomainService | None = None
         self._variant_domain_service: VariantDomainService | None = None
         self._evidence_domain_service: EvidenceDomainService | None = None
+        self._genomic_index_cache = app_services.GenomicIndexCache()
+        self._activation_rule_cache = app_services.ActivationRuleCache()
+        self._source_catalog_index_cache = SourceCatalogIndexCache()
+        self._entity_count_cache = EntityCountCache()
+        self._source_query_client = None
         self._storage_plugin_registry = storage.initialize_storage_plugins()
         self._storage_metrics_recorder = (
             observability.logging_metrics_recorder.LoggingStorageMetricsRecorder()
@@ -137,6 +148,19 @@ class DependencyContainer(ApplicationServiceFactoryMixin):
             )
         return self._session_repository
 
+    def get_token_validation_cache(self) -> app_services.TokenValidationCache:
+        return self._token_validation_cache
+
+    def get_activation_rule_cache(self) -> app_services.ActivationRuleCache:
+        return self._activation_rule_cache
+
+    def get_session_activity_recorder(self) -> app_services.SessionActivityRecorder:
+        if self._session_activity_recorder is None:
+            self._session_activity_recorder = app_services.SessionActivityRecorder(
+                self.get_session_repository(),
+            )
+        return self._session_activity_recorder
+
     def get_system_status_repository(self) -> SqlAlchemySystemStatusRepository:
         if self._system_status_repository is None:
             self._system_status_repository = SqlAlchemySystemStatusRepository(
@@ -151,6 +175,7 @@ class DependencyContainer(ApplicationServiceFactoryMixin):
             self._system_status_service = app_services.SystemStatusService(
                 repository=repository,
                 session_revoker=session_revoker,
+                token_cache=self._token_validation_cache,
             )
         return self._system_status_service
 
@@ -167,6 +192,8 @@ class DependencyContainer(ApplicationServiceFactoryMixin):
                 session_repository=session_repository,
                 jwt_provider=self.jwt_provider,
                 password_hasher=self.password_hasher,
+                token_cache=self._token_validation_cache,
+                activity_recorder=self.get_session_activity_recorder(),
             )
             self._authentication_service_loop = current_loop
         return self._authentication_service
@@ -194,6 +221,7 @@ class DependencyContainer(ApplicationServiceFactoryMixin):
             self._user_management_service = app_services.UserManagementService(
                 user_repository=user_repository,
                 password_hasher=self.password_hasher,
+                token_cache=self._token_validation_cache,
             )
             self._user_management_service_loop = current_loop
         return self._user_management_service
@@ -239,8 +267,29 @@ class DependencyContainer(ApplicationServiceFactoryMixin):
             yield
         finally:
             # Shutdown
+            await self.close_session_activity_recorder()
+            await self.close_source_query_client()
             await self.engine.dispose()
 
+    async def close_session_activity_recorder(self) -> None:
+        """Persist buffered session activity before shutdown."""
+        if self._session_activity_recorder is None:
+            return
+        try:
+            await self._session_activity_recorder.close()
+        except Exception:
+            logger.exception("Failed to flush buffered session activity")
+
+    async def close_source_query_client(self) -> None:
+        """Close pooled connections to external data sources."""
+        client, self._source_query_client = self._source_query_client, None
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except Exception:
+            logger.exception("Failed to close the source query client")
+
     async def health_check(self) -> dict[str, bool]:
         health_status: dict[str, bool] = {
             "database": False,
@@ -57,6 +57,8 @@ def _build_authentication_service() -> AuthenticationService:
         session_repository=SqlAlchemySessionRepository(container.async_session_factory),
         jwt_provider=container.jwt_provider,
         password_hasher=container.password_hasher,
+        token_cache=container.get_token_validation_cache(),
+        activity_recorder=container.get_session_activity_recorder(),
     )
 
 
@@ -89,12 +91,14 @@ def get_user_management_service_dependency() -> UserManagementService:
             return UserManagementService(
                 user_repository=get_user_repository_dependency(),
                 password_hasher=container.password_hasher,
+                token_cache=container.get_token_validation_cache(),
             )
         return loop.run_until_complete(container.get_user_management_service())
     except RuntimeError:
         return UserManagementService(
             user_repository=get_user_repository_dependency(),
             password_hasher=container.password_hasher,
+            token_cache=container.get_token_validation_cache(),
         )
 
 
@@ -118,9 +122,9 @@ def get_data_discovery_service_dependency() -> Generator[DataDiscoveryService]:
         session.close()
 
 
-def get_discovery_configuration_service_dependency() -> (
-    Generator[DiscoveryConfigurationService]
-):
+def get_discovery_configuration_service_dependency() -> Generator[
+    DiscoveryConfigurationService
+]:
     """Provide a scoped DiscoveryConfigurationService for FastAPI routes."""
     session = SessionLocal()
     try:
@@ -15,6 +15,7 @@ from src.application.curation import (
     SqlAlchemyReviewRepository,
 )
 from src.application.services import (
+    ActivationRuleCache,
     DashboardService,
     DataDiscoveryService,
     DataDiscoveryServiceDependencies,
@@ -24,6 +25,8 @@ from src.application.services import (
     ExtractionQueueService,
     ExtractionRunnerService,
     GeneApplicationService,
+    GenomicIndexCache,
+    GenomicRegionService,
     MechanismApplicationService,
     PhenotypeApplicationService,
     PublicationApplicationService,
@@ -46,7 +49,10 @@ from src.infrastructure.data_sources import (
     DeterministicPubMedSearchGateway,
     SimplePubMedPdfGateway,
 )
-from src.infrastructure.extraction import RuleBasedPubMedExtractionProcessor
+from src.infrastructure.extraction import (
+    RuleBasedPubMedExtractionProcessor,
+    load_extraction_vocabulary,
+)
 from src.infrastructure.llm.adapters.query_agent_adapter import FlujoQueryAgentAdapter
 from src.infrastructure.llm.config.model_registry import get_model_registry
 from src.infrastructure.queries.source_query_client import HTTPQueryClient
@@ -76,6 +82,10 @@ if TYPE_CHECKING:
 
     from src.domain.agents.ports.query_agent_port import QueryAgentPort
     from src.domain.services import storage_metrics, storage_providers
+    from src.infrastructure.repositories import (
+        EntityCountCache,
+        SourceCatalogIndexCache,
+    )
 
 
 class ApplicationServiceFactoryMixin:
@@ -85,6 +95,11 @@ class ApplicationServiceFactoryMixin:
         _storage_plugin_registry: storage_providers.StoragePluginRegistry
         _storage_metrics_recorder: storage_metrics.StorageMetricsRecorder
         _query_agent: QueryAgentPort | None
+        _genomic_index_cache: GenomicIndexCache
+        _activation_rule_cache: ActivationRuleCache
+        _source_catalog_index_cache: SourceCatalogIndexCache
+        _entity_count_cache: EntityCountCache
+        _source_query_client: HTTPQueryClient | None
 
         def get_system_status_service(self) -> SystemStatusService: ...
         def get_variant_domain_service(self) -> VariantDomainService: ...
@@ -97,37 +112,63 @@ class ApplicationServiceFactoryMixin:
             self._query_agent = FlujoQueryAgentAdapter(model=model_spec.model_id)
         return self._query_agent
 
+    def get_source_query_client(self) -> HTTPQueryClient:
+        if self._source_query_client is None:
+            self._source_query_client = HTTPQueryClient()
+        return self._source_query_client
+
     def create_gene_application_service(
         self,
         session: Session,
     ) -> GeneApplicationService:
-        gene_repository = SqlAlchemyGeneRepository(session)
+        gene_repository = SqlAlchemyGeneRepository(
+            session,
+            count_cache=self._entity_count_cache,
+        )
         gene_domain_service = GeneDomainService()
         variant_repository = SqlAlchemyVariantRepository(session)
         return GeneApplicationService(
             gene_repository=gene_repository,
             gene_domain_service=gene_domain_service,
             variant_repository=variant_repository,
+            index_cache=self._genomic_index_cache,
         )
 
     def create_variant_application_service(
         self,
         session: Session,
     ) -> VariantApplicationService:
-        variant_repository = SqlAlchemyVariantRepository(session)
+        variant_repository = SqlAlchemyVariantRepository(
+            session,
+            count_cache=self._entity_count_cache,
+        )
         variant_domain_service = VariantDomainService()
         evidence_repository = SqlAlchemyEvidenceRepository(session)
         return VariantApplicationService(
             variant_repository=variant_repository,
             variant_domain_service=variant_domain_service,
             evidence_repository=evidence_repository,
+            index_cache=self._genomic_index_cache,
+        )
+
+    def create_genomic_region_service(
+        self,
+        session: Session,
+    ) -> GenomicRegionService:
+        return GenomicRegionService(
+            gene_repository=SqlAlchemyGeneRepository(session),
+            variant_repository=SqlAlchemyVariantRepository(session),
+            index_cache=self._genomic_index_cache,
         )
 
     def create_phenotype_application_service(
         self,
         session: Session,
     ) -> PhenotypeApplicationService:
-        phenotype_repository = SqlAlchemyPhenotypeRepository(session)
+        phenotype_repository = SqlAlchemyPhenotypeRepository(
+            session,
+            count_cache=self._entity_count_cache,
+        )
         return PhenotypeApplicationService(
             phenotype_repository=phenotype_repository,
         )
@@ -145,7 +186,10 @@ class ApplicationServiceFactoryMixin:
         self,
         session: Session,
     ) -> EvidenceApplicationService:
-        evidence_repository = SqlAlchemyEvidenceRepository(session)
+        evidence_repository = SqlAlchemyEvidenceRepository(
+            session,
+            count_cache=self._entity_count_cache,
+        )
         evidence_domain_service = EvidenceDomainService()
         return EvidenceApplicationService(
             evidence_repository=evidence_repository,
@@ -156,7 +200,10 @@ class ApplicationServiceFactoryMixin:
         self,
         session: Session,
     ) -> PublicationApplicationService:
-        publication_repository = SqlAlchemyPublicationRepository(session)
+        publication_repository = SqlAlchemyPublicationRepository(
+            session,
+            count_cache=self._entity_count_cache,
+        )
         evidence_repository = SqlAlchemyEvidenceRepository(session)
         return PublicationApplicationService(
             publication_repository=publication_repository,
@@ -184,7 +231,9 @@ class ApplicationServiceFactoryMixin:
         queue_repository = SqlAlchemyExtractionQueueRepository(session)
         publication_repository = SqlAlchemyPublicationRepository(session)
         extraction_repository = SqlAlchemyPublicationExtractionRepository(session)
-        processor = RuleBasedPubMedExtractionProcessor()
+        processor = RuleBasedPubMedExtractionProcessor(
+            vocabulary=load_extraction_vocabulary(session),
+        )
         storage_coordinator = self.create_storage_operation_coordinator(session)
         return ExtractionRunnerService(
             queue_repository=queue_repository,
@@ -316,15 +365,21 @@ class ApplicationServiceFactoryMixin:
 
     def create_data_discovery_service(self, session: Session) -> DataDiscoveryService:
         session_repo = SQLAlchemyDataDiscoverySessionRepository(session)
-        catalog_repo = SQLAlchemySourceCatalogRepository(session)
+        catalog_repo = SQLAlchemySourceCatalogRepository(
+            session,
+            index_cache=self._source_catalog_index_cache,
+        )
         query_repo = SQLAlchemyQueryTestResultRepository(session)
 
-        query_client = HTTPQueryClient()
+        query_client = self.get_source_query_client()
 
         source_service = self.create_source_management_service(session)
         template_repo = SqlAlchemySourceTemplateRepository(session)
         activation_repo = SqlAlchemyDataSourceActivationRepository(session)
-        activation_service = DataSourceActivationService(activation_repo)
+        activation_service = DataSourceActivationService(
+            activation_repo,
+            rule_cache=self._activation_rule_cache,
+        )
 
         return DataDiscoveryService(
             data_discovery_session_repository=session_repo,
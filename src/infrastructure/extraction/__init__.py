@@ -1,13 +1,25 @@
 """Extraction processor adapters."""
 
+from src.infrastructure.extraction.dictionary_matcher import (
+    DictionaryMatcher,
+    DictionaryTerm,
+    ExtractionVocabulary,
+    get_dictionary_matcher,
+)
 from src.infrastructure.extraction.placeholder_extraction_processor import (
     PlaceholderExtractionProcessor,
 )
 from src.infrastructure.extraction.rule_based_pubmed_extraction_processor import (
     RuleBasedPubMedExtractionProcessor,
 )
+from src.infrastructure.extraction.vocabulary_loader import load_extraction_vocabulary
 
 __all__ = [
+    "DictionaryMatcher",
+    "DictionaryTerm",
+    "ExtractionVocabulary",
     "PlaceholderExtractionProcessor",
     "RuleBasedPubMedExtractionProcessor",
+    "get_dictionary_matcher",
+    "load_extraction_vocabulary",
 ]
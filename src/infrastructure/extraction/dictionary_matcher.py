@@ -0,0 +1,237 @@
+"""Aho-Corasick dictionary matching for rule-based extraction.
+
+Gene symbols, gene aliases and HPO term labels are compiled into a single
+automaton, so every vocabulary entry is found in one pass over the text
+regardless of vocabulary size. Automata are cached per vocabulary version and
+shared by every processor in the process.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from src.type_definitions.common import ExtractionFactType
+
+
+@dataclass(frozen=True)
+class DictionaryTerm:
+    """
+    Vocabulary entry recognised in text.
+
+    ``label`` is the surface form to find and ``value`` the canonical name
+    reported for it (the gene symbol for aliases, the term name for HPO
+    labels). Labels must sit on word boundaries; ``case_sensitive`` labels
+    must also match letter case exactly.
+    """
+
+    label: str
+    fact_type: ExtractionFactType
+    normalized_id: str
+    value: str = ""
+    case_sensitive: bool = False
+
+    @property
+    def canonical_value(self) -> str:
+        return self.value or self.label
+
+
+@dataclass(frozen=True)
+class ExtractionVocabulary:
+    """Versioned set of dictionary terms; the version keys the matcher cache."""
+
+    version: str
+    terms: tuple[DictionaryTerm, ...] = field(default=(), repr=False)
+
+    @classmethod
+    def from_sources(
+        cls,
+        version: str,
+        *,
+        gene_symbols: Mapping[str, str] | None = None,
+        gene_aliases: Mapping[str, Iterable[str]] | None = None,
+        phenotype_labels: Mapping[str, Iterable[str]] | None = None,
+    ) -> ExtractionVocabulary:
+        """
+        Build a vocabulary from gene and phenotype dictionaries.
+
+        ``gene_symbols`` maps each symbol to its normalized ID (e.g. an HGNC
+        ID), ``gene_aliases`` maps a symbol to its aliases, and
+        ``phenotype_labels`` maps an HPO ID to its name followed by synonyms.
+        Symbols and phenotype labels match case-insensitively; aliases are
+        often ordinary words or other genes' symbols, so they match
+        case-sensitively.
+        """
+        symbols = dict(gene_symbols or {})
+        terms: list[DictionaryTerm] = [
+            DictionaryTerm(label=symbol, fact_type="gene", normalized_id=gene_id)
+            for symbol, gene_id in symbols.items()
+        ]
+        for symbol, aliases in (gene_aliases or {}).items():
+            gene_id = symbols.get(symbol, symbol)
+            terms.extend(
+                DictionaryTerm(
+                    label=alias,
+                    fact_type="gene",
+                    normalized_id=gene_id,
+                    value=symbol,
+                    case_sensitive=True,
+                )
+                for alias in aliases
+                if alias and alias != symbol
+            )
+        for hpo_id, labels in (phenotype_labels or {}).items():
+            names = [label for label in labels if label]
+            if not names:
+                continue
+            terms.extend(
+                DictionaryTerm(
+                    label=label,
+                    fact_type="phenotype",
+                    normalized_id=hpo_id,
+                    value=names[0],
+                )
+                for label in names
+            )
+        return cls(version=version, terms=tuple(terms))
+
+
+@dataclass(frozen=True)
+class DictionaryMatch:
+    """Occurrence of a dictionary term in text."""
+
+    term: DictionaryTerm
+    start: int
+    end: int
+    text: str
+
+
+class DictionaryMatcher:
+    """Multi-pattern matcher over a fixed vocabulary (Aho-Corasick automaton)."""
+
+    def __init__(self, vocabulary: ExtractionVocabulary) -> None:
+        self.version = vocabulary.version
+        self._terms: list[DictionaryTerm] = []
+        self._lengths: list[int] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[tuple[int, ...]] = [()]
+
+        seen: set[DictionaryTerm] = set()
+        for term in vocabulary.terms:
+            if not term.label or term in seen:
+                continue
+            seen.add(term)
+            self._insert(term)
+        self._link_failures()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def find_all(self, text: str) -> list[DictionaryMatch]:
+        """Return every term occurrence in ``text``, ordered by end offset."""
+        matches: list[DictionaryMatch] = []
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        for index, char in enumerate(_fold(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term_index in outputs[state]:
+                end = index + 1
+                start = end - self._lengths[term_index]
+                term = self._terms[term_index]
+                if self._accepts(term, text, start, end):
+                    matches.append(
+                        DictionaryMatch(
+                            term=term,
+                            start=start,
+                            end=end,
+                            text=text[start:end],
+                        ),
+                    )
+        return matches
+
+    def _insert(self, term: DictionaryTerm) -> None:
+        state = 0
+        for char in _fold(term.label):
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(())
+            state = next_state
+        self._outputs[state] = (*self._outputs[state], len(self._terms))
+        self._terms.append(term)
+        self._lengths.append(len(term.label))
+
+    def _link_failures(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] = (
+                    *self._outputs[next_state],
+                    *self._outputs[self._fail[next_state]],
+                )
+
+    @staticmethod
+    def _accepts(term: DictionaryTerm, text: str, start: int, end: int) -> bool:
+        label = term.label
+        if _is_word_char(label[0]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(label[-1]) and end < len(text) and _is_word_char(text[end]):
+            return False
+        return not term.case_sensitive or text[start:end] == label
+
+
+_MATCHERS: dict[str, DictionaryMatcher] = {}
+_MATCHERS_LOCK = threading.Lock()
+
+
+def get_dictionary_matcher(vocabulary: ExtractionVocabulary) -> DictionaryMatcher:
+    """Return the process-wide matcher for ``vocabulary``, building it once."""
+    matcher = _MATCHERS.get(vocabulary.version)
+    if matcher is not None:
+        return matcher
+    with _MATCHERS_LOCK:
+        matcher = _MATCHERS.get(vocabulary.version)
+        if matcher is None:
+            matcher = DictionaryMatcher(vocabulary)
+            _MATCHERS[vocabulary.version] = matcher
+    return matcher
+
+
+def _fold(text: str) -> str:
+    # Per-character lowercasing keeps offsets aligned with the original text.
+    return "".join(
+        lowered if len(lowered := char.lower()) == 1 else char for char in text
+    )
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+__all__ = [
+    "DictionaryMatch",
+    "DictionaryMatcher",
+    "DictionaryTerm",
+    "ExtractionVocabulary",
+    "get_dictionary_matcher",
+]
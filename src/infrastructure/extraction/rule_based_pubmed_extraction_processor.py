@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
 from typing import TYPE_CHECKING, Protocol
 
@@ -11,6 +12,11 @@ from src.application.services.ports.extraction_processor_port import (
     ExtractionProcessorResult,
     ExtractionTextPayload,
 )
+from src.infrastructure.extraction.dictionary_matcher import (
+    DictionaryMatcher,
+    ExtractionVocabulary,
+    get_dictionary_matcher,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -31,11 +37,36 @@ _PROTEIN_VARIANT_1_PATTERN = re.compile(r"\bp\.[A-Z]\d+[A-Z]\b")
 
 
 class RuleBasedPubMedExtractionProcessor(ExtractionProcessorPort):
-    """Extracts simple gene, variant, and phenotype facts from titles/abstracts."""
+    """
+    Extracts simple gene, variant, and phenotype facts from titles/abstracts.
+
+    Gene symbols, aliases and HPO labels come from ``vocabulary`` and are
+    matched in a single pass by the shared dictionary matcher. Without a
+    vocabulary, ``gene_symbols`` are matched case-insensitively.
+    """
+
+    def __init__(
+        self,
+        *,
+        gene_symbols: Iterable[str] | None = None,
+        vocabulary: ExtractionVocabulary | None = None,
+    ) -> None:
+        self._vocabulary = vocabulary or _gene_symbol_vocabulary(
+            gene_symbols or ("MED13",),
+        )
+        self._matcher: DictionaryMatcher = get_dictionary_matcher(self._vocabulary)
+
+    def __getstate__(self) -> dict[str, object]:
+        # Worker processes rebuild the matcher from their own cache.
+        return {"_vocabulary": self._vocabulary}
 
-    def __init__(self, *, gene_symbols: Iterable[str] | None = None) -> None:
-        symbols = gene_symbols or ("MED13",)
-        self._gene_symbols = {symbol.strip().upper() for symbol in symbols if symbol}
+    def __setstate__(self, state: dict[str, object]) -> None:
+        vocabulary = state["_vocabulary"]
+        if not isinstance(vocabulary, ExtractionVocabulary):
+            message = "Invalid extraction processor state"
+            raise TypeError(message)
+        self._vocabulary = vocabulary
+        self._matcher = get_dictionary_matcher(vocabulary)
 
     def extract_publication(
         self,
@@ -111,7 +142,7 @@ class RuleBasedPubMedExtractionProcessor(ExtractionProcessorPort):
                 fact["attributes"] = attributes
             facts.append(fact)
 
-        _extract_gene_mentions(text, self._gene_symbols, add_fact, source=text_source)
+        _extract_dictionary_terms(text, self._matcher, add_fact, source=text_source)
         _extract_variants(text, add_fact, source=text_source)
         _extract_hpo_ids(text, add_fact, source=text_source)
 
@@ -119,6 +150,7 @@ class RuleBasedPubMedExtractionProcessor(ExtractionProcessorPort):
         metadata: JSONObject = {
             "queue_item_id": str(queue_item.id),
             "fact_count": len(facts),
+            "vocabulary_version": self._matcher.version,
         }
         return ExtractionProcessorResult(
             status=status,
@@ -148,24 +180,35 @@ class _AddFact(Protocol):
     ) -> None: ...
 
 
-def _extract_gene_mentions(
+def _gene_symbol_vocabulary(symbols: Iterable[str]) -> ExtractionVocabulary:
+    normalized = sorted({symbol.strip().upper() for symbol in symbols if symbol})
+    digest = hashlib.sha256("\n".join(normalized).encode("utf-8")).hexdigest()
+    return ExtractionVocabulary.from_sources(
+        f"gene-symbols:{digest[:16]}",
+        gene_symbols={symbol: symbol for symbol in normalized},
+    )
+
+
+def _extract_dictionary_terms(
     text: str,
-    symbols: set[str],
+    matcher: DictionaryMatcher,
     add_fact: _AddFact,
     *,
     source: str,
 ) -> None:
-    if not symbols:
-        return
-    for symbol in symbols:
-        pattern = re.compile(rf"\b{re.escape(symbol)}\b", re.IGNORECASE)
-        if pattern.search(text):
-            add_fact(
-                "gene",
-                symbol,
-                normalized_id=symbol,
-                source=source,
-            )
+    for match in matcher.find_all(text):
+        term = match.term
+        value = term.canonical_value
+        attributes: JSONObject | None = None
+        if match.text.lower() != value.lower():
+            attributes = {"matched_text": match.text}
+        add_fact(
+            term.fact_type,
+            value,
+            normalized_id=term.normalized_id,
+            source=source,
+            attributes=attributes,
+        )
 
 
 def _extract_variants(text: str, add_fact: _AddFact, *, source: str) -> None:
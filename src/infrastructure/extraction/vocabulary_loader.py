@@ -0,0 +1,75 @@
+"""Build the extraction vocabulary from the stored gene and HPO term tables."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from src.infrastructure.extraction.dictionary_matcher import ExtractionVocabulary
+from src.models.database import GeneModel, PhenotypeModel
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+_DEFAULT_GENE_SYMBOLS = {"MED13": "MED13"}
+
+
+def load_extraction_vocabulary(session: Session) -> ExtractionVocabulary:
+    """
+    Load gene symbols and HPO labels for the rule-based extraction processor.
+
+    Gene symbols map to their stored gene IDs; each HPO term contributes its
+    name followed by its synonyms. MED13 is always present so an empty
+    database still matches the library's focus gene. The version is a digest
+    of the contents, so processors keep sharing one matcher until the curated
+    tables change.
+    """
+    gene_symbols = dict(_DEFAULT_GENE_SYMBOLS)
+    gene_rows = session.execute(
+        select(GeneModel.symbol, GeneModel.gene_id).order_by(GeneModel.gene_id),
+    )
+    for symbol, gene_id in gene_rows:
+        if symbol:
+            gene_symbols[symbol.upper()] = gene_id
+
+    phenotype_rows = session.execute(
+        select(
+            PhenotypeModel.hpo_id,
+            PhenotypeModel.name,
+            PhenotypeModel.synonyms,
+        ).order_by(PhenotypeModel.hpo_id),
+    )
+    phenotype_labels = {
+        hpo_id: [name, *_parse_synonyms(synonyms)]
+        for hpo_id, name, synonyms in phenotype_rows
+    }
+
+    payload = json.dumps(
+        [sorted(gene_symbols.items()), sorted(phenotype_labels.items())],
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return ExtractionVocabulary.from_sources(
+        f"curated:{digest[:16]}",
+        gene_symbols=gene_symbols,
+        phenotype_labels=phenotype_labels,
+    )
+
+
+def _parse_synonyms(raw_synonyms: str | None) -> list[str]:
+    # Same storage format the phenotype mapper reads: a JSON array, or a
+    # comma-separated list in older rows.
+    if not raw_synonyms:
+        return []
+    try:
+        parsed = json.loads(raw_synonyms)
+        if isinstance(parsed, list):
+            return [str(item).strip() for item in parsed if str(item).strip()]
+    except json.JSONDecodeError:
+        pass
+    return [token.strip() for token in raw_synonyms.split(",") if token.strip()]
+
+
+__all__ = ["load_extraction_vocabulary"]
@@ -22,7 +22,10 @@ from src.infrastructure.data_sources import (
     PubMedSourceGateway,
     SimplePubMedPdfGateway,
 )
-from src.infrastructure.extraction import RuleBasedPubMedExtractionProcessor
+from src.infrastructure.extraction import (
+    RuleBasedPubMedExtractionProcessor,
+    load_extraction_vocabulary,
+)
 from src.infrastructure.llm.adapters.query_agent_adapter import FlujoQueryAgentAdapter
 from src.infrastructure.repositories import (
     SQLAlchemyDiscoverySearchJobRepository,
@@ -78,7 +81,9 @@ def build_ingestion_scheduling_service(
         queue_repository=extraction_queue_repository,
         publication_repository=publication_repository,
         extraction_repository=extraction_repository,
-        processor=RuleBasedPubMedExtractionProcessor(),
+        processor=RuleBasedPubMedExtractionProcessor(
+            vocabulary=load_extraction_vocabulary(session),
+        ),
         storage_coordinator=storage_coordinator,
     )
 
@@ -0,0 +1,31 @@
+"""Shared HTTP clients and request budgets for upstream data sources."""
+
+from .client_registry import (
+    ConnectionReuseStats,
+    HttpClientRegistry,
+    HttpPoolSettings,
+    get_http_client_registry,
+    origin_of,
+)
+from .rate_limits import (
+    HostBudget,
+    HostRateLimiters,
+    RateLimiter,
+    SharedRateBackend,
+    get_host_rate_limiters,
+    ncbi_api_key,
+)
+
+__all__ = [
+    "ConnectionReuseStats",
+    "HostBudget",
+    "HostRateLimiters",
+    "HttpClientRegistry",
+    "HttpPoolSettings",
+    "RateLimiter",
+    "SharedRateBackend",
+    "get_host_rate_limiters",
+    "get_http_client_registry",
+    "ncbi_api_key",
+    "origin_of",
+]
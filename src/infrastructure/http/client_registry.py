@@ -0,0 +1,174 @@
+"""
+Process-wide registry of pooled HTTP clients for upstream data sources.
+
+Gateways and ingestors ask the registry for the client serving an origin
+(scheme, host and port) instead of opening their own, so TCP and TLS
+connections to NCBI, UniProt, HPO and user-configured APIs are reused across
+calls and ingestion batches. HTTP/2 is offered when the optional ``h2``
+package is installed; hosts without HTTP/2 fall back to HTTP/1.1 through
+ALPN. ``stats`` reports how often requests reused a pooled connection and
+``aclose`` shuts the clients down from the application lifespan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, replace
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:  # pragma: no cover - typing helpers only
+    from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = find_spec("h2") is not None
+_CONNECTION_OPENED_EVENT = "connection.connect_tcp.complete"
+
+
+@dataclass(frozen=True)
+class HttpPoolSettings:
+    """Connection pool limits applied to every client in the registry."""
+
+    max_connections: int = 50
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    http2: bool = HTTP2_AVAILABLE
+
+
+@dataclass
+class ConnectionReuseStats:
+    """Requests sent to an origin and the connections opened to serve them."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused / self.requests if self.requests else 0.0
+
+
+ClientKey = tuple[str, asyncio.AbstractEventLoop]
+
+
+def origin_of(url: str | httpx.URL) -> str:
+    """Return ``scheme://host[:port]`` for ``url``."""
+    parsed = httpx.URL(url)
+    origin = f"{parsed.scheme}://{parsed.host}"
+    return f"{origin}:{parsed.port}" if parsed.port is not None else origin
+
+
+class HttpClientRegistry:
+    """
+    Shares one pooled ``httpx.AsyncClient`` per origin and event loop.
+
+    Async clients are bound to the loop that first used them, so a worker
+    thread running its own loop gets its own client for the same origin.
+    Callers pass headers and timeouts per request; clients carry none.
+    """
+
+    def __init__(
+        self,
+        settings: HttpPoolSettings | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.settings = settings or HttpPoolSettings()
+        self._transport = transport
+        self._clients: dict[ClientKey, httpx.AsyncClient] = {}
+        self._stats: dict[str, ConnectionReuseStats] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def client_for(self, url: str | httpx.URL) -> httpx.AsyncClient:
+        """Return the shared client for the origin of ``url``."""
+        origin = origin_of(url)
+        key = (origin, asyncio.get_running_loop())
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                self._discard_closed_loops()
+                client = self._build_client(origin)
+                self._clients[key] = client
+        return client
+
+    def stats(self) -> dict[str, ConnectionReuseStats]:
+        """Snapshot of connection reuse per origin."""
+        with self._lock:
+            return {origin: replace(stats) for origin, stats in self._stats.items()}
+
+    async def aclose(self) -> None:
+        """Close the clients bound to the running loop and forget the rest."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for (origin, owner), client in clients.items():
+            if owner is not loop:
+                # Connections of another loop cannot be closed from this one.
+                logger.debug(
+                    "Dropping HTTP client for %s owned by another loop",
+                    origin,
+                )
+                continue
+            try:
+                await client.aclose()
+            except Exception:
+                logger.exception("Failed to close HTTP client for %s", origin)
+
+    def _discard_closed_loops(self) -> None:
+        stale = [key for key in self._clients if key[1].is_closed()]
+        for key in stale:
+            del self._clients[key]
+
+    def _build_client(self, origin: str) -> httpx.AsyncClient:
+        stats = self._stats.setdefault(origin, ConnectionReuseStats())
+
+        async def trace(event: str, _info: Mapping[str, object]) -> None:
+            if event == _CONNECTION_OPENED_EVENT:
+                stats.connections_opened += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = trace
+
+        settings = self.settings
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry_seconds,
+            ),
+            http2=settings.http2,
+            transport=self._transport,
+            event_hooks={"request": [on_request]},
+        )
+
+
+_registry: HttpClientRegistry | None = None
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Return the process-wide registry shared by gateways and ingestors."""
+    global _registry  # noqa: PLW0603 - lazily created singleton
+    if _registry is None:
+        _registry = HttpClientRegistry()
+    return _registry
+
+
+__all__ = [
+    "ConnectionReuseStats",
+    "HttpClientRegistry",
+    "HttpPoolSettings",
+    "get_http_client_registry",
+    "origin_of",
+]
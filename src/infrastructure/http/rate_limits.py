@@ -0,0 +1,283 @@
+"""
+Per-host request budgets shared by every outbound caller in the process.
+
+Ingestors, the API source gateway and discovery queries all draw from one
+token bucket per upstream host, so concurrent ingestion runs, scheduled jobs
+and interactive tests together stay within the host's quota. A caller that
+finds the bucket empty reserves the next token and sleeps exactly until it
+becomes available, which keeps throughput close to the quota without
+polling. Known hosts use their published quota (NCBI E-utilities allow
+three requests per second, ten with an API key); other hosts use the
+strictest rate declared by their callers.
+
+An optional shared backend (the Redis-backed sliding-window limiter) can be
+plugged in to extend the budget across processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+import httpx
+
+if TYPE_CHECKING:  # pragma: no cover - typing helpers only
+    from collections.abc import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUESTS_PER_MINUTE = 60
+NCBI_EUTILS_HOST = "eutils.ncbi.nlm.nih.gov"
+NCBI_API_KEY_ENV = "NCBI_API_KEY"
+NCBI_REQUESTS_PER_SECOND = 3
+NCBI_REQUESTS_PER_SECOND_WITH_KEY = 10
+
+
+class SharedRateBackend(Protocol):
+    """Cross-process limiter consulted after the local bucket admits a request."""
+
+    window_seconds: int
+
+    async def allow(self, key: str, capacity: int) -> tuple[bool, int]: ...
+
+    async def close(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class HostBudget:
+    """Sustained request rate and burst size allowed for one host."""
+
+    requests_per_second: float
+    burst: int = 1
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float) -> HostBudget:
+        rate = requests_per_minute / 60
+        return cls(requests_per_second=rate, burst=max(1, math.floor(rate)))
+
+
+def ncbi_api_key() -> str | None:
+    """The NCBI E-utilities API key configured for this process, if any."""
+    return os.getenv(NCBI_API_KEY_ENV) or None
+
+
+def default_host_budgets() -> dict[str, HostBudget]:
+    """Published quotas for hosts the ingestors talk to."""
+    ncbi_rate = (
+        NCBI_REQUESTS_PER_SECOND_WITH_KEY
+        if ncbi_api_key()
+        else NCBI_REQUESTS_PER_SECOND
+    )
+    # Evenly spaced requests: NCBI counts requests per second, not per minute.
+    return {NCBI_EUTILS_HOST: HostBudget(ncbi_rate)}
+
+
+class RateLimiter:
+    """
+    Token bucket for one host.
+
+    Waiters reserve tokens in arrival order: the balance may go negative and
+    each caller sleeps for its own deficit, so no one polls or overshoots.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        budget: HostBudget,
+        *,
+        backend: SharedRateBackend | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.key = key
+        self.budget = budget
+        self.backend = backend
+        self._clock = clock
+        self._tokens = float(budget.burst)
+        self._updated = clock()
+        # Ingestors may run on worker threads with their own event loops.
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    @property
+    def requests_per_minute(self) -> float:
+        return self.budget.requests_per_second * 60
+
+    def acquire(self) -> bool:
+        """Take a token if one is available now, without waiting."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    async def wait_for_token(self) -> None:
+        """Wait exactly as long as needed for the next token."""
+        delay = self._reserve()
+        if delay > 0:
+            self.waits += 1
+            self.waited_seconds += delay
+            await asyncio.sleep(delay)
+        if self.backend is not None:
+            await self._wait_for_backend(self.backend)
+
+    def tighten(self, budget: HostBudget) -> None:
+        """Lower the budget if ``budget`` is stricter than the current one."""
+        with self._lock:
+            if budget.requests_per_second >= self.budget.requests_per_second:
+                return
+            self._refill()
+            self.budget = budget
+            self._tokens = min(self._tokens, float(budget.burst))
+
+    def _reserve(self) -> float:
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.budget.requests_per_second
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(now - self._updated, 0.0)
+        self._updated = now
+        self._tokens = min(
+            float(self.budget.burst),
+            self._tokens + elapsed * self.budget.requests_per_second,
+        )
+
+    async def _wait_for_backend(self, backend: SharedRateBackend) -> None:
+        capacity = max(
+            1,
+            math.floor(self.budget.requests_per_second * backend.window_seconds),
+        )
+        while True:
+            allowed, retry_after = await backend.allow(self.key, capacity)
+            if allowed:
+                return
+            self.waits += 1
+            self.waited_seconds += retry_after
+            await asyncio.sleep(retry_after)
+
+
+class HostRateLimiters:
+    """Process-wide registry of per-host rate limiters."""
+
+    def __init__(
+        self,
+        known_budgets: Mapping[str, HostBudget] | None = None,
+        *,
+        backend: SharedRateBackend | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._known = dict(
+            known_budgets if known_budgets is not None else default_host_budgets(),
+        )
+        self._backend = backend
+        self._clock = clock
+        self._limiters: dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter_for(
+        self,
+        url: str,
+        requests_per_minute: float | None = None,
+    ) -> RateLimiter:
+        """
+        Return the limiter shared by every caller of ``url``'s host.
+
+        Args:
+            url: A URL on the host
+            requests_per_minute: Rate the caller wants to stay under; ignored
+                for hosts with a known quota
+
+        Returns:
+            The host's shared limiter
+        """
+        host = httpx.URL(url).host
+        known = self._known.get(host)
+        budget = known or HostBudget.per_minute(
+            requests_per_minute or DEFAULT_REQUESTS_PER_MINUTE,
+        )
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = RateLimiter(
+                    f"host:{host}",
+                    budget,
+                    backend=self._backend,
+                    clock=self._clock,
+                )
+                self._limiters[host] = limiter
+            elif known is None and requests_per_minute is not None:
+                limiter.tighten(budget)
+        return limiter
+
+    def budgeted_limiter_for(self, url: str) -> RateLimiter | None:
+        """
+        Return ``url``'s host limiter only if the host has a budget.
+
+        A host has a budget when it has a known quota or another caller has
+        declared a rate for it. Callers with no rate of their own use this so
+        that unknown hosts are not held to the default rate.
+        """
+        host = httpx.URL(url).host
+        if host in self._known:
+            return self.limiter_for(url)
+        with self._lock:
+            return self._limiters.get(host)
+
+    async def acquire(
+        self,
+        url: str,
+        requests_per_minute: float | None = None,
+    ) -> None:
+        """Wait for a request slot on ``url``'s host."""
+        await self.limiter_for(url, requests_per_minute).wait_for_token()
+
+    def use_backend(self, backend: SharedRateBackend | None) -> None:
+        """Share budgets across processes through ``backend``."""
+        with self._lock:
+            self._backend = backend
+            for limiter in self._limiters.values():
+                limiter.backend = backend
+
+    async def aclose(self) -> None:
+        """Release the shared backend, if one is configured."""
+        backend, self._backend = self._backend, None
+        if backend is None:
+            return
+        self.use_backend(None)
+        try:
+            await backend.close()
+        except Exception:
+            logger.exception("Failed to close the shared rate limit backend")
+
+
+_host_rate_limiters: HostRateLimiters | None = None
+
+
+def get_host_rate_limiters() -> HostRateLimiters:
+    """Return the process-wide per-host limiters."""
+    global _host_rate_limiters  # noqa: PLW0603 - lazily created singleton
+    if _host_rate_limiters is None:
+        _host_rate_limiters = HostRateLimiters()
+    return _host_rate_limiters
+
+
+__all__ = [
+    "HostBudget",
+    "HostRateLimiters",
+    "RateLimiter",
+    "SharedRateBackend",
+    "get_host_rate_limiters",
+    "ncbi_api_key",
+]
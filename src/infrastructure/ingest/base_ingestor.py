@@ -1,14 +1,15 @@
 """
 Base ingestor for MED13 Resource Library data acquisition.
 Provides common functionality for API clients with rate limiting and error handling.
+HTTP connections and request budgets come from process-wide registries, so
+every ingestor for a host shares one connection pool and one rate limit.
 """
 
 import asyncio
-import json
-import time
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
@@ -16,6 +17,14 @@ from types import TracebackType
 
 import httpx
 
+from src.domain.transform.raw_spool import DEFAULT_SEGMENT_BYTES, RawRecordSpool
+from src.infrastructure.http import (
+    HostRateLimiters,
+    HttpClientRegistry,
+    RateLimiter,
+    get_host_rate_limiters,
+    get_http_client_registry,
+)
 from src.models.value_objects import DataSource, Provenance
 from src.type_definitions.common import JSONObject, JSONPrimitive, JSONValue, RawRecord
 
@@ -57,39 +66,7 @@ class IngestionResult:
     errors: list[IngestionError]
     duration_seconds: float
     timestamp: datetime
-
-
-class RateLimiter:
-    """Simple token bucket rate limiter."""
-
-    def __init__(self, requests_per_minute: int):
-        self.requests_per_minute: int = requests_per_minute
-        self.requests_per_second: float = requests_per_minute / 60.0
-        self.tokens: float = float(requests_per_minute)
-        self.last_update: float = time.time()
-        self.max_tokens: float = float(requests_per_minute)
-
-    def acquire(self) -> bool:
-        """Acquire a token. Returns True if successful."""
-        now = time.time()
-        elapsed = now - self.last_update
-
-        # Add tokens based on elapsed time
-        self.tokens = min(
-            self.max_tokens,
-            self.tokens + elapsed * self.requests_per_second,
-        )
-        self.last_update = now
-
-        if self.tokens >= 1:
-            self.tokens -= 1
-            return True
-        return False
-
-    async def wait_for_token(self) -> None:
-        """Wait until a token is available."""
-        while not self.acquire():
-            await asyncio.sleep(1.0)
+    raw_snapshot: list[Path] = field(default_factory=list)
 
 
 QueryParams = Mapping[str, JSONPrimitive]
@@ -116,10 +93,20 @@ class BaseIngestor(ABC):
         timeout_seconds: int = 30,
         max_retries: int = 3,
         raw_data_dir: Path | None = None,
+        *,
+        http_clients: HttpClientRegistry | None = None,
+        rate_limiters: HostRateLimiters | None = None,
     ):
         self.source_name: str = source_name
         self.base_url: str = base_url
-        self.rate_limiter = RateLimiter(requests_per_minute)
+        # Budget shared with every other caller of the same host
+        limiters = (
+            rate_limiters if rate_limiters is not None else get_host_rate_limiters()
+        )
+        self.rate_limiter: RateLimiter = limiters.limiter_for(
+            base_url,
+            requests_per_minute,
+        )
         self.timeout_seconds: int = timeout_seconds
         self.max_retries: int = max_retries
         # Circuit breaker threshold for consecutive failures
@@ -128,30 +115,41 @@ class BaseIngestor(ABC):
         # Raw data storage
         self.raw_data_dir: Path = raw_data_dir or Path("data/raw") / source_name
         self.raw_data_dir.mkdir(parents=True, exist_ok=True)
+        # Uncompressed size at which a raw snapshot rolls over to a new segment
+        self.raw_segment_bytes: int = DEFAULT_SEGMENT_BYTES
 
         # Circuit breaker state
         self.failure_count: int = 0
         self.last_failure_time: datetime | None = None
         self.circuit_open: bool = False
 
-        # HTTP client
-        self.client: httpx.AsyncClient = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout_seconds),
-            headers={"User-Agent": "MED13-Resource-Library/1.0 (research@med13.org)"},
+        # HTTP client: pooled per origin and shared with other ingestors
+        self.http_clients = (
+            http_clients if http_clients is not None else get_http_client_registry()
         )
+        self.timeout = httpx.Timeout(timeout_seconds)
+        self.default_headers: dict[str, str] = {
+            "User-Agent": "MED13-Resource-Library/1.0 (research@med13.org)",
+        }
+        # Query parameters sent with every request (e.g. API keys)
+        self.default_params: dict[str, JSONPrimitive] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared client for ``base_url``; connections outlive this ingestor."""
+        return self.http_clients.client_for(self.base_url)
 
     async def __aenter__(self) -> "BaseIngestor":
         """Async context manager entry."""
         return self
 
-    async def __aexit__(
+    async def __aexit__(  # noqa: B027 - the registry owns the connections
         self,
         exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Async context manager exit."""
-        await self.client.aclose()
+        """Async context manager exit; the shared client stays open."""
 
     @abstractmethod
     async def fetch_data(self, **kwargs: JSONValue) -> list[RawRecord]:
@@ -165,6 +163,22 @@ class BaseIngestor(ABC):
             List of raw data records
         """
 
+    async def stream_records(self, **kwargs: JSONValue) -> AsyncIterator[RawRecord]:
+        """
+        Yield records as the source produces them.
+
+        The default wraps ``fetch_data``; ingestors that can page through
+        their source override it so records reach the raw spool early.
+
+        Args:
+            **kwargs: Source-specific parameters
+
+        Yields:
+            Raw data records
+        """
+        for record in await self.fetch_data(**kwargs):
+            yield record
+
     async def ingest(self, **kwargs: JSONValue) -> IngestionResult:
         """
         Main ingestion method with error handling and provenance tracking.
@@ -203,11 +217,11 @@ class BaseIngestor(ABC):
             )
 
         try:
-            # Fetch data
-            data = await self.fetch_data(**kwargs)
-
-            # Store raw data
-            await self._store_raw_data(data, start_time)
+            # Fetch data, spooling each record to the raw snapshot as it arrives
+            with self._open_raw_spool(start_time) as spool:
+                async for record in self.stream_records(**kwargs):
+                    spool.write(record)
+                    data.append(record)
 
             # Update provenance
             provenance = provenance.add_processing_step(
@@ -224,6 +238,7 @@ class BaseIngestor(ABC):
                 errors=errors,
                 duration_seconds=(datetime.now(UTC) - start_time).total_seconds(),
                 timestamp=start_time,
+                raw_snapshot=[segment.path for segment in spool.segments],
             )
 
         except Exception as e:  # noqa: BLE001 - top-level ingest guard
@@ -255,6 +270,7 @@ class BaseIngestor(ABC):
         *,
         params: QueryParams | None = None,
         headers: HeaderMap | None = None,
+        stream: bool = False,
     ) -> httpx.Response:
         """
         Make HTTP request with rate limiting and retry logic.
@@ -263,6 +279,8 @@ class BaseIngestor(ABC):
             method: HTTP method
             endpoint: API endpoint (relative to base_url)
             **kwargs: Additional request parameters
+            stream: Return once the headers arrive and leave the body unread;
+                the caller must close the response
 
         Returns:
             HTTP response
@@ -279,20 +297,26 @@ class BaseIngestor(ABC):
                 # Wait for rate limit token
                 await self.rate_limiter.wait_for_token()
 
-                response = await self.client.request(
+                request = self.client.build_request(
                     method,
                     url,
-                    params=params,
-                    headers=headers,
+                    params={**self.default_params, **(params or {})},
+                    headers={**self.default_headers, **(headers or {})},
+                    timeout=self.timeout,
                 )
+                response = await self.client.send(request, stream=stream)
 
                 # Check for rate limiting
                 if response.status_code == rate_limit_status:
+                    await response.aclose()
                     # Exponential backoff for rate limiting
                     wait_time = 2**attempt
                     await asyncio.sleep(wait_time)
                     continue
 
+                if response.is_error:
+                    # Error bodies are small; read them for the error message
+                    await response.aread()
                 response.raise_for_status()
             except httpx.HTTPStatusError as e:
                 if (
@@ -316,38 +340,49 @@ class BaseIngestor(ABC):
         message = f"Failed after {self.max_retries} attempts"
         raise IngestionError(message, self.source_name)
 
-    async def _store_raw_data(
+    @asynccontextmanager
+    async def _stream_request(
         self,
-        data: list[RawRecord],
-        timestamp: datetime,
-    ) -> Path:
+        method: str,
+        endpoint: str,
+        *,
+        params: QueryParams | None = None,
+        headers: HeaderMap | None = None,
+    ) -> AsyncIterator[httpx.Response]:
         """
-        Store raw data to filesystem with timestamp.
+        Make a request like ``_make_request`` without reading the body.
+
+        The caller iterates the body (e.g. ``response.aiter_bytes()``) inside
+        the block; the response is closed when the block exits.
+        """
+        response = await self._make_request(
+            method,
+            endpoint,
+            params=params,
+            headers=headers,
+            stream=True,
+        )
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    def _open_raw_spool(self, timestamp: datetime) -> RawRecordSpool:
+        """
+        Start a compressed raw-data snapshot for this run.
 
         Args:
-            data: Raw data to store
-            timestamp: Timestamp for filename
+            timestamp: Timestamp for the snapshot name
 
         Returns:
-            Path to stored file
+            Spool writing segments under ``raw_data_dir``
         """
         timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.source_name}_{timestamp_str}.json"
-        filepath = self.raw_data_dir / filename
-
-        with filepath.open("w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "source": self.source_name,
-                    "timestamp": timestamp.isoformat(),
-                    "records": data,
-                },
-                f,
-                indent=2,
-                default=str,
-            )
-
-        return filepath
+        return RawRecordSpool(
+            self.raw_data_dir,
+            f"{self.source_name}_{timestamp_str}",
+            max_segment_bytes=self.raw_segment_bytes,
+        )
 
     def _record_failure(self) -> None:
         """Record a failure for circuit breaker logic."""
@@ -6,23 +6,40 @@ Fetches genetic variant data from ClinVar database.
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
 from typing import TYPE_CHECKING
 
+from defusedxml import ElementTree
+
+from src.infrastructure.http import ncbi_api_key
 from src.infrastructure.ingest.base_ingestor import BaseIngestor
 from src.infrastructure.validation.api_response_validator import (
     APIResponseValidator,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from xml.etree.ElementTree import Element  # nosec B405
+
     from src.type_definitions.common import JSONValue, RawRecord
-    from src.type_definitions.external_apis import (
-        ClinVarSearchResponse,
-        ClinVarVariantResponse,
-    )
+    from src.type_definitions.external_apis import ClinVarSearchResponse
 
 logger = logging.getLogger(__name__)
 
+# Variants per EFetch request; IDs travel in the query string.
+EFETCH_BATCH_SIZE = 100
+# EFetch batches in flight at once, paced by the shared NCBI budget.
+MAX_CONCURRENT_BATCHES = 3
+VCV_RESULT_SET = "ClinVarResult-Set"
+
+
+def _unique_texts(elements: Iterable[Element]) -> list[str]:
+    """Non-empty element texts in document order, without duplicates."""
+    texts = (element.text.strip() for element in elements if element.text)
+    return list(dict.fromkeys(text for text in texts if text))
+
 
 class ClinVarIngestor(BaseIngestor):
     """
@@ -33,14 +50,20 @@ class ClinVarIngestor(BaseIngestor):
     related to MED13.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, raw_data_dir: Path | None = None) -> None:
         super().__init__(
             source_name="clinvar",
             base_url="https://eutils.ncbi.nlm.nih.gov/entrez/eutils",
-            requests_per_minute=10,  # NCBI limits: 10 requests per second,
-            # but be conservative
+            # NCBI E-utilities allow 3 requests/second, 10 with an API key;
+            # the shared host budget enforces whichever applies.
+            requests_per_minute=180,
             timeout_seconds=60,  # NCBI can be slow
+            raw_data_dir=raw_data_dir,
         )
+        api_key = ncbi_api_key()
+        if api_key:
+            self.default_params["api_key"] = api_key
+        self.max_concurrent_batches: int = MAX_CONCURRENT_BATCHES
 
     async def fetch_data(self, **kwargs: JSONValue) -> list[RawRecord]:
         """
@@ -66,19 +89,21 @@ class ClinVarIngestor(BaseIngestor):
         if not variant_ids:
             return []
 
-        # Step 2: Fetch detailed records in batches
-        all_records: list[RawRecord] = []
-        batch_size = 50  # ClinVar API limit
-
-        for i in range(0, len(variant_ids), batch_size):
-            batch_ids = variant_ids[i : i + batch_size]
-            batch_records = await self._fetch_variant_details(batch_ids)
-            all_records.extend(batch_records)
+        # Step 2: Fetch detailed records in batches; the shared NCBI budget
+        # paces the concurrent requests.
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
 
-            # Small delay between batches to be respectful
-            await asyncio.sleep(0.1)
+        async def fetch_batch(batch_ids: list[str]) -> list[RawRecord]:
+            async with semaphore:
+                return await self._fetch_variant_details(batch_ids)
 
-        return all_records
+        batches = await asyncio.gather(
+            *(
+                fetch_batch(variant_ids[i : i + EFETCH_BATCH_SIZE])
+                for i in range(0, len(variant_ids), EFETCH_BATCH_SIZE)
+            ),
+        )
+        return [record for batch in batches for record in batch]
 
     async def _search_variants(
         self,
@@ -164,7 +189,7 @@ class ClinVarIngestor(BaseIngestor):
         variant_ids: list[str],
     ) -> list[RawRecord]:
         """
-        Fetch detailed ClinVar records for given variant IDs.
+        Fetch detailed ClinVar records for given variant IDs in one EFetch call.
 
         Args:
             variant_ids: List of ClinVar variant IDs
@@ -175,124 +200,110 @@ class ClinVarIngestor(BaseIngestor):
         if not variant_ids:
             return []
 
-        # Use ESummary to get basic info, then EFetch for full details
-        id_str = ",".join(variant_ids)
-
-        # Get summaries first
-        summary_params = {
+        params = {
             "db": "clinvar",
-            "id": id_str,
-            "retmode": "json",
+            "id": ",".join(variant_ids),
+            "rettype": "vcv",
+            "retmode": "xml",
         }
+        response = await self._make_request("GET", "efetch.fcgi", params=params)
+        fetched_at = response.headers.get("date", "")
 
-        response = await self._make_request(
-            "GET",
-            "esummary.fcgi",
-            params=summary_params,
-        )
-        summary_data = self._ensure_raw_record(response.json())
-
-        # Validate response structure with runtime validation
-        validation_result = APIResponseValidator.validate_clinvar_variant_response(
-            summary_data,
-        )
-
-        variant_response: RawRecord
-        if not validation_result["is_valid"]:
+        records: list[RawRecord] = []
+        try:
+            records.extend(
+                self._build_variant_record(archive, fetched_at)
+                for archive in self._iter_variation_archives(response.content)
+            )
+        except ElementTree.ParseError as exc:
             logger.warning(
-                "ClinVar variant response validation failed: %s",
-                validation_result["issues"],
+                "Failed to parse ClinVar EFetch batch of %d variants: %s",
+                len(variant_ids),
+                exc,
             )
-            # Fallback to old processing
-            variant_response = summary_data
-        else:
-            sanitized_variant: ClinVarVariantResponse | None = validation_result[
-                "sanitized_data"
-            ]
-            if sanitized_variant is None:
-                logger.warning(
-                    "ClinVar variant validation returned no sanitized payload despite passing validation",
-                )
-                variant_response = summary_data
-            else:
-                variant_response = self._ensure_raw_record(sanitized_variant)
-
-        records: list[RawRecord] = []
-        result_section = variant_response.get("result")
-        if isinstance(result_section, dict):
-            for uid in result_section:
-                if not isinstance(uid, str) or uid == "uids":
-                    continue
-
-                # Get full record details
-                try:
-                    full_record = await self._fetch_single_variant(uid)
-                    if full_record:
-                        records.append(full_record)
-                except Exception as exc:  # noqa: BLE001 - log and continue per-record
-                    logger.warning("Failed to fetch full record for %s: %s", uid, exc)
-                    continue
 
+        if len(records) < len(variant_ids):
+            logger.info(
+                "ClinVar EFetch returned %d of %d requested variants",
+                len(records),
+                len(variant_ids),
+            )
         return records
 
-    async def _fetch_single_variant(self, variant_id: str) -> RawRecord | None:
+    @staticmethod
+    def _iter_variation_archives(content: bytes) -> Iterator[Element]:
         """
-        Fetch detailed record for a single ClinVar variant.
+        Yield each ``VariationArchive`` element of a VCV response as it is parsed.
 
-        Args:
-            variant_id: ClinVar variant ID
-
-        Returns:
-            Detailed variant record or None if failed
+        Elements are cleared once the caller is done with them, so only one
+        record's tree is held in memory at a time.
         """
-        params = {
-            "db": "clinvar",
-            "id": variant_id,
-            "rettype": "vcv",
-            "retmode": "xml",
-        }
-
-        response = await self._make_request("GET", "efetch.fcgi", params=params)
-
-        # Parse XML response (simplified - in production would use proper XML parsing)
-        xml_content = response.text
-
-        # For now, return basic structure - in production would parse XML properly
+        for _event, element in ElementTree.iterparse(
+            io.BytesIO(content),
+            events=("end",),
+        ):
+            if element.tag == "VariationArchive":
+                yield element
+                element.clear()
+
+    def _build_variant_record(self, archive: Element, fetched_at: str) -> RawRecord:
+        """Build the raw record for one ``VariationArchive`` element."""
+        # Keep the single-record EFetch envelope expected by ClinVarParser
+        raw_xml = (
+            f"<{VCV_RESULT_SET}>"
+            f"{ElementTree.tostring(archive, encoding='unicode')}"
+            f"</{VCV_RESULT_SET}>"
+        )
         return {
-            "clinvar_id": variant_id,
-            "raw_xml": xml_content,
+            "clinvar_id": archive.get("VariationID", ""),
+            "raw_xml": raw_xml,
             "source": "clinvar",
-            "fetched_at": response.headers.get("date", ""),
-            # TODO: Parse XML to extract structured data
-            "parsed_data": self._parse_clinvar_xml(xml_content),
+            "fetched_at": fetched_at,
+            "parsed_data": self._parse_variation_archive(archive),
         }
 
-    def _parse_clinvar_xml(self, _xml_content: str) -> RawRecord:
+    @staticmethod
+    def _parse_variation_archive(archive: Element) -> RawRecord:
         """
-        Parse ClinVar XML response into structured data.
+        Extract the summary fields of a ClinVar ``VariationArchive`` element.
 
         Args:
-            xml_content: Raw XML response
+            archive: Parsed ``VariationArchive`` element
 
         Returns:
             Parsed variant data
         """
-        # Simplified XML parsing - in production would use proper XML parser
-        # This is a placeholder that would be replaced with actual XML parsing logic
-        try:
-            # Basic extraction (would be replaced with proper XML parsing)
-            parsed: RawRecord = {
-                "gene_symbol": "MED13",  # Extract from XML
-                "variant_type": "unknown",  # Extract from XML
-                "clinical_significance": "unknown",  # Extract from XML
-                "hgvs_notations": [],  # Extract from XML
-                "conditions": [],  # Extract from XML
-                "review_status": "unknown",  # Extract from XML
-            }
-        except Exception:  # noqa: BLE001
-            return {"parsing_error": "Failed to parse ClinVar XML"}
-        else:
-            return parsed
+        gene = archive.find(".//Gene")
+        classification = archive.find(".//GermlineClassification")
+        if classification is None:
+            classification = archive.find(".//ClinicalSignificance")
+
+        clinical_significance = "unknown"
+        review_status = "unknown"
+        if classification is not None:
+            clinical_significance = (
+                classification.findtext("Description") or clinical_significance
+            )
+            review_status = classification.findtext("ReviewStatus") or review_status
+
+        hgvs_notations = _unique_texts(
+            archive.iterfind(".//NucleotideExpression/Expression"),
+        )
+        conditions = _unique_texts(
+            archive.iterfind(
+                ".//TraitSet/Trait/Name/ElementValue[@Type='Preferred']",
+            ),
+        )
+        return {
+            "accession": archive.get("Accession", ""),
+            "variation_name": archive.get("VariationName", ""),
+            "gene_symbol": gene.get("Symbol", "") if gene is not None else "",
+            "variant_type": archive.get("VariationType") or "unknown",
+            "clinical_significance": clinical_significance,
+            "hgvs_notations": hgvs_notations,
+            "conditions": conditions,
+            "review_status": review_status,
+        }
 
     async def fetch_med13_variants(self, **kwargs: JSONValue) -> list[RawRecord]:
         """
@@ -15,6 +15,7 @@ from defusedxml import ElementTree
 from .base_ingestor import BaseIngestor
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from pathlib import Path
     from xml.etree.ElementTree import Element  # nosec B405
 
     from src.type_definitions.common import JSONObject, JSONValue, RawRecord
@@ -30,7 +31,7 @@ class HPOIngestor(BaseIngestor):
     definitions, and hierarchical relationships.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, raw_data_dir: Path | None = None) -> None:
         super().__init__(
             source_name="hpo",
             base_url=(
@@ -38,6 +39,7 @@ class HPOIngestor(BaseIngestor):
             ),
             requests_per_minute=60,  # GitHub API is more permissive
             timeout_seconds=120,  # Large file downloads
+            raw_data_dir=raw_data_dir,
         )
 
     async def fetch_data(self, **kwargs: JSONValue) -> list[RawRecord]:
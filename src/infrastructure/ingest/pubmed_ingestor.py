@@ -5,21 +5,105 @@ Fetches scientific literature and publication data from PubMed.
 
 from __future__ import annotations
 
-import asyncio
+import logging
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
+from xml.etree.ElementTree import Element, TreeBuilder  # nosec B405
 
-from defusedxml import ElementTree
+from defusedxml.ElementTree import DefusedXMLParser, ParseError
+
+from src.infrastructure.http import ncbi_api_key
 
 from .base_ingestor import BaseIngestor
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
-    from xml.etree.ElementTree import Element  # nosec B405
+    from collections.abc import AsyncIterator, Iterator
+    from pathlib import Path
 
     from src.type_definitions.common import JSONValue, RawRecord
 
+logger = logging.getLogger(__name__)
+
 # Relevance threshold constant
 RELEVANCE_THRESHOLD: int = 5
+DEFAULT_MAX_RESULTS = 500
+# Articles per EFetch page of the search history
+EFETCH_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class SearchHistory:
+    """ESearch result stored on the NCBI history server."""
+
+    count: int
+    web_env: str
+    query_key: str
+
+
+class _EventTarget:
+    """Parser target building the tree and queueing start and end events."""
+
+    def __init__(self) -> None:
+        self._builder = TreeBuilder()
+        self.events: list[tuple[str, Element]] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> Element:
+        element = self._builder.start(tag, attrib)
+        self.events.append(("start", element))
+        return element
+
+    def end(self, tag: str) -> Element:
+        element = self._builder.end(tag)
+        self.events.append(("end", element))
+        return element
+
+    def data(self, data: str) -> None:
+        self._builder.data(data)
+
+    def close(self) -> Element:
+        return self._builder.close()
+
+
+class CitationStream:
+    """
+    Incremental PubmedArticleSet parser yielding completed citations.
+
+    Articles are removed from the tree once read, so only the article being
+    parsed is held in memory. Parsing uses defusedxml's entity protections.
+    """
+
+    def __init__(self) -> None:
+        self._target = _EventTarget()
+        self._parser = DefusedXMLParser(target=self._target)
+        self._depth = 0
+        self._root: Element | None = None
+
+    def feed(self, chunk: bytes) -> Iterator[Element]:
+        """Feed a chunk and return the ``MedlineCitation`` elements it completed."""
+        self._parser.feed(chunk)
+        return self._completed_citations()
+
+    def close(self) -> Iterator[Element]:
+        """Finish the document and return any remaining citations."""
+        self._parser.close()
+        return self._completed_citations()
+
+    def _completed_citations(self) -> Iterator[Element]:
+        events = self._target.events
+        self._target.events = []
+        for event, element in events:
+            if event == "start":
+                self._depth += 1
+                if self._root is None:
+                    self._root = element
+                continue
+            self._depth -= 1
+            if element.tag == "MedlineCitation":
+                yield element
+            if self._depth == 1 and self._root is not None:
+                # A finished article: drop it from the set
+                self._root.remove(element)
 
 
 class PubMedIngestor(BaseIngestor):
@@ -31,13 +115,19 @@ class PubMedIngestor(BaseIngestor):
     associated conditions.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, raw_data_dir: Path | None = None) -> None:
         super().__init__(
             source_name="pubmed",
             base_url="https://eutils.ncbi.nlm.nih.gov/entrez/eutils",
-            requests_per_minute=10,  # NCBI limits: 10 requests per second
+            # NCBI E-utilities allow 3 requests/second, 10 with an API key;
+            # the shared host budget enforces whichever applies.
+            requests_per_minute=180,
             timeout_seconds=60,  # PubMed can be slow
+            raw_data_dir=raw_data_dir,
         )
+        api_key = ncbi_api_key()
+        if api_key:
+            self.default_params["api_key"] = api_key
 
     async def fetch_data(self, **kwargs: JSONValue) -> list[RawRecord]:
         """
@@ -50,41 +140,72 @@ class PubMedIngestor(BaseIngestor):
         Returns:
             List of PubMed article records
         """
-        # Step 1: Search for publications
-        query_value = kwargs.get("query")
-        query = query_value if isinstance(query_value, str) else "MED13"
+        return [record async for record in self.stream_records(**kwargs)]
 
-        search_kwargs = dict(kwargs)
-        search_kwargs.pop("query", None)
+    async def stream_records(self, **kwargs: JSONValue) -> AsyncIterator[RawRecord]:
+        """
+        Yield PubMed article records as they are parsed.
 
-        article_ids = await self._search_publications(query, **search_kwargs)
-        if not article_ids:
-            return []
+        The search result stays on the NCBI history server and is fetched
+        page by page; each page is parsed while it downloads, so memory use
+        does not grow with the number of articles.
 
-        # Step 2: Fetch detailed records in batches
-        all_records: list[RawRecord] = []
-        batch_size = 50  # PubMed API limit
+        Args:
+            query: Search query (default: MED13)
+            **kwargs: Additional search parameters
 
-        for i in range(0, len(article_ids), batch_size):
-            batch_ids = article_ids[i : i + batch_size]
-            batch_records = await self._fetch_article_details(batch_ids)
-            all_records.extend(batch_records)
+        Yields:
+            PubMed article records
+        """
+        query_value = kwargs.get("query")
+        query = query_value if isinstance(query_value, str) else "MED13"
 
-            # Small delay between batches
-            await asyncio.sleep(0.1)
+        search_kwargs = dict(kwargs)
+        search_kwargs.pop("query", None)
 
-        return all_records
+        history = await self._search_history(query, **search_kwargs)
+        if history is None:
+            return
 
-    async def _search_publications(self, query: str, **kwargs: JSONValue) -> list[str]:
+        max_results = self._coerce_int(
+            search_kwargs.get("max_results"),
+            DEFAULT_MAX_RESULTS,
+        )
+        total = min(history.count, max_results)
+        for retstart in range(0, total, EFETCH_PAGE_SIZE):
+            params: dict[str, str | int] = {
+                "db": "pubmed",
+                "WebEnv": history.web_env,
+                "query_key": history.query_key,
+                "retstart": retstart,
+                "retmax": min(EFETCH_PAGE_SIZE, total - retstart),
+                "rettype": "medline",
+                "retmode": "xml",
+            }
+            async with self._stream_request(
+                "GET",
+                "efetch.fcgi",
+                params=params,
+            ) as response:
+                fetched_at = response.headers.get("date", "")
+                async for record in self._iter_articles(response.aiter_bytes()):
+                    record.update({"source": "pubmed", "fetched_at": fetched_at})
+                    yield record
+
+    async def _search_history(
+        self,
+        query: str,
+        **kwargs: JSONValue,
+    ) -> SearchHistory | None:
         """
-        Search PubMed for publications matching the query.
+        Run the PubMed search and keep its result on the history server.
 
         Args:
             query: PubMed search query
             **kwargs: Additional search parameters
 
         Returns:
-            List of PubMed article IDs
+            The stored search, or None if nothing matched
         """
         # Build comprehensive search query
         query_terms = [query]
@@ -112,7 +233,9 @@ class PubMedIngestor(BaseIngestor):
             "db": "pubmed",
             "term": full_query,
             "retmode": "json",
-            "retmax": self._coerce_int(kwargs.get("max_results"), 500),
+            # IDs are read back through the history server, not the response
+            "retmax": 0,
+            "usehistory": "y",
             "sort": "relevance",
             "datetype": "pdat",
             "mindate": mindate_value if isinstance(mindate_value, str) else None,
@@ -122,89 +245,38 @@ class PubMedIngestor(BaseIngestor):
         response = await self._make_request("GET", "esearch.fcgi", params=params)
         data = self._ensure_raw_record(response.json())
 
-        # Extract article IDs from search results
         esearch_section = data.get("esearchresult")
         if not isinstance(esearch_section, dict):
-            return []
-        id_list = esearch_section.get("idlist", [])
-        if not isinstance(id_list, list):
-            return []
-        return [str(aid) for aid in id_list]
+            return None
+        count = self._coerce_int(esearch_section.get("count"), 0)
+        web_env = esearch_section.get("webenv")
+        query_key = esearch_section.get("querykey")
+        if count <= 0 or not isinstance(web_env, str) or query_key is None:
+            return None
+        return SearchHistory(count=count, web_env=web_env, query_key=str(query_key))
 
-    async def _fetch_article_details(
+    async def _iter_articles(
         self,
-        article_ids: list[str],
-    ) -> list[RawRecord]:
+        chunks: AsyncIterator[bytes],
+    ) -> AsyncIterator[RawRecord]:
         """
-        Fetch detailed PubMed records for given article IDs.
-
-        Args:
-            article_ids: List of PubMed article IDs
+        Parse a PubmedArticleSet document as its bytes arrive.
 
-        Returns:
-            List of detailed article records
-        """
-        if not article_ids:
-            return []
-
-        id_str = ",".join(article_ids)
-
-        # Get detailed records using EFetch
-        params = {
-            "db": "pubmed",
-            "id": id_str,
-            "rettype": "medline",
-            "retmode": "xml",
-        }
-
-        response = await self._make_request("GET", "efetch.fcgi", params=params)
-
-        # Parse XML response
-        xml_content = response.text
-        records = self._parse_pubmed_xml(xml_content)
-
-        # Add source metadata
-        for record in records:
-            record.update(
-                {
-                    "pubmed_ids": article_ids,
-                    "source": "pubmed",
-                    "fetched_at": response.headers.get("date", ""),
-                },
-            )
-
-        return records
-
-    def _parse_pubmed_xml(self, xml_content: str) -> list[RawRecord]:
-        """
-        Parse PubMed XML response into structured data.
-
-        Args:
-            xml_content: Raw XML response
-
-        Returns:
-            List of parsed article records
+        A malformed document ends the page after the articles parsed so far.
         """
+        stream = CitationStream()
         try:
-            root = ElementTree.fromstring(xml_content)
-            records: list[RawRecord] = []
-
-            # PubMed XML structure: MedlineCitation elements
-            for citation in root.findall(".//MedlineCitation"):
+            async for chunk in chunks:
+                for citation in stream.feed(chunk):
+                    record = self._parse_single_citation(citation)
+                    if record:
+                        yield record
+            for citation in stream.close():
                 record = self._parse_single_citation(citation)
                 if record:
-                    records.append(record)
-
-        except Exception as e:  # noqa: BLE001
-            # Return error record for debugging
-            return [
-                {
-                    "parsing_error": str(e),
-                    "raw_xml": xml_content[:1000],  # First 1000 chars for debugging
-                },
-            ]
-        else:
-            return records
+                    yield record
+        except ParseError as exc:
+            logger.warning("Failed to parse PubMed EFetch page: %s", exc)
 
     def _parse_single_citation(self, citation: Element) -> RawRecord | None:
         """
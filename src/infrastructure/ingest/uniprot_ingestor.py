@@ -18,6 +18,7 @@ from .uniprot_record_parser_mixin import UniProtRecordParserMixin
 from .uniprot_xml_parser_mixin import UniProtXmlParserMixin
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from pathlib import Path
     from xml.etree.ElementTree import Element  # nosec B405
 
     from src.type_definitions.common import JSONValue, RawRecord
@@ -37,13 +38,14 @@ class UniProtIngestor(UniProtRecordParserMixin, UniProtXmlParserMixin, BaseInges
     This ingestor focuses on MED13 protein data and related annotations.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, raw_data_dir: Path | None = None) -> None:
         super().__init__(
             source_name="uniprot",
             base_url="https://www.ebi.ac.uk/proteins/api",  # Try EBI Proteins API
             requests_per_minute=30,  # UniProt allows up to 200 requests/minute
             # for programmatic access
             timeout_seconds=60,  # Protein data can be large
+            raw_data_dir=raw_data_dir,
         )
 
     async def _make_request(
@@ -53,9 +55,13 @@ class UniProtIngestor(UniProtRecordParserMixin, UniProtXmlParserMixin, BaseInges
         *,
         params: QueryParams | None = None,
         headers: HeaderMap | None = None,
+        stream: bool = False,
     ) -> httpx.Response:
         """
         Override base _make_request to handle UniProt's redirect issues.
+
+        ``stream`` leaves the body unread as in the base method; the caller
+        must close the response.
         """
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
 
@@ -64,30 +70,32 @@ class UniProtIngestor(UniProtRecordParserMixin, UniProtXmlParserMixin, BaseInges
                 # Wait for rate limit token
                 await self.rate_limiter.wait_for_token()
 
-                # Use a fresh client for each request to avoid redirect issues
-                async with httpx.AsyncClient(
-                    timeout=httpx.Timeout(self.timeout_seconds),
-                    follow_redirects=False,  # Don't follow redirects for UniProt
-                    headers={
-                        "User-Agent": "MED13-Resource-Library/1.0 (research@med13.org)",
-                    },
-                ) as temp_client:
-                    response = await temp_client.request(
-                        method,
-                        url,
-                        params=params,
-                        headers=headers,
-                    )
+                # Shared pooled client; redirects stay off for UniProt
+                request = self.client.build_request(
+                    method,
+                    url,
+                    params={**self.default_params, **(params or {})},
+                    headers={**self.default_headers, **(headers or {})},
+                    timeout=self.timeout,
+                )
+                response = await self.client.send(
+                    request,
+                    stream=stream,
+                    follow_redirects=False,
+                )
 
-                    # Check for rate limiting
-                    if response.status_code == STATUS_TOO_MANY_REQUESTS:
-                        # Exponential backoff for rate limiting
-                        wait_time = 2**attempt
-                        await asyncio.sleep(wait_time)
-                        continue
+                # Check for rate limiting
+                if response.status_code == STATUS_TOO_MANY_REQUESTS:
+                    await response.aclose()
+                    # Exponential backoff for rate limiting
+                    wait_time = 2**attempt
+                    await asyncio.sleep(wait_time)
+                    continue
 
-                    response.raise_for_status()
-                    return response
+                if response.is_error:
+                    # Error bodies are small; read them for the error message
+                    await response.aread()
+                response.raise_for_status()
 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code >= SERVER_ERROR_MIN_STATUS and (
@@ -105,6 +113,8 @@ class UniProtIngestor(UniProtRecordParserMixin, UniProtXmlParserMixin, BaseInges
                     continue
                 message = f"Request failed after {self.max_retries} attempts: {e!s}"
                 raise IngestionError(message, self.source_name) from e
+            else:
+                return response
 
         final_message = f"Request failed after {self.max_retries} attempts"
         raise IngestionError(final_message, self.source_name)
@@ -137,9 +147,6 @@ class UniProtIngestor(UniProtRecordParserMixin, UniProtXmlParserMixin, BaseInges
             batch_records = await self._fetch_protein_details(batch_ids)
             all_records.extend(batch_records)
 
-            # Small delay between batches
-            await asyncio.sleep(0.1)
-
         return all_records
 
     async def _search_proteins(self, query: str, **kwargs: JSONValue) -> list[str]:
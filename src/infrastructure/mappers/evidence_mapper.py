@@ -10,6 +10,7 @@ from src.domain.value_objects.identifiers import (
     PublicationIdentifier,
     VariantIdentifier,
 )
+from src.infrastructure.mappers.loaded_relationships import is_loaded
 from src.models.database.evidence import EvidenceModel
 from src.models.database.phenotype import PhenotypeModel
 from src.models.database.publication import PublicationModel
@@ -54,7 +55,7 @@ class EvidenceMapper:
             id=model.id,
         )
 
-        if hasattr(model, "variant") and isinstance(model.variant, VariantModel):
+        if is_loaded(model, "variant") and isinstance(model.variant, VariantModel):
             evidence.variant_identifier = EvidenceMapper._variant_identifier(
                 model.variant,
             )
@@ -66,13 +67,16 @@ class EvidenceMapper:
                 clinical_significance=model.variant.clinical_significance,
             )
 
-        if hasattr(model, "phenotype") and isinstance(model.phenotype, PhenotypeModel):
+        if is_loaded(model, "phenotype") and isinstance(
+            model.phenotype,
+            PhenotypeModel,
+        ):
             evidence.phenotype_identifier = PhenotypeIdentifier(
                 hpo_id=model.phenotype.hpo_id,
                 hpo_term=model.phenotype.hpo_term,
             )
 
-        if hasattr(model, "publication") and isinstance(
+        if is_loaded(model, "publication") and isinstance(
             model.publication,
             PublicationModel,
         ):
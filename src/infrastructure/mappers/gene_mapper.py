@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from src.domain.entities.gene import Gene, GeneType
 from src.domain.entities.variant import VariantSummary
 from src.domain.value_objects.identifiers import GeneIdentifier
+from src.infrastructure.mappers.loaded_relationships import is_loaded
 from src.models.database.gene import GeneModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
@@ -39,7 +40,7 @@ class GeneMapper:
             id=model.id,
         )
 
-        if hasattr(model, "variants") and model.variants:
+        if is_loaded(model, "variants") and model.variants:
             gene.variants = [
                 GeneMapper._serialize_variant(variant) for variant in model.variants
             ]
@@ -0,0 +1,24 @@
+"""Check relationship load state without triggering a lazy load."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import inspect
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from src.models.database.base import Base
+
+
+def is_loaded(model: Base, relationship: str) -> bool:
+    """
+    Whether ``relationship`` is populated on ``model``.
+
+    Repositories eager-load what mappers read (see ``load_plans``); anything
+    else reads as absent rather than issuing a SELECT per mapped row.
+    Relationships assigned on transient models count as loaded.
+    """
+    return relationship not in inspect(model).unloaded
+
+
+__all__ = ["is_loaded"]
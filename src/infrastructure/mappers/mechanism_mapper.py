@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from src.domain.entities.mechanism import Mechanism
 from src.domain.value_objects.confidence import EvidenceLevel
 from src.domain.value_objects.protein_structure import ProteinDomain
+from src.infrastructure.mappers.loaded_relationships import is_loaded
 from src.models.database.mechanism import MechanismModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
@@ -19,7 +20,11 @@ class MechanismMapper:
         protein_domains = [
             ProteinDomain.model_validate(item) for item in model.protein_domains or []
         ]
-        phenotype_ids = [phenotype.id for phenotype in model.phenotypes]
+        phenotype_ids = (
+            [phenotype.id for phenotype in model.phenotypes]
+            if is_loaded(model, "phenotypes")
+            else []
+        )
         return Mechanism(
             name=model.name,
             description=model.description,
@@ -9,6 +9,7 @@ from src.domain.entities.variant import (
     VariantType,
 )
 from src.domain.value_objects.identifiers import GeneIdentifier, VariantIdentifier
+from src.infrastructure.mappers.loaded_relationships import is_loaded
 from src.models.database.variant import VariantModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
@@ -28,7 +29,9 @@ class VariantMapper:
             clinvar_id=model.clinvar_id,
         )
 
-        gene_identifier = VariantMapper._build_gene_identifier(model.gene)
+        gene_identifier = VariantMapper._build_gene_identifier(
+            model.gene if is_loaded(model, "gene") else None,
+        )
 
         variant = Variant(
             identifier=identifier,
@@ -54,7 +57,7 @@ class VariantMapper:
             id=model.id,
         )
 
-        if hasattr(model, "evidence") and model.evidence:
+        if is_loaded(model, "evidence") and model.evidence:
             variant.evidence = [
                 VariantMapper._to_evidence_summary(evidence)
                 for evidence in model.evidence
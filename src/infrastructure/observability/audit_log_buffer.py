@@ -0,0 +1,247 @@
+"""
+In-process buffer that persists audit records off the request path.
+
+Requests enqueue unsaved ``AuditLog`` rows; a background flusher bulk-inserts
+them every ``flush_interval_ms`` or ``max_batch_size`` records, whichever
+comes first. Records are never dropped: when ``max_pending`` records are
+waiting, producers wait up to ``enqueue_timeout_seconds`` for space and then
+write their record directly, and ``close`` drains everything still queued.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.application.curation.repositories.audit_repository import (
+    SqlAlchemyAuditRepository,
+)
+from src.database.session import SessionLocal
+
+if TYPE_CHECKING:  # pragma: no cover - typing helpers only
+    from collections.abc import Callable, Sequence
+
+    from sqlalchemy.orm import Session
+
+    from src.application.curation.repositories.audit_repository import (
+        AuditRepository,
+    )
+    from src.models.database.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+MAX_FLUSH_BACKOFF_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class AuditBufferSettings:
+    """Throughput and memory bounds for the audit buffer."""
+
+    flush_interval_ms: int = 250
+    max_batch_size: int = 200
+    max_pending: int = 10_000
+    enqueue_timeout_seconds: float = 1.0
+
+
+class AuditLogBuffer:
+    """Batches audit records and writes them from a background task."""
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session] = SessionLocal,
+        repository: AuditRepository | None = None,
+        settings: AuditBufferSettings | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._repository = repository or SqlAlchemyAuditRepository()
+        self._settings = settings or AuditBufferSettings()
+        self._queue: asyncio.Queue[AuditLog | None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flusher: asyncio.Task[None] | None = None
+        self._closing = False
+        self.direct_writes = 0
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def enqueue(self, log: AuditLog) -> None:
+        """Queue ``log`` for persistence, applying backpressure when full."""
+        if self._closing:
+            await self._write_direct([log])
+            return
+        queue = self._ensure_started()
+        try:
+            queue.put_nowait(log)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(
+                    queue.put(log),
+                    self._settings.enqueue_timeout_seconds,
+                )
+            except TimeoutError:
+                logger.warning(
+                    "Audit buffer full (%d pending); writing record directly",
+                    queue.qsize(),
+                )
+                await self._write_direct([log])
+
+    async def close(self) -> None:
+        """Stop accepting buffered records and flush everything queued."""
+        flusher = self._flusher
+        if flusher is None:
+            return
+        if flusher.get_loop() is not asyncio.get_running_loop():
+            # The flusher's loop cannot be awaited from here; persist its queue.
+            self._flusher = None
+            self._drain_abandoned_queue()
+            return
+        self._closing = True
+        if self._queue is not None:
+            # Wake an idle flusher; a full queue means it is not waiting anyway.
+            with suppress(asyncio.QueueFull):
+                self._queue.put_nowait(None)
+        try:
+            await flusher
+        finally:
+            self._flusher = None
+            self._closing = False
+
+    def _ensure_started(self) -> asyncio.Queue[AuditLog | None]:
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._loop is loop:
+            if self._flusher is None or self._flusher.done():
+                self._flusher = loop.create_task(
+                    self._run(self._queue),
+                    name="audit-log-flusher",
+                )
+            return self._queue
+
+        # The previous event loop is gone; persist what it left behind.
+        self._drain_abandoned_queue()
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=max(self._settings.max_pending, 1))
+        self._flusher = loop.create_task(
+            self._run(self._queue),
+            name="audit-log-flusher",
+        )
+        return self._queue
+
+    def _drain_abandoned_queue(self) -> None:
+        queue, self._queue, self._loop = self._queue, None, None
+        if queue is None:
+            return
+        logs = _drain(queue)
+        try:
+            self._write_batch(logs)
+        except Exception:
+            logger.exception("Failed to flush %d audit records", len(logs))
+            _log_unpersisted(logs)
+
+    async def _run(self, queue: asyncio.Queue[AuditLog | None]) -> None:
+        backoff = self._settings.flush_interval_ms / 1000
+        batch: list[AuditLog] = []
+        while not (self._closing and queue.empty() and not batch):
+            if not batch:
+                batch = await self._collect_batch(queue)
+            if not batch:
+                continue
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception:
+                logger.exception("Failed to flush %d audit records", len(batch))
+                if self._closing:
+                    _log_unpersisted(batch)
+                    batch = []
+                    continue
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, MAX_FLUSH_BACKOFF_SECONDS)
+                continue
+            batch = []
+            backoff = self._settings.flush_interval_ms / 1000
+
+    async def _collect_batch(
+        self,
+        queue: asyncio.Queue[AuditLog | None],
+    ) -> list[AuditLog]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._settings.flush_interval_ms / 1000
+        batch: list[AuditLog] = []
+        while len(batch) < self._settings.max_batch_size:
+            remaining = deadline - loop.time()
+            if queue.empty() and (remaining <= 0 or self._closing):
+                break
+            try:
+                log = (
+                    queue.get_nowait()
+                    if not queue.empty()
+                    else await asyncio.wait_for(queue.get(), remaining)
+                )
+            except TimeoutError:
+                break
+            if log is None:
+                continue
+            batch.append(log)
+        return batch
+
+    async def _write_direct(self, logs: list[AuditLog]) -> None:
+        self.direct_writes += len(logs)
+        try:
+            await asyncio.to_thread(self._write_batch, logs)
+        except Exception:
+            logger.exception("Failed to write %d audit records directly", len(logs))
+            _log_unpersisted(logs)
+
+    def _write_batch(self, logs: Sequence[AuditLog]) -> None:
+        if not logs:
+            return
+        db = self._session_factory()
+        try:
+            self._repository.record_many(db, logs)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+def _drain(queue: asyncio.Queue[AuditLog | None]) -> list[AuditLog]:
+    logs: list[AuditLog] = []
+    while not queue.empty():
+        log = queue.get_nowait()
+        if log is not None:
+            logs.append(log)
+    return logs
+
+
+def _log_unpersisted(logs: Sequence[AuditLog]) -> None:
+    # Last-resort trail so no access goes unrecorded when the database is down.
+    for log in logs:
+        logger.error(
+            "Unpersisted audit record: action=%s entity=%s:%s user=%s "
+            "request_id=%s success=%s",
+            log.action,
+            log.entity_type,
+            log.entity_id,
+            log.user,
+            log.request_id,
+            log.success,
+        )
+
+
+_audit_log_buffer: AuditLogBuffer | None = None
+
+
+def get_audit_log_buffer() -> AuditLogBuffer:
+    """Return the process-wide audit buffer shared by middleware and lifespan."""
+    global _audit_log_buffer  # noqa: PLW0603 - lazily created singleton
+    if _audit_log_buffer is None:
+        _audit_log_buffer = AuditLogBuffer()
+    return _audit_log_buffer
+
+
+__all__ = ["AuditBufferSettings", "AuditLogBuffer", "get_audit_log_buffer"]
@@ -3,18 +3,29 @@ Infrastructure implementation for executing queries against external data source
 
 This client handles both URL generation for link-based sources and API calls
 for programmatic sources, following Clean Architecture principles.
+
+API calls share one pooled ``httpx.AsyncClient`` per event loop, so repeated
+queries reuse keep-alive connections. Requests to hosts with a known quota,
+or a rate declared by the ingestors, draw from the shared per-host budget,
+and concurrent requests to the same host are capped. Transient failures
+(connection errors, timeouts, 429 and 5xx responses) are retried with
+jittered exponential backoff, and successful responses are cached briefly
+per catalog entry and normalized parameters.
 """
 
 import asyncio
+import copy
 import logging
-from collections.abc import MutableMapping
-from typing import TYPE_CHECKING, Protocol, assert_never
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import assert_never
 from urllib.parse import quote
 
-import aiohttp
-import requests
-from requests.adapters import BaseAdapter, HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
 
 from src.domain.entities.data_discovery_parameters import (
     AdvancedQueryParameters,
@@ -23,24 +34,80 @@ from src.domain.entities.data_discovery_parameters import (
 )
 from src.domain.entities.data_discovery_session import SourceCatalogEntry
 from src.domain.repositories.data_discovery_repository import SourceQueryClient
+from src.infrastructure.http import HostRateLimiters, get_host_rate_limiters
 from src.type_definitions.common import JSONObject, JSONValue
 
-if TYPE_CHECKING:
-    from aiohttp import ClientResponse
-
 logger = logging.getLogger(__name__)
 
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_PER_HOST_CONCURRENCY = 8
+DEFAULT_BACKOFF_BASE_SECONDS = 0.5
+DEFAULT_BACKOFF_MAX_SECONDS = 8.0
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS = 60.0
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 512
 
-class SessionLike(Protocol):
-    """Minimal protocol for the HTTP session used by the query client."""
+ResponseCacheKey = tuple[str, str, tuple[tuple[str, str], ...]]
 
-    headers: MutableMapping[str, str | bytes]
 
-    def mount(self, prefix: str | bytes, adapter: BaseAdapter) -> None:
-        """Attach an adapter for the specified prefix."""
+@dataclass
+class QueryResponseCache:
+    """
+    Small TTL cache of successful API query results.
+
+    Keyed by catalog entry, endpoint and the normalized request parameters,
+    so repeated query tests against the same source skip the upstream call.
+    """
 
-    def close(self) -> None:
-        """Close the session."""
+    ttl_seconds: float = DEFAULT_RESPONSE_CACHE_TTL_SECONDS
+    max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES
+    clock: Callable[[], float] = time.monotonic
+    _entries: OrderedDict[ResponseCacheKey, tuple[float, JSONObject]] = field(
+        default_factory=OrderedDict,
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key_for(
+        catalog_entry: SourceCatalogEntry,
+        url: str,
+        request_params: dict[str, str],
+    ) -> ResponseCacheKey:
+        normalized = tuple(
+            sorted((name, value.strip()) for name, value in request_params.items()),
+        )
+        return (catalog_entry.id, url, normalized)
+
+    def get(self, key: ResponseCacheKey) -> JSONObject | None:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def put(self, key: ResponseCacheKey, result: JSONObject) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        expires_at = self.clock() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
 
 class QueryExecutionError(Exception):
@@ -60,11 +127,19 @@ class HTTPQueryClient(SourceQueryClient):
     timeouts, and rate limiting.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - pool and retry tuning is keyword-only
         self,
         timeout_seconds: int = 30,
         max_retries: int = 3,
         user_agent: str = "MED13-Workbench/1.0",
+        *,
+        client: httpx.AsyncClient | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+        backoff_base_seconds: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds: float = DEFAULT_BACKOFF_MAX_SECONDS,
+        response_cache: QueryResponseCache | None = None,
+        rate_limiters: HostRateLimiters | None = None,
     ):
         """
         Initialize the HTTP query client.
@@ -73,39 +148,65 @@ class HTTPQueryClient(SourceQueryClient):
             timeout_seconds: Default timeout for requests
             max_retries: Maximum number of retries for failed requests
             user_agent: User agent string to send with requests
+            client: Pre-built HTTP client, mainly for tests
+            max_connections: Connection pool size across all hosts
+            per_host_concurrency: Concurrent requests allowed per upstream host
+            backoff_base_seconds: Backoff ceiling before the first retry
+            backoff_max_seconds: Upper bound on any single retry delay
+            response_cache: Cache for successful results (a default is created)
+            rate_limiters: Per-host request budgets (the process-wide ones by default)
         """
         self.timeout_seconds = timeout_seconds
         self.max_retries = max_retries
         self.user_agent = user_agent
-
-        # Create a session with retry strategy
-        self._session = self._create_session()
-
-    def _create_session(self) -> SessionLike:
-        """Create a requests session with retry strategy."""
-        session: SessionLike = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1,
+        self.max_connections = max_connections
+        self.per_host_concurrency = max(per_host_concurrency, 1)
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.response_cache = (
+            response_cache if response_cache is not None else QueryResponseCache()
         )
-
-        # Mount adapters with retry strategy
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        # Set default headers
-        session.headers.update(
-            {
-                "User-Agent": self.user_agent,
-                "Accept": "application/json, text/plain, */*",
-            },
+        self.rate_limiters = (
+            rate_limiters if rate_limiters is not None else get_host_rate_limiters()
         )
+        self._client = client
+        self._owns_client = client is None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            # Pooled connections and semaphores belong to a single loop.
+            self._client_loop = loop
+            self._host_slots = {}
+            if self._owns_client:
+                self._client = None
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            self._client = httpx.AsyncClient(
+                headers={
+                    "User-Agent": self.user_agent,
+                    "Accept": "application/json, text/plain, */*",
+                },
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=min(
+                        self.max_connections,
+                        DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                    ),
+                ),
+                follow_redirects=True,
+            )
+        return self._client
 
-        return session
+    def _host_slot(self, url: httpx.URL) -> asyncio.Semaphore:
+        slot = self._host_slots.get(url.host)
+        if slot is None:
+            slot = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_slots[url.host] = slot
+        return slot
 
     async def execute_query(
         self,
@@ -216,7 +317,7 @@ class HTTPQueryClient(SourceQueryClient):
         timeout_seconds: int,
     ) -> JSONObject:
         """
-        Execute an API query using aiohttp for async HTTP requests.
+        Execute an API query over the pooled async HTTP client.
 
         Args:
             catalog_entry: The catalog entry
@@ -235,31 +336,101 @@ class HTTPQueryClient(SourceQueryClient):
 
         url = catalog_entry.api_endpoint
         request_params = self._build_request_params(catalog_entry, parameters)
+        cache_key = QueryResponseCache.key_for(catalog_entry, url, request_params)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with (
-                aiohttp.ClientSession(
-                    headers={"User-Agent": self.user_agent},
-                    timeout=aiohttp.ClientTimeout(total=timeout_seconds),
-                ) as session,
-                session.get(url, params=request_params) as response,
-            ):
-                response.raise_for_status()
-                return await self._parse_response_payload(response)
-
-        except aiohttp.ClientError as exc:
+            response = await self._get_with_retries(
+                url,
+                request_params,
+                timeout_seconds,
+            )
+            response.raise_for_status()
+        except httpx.TimeoutException as exc:
+            msg = f"Timeout error for source {catalog_entry.id}"
+            raise QueryExecutionError(msg, catalog_entry.id) from exc
+        except httpx.HTTPStatusError as exc:
             msg = f"HTTP error for source {catalog_entry.id}: {exc}"
             raise QueryExecutionError(
                 msg,
                 catalog_entry.id,
-                getattr(exc, "status", None),
+                exc.response.status_code,
             ) from exc
-        except TimeoutError:
-            msg = f"Timeout error for source {catalog_entry.id}"
-            raise QueryExecutionError(
-                msg,
-                catalog_entry.id,
-            ) from asyncio.TimeoutError
+        except httpx.HTTPError as exc:
+            msg = f"HTTP error for source {catalog_entry.id}: {exc}"
+            raise QueryExecutionError(msg, catalog_entry.id) from exc
+
+        result = self._parse_response_payload(response)
+        self.response_cache.put(cache_key, result)
+        return result
+
+    async def _get_with_retries(
+        self,
+        url: str,
+        request_params: dict[str, str],
+        timeout_seconds: int,
+    ) -> httpx.Response:
+        """GET ``url``, retrying transient failures with jittered backoff."""
+        client = self._get_client()
+        slot = self._host_slot(httpx.URL(url))
+        attempt = 0
+        while True:
+            # Discovery queries declare no rate; only hosts with a budget pace them.
+            limiter = self.rate_limiters.budgeted_limiter_for(url)
+            if limiter is not None:
+                await limiter.wait_for_token()
+            async with slot:
+                try:
+                    response = await client.get(
+                        url,
+                        params=request_params,
+                        timeout=timeout_seconds,
+                    )
+                except httpx.TransportError:
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = self._backoff_delay(attempt)
+                else:
+                    if (
+                        response.status_code not in RETRYABLE_STATUS_CODES
+                        or attempt >= self.max_retries
+                    ):
+                        return response
+                    await response.aclose()
+                    delay = self._retry_after(response) or self._backoff_delay(
+                        attempt,
+                    )
+            logger.debug(
+                "Retrying %s in %.2fs (attempt %d of %d)",
+                url,
+                delay,
+                attempt + 1,
+                self.max_retries,
+            )
+            # Sleep outside the host slot so waiting does not block other requests.
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        ceiling = min(
+            self.backoff_max_seconds,
+            self.backoff_base_seconds * (2**attempt),
+        )
+        return random.uniform(0, ceiling)  # noqa: S311  # nosec B311 - jitter only
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        """Honour a numeric ``Retry-After`` header, capped at the backoff maximum."""
+        header = response.headers.get("Retry-After")
+        if header is None:
+            return None
+        try:
+            seconds = float(header)
+        except ValueError:
+            return None
+        return min(max(seconds, 0.0), self.backoff_max_seconds)
 
     def _build_request_params(
         self,
@@ -331,29 +502,32 @@ class HTTPQueryClient(SourceQueryClient):
                     {str(key): str(value) for key, value in api_params.items()},
                 )
 
-    async def _parse_response_payload(
+    def _parse_response_payload(
         self,
-        response: "ClientResponse",
+        response: httpx.Response,
     ) -> JSONObject:
         """Parse API response payload with JSON/text fallback."""
-        try:
-            raw_payload = await response.json()
-            data = self._coerce_json_value(raw_payload)
-        except aiohttp.ContentTypeError:
-            text = await response.text()
-            data = {"response": text, "content_type": response.content_type}
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+        data: JSONValue = {"response": response.text, "content_type": content_type}
+        if "json" in content_type:
+            try:
+                data = self._coerce_json_value(response.json())
+            except ValueError:
+                logger.debug("Non-JSON body from %s", response.url)
 
         return {
-            "status_code": response.status,
+            "status_code": response.status_code,
             "data": data,
             "url": str(response.url),
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": asyncio.get_running_loop().time(),
         }
 
-    def close(self) -> None:
-        """Close the underlying HTTP session."""
-        if hasattr(self, "_session"):
-            self._session.close()
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if this instance created it."""
+        client, self._client = self._client, None
+        self._client_loop = None
+        if client is not None and self._owns_client:
+            await client.aclose()
 
     @staticmethod
     def _coerce_json_value(value: object) -> JSONValue:
@@ -6,6 +6,7 @@ from .data_discovery_repository_impl import (
     SQLAlchemySourceCatalogRepository,
 )
 from .data_source_activation_repository import SqlAlchemyDataSourceActivationRepository
+from .entity_count_cache import EntityCountCache
 from .evidence_repository import SqlAlchemyEvidenceRepository
 from .extraction_queue_repository import SqlAlchemyExtractionQueueRepository
 from .gene_repository import SqlAlchemyGeneRepository
@@ -15,6 +16,7 @@ from .phenotype_repository import SqlAlchemyPhenotypeRepository
 from .publication_extraction_repository import SqlAlchemyPublicationExtractionRepository
 from .publication_repository import SqlAlchemyPublicationRepository
 from .research_space_repository import SqlAlchemyResearchSpaceRepository
+from .source_catalog_index_cache import SourceCatalogIndexCache
 from .source_template_repository import SqlAlchemySourceTemplateRepository
 from .sqlalchemy_session_repository import SqlAlchemySessionRepository
 from .sqlalchemy_user_repository import SqlAlchemyUserRepository
@@ -27,6 +29,7 @@ from .user_data_source_repository import SqlAlchemyUserDataSourceRepository
 from .variant_repository import SqlAlchemyVariantRepository
 
 __all__ = [
+    "EntityCountCache",
     "SQLAlchemyDataDiscoverySessionRepository",
     "SQLAlchemyDiscoveryPresetRepository",
     "SQLAlchemyDiscoverySearchJobRepository",
@@ -50,4 +53,5 @@ __all__ = [
     "SqlAlchemyUserDataSourceRepository",
     "SqlAlchemyUserRepository",
     "SqlAlchemyVariantRepository",
+    "SourceCatalogIndexCache",
 ]
@@ -24,6 +24,7 @@ from src.domain.repositories.data_discovery_repository import (
     QueryTestResultRepository,
     SourceCatalogRepository,
 )
+from src.domain.services.source_catalog_index import SourceCatalogIndex
 from src.infrastructure.mappers.data_discovery_mapper import (
     preset_to_entity,
     preset_to_model,
@@ -41,6 +42,9 @@ from src.infrastructure.repositories.data_discovery_repository_utils import (
     expand_identifier,
     owner_identifier_candidates,
 )
+from src.infrastructure.repositories.source_catalog_index_cache import (
+    SourceCatalogIndexCache,
+)
 from src.models.database.data_discovery import (
     DataDiscoverySessionModel,
     DiscoveryPresetModel,
@@ -165,22 +169,45 @@ class SQLAlchemyDataDiscoverySessionRepository(DataDiscoverySessionRepository):
 
 
 class SQLAlchemySourceCatalogRepository(SourceCatalogRepository):
-    """SQLAlchemy implementation of SourceCatalogRepository."""
+    """
+    SQLAlchemy implementation of SourceCatalogRepository.
 
-    def __init__(self, session: Session):
+    With an ``index_cache`` the read methods are answered from the in-memory
+    catalog index; writes go to the database and are then applied to it.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        index_cache: SourceCatalogIndexCache | None = None,
+    ):
         self._session = session
+        self._index_cache = index_cache
+
+    def _index(self) -> SourceCatalogIndex | None:
+        if self._index_cache is None:
+            return None
+        return self._index_cache.get_or_load(self._load_all)
 
     def save(self, entry: SourceCatalogEntry) -> SourceCatalogEntry:
         model = source_catalog_to_model(entry)
         self._session.merge(model)
         self._session.commit()
+        if self._index_cache is not None:
+            self._index_cache.update_entry(entry)
         return entry
 
     def find_by_id(self, entry_id: str) -> SourceCatalogEntry | None:
+        index = self._index()
+        if index is not None:
+            return index.get(entry_id)
         model = self._session.get(SourceCatalogEntryModel, entry_id)
         return source_catalog_to_entity(model) if model else None
 
     def find_all_active(self) -> list[SourceCatalogEntry]:
+        index = self._index()
+        if index is not None:
+            return index.all(active_only=True)
         models = (
             self._session.query(SourceCatalogEntryModel)
             .filter_by(is_active=True)
@@ -190,6 +217,12 @@ class SQLAlchemySourceCatalogRepository(SourceCatalogRepository):
         return [source_catalog_to_entity(model) for model in models]
 
     def find_all(self) -> list[SourceCatalogEntry]:
+        index = self._index()
+        if index is not None:
+            return index.all()
+        return self._load_all()
+
+    def _load_all(self) -> list[SourceCatalogEntry]:
         models = (
             self._session.query(SourceCatalogEntryModel)
             .order_by(SourceCatalogEntryModel.category, SourceCatalogEntryModel.name)
@@ -198,6 +231,9 @@ class SQLAlchemySourceCatalogRepository(SourceCatalogRepository):
         return [source_catalog_to_entity(model) for model in models]
 
     def find_by_category(self, category: str) -> list[SourceCatalogEntry]:
+        index = self._index()
+        if index is not None:
+            return index.by_category(category)
         models = (
             self._session.query(SourceCatalogEntryModel)
             .filter_by(category=category, is_active=True)
@@ -211,6 +247,10 @@ class SQLAlchemySourceCatalogRepository(SourceCatalogRepository):
         query: str,
         category: str | None = None,
     ) -> list[SourceCatalogEntry]:
+        index = self._index()
+        if index is not None:
+            return index.search(query, category)
+
         # Build the base query
         db_query = self._session.query(SourceCatalogEntryModel).filter_by(
             is_active=True,
@@ -261,6 +301,8 @@ class SQLAlchemySourceCatalogRepository(SourceCatalogRepository):
             self._session.commit()
 
         retry_on_sqlite_lock(_commit)
+        if self._index_cache is not None:
+            self._index_cache.update_entry(source_catalog_to_entity(model))
         return True
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from uuid import UUID  # noqa: TC003
 
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session  # noqa: TC002
 
 from src.domain.entities.data_source_activation import (
@@ -91,6 +91,25 @@ class SqlAlchemyDataSourceActivationRepository(DataSourceActivationRepository):
             )
         return rules_by_source
 
+    def list_rules_for_scope(
+        self,
+        research_space_id: UUID | None = None,
+    ) -> list[DataSourceActivation]:
+        condition = DataSourceActivationModel.scope == ActivationScopeEnum.GLOBAL
+        if research_space_id is not None:
+            condition = or_(
+                condition,
+                and_(
+                    DataSourceActivationModel.scope
+                    == ActivationScopeEnum.RESEARCH_SPACE,
+                    DataSourceActivationModel.research_space_id
+                    == str(research_space_id),
+                ),
+            )
+        stmt = select(DataSourceActivationModel).where(condition)
+        models = self._session.execute(stmt).scalars().all()
+        return [self._to_domain(model) for model in models]
+
     def set_rule(
         self,
         *,
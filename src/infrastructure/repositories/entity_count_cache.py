@@ -0,0 +1,226 @@
+"""
+Process-wide cache of the totals behind paginated list endpoints.
+
+Totals are counted with the same predicates as the page they describe and
+cached per ``(table, predicate hash)``. ORM writes invalidate every cached
+total of the tables they touch once they commit; a session with uncommitted
+writes to a table counts it afresh and does not cache the result, so other
+sessions never see its pending rows. The TTL covers writes made by other
+processes.
+
+On PostgreSQL, unfiltered totals of large tables are read from the planner
+statistics in ``pg_class.reltuples`` instead of scanning the table, and are
+reported as estimates.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from sqlalchemy import and_, event, func, select, text
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from src.domain.repositories.base import TotalCount
+from src.infrastructure.repositories.data_discovery_repository_utils import (
+    dialect_name_for_session,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.orm import UOWTransaction
+
+    from src.models.database.base import Base
+
+DEFAULT_COUNT_TTL_SECONDS = 60.0
+DEFAULT_ESTIMATE_THRESHOLD = 500_000
+DEFAULT_MAX_COUNT_ENTRIES = 1_024
+
+_PENDING_TABLES_KEY = "entity_count_cache.pending_tables"
+_RELTUPLES_SQL = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)",
+)
+_caches: weakref.WeakSet[EntityCountCache] = weakref.WeakSet()
+
+
+@dataclass(eq=False)
+class EntityCountCache:
+    """
+    Cached row totals keyed by table and filter predicates.
+
+    ``estimate_above`` enables the PostgreSQL estimate for unfiltered totals
+    whose planner row count reaches it; ``None`` always counts exactly.
+    """
+
+    ttl_seconds: float = DEFAULT_COUNT_TTL_SECONDS
+    estimate_above: int | None = DEFAULT_ESTIMATE_THRESHOLD
+    max_entries: int = DEFAULT_MAX_COUNT_ENTRIES
+    clock: Callable[[], float] = time.monotonic
+    _entries: dict[tuple[str, str], tuple[TotalCount, float]] = field(
+        default_factory=dict,
+    )
+    _versions: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        _caches.add(self)
+
+    def count(
+        self,
+        session: Session,
+        model: type[Base],
+        predicates: Sequence[ColumnElement[bool]] = (),
+    ) -> TotalCount:
+        """Total rows of ``model`` matching every predicate."""
+        table_name: str = model.__tablename__
+        if table_name in _pending_tables(session):
+            return exact_count(session, model, predicates)
+
+        key = (table_name, _predicate_key(predicates))
+        now = self.clock()
+        with self._lock:
+            version = self._versions.get(table_name, 0)
+            cached = self._entries.get(key)
+            if cached is not None and now - cached[1] < self.ttl_seconds:
+                return cached[0]
+
+        total = self._load(session, model, predicates)
+        with self._lock:
+            if self._versions.get(table_name, 0) == version:
+                self._entries.pop(key, None)
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+                self._entries[key] = (total, now)
+        return total
+
+    def invalidate(self, table_names: Iterable[str]) -> None:
+        """Drop every cached total of the given tables."""
+        tables = set(table_names)
+        if not tables:
+            return
+        with self._lock:
+            for table_name in tables:
+                self._versions[table_name] = self._versions.get(table_name, 0) + 1
+            self._entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if key[0] not in tables
+            }
+
+    def _load(
+        self,
+        session: Session,
+        model: type[Base],
+        predicates: Sequence[ColumnElement[bool]],
+    ) -> TotalCount:
+        if (
+            not predicates
+            and self.estimate_above is not None
+            and dialect_name_for_session(session) == "postgresql"
+        ):
+            estimate = session.execute(
+                _RELTUPLES_SQL,
+                {"table_name": model.__tablename__},
+            ).scalar_one_or_none()
+            # reltuples is -1 until the table is first analyzed.
+            if estimate is not None and estimate >= self.estimate_above:
+                return TotalCount(int(estimate), exact=False)
+        return exact_count(session, model, predicates)
+
+
+def exact_count(
+    session: Session,
+    model: type[Base],
+    predicates: Sequence[ColumnElement[bool]] = (),
+) -> TotalCount:
+    """``COUNT(*)`` of ``model`` rows matching every predicate."""
+    stmt = select(func.count()).select_from(model).where(*predicates)
+    return TotalCount(int(session.execute(stmt).scalar_one()))
+
+
+def count_matching(
+    session: Session,
+    model: type[Base],
+    predicates: Sequence[ColumnElement[bool]],
+    cache: EntityCountCache | None,
+) -> TotalCount:
+    """Count through ``cache`` when one is configured, exactly otherwise."""
+    if cache is None:
+        return exact_count(session, model, predicates)
+    return cache.count(session, model, predicates)
+
+
+def _predicate_key(predicates: Sequence[ColumnElement[bool]]) -> str:
+    if not predicates:
+        return ""
+    compiled = and_(*predicates).compile()
+    params = sorted((name, repr(value)) for name, value in compiled.params.items())
+    payload = f"{compiled}|{params}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _pending_tables(session: Session) -> set[str]:
+    pending: set[str] = session.info.setdefault(_PENDING_TABLES_KEY, set())
+    return pending
+
+
+def _mark_written(session: Session, table_names: Iterable[str]) -> None:
+    tables = {name for name in table_names if name}
+    if not tables:
+        return
+    _pending_tables(session).update(tables)
+    for cache in list(_caches):
+        cache.invalidate(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, _flush_context: UOWTransaction) -> None:
+    _mark_written(
+        session,
+        (
+            getattr(instance, "__tablename__", "")
+            for instance in chain(session.new, session.dirty, session.deleted)
+        ),
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_bulk_write(orm_execute_state: ORMExecuteState) -> None:
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    _mark_written(orm_execute_state.session, [getattr(table, "name", "")])
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    # Counts cached by other sessions before this commit are stale now.
+    tables = _pending_tables(session)
+    for cache in list(_caches):
+        cache.invalidate(tables)
+    tables.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    _pending_tables(session).clear()
+
+
+__all__ = [
+    "DEFAULT_COUNT_TTL_SECONDS",
+    "DEFAULT_ESTIMATE_THRESHOLD",
+    "EntityCountCache",
+    "count_matching",
+    "exact_count",
+]
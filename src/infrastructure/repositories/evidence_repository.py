@@ -6,25 +6,50 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy import and_, asc, desc, func, select
 
+from src.domain.repositories.base import SeekPage
 from src.domain.repositories.evidence_repository import (
     EvidenceRepository as EvidenceRepositoryInterface,
 )
 from src.infrastructure.mappers.evidence_mapper import EvidenceMapper
+from src.infrastructure.repositories.entity_count_cache import count_matching
+from src.infrastructure.repositories.full_text_search import full_text_search
+from src.infrastructure.repositories.load_plans import (
+    LoadPlan,
+    evidence_load_options,
+)
+from src.infrastructure.repositories.seek_pagination import (
+    SeekOrder,
+    fetch_seek_page,
+    sort_attribute,
+)
 from src.models.database import EvidenceModel, VariantModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from collections.abc import Iterable
+
+    from sqlalchemy import ColumnElement, Select
     from sqlalchemy.orm import Session
 
     from src.domain.entities.evidence import Evidence
-    from src.domain.repositories.base import QuerySpecification
+    from src.domain.repositories.base import (
+        QuerySpecification,
+        SeekPosition,
+        TotalCount,
+    )
+    from src.infrastructure.repositories.entity_count_cache import EntityCountCache
     from src.type_definitions.common import EvidenceUpdate, QueryFilters
 
 
 class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
     """Domain-facing repository adapter for evidence backed by SQLAlchemy."""
 
-    def __init__(self, session: Session | None = None) -> None:
+    def __init__(
+        self,
+        session: Session | None = None,
+        count_cache: EntityCountCache | None = None,
+    ) -> None:
         self._session = session
+        self._count_cache = count_cache
 
     @property
     def session(self) -> Session:
@@ -39,15 +64,48 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
     def _to_domain_sequence(self, models: list[EvidenceModel]) -> list[Evidence]:
         return EvidenceMapper.to_domain_sequence(models)
 
+    @staticmethod
+    def _filter_predicates(
+        filters: QueryFilters | None,
+    ) -> list[ColumnElement[bool]]:
+        predicates: list[ColumnElement[bool]] = []
+        for field, value in (filters or {}).items():
+            column = getattr(EvidenceModel, field, None)
+            if column is not None and value is not None:
+                predicates.append(column == value)
+        return predicates
+
+    @staticmethod
+    def _select(plan: LoadPlan) -> Select[EvidenceModel]:
+        return select(EvidenceModel).options(*evidence_load_options(plan))
+
+    def _load(
+        self,
+        evidence_id: int,
+        *,
+        refresh: bool = False,
+    ) -> EvidenceModel | None:
+        stmt = self._select(LoadPlan.DETAIL).where(EvidenceModel.id == evidence_id)
+        if refresh:
+            stmt = stmt.execution_options(populate_existing=True)
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def _reload(self, evidence_id: int) -> Evidence:
+        """Re-read evidence after a write, relationships included."""
+        model = self._load(evidence_id, refresh=True)
+        if model is None:
+            message = f"Evidence with id {evidence_id} not found"
+            raise ValueError(message)
+        return EvidenceMapper.to_domain(model)
+
     def create(self, evidence: Evidence) -> Evidence:
         model = EvidenceMapper.to_model(evidence)
         self.session.add(model)
         self.session.commit()
-        self.session.refresh(model)
-        return EvidenceMapper.to_domain(model)
+        return self._reload(model.id)
 
     def get_by_id(self, evidence_id: int) -> Evidence | None:
-        return self._to_domain(self.session.get(EvidenceModel, evidence_id))
+        return self._to_domain(self._load(evidence_id))
 
     def get_by_id_or_fail(self, evidence_id: int) -> Evidence:
         evidence = self.get_by_id(evidence_id)
@@ -61,7 +119,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         limit: int | None = None,
         offset: int | None = None,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel)
+        stmt = self._select(LoadPlan.SUMMARY)
         if offset:
             stmt = stmt.offset(offset)
         if limit:
@@ -93,25 +151,39 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
             if hasattr(model, field):
                 setattr(model, field, value)
         self.session.commit()
-        self.session.refresh(model)
-        return EvidenceMapper.to_domain(model)
+        return self._reload(evidence_id)
 
     def find_by_variant(
         self,
         variant_id: int,
         limit: int | None = None,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(EvidenceModel.variant_id == variant_id)
+        stmt = self._select(LoadPlan.SUMMARY).where(
+            EvidenceModel.variant_id == variant_id,
+        )
         if limit:
             stmt = stmt.limit(limit)
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
 
+    def find_by_variants(self, variant_ids: Iterable[int]) -> list[Evidence]:
+        unique_ids = list(dict.fromkeys(variant_ids))
+        if not unique_ids:
+            return []
+        stmt = (
+            self._select(LoadPlan.SUMMARY)
+            .where(EvidenceModel.variant_id.in_(unique_ids))
+            .order_by(EvidenceModel.id)
+        )
+        return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
+
     def find_by_phenotype(
         self,
         phenotype_id: int,
         limit: int | None = None,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(EvidenceModel.phenotype_id == phenotype_id)
+        stmt = self._select(LoadPlan.SUMMARY).where(
+            EvidenceModel.phenotype_id == phenotype_id,
+        )
         if limit:
             stmt = stmt.limit(limit)
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
@@ -121,7 +193,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         variant_id: int,
         phenotype_id: int,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             and_(
                 EvidenceModel.variant_id == variant_id,
                 EvidenceModel.phenotype_id == phenotype_id,
@@ -134,7 +206,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         publication_id: int,
         limit: int | None = None,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             EvidenceModel.publication_id == publication_id,
         )
         if limit:
@@ -143,7 +215,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
 
     def find_by_gene(self, gene_id: int) -> list[Evidence]:
         stmt = (
-            select(EvidenceModel)
+            self._select(LoadPlan.SUMMARY)
             .join(EvidenceModel.variant)
             .where(VariantModel.gene_id == gene_id)
         )
@@ -154,7 +226,9 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         level: str,
         limit: int | None = None,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(EvidenceModel.evidence_level == level)
+        stmt = self._select(LoadPlan.SUMMARY).where(
+            EvidenceModel.evidence_level == level,
+        )
         if limit:
             stmt = stmt.limit(limit)
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
@@ -164,7 +238,9 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         evidence_type: str,
         limit: int | None = None,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(EvidenceModel.evidence_type == evidence_type)
+        stmt = self._select(LoadPlan.SUMMARY).where(
+            EvidenceModel.evidence_type == evidence_type,
+        )
         if limit:
             stmt = stmt.limit(limit)
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
@@ -174,7 +250,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         min_score: float,
         max_score: float,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             EvidenceModel.confidence_score >= min_score,
             EvidenceModel.confidence_score <= max_score,
         )
@@ -184,7 +260,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         self,
         limit: int | None = None,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             EvidenceModel.evidence_level.in_(["definitive", "strong"]),
         )
         if limit:
@@ -192,7 +268,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
 
     def find_by_criteria(self, spec: QuerySpecification) -> list[Evidence]:
-        stmt = select(EvidenceModel)
+        stmt = self._select(LoadPlan.SUMMARY)
         for field, value in spec.filters.items():
             column = getattr(EvidenceModel, field, None)
             if column is not None and value is not None:
@@ -214,7 +290,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         phenotype_id: int,
         min_confidence: float = 0.0,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             and_(
                 EvidenceModel.variant_id == variant_id,
                 EvidenceModel.phenotype_id == phenotype_id,
@@ -229,9 +305,15 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         limit: int = 10,
         filters: QueryFilters | None = None,
     ) -> list[Evidence]:
-        stmt = select(EvidenceModel).limit(limit)
+        stmt = self._select(LoadPlan.SUMMARY).limit(limit)
         if query:
-            stmt = stmt.where(EvidenceModel.description.ilike(f"%{query}%"))
+            stmt = full_text_search(
+                self.session,
+                stmt,
+                EvidenceModel,
+                query,
+                fallback=[EvidenceModel.description],
+            )
         if filters:
             for field, value in filters.items():
                 column = getattr(EvidenceModel, field, None)
@@ -246,13 +328,9 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Evidence], int]:
-        stmt = select(EvidenceModel)
-        if filters:
-            for field, value in filters.items():
-                column = getattr(EvidenceModel, field, None)
-                if column is not None and value is not None:
-                    stmt = stmt.where(column == value)
+    ) -> tuple[list[Evidence], TotalCount]:
+        predicates = self._filter_predicates(filters)
+        stmt = self._select(LoadPlan.SUMMARY).where(*predicates)
         column = getattr(EvidenceModel, sort_by, None) if sort_by else None
         if column is not None:
             stmt = stmt.order_by(
@@ -260,9 +338,64 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
             )
         stmt = stmt.offset(max(page - 1, 0) * per_page).limit(per_page)
         models = list(self.session.execute(stmt).scalars())
-        total = self.count()
+        total = count_matching(
+            self.session,
+            EvidenceModel,
+            predicates,
+            self._count_cache,
+        )
         return self._to_domain_sequence(models), total
 
+    def paginate_evidence_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: QueryFilters | None = None,
+    ) -> list[Evidence]:
+        stmt = (
+            self._select(LoadPlan.SUMMARY).order_by(asc(EvidenceModel.id)).limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(EvidenceModel.id > after_id)
+        if filters:
+            for field, value in filters.items():
+                column = getattr(EvidenceModel, field, None)
+                if column is not None and value is not None:
+                    stmt = stmt.where(column == value)
+        return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
+
+    def paginate_evidence_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Evidence]:
+        predicates = self._filter_predicates(filters)
+        order = SeekOrder(
+            EvidenceModel.id,
+            sort_attribute(EvidenceModel, sort_by),
+            descending=sort_order == "desc",
+        )
+        models, next_position = fetch_seek_page(
+            self.session,
+            self._select(LoadPlan.SUMMARY).where(*predicates),
+            order,
+            after=after,
+            limit=limit,
+            offset=offset,
+        )
+        total = count_matching(
+            self.session,
+            EvidenceModel,
+            predicates,
+            self._count_cache,
+        )
+        return SeekPage(self._to_domain_sequence(models), total, next_position)
+
     def get_evidence_statistics(self) -> dict[str, int | float | bool | str | None]:
         total = self.count()
         high_confidence = len(self.find_high_confidence_evidence())
@@ -272,7 +405,7 @@ class SqlAlchemyEvidenceRepository(EvidenceRepositoryInterface):
         }
 
     def find_conflicting_evidence(self, variant_id: int) -> list[Evidence]:
-        stmt = select(EvidenceModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             and_(
                 EvidenceModel.variant_id == variant_id,
                 EvidenceModel.evidence_level == "conflicting",
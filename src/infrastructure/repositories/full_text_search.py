@@ -0,0 +1,85 @@
+"""
+Ranked full-text search over the indexes in ``src.models.database.full_text``.
+
+PostgreSQL matches the generated ``tsvector`` column and orders by
+``ts_rank``; SQLite joins the FTS5 shadow table and orders by its weighted
+bm25 ``rank``. Both match every word of the query after stemming. Databases
+without either index keep the ``ILIKE`` substring match, unranked.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+from sqlalchemy import column, func, literal_column, or_, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.infrastructure.repositories.data_discovery_repository_utils import (
+    dialect_name_for_session,
+)
+from src.models.database.full_text import (
+    FULL_TEXT_INDEXES,
+    SEARCH_VECTOR_COLUMN,
+    TEXT_SEARCH_CONFIG,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+    from sqlalchemy.orm import InstrumentedAttribute, Session
+
+    from src.models.database.base import Base
+
+_WORD = re.compile(r"\w+")
+
+
+def search_words(query: str) -> list[str]:
+    """Words of ``query`` as the full-text indexes tokenize them."""
+    return _WORD.findall(query.lower())
+
+
+def full_text_search[TModel: Base](  # noqa: PLR0913
+    session: Session,
+    stmt: Select[TModel],
+    model: type[TModel],
+    query: str,
+    *,
+    fallback: list[InstrumentedAttribute[str]]
+    | list[InstrumentedAttribute[str | None]],
+) -> Select[TModel]:
+    """
+    ``stmt`` narrowed to rows of ``model`` matching ``query``, best first.
+
+    ``fallback`` lists the columns matched with ``ILIKE`` where the database
+    has no full-text index. A query without words leaves ``stmt`` unchanged.
+    """
+    words = search_words(query)
+    if not words:
+        return stmt
+    index = FULL_TEXT_INDEXES[model.__tablename__]
+    row_id = model.__table__.c.id
+    dialect = dialect_name_for_session(session)
+    if dialect == "postgresql":
+        vector = literal_column(
+            f"{index.table}.{SEARCH_VECTOR_COLUMN}",
+            type_=TSVECTOR,
+        )
+        tsquery = func.plainto_tsquery(TEXT_SEARCH_CONFIG, " ".join(words))
+        return stmt.where(vector.op("@@")(tsquery)).order_by(
+            func.ts_rank(vector, tsquery).desc(),
+            row_id,
+        )
+    if dialect == "sqlite" and index.is_available(session.connection()):
+        fts = table(index.fts_table, column("rowid"), column("rank"))
+        # Quoted words are plain terms, whatever FTS5 syntax the query held
+        match = " ".join(f'"{word}"' for word in words)
+        return (
+            stmt.join(fts, fts.c.rowid == row_id)
+            .where(literal_column(index.fts_table).op("MATCH")(match))
+            .order_by(fts.c.rank, row_id)
+        )
+    pattern = f"%{query}%"
+    return stmt.where(or_(*(attribute.ilike(pattern) for attribute in fallback)))
+
+
+__all__ = ["full_text_search", "search_words"]
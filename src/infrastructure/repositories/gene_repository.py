@@ -9,21 +9,43 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy import asc, delete, desc, func, or_, select, update
 
+from src.domain.repositories.base import SeekPage
 from src.domain.repositories.gene_repository import (
     GeneRepository as GeneRepositoryInterface,
 )
 from src.infrastructure.mappers.gene_mapper import GeneMapper
+from src.infrastructure.repositories.entity_count_cache import count_matching
+from src.infrastructure.repositories.load_plans import LoadPlan, gene_load_options
+from src.infrastructure.repositories.seek_pagination import (
+    SeekOrder,
+    fetch_seek_page,
+)
 from src.models.database import GeneModel
 from src.type_definitions.repositories import GeneStatistics
 
 if TYPE_CHECKING:
-    from sqlalchemy.orm import Session
+    from sqlalchemy import ColumnElement, Select
+    from sqlalchemy.orm import InstrumentedAttribute, Session
 
     from src.domain.entities.gene import Gene
-    from src.domain.repositories.base import QuerySpecification
+    from src.domain.repositories.base import (
+        QuerySpecification,
+        SeekPosition,
+        SortValue,
+        TotalCount,
+    )
     from src.domain.value_objects.identifiers import GeneIdentifier
+    from src.infrastructure.repositories.entity_count_cache import EntityCountCache
     from src.type_definitions.common import GeneUpdate, JSONObject
 
+_SORTABLE_FIELDS: dict[str, InstrumentedAttribute[SortValue]] = {
+    "symbol": GeneModel.symbol,
+    "name": GeneModel.name,
+    "gene_type": GeneModel.gene_type,
+    "chromosome": GeneModel.chromosome,
+    "created_at": GeneModel.created_at,
+}
+
 
 class SqlAlchemyGeneRepository(GeneRepositoryInterface):
     """
@@ -33,8 +55,13 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
     symbol-based lookups, external ID searches, and relationship queries.
     """
 
-    def __init__(self, session: Session | None = None) -> None:
+    def __init__(
+        self,
+        session: Session | None = None,
+        count_cache: EntityCountCache | None = None,
+    ) -> None:
         self._session = session
+        self._count_cache = count_cache
 
     @property
     def session(self) -> Session:
@@ -44,12 +71,32 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
             raise ValueError(message)
         return self._session
 
+    @staticmethod
+    def _select(plan: LoadPlan) -> Select[GeneModel]:
+        return select(GeneModel).options(*gene_load_options(plan))
+
+    @staticmethod
+    def _search_predicates(search: str | None) -> list[ColumnElement[bool]]:
+        if not search:
+            return []
+        pattern = f"%{search}%"
+        return [
+            or_(
+                GeneModel.symbol.ilike(pattern),
+                GeneModel.name.ilike(pattern),
+            ),
+        ]
+
     def create(self, gene: Gene) -> Gene:
         model = GeneMapper.to_model(gene)
         self.session.add(model)
         self.session.commit()
-        self.session.refresh(model)
-        return GeneMapper.to_domain(model)
+        stmt = (
+            self._select(LoadPlan.DETAIL)
+            .where(GeneModel.id == model.id)
+            .execution_options(populate_existing=True)
+        )
+        return GeneMapper.to_domain(self.session.execute(stmt).scalar_one())
 
     def paginate_genes(
         self,
@@ -58,7 +105,7 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
         sort_by: str,
         sort_order: str,
         search: str | None = None,
-    ) -> tuple[list[Gene], int]:
+    ) -> tuple[list[Gene], TotalCount]:
         """
         Retrieve paginated genes with optional search and sorting.
 
@@ -74,35 +121,80 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
         """
         offset = max(page - 1, 0) * per_page
 
-        sortable_fields = {
-            "symbol": GeneModel.symbol,
-            "name": GeneModel.name,
-            "gene_type": GeneModel.gene_type,
-            "chromosome": GeneModel.chromosome,
-            "created_at": GeneModel.created_at,
-        }
-
-        sort_column = sortable_fields.get(sort_by, GeneModel.symbol)
+        sort_column = _SORTABLE_FIELDS.get(sort_by, GeneModel.symbol)
         order_clause = (
             desc(sort_column) if sort_order.lower() == "desc" else asc(sort_column)
         )
 
-        stmt = select(GeneModel).order_by(order_clause).offset(offset).limit(per_page)
-        count_stmt = select(func.count()).select_from(GeneModel)
+        stmt = (
+            self._select(LoadPlan.SUMMARY)
+            .order_by(order_clause)
+            .offset(offset)
+            .limit(per_page)
+        )
+        predicates = self._search_predicates(search)
+        stmt = stmt.where(*predicates)
 
-        if search:
-            pattern = f"%{search}%"
-            predicate = or_(
-                GeneModel.symbol.ilike(pattern),
-                GeneModel.name.ilike(pattern),
-            )
-            stmt = stmt.where(predicate)
-            count_stmt = count_stmt.where(predicate)
+        models = list(self.session.execute(stmt).scalars())
+        total = count_matching(
+            self.session,
+            GeneModel,
+            predicates,
+            self._count_cache,
+        )
+
+        return GeneMapper.to_domain_sequence(models), total
 
+    def paginate_genes_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        search: str | None = None,
+    ) -> list[Gene]:
+        """
+        Retrieve genes ordered by primary key using a seek predicate.
+
+        Unlike ``paginate_genes`` this never issues an ``OFFSET`` scan, so
+        each batch costs the same regardless of how deep the caller reads.
+        """
+        stmt = self._select(LoadPlan.SUMMARY).order_by(asc(GeneModel.id)).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(GeneModel.id > after_id)
+        stmt = stmt.where(*self._search_predicates(search))
         models = list(self.session.execute(stmt).scalars())
-        total = self.session.execute(count_stmt).scalar_one()
+        return GeneMapper.to_domain_sequence(models)
 
-        return GeneMapper.to_domain_sequence(models), int(total)
+    def paginate_genes_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        search: str | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Gene]:
+        predicates = self._search_predicates(search)
+        order = SeekOrder(
+            GeneModel.id,
+            _SORTABLE_FIELDS.get(sort_by, GeneModel.symbol),
+            descending=sort_order.lower() == "desc",
+        )
+        models, next_position = fetch_seek_page(
+            self.session,
+            self._select(LoadPlan.SUMMARY).where(*predicates),
+            order,
+            after=after,
+            limit=limit,
+            offset=offset,
+        )
+        total = count_matching(
+            self.session,
+            GeneModel,
+            predicates,
+            self._count_cache,
+        )
+        return SeekPage(GeneMapper.to_domain_sequence(models), total, next_position)
 
     def find_by_gene_id(self, gene_id: str) -> Gene | None:
         """
@@ -114,7 +206,7 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
         Returns:
             GeneModel instance or None if not found
         """
-        stmt = select(GeneModel).where(GeneModel.gene_id == gene_id)
+        stmt = self._select(LoadPlan.DETAIL).where(GeneModel.gene_id == gene_id)
         model = self.session.execute(stmt).scalar_one_or_none()
         return GeneMapper.to_domain(model) if model else None
 
@@ -128,7 +220,9 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
         Returns:
             GeneModel instance or None if not found
         """
-        stmt = select(GeneModel).where(GeneModel.symbol.ilike(symbol.upper()))
+        stmt = self._select(LoadPlan.DETAIL).where(
+            GeneModel.symbol.ilike(symbol.upper()),
+        )
         model = self.session.execute(stmt).scalar_one_or_none()
         return GeneMapper.to_domain(model) if model else None
 
@@ -149,7 +243,7 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
         if external_id.isdigit():
             conditions.append(GeneModel.ncbi_gene_id == int(external_id))
 
-        stmt = select(GeneModel).where(or_(*conditions))
+        stmt = self._select(LoadPlan.DETAIL).where(or_(*conditions))
         model = self.session.execute(stmt).scalar_one_or_none()
         return GeneMapper.to_domain(model) if model else None
 
@@ -193,7 +287,7 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
 
     def get_by_id(self, gene_id: int) -> Gene | None:
         """Get gene by database ID."""
-        stmt = select(GeneModel).where(GeneModel.id == gene_id)
+        stmt = self._select(LoadPlan.DETAIL).where(GeneModel.id == gene_id)
         model = self.session.execute(stmt).scalar_one_or_none()
         return GeneMapper.to_domain(model) if model else None
 
@@ -211,7 +305,7 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
         offset: int | None = None,
     ) -> list[Gene]:
         """Get all genes with optional pagination."""
-        stmt = select(GeneModel)
+        stmt = self._select(LoadPlan.SUMMARY)
         if offset:
             stmt = stmt.offset(offset)
         if limit:
@@ -261,7 +355,7 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
         """Search genes by name or symbol containing the query string."""
         search_pattern = f"%{query}%"
         stmt = (
-            select(GeneModel)
+            self._select(LoadPlan.SUMMARY)
             .where(
                 or_(
                     GeneModel.symbol.ilike(search_pattern),
@@ -304,11 +398,22 @@ class SqlAlchemyGeneRepository(GeneRepositoryInterface):
 
         return gene
 
+    def find_by_chromosome(self, chromosome: str) -> list[Gene]:
+        stmt = (
+            self._select(LoadPlan.SUMMARY)
+            .where(
+                GeneModel.chromosome == chromosome,
+                GeneModel.start_position.is_not(None),
+                GeneModel.end_position.is_not(None),
+            )
+            .order_by(asc(GeneModel.start_position))
+        )
+        models = list(self.session.execute(stmt).scalars())
+        return GeneMapper.to_domain_sequence(models)
+
     def find_with_variants(self, gene_id: int) -> Gene | None:
         """Find a gene with its associated variants loaded."""
-        stmt = select(GeneModel).where(GeneModel.id == gene_id)
-        model = self.session.execute(stmt).scalar_one_or_none()
-        return GeneMapper.to_domain(model) if model else None
+        return self.get_by_id(gene_id)
 
     def update_gene(self, gene_id: int, updates: GeneUpdate) -> Gene:
         """Update a gene with type-safe update parameters."""
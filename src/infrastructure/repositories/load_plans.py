@@ -0,0 +1,159 @@
+"""
+Eager-loading plans for the domain entity repositories.
+
+Mappers only read relationships that are already loaded, so every query whose
+rows go through a mapper states what to load up front. ``SUMMARY`` serves
+list paths: each relationship the mapper reads is eager-loaded, restricted to
+the columns the mapper reads. ``DETAIL`` serves single-entity paths and loads
+full related rows. Either way related rows cost one JOIN (many-to-one) or one
+``IN`` query per collection for the whole result, not one SELECT per row.
+
+With ``RAISE_ON_LAZY_LOAD`` set, any remaining lazy load on objects loaded
+under a plan raises instead of querying; tests use it to keep list paths free
+of N+1 queries.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+
+from src.models.database import (
+    EvidenceModel,
+    GeneModel,
+    MechanismModel,
+    PhenotypeModel,
+    PublicationModel,
+    VariantModel,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sqlalchemy.orm import InstrumentedAttribute
+    from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+RAISE_ON_LAZY_LOAD = False
+
+
+class LoadPlan(StrEnum):
+    """How much of an entity's related rows a query loads."""
+
+    SUMMARY = "summary"
+    DETAIL = "detail"
+
+
+# Related columns each mapper reads, loaded on their own under SUMMARY.
+GENE_IDENTIFIER_COLUMNS: tuple[InstrumentedAttribute[object], ...] = (
+    GeneModel.gene_id,
+    GeneModel.symbol,
+    GeneModel.ensembl_id,
+    GeneModel.ncbi_gene_id,
+    GeneModel.uniprot_id,
+)
+VARIANT_SUMMARY_COLUMNS: tuple[InstrumentedAttribute[object], ...] = (
+    VariantModel.variant_id,
+    VariantModel.clinvar_id,
+    VariantModel.chromosome,
+    VariantModel.position,
+    VariantModel.clinical_significance,
+)
+EVIDENCE_SUMMARY_COLUMNS: tuple[InstrumentedAttribute[object], ...] = (
+    EvidenceModel.evidence_level,
+    EvidenceModel.evidence_type,
+    EvidenceModel.description,
+    EvidenceModel.reviewed,
+)
+PHENOTYPE_IDENTIFIER_COLUMNS: tuple[InstrumentedAttribute[object], ...] = (
+    PhenotypeModel.hpo_id,
+    PhenotypeModel.hpo_term,
+)
+PUBLICATION_IDENTIFIER_COLUMNS: tuple[InstrumentedAttribute[object], ...] = (
+    PublicationModel.pubmed_id,
+    PublicationModel.pmc_id,
+    PublicationModel.doi,
+)
+
+
+def _related(
+    loader: _AbstractLoad,
+    plan: LoadPlan,
+    columns: tuple[InstrumentedAttribute[object], ...],
+) -> _AbstractLoad:
+    if plan is LoadPlan.SUMMARY:
+        loader = loader.load_only(*columns, raiseload=RAISE_ON_LAZY_LOAD)
+    if RAISE_ON_LAZY_LOAD:
+        loader = loader.raiseload("*")
+    return loader
+
+
+def _with_guard(options: list[_AbstractLoad]) -> list[_AbstractLoad]:
+    if RAISE_ON_LAZY_LOAD:
+        options.append(raiseload("*"))
+    return options
+
+
+def variant_load_options(plan: LoadPlan) -> list[_AbstractLoad]:
+    """Gene identifier and evidence summaries read by ``VariantMapper``."""
+    return _with_guard(
+        [
+            _related(joinedload(VariantModel.gene), plan, GENE_IDENTIFIER_COLUMNS),
+            _related(
+                selectinload(VariantModel.evidence),
+                plan,
+                EVIDENCE_SUMMARY_COLUMNS,
+            ),
+        ],
+    )
+
+
+def gene_load_options(plan: LoadPlan) -> list[_AbstractLoad]:
+    """Variant summaries read by ``GeneMapper``."""
+    return _with_guard(
+        [
+            _related(
+                selectinload(GeneModel.variants),
+                plan,
+                VARIANT_SUMMARY_COLUMNS,
+            ),
+        ],
+    )
+
+
+def evidence_load_options(plan: LoadPlan) -> list[_AbstractLoad]:
+    """Variant, phenotype and publication identifiers read by ``EvidenceMapper``."""
+    return _with_guard(
+        [
+            _related(
+                joinedload(EvidenceModel.variant),
+                plan,
+                VARIANT_SUMMARY_COLUMNS,
+            ),
+            _related(
+                joinedload(EvidenceModel.phenotype),
+                plan,
+                PHENOTYPE_IDENTIFIER_COLUMNS,
+            ),
+            _related(
+                joinedload(EvidenceModel.publication),
+                plan,
+                PUBLICATION_IDENTIFIER_COLUMNS,
+            ),
+        ],
+    )
+
+
+def mechanism_load_options(plan: LoadPlan) -> list[_AbstractLoad]:
+    """Linked phenotype IDs read by ``MechanismMapper``."""
+    return _with_guard(
+        [_related(selectinload(MechanismModel.phenotypes), plan, (PhenotypeModel.id,))],
+    )
+
+
+__all__ = [
+    "LoadPlan",
+    "evidence_load_options",
+    "gene_load_options",
+    "mechanism_load_options",
+    "variant_load_options",
+]
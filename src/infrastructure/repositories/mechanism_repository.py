@@ -11,10 +11,15 @@ from src.domain.repositories.mechanism_repository import (
 )
 from src.domain.value_objects.protein_structure import ProteinDomain
 from src.infrastructure.mappers.mechanism_mapper import MechanismMapper
+from src.infrastructure.repositories.load_plans import (
+    LoadPlan,
+    mechanism_load_options,
+)
 from src.models.database.mechanism import MechanismModel
 from src.models.database.phenotype import PhenotypeModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from sqlalchemy import Select
     from sqlalchemy.orm import Session
 
     from src.domain.entities.mechanism import Mechanism
@@ -41,20 +46,33 @@ class SqlAlchemyMechanismRepository(MechanismRepositoryInterface):
     def _to_domain_sequence(self, models: list[MechanismModel]) -> list[Mechanism]:
         return MechanismMapper.to_domain_sequence(models)
 
+    @staticmethod
+    def _select(plan: LoadPlan) -> Select[MechanismModel]:
+        return select(MechanismModel).options(*mechanism_load_options(plan))
+
+    def _reload(self, mechanism_id: int) -> Mechanism:
+        """Re-read a mechanism after a write, phenotype links included."""
+        stmt = (
+            self._select(LoadPlan.DETAIL)
+            .where(MechanismModel.id == mechanism_id)
+            .execution_options(populate_existing=True)
+        )
+        return MechanismMapper.to_domain(self.session.execute(stmt).scalar_one())
+
     def create(self, mechanism: Mechanism) -> Mechanism:
         model = MechanismMapper.to_model(mechanism)
         if mechanism.phenotype_ids:
             model.phenotypes = self._resolve_phenotypes(mechanism.phenotype_ids)
         self.session.add(model)
         self.session.commit()
-        self.session.refresh(model)
-        return MechanismMapper.to_domain(model)
+        return self._reload(model.id)
 
     def get_by_id(self, mechanism_id: int) -> Mechanism | None:
-        return self._to_domain(self.session.get(MechanismModel, mechanism_id))
+        stmt = self._select(LoadPlan.DETAIL).where(MechanismModel.id == mechanism_id)
+        return self._to_domain(self.session.execute(stmt).scalar_one_or_none())
 
     def find_by_name(self, name: str) -> Mechanism | None:
-        stmt = select(MechanismModel).where(MechanismModel.name == name)
+        stmt = self._select(LoadPlan.DETAIL).where(MechanismModel.name == name)
         return self._to_domain(self.session.execute(stmt).scalar_one_or_none())
 
     def find_all(
@@ -62,7 +80,7 @@ class SqlAlchemyMechanismRepository(MechanismRepositoryInterface):
         limit: int | None = None,
         offset: int | None = None,
     ) -> list[Mechanism]:
-        stmt = select(MechanismModel)
+        stmt = self._select(LoadPlan.SUMMARY)
         if offset:
             stmt = stmt.offset(offset)
         if limit:
@@ -86,7 +104,7 @@ class SqlAlchemyMechanismRepository(MechanismRepositoryInterface):
         return True
 
     def find_by_criteria(self, spec: QuerySpecification) -> list[Mechanism]:
-        stmt = select(MechanismModel)
+        stmt = self._select(LoadPlan.SUMMARY)
         for field, value in spec.filters.items():
             column = getattr(MechanismModel, field, None)
             if column is not None and value is not None:
@@ -107,7 +125,7 @@ class SqlAlchemyMechanismRepository(MechanismRepositoryInterface):
             _ = dict(filters)
         pattern = f"%{query}%"
         stmt = (
-            select(MechanismModel)
+            self._select(LoadPlan.SUMMARY)
             .where(
                 or_(
                     MechanismModel.name.ilike(pattern),
@@ -126,7 +144,7 @@ class SqlAlchemyMechanismRepository(MechanismRepositoryInterface):
         sort_order: str,
         filters: QueryFilters | None = None,
     ) -> tuple[list[Mechanism], int]:
-        stmt = select(MechanismModel)
+        stmt = self._select(LoadPlan.SUMMARY)
         if filters:
             for field, value in filters.items():
                 column = getattr(MechanismModel, field, None)
@@ -178,8 +196,7 @@ class SqlAlchemyMechanismRepository(MechanismRepositoryInterface):
 
         self.session.add(model)
         self.session.commit()
-        self.session.refresh(model)
-        return MechanismMapper.to_domain(model)
+        return self._reload(mechanism_id)
 
     def _resolve_phenotypes(self, phenotype_ids: list[int]) -> list[PhenotypeModel]:
         if not phenotype_ids:
@@ -4,28 +4,55 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import asc, func, or_, select
+from sqlalchemy import asc, func, select
 
 from src.domain.entities.phenotype import PhenotypeCategory
+from src.domain.repositories.base import SeekPage
 from src.domain.repositories.phenotype_repository import (
     PhenotypeRepository as PhenotypeRepositoryInterface,
 )
 from src.infrastructure.mappers.phenotype_mapper import PhenotypeMapper
+from src.infrastructure.repositories.entity_count_cache import count_matching
+from src.infrastructure.repositories.full_text_search import full_text_search
+from src.infrastructure.repositories.seek_pagination import (
+    SeekOrder,
+    fetch_seek_page,
+)
 from src.models.database import EvidenceModel, PhenotypeModel, VariantModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
-    from sqlalchemy.orm import Session
+    from collections.abc import Iterable
+
+    from sqlalchemy import ColumnElement
+    from sqlalchemy.orm import InstrumentedAttribute, Session
 
     from src.domain.entities.phenotype import Phenotype
-    from src.domain.repositories.base import QuerySpecification
+    from src.domain.repositories.base import (
+        QuerySpecification,
+        SeekPosition,
+        SortValue,
+        TotalCount,
+    )
+    from src.infrastructure.repositories.entity_count_cache import EntityCountCache
     from src.type_definitions.common import PhenotypeUpdate, QueryFilters
 
+_SORTABLE_FIELDS: dict[str, InstrumentedAttribute[SortValue]] = {
+    "name": PhenotypeModel.name,
+    "category": PhenotypeModel.category,
+    "hpo_id": PhenotypeModel.hpo_id,
+}
+
 
 class SqlAlchemyPhenotypeRepository(PhenotypeRepositoryInterface):
     """Domain-facing repository adapter for phenotypes backed by SQLAlchemy."""
 
-    def __init__(self, session: Session | None = None) -> None:
+    def __init__(
+        self,
+        session: Session | None = None,
+        count_cache: EntityCountCache | None = None,
+    ) -> None:
         self._session = session
+        self._count_cache = count_cache
 
     @property
     def session(self) -> Session:
@@ -40,6 +67,17 @@ class SqlAlchemyPhenotypeRepository(PhenotypeRepositoryInterface):
     def _to_domain_sequence(self, models: list[PhenotypeModel]) -> list[Phenotype]:
         return PhenotypeMapper.to_domain_sequence(models)
 
+    @staticmethod
+    def _filter_predicates(
+        filters: QueryFilters | None,
+    ) -> list[ColumnElement[bool]]:
+        predicates: list[ColumnElement[bool]] = []
+        for field, value in (filters or {}).items():
+            column = getattr(PhenotypeModel, field, None)
+            if column is not None and value is not None:
+                predicates.append(column == value)
+        return predicates
+
     def create(self, phenotype: Phenotype) -> Phenotype:
         model = PhenotypeMapper.to_model(phenotype)
         self.session.add(model)
@@ -97,17 +135,16 @@ class SqlAlchemyPhenotypeRepository(PhenotypeRepositoryInterface):
     ) -> list[Phenotype]:
         if filters:
             _ = dict(filters)
-        pattern = f"%{query}%"
-        stmt = (
-            select(PhenotypeModel)
-            .where(
-                or_(
-                    PhenotypeModel.name.ilike(pattern),
-                    PhenotypeModel.definition.ilike(pattern),
-                    PhenotypeModel.synonyms.ilike(pattern),
-                ),
-            )
-            .limit(limit)
+        stmt = full_text_search(
+            self.session,
+            select(PhenotypeModel).limit(limit),
+            PhenotypeModel,
+            query,
+            fallback=[
+                PhenotypeModel.name,
+                PhenotypeModel.definition,
+                PhenotypeModel.synonyms,
+            ],
         )
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
 
@@ -163,6 +200,13 @@ class SqlAlchemyPhenotypeRepository(PhenotypeRepositoryInterface):
     def get_by_id(self, phenotype_id: int) -> Phenotype | None:
         return self._to_domain(self.session.get(PhenotypeModel, phenotype_id))
 
+    def find_by_ids(self, phenotype_ids: Iterable[int]) -> list[Phenotype]:
+        unique_ids = list(dict.fromkeys(phenotype_ids))
+        if not unique_ids:
+            return []
+        stmt = select(PhenotypeModel).where(PhenotypeModel.id.in_(unique_ids))
+        return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
+
     def find_by_gene_associations(self, gene_id: int) -> list[Phenotype]:
         stmt = (
             select(PhenotypeModel)
@@ -198,19 +242,10 @@ class SqlAlchemyPhenotypeRepository(PhenotypeRepositoryInterface):
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Phenotype], int]:
-        stmt = select(PhenotypeModel)
-        if filters:
-            for field, value in filters.items():
-                column = getattr(PhenotypeModel, field, None)
-                if column is not None and value is not None:
-                    stmt = stmt.where(column == value)
-        sortable = {
-            "name": PhenotypeModel.name,
-            "category": PhenotypeModel.category,
-            "hpo_id": PhenotypeModel.hpo_id,
-        }
-        sort_column = sortable.get(sort_by)
+    ) -> tuple[list[Phenotype], TotalCount]:
+        predicates = self._filter_predicates(filters)
+        stmt = select(PhenotypeModel).where(*predicates)
+        sort_column = _SORTABLE_FIELDS.get(sort_by)
         if sort_column is not None:
             stmt = stmt.order_by(
                 asc(sort_column) if sort_order != "desc" else sort_column.desc(),
@@ -218,9 +253,62 @@ class SqlAlchemyPhenotypeRepository(PhenotypeRepositoryInterface):
         offset = max(page - 1, 0) * per_page
         stmt = stmt.offset(offset).limit(per_page)
         models = list(self.session.execute(stmt).scalars())
-        total = self.count()
+        total = count_matching(
+            self.session,
+            PhenotypeModel,
+            predicates,
+            self._count_cache,
+        )
         return self._to_domain_sequence(models), total
 
+    def paginate_phenotypes_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: QueryFilters | None = None,
+    ) -> list[Phenotype]:
+        stmt = select(PhenotypeModel).order_by(asc(PhenotypeModel.id)).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(PhenotypeModel.id > after_id)
+        if filters:
+            for field, value in filters.items():
+                column = getattr(PhenotypeModel, field, None)
+                if column is not None and value is not None:
+                    stmt = stmt.where(column == value)
+        return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
+
+    def paginate_phenotypes_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Phenotype]:
+        predicates = self._filter_predicates(filters)
+        order = SeekOrder(
+            PhenotypeModel.id,
+            _SORTABLE_FIELDS.get(sort_by),
+            descending=sort_order == "desc",
+        )
+        models, next_position = fetch_seek_page(
+            self.session,
+            select(PhenotypeModel).where(*predicates),
+            order,
+            after=after,
+            limit=limit,
+            offset=offset,
+        )
+        total = count_matching(
+            self.session,
+            PhenotypeModel,
+            predicates,
+            self._count_cache,
+        )
+        return SeekPage(self._to_domain_sequence(models), total, next_position)
+
     def update(self, phenotype_id: int, updates: PhenotypeUpdate) -> Phenotype:
         model = self.session.get(PhenotypeModel, phenotype_id)
         if model is None:
@@ -4,22 +4,59 @@ import json
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import and_, asc, desc, func, or_, select
+from sqlalchemy import and_, asc, desc, exc, func, select
+from sqlalchemy.dialects import postgresql, sqlite
 
+from src.domain.repositories.publication_repository import (
+    DEFAULT_UPSERT_BATCH_SIZE,
+    PublicationUpsertResult,
+)
 from src.domain.repositories.publication_repository import (
     PublicationRepository as PublicationRepositoryInterface,
 )
 from src.infrastructure.mappers.publication_mapper import PublicationMapper
+from src.infrastructure.repositories.data_discovery_repository_utils import (
+    dialect_name_for_session,
+)
+from src.infrastructure.repositories.entity_count_cache import (
+    EntityCountCache,
+    count_matching,
+)
+from src.infrastructure.repositories.full_text_search import full_text_search
 from src.models.database import PublicationModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from collections.abc import Iterable
+
     from sqlalchemy.orm import Session
+    from sqlalchemy.sql.base import ReadOnlyColumnCollection
+    from sqlalchemy.sql.elements import ColumnElement, KeyedColumnElement
 
     from src.domain.entities.publication import Publication
-    from src.domain.repositories.base import QuerySpecification
+    from src.domain.repositories.base import QuerySpecification, TotalCount
     from src.type_definitions.common import PublicationUpdate, QueryFilters
 
 
+# Dialects supporting INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+_UPSERT_DIALECTS = frozenset({"postgresql", "sqlite"})
+# Columns refreshed on conflict; mirrors ``upsert_update_payload``
+_UPSERT_UPDATE_COLUMNS = (
+    "title",
+    "authors",
+    "journal",
+    "publication_year",
+    "abstract",
+    "doi",
+)
+# Columns left to database defaults when inserting
+_UPSERT_EXCLUDED_COLUMNS = frozenset({"id", "created_at", "updated_at"})
+_UPSERT_INSERT_COLUMNS = tuple(
+    column.key
+    for column in PublicationModel.__table__.columns
+    if column.key not in _UPSERT_EXCLUDED_COLUMNS
+)
+
+
 class PublicationQueryMixin:
     """Reusable mixin providing rich publication query helpers."""
 
@@ -107,18 +144,17 @@ class PublicationQueryMixin:
     ) -> list[Publication]:
         if filters:
             _ = dict(filters)
-        search_pattern = f"%{query}%"
-        stmt = (
-            select(PublicationModel)
-            .where(
-                or_(
-                    PublicationModel.title.ilike(search_pattern),
-                    PublicationModel.authors.ilike(search_pattern),
-                    PublicationModel.abstract.ilike(search_pattern),
-                    PublicationModel.keywords.ilike(search_pattern),
-                ),
-            )
-            .limit(limit)
+        stmt = full_text_search(
+            self.session,
+            select(PublicationModel).limit(limit),
+            PublicationModel,
+            query,
+            fallback=[
+                PublicationModel.title,
+                PublicationModel.authors,
+                PublicationModel.abstract,
+                PublicationModel.keywords,
+            ],
         )
         models = list(self.session.execute(stmt).scalars())
         return self._to_domain_sequence(models)
@@ -220,8 +256,13 @@ class SqlAlchemyPublicationRepository(
 ):
     """Domain-facing repository adapter for publications backed by SQLAlchemy."""
 
-    def __init__(self, session: Session | None = None) -> None:
+    def __init__(
+        self,
+        session: Session | None = None,
+        count_cache: EntityCountCache | None = None,
+    ) -> None:
         self._session = session
+        self._count_cache = count_cache
 
     @property
     def session(self) -> Session:
@@ -239,6 +280,17 @@ class SqlAlchemyPublicationRepository(
     ) -> list[Publication]:
         return PublicationMapper.to_domain_sequence(models)
 
+    @staticmethod
+    def _filter_predicates(
+        filters: QueryFilters | None,
+    ) -> list[ColumnElement[bool]]:
+        predicates: list[ColumnElement[bool]] = []
+        for field, value in (filters or {}).items():
+            column = getattr(PublicationModel, field, None)
+            if column is not None and value is not None:
+                predicates.append(column == value)
+        return predicates
+
     def create(self, publication: Publication) -> Publication:
         model = PublicationMapper.to_model(publication)
         self.session.add(model)
@@ -257,6 +309,13 @@ class SqlAlchemyPublicationRepository(
             raise ValueError(message)
         return PublicationMapper.to_domain(model)
 
+    def find_by_ids(self, publication_ids: Iterable[int]) -> list[Publication]:
+        unique_ids = list(dict.fromkeys(publication_ids))
+        if not unique_ids:
+            return []
+        stmt = select(PublicationModel).where(PublicationModel.id.in_(unique_ids))
+        return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
+
     def find_by_pubmed_id(self, pubmed_id: str) -> Publication | None:
         stmt = select(PublicationModel).where(PublicationModel.pubmed_id == pubmed_id)
         model = self.session.execute(stmt).scalar_one_or_none()
@@ -306,13 +365,9 @@ class SqlAlchemyPublicationRepository(
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Publication], int]:
-        stmt = select(PublicationModel)
-        if filters:
-            for field, value in filters.items():
-                column = getattr(PublicationModel, field, None)
-                if column is not None and value is not None:
-                    stmt = stmt.where(column == value)
+    ) -> tuple[list[Publication], TotalCount]:
+        predicates = self._filter_predicates(filters)
+        stmt = select(PublicationModel).where(*predicates)
         sortable_fields = {
             "title": PublicationModel.title,
             "publication_year": PublicationModel.publication_year,
@@ -327,7 +382,12 @@ class SqlAlchemyPublicationRepository(
         offset = max(page - 1, 0) * per_page
         stmt = stmt.offset(offset).limit(per_page)
         records = list(self.session.execute(stmt).scalars())
-        total = self.count()
+        total = count_matching(
+            self.session,
+            PublicationModel,
+            predicates,
+            self._count_cache,
+        )
         return self._to_domain_sequence(records), total
 
     def update(self, publication_id: int, updates: PublicationUpdate) -> Publication:
@@ -355,5 +415,176 @@ class SqlAlchemyPublicationRepository(
     ) -> Publication:
         return self.update(publication_id, updates)
 
+    def upsert_many(
+        self,
+        publications: Iterable[Publication],
+        batch_size: int = DEFAULT_UPSERT_BATCH_SIZE,
+    ) -> PublicationUpsertResult:
+        """
+        Upsert publications on ``pubmed_id``, committing once per batch.
+
+        Counts match the per-row default: a repeated PubMed ID is written once
+        but counts as an update for every occurrence after the first. A batch
+        rejected for a DOI or PMC ID clash is rolled back and retried row by
+        row; rows that still clash are skipped.
+        """
+        dialect_name = dialect_name_for_session(self.session)
+        if dialect_name not in _UPSERT_DIALECTS:
+            return super().upsert_many(publications, batch_size)
+
+        groups = _group_by_pubmed_id(publications)
+        size = max(batch_size, 1)
+        created_ids: list[int] = []
+        updated_ids: list[int] = []
+        skipped = 0
+        for offset in range(0, len(groups), size):
+            batch = groups[offset : offset + size]
+            try:
+                batch_result = self._upsert_batch(dialect_name, batch)
+            except exc.IntegrityError:
+                self.session.rollback()
+                batch_result = self._upsert_each(
+                    publication for group in batch for publication in group
+                )
+            created_ids.extend(batch_result.created_ids)
+            updated_ids.extend(batch_result.updated_ids)
+            skipped += batch_result.skipped
+        return PublicationUpsertResult(
+            created=len(created_ids),
+            updated=len(updated_ids),
+            created_ids=tuple(created_ids),
+            updated_ids=tuple(updated_ids),
+            skipped=skipped,
+        )
+
+    def _upsert_batch(
+        self,
+        dialect_name: str,
+        batch: list[list[Publication]],
+    ) -> PublicationUpsertResult:
+        rows = [_upsert_row(group) for group in batch]
+        occurrences = {group[0].identifier.pubmed_id: len(group) for group in batch}
+        existing = self._existing_pubmed_ids(rows)
+        stmt = _upsert_statement(dialect_name, rows).returning(
+            PublicationModel.id,
+            PublicationModel.pubmed_id,
+        )
+        created_ids: list[int] = []
+        updated_ids: list[int] = []
+        for publication_id, pubmed_id in self.session.execute(stmt):
+            repeats = occurrences.get(pubmed_id, 1) if pubmed_id else 1
+            if pubmed_id in existing:
+                updated_ids.extend([publication_id] * repeats)
+            else:
+                created_ids.append(publication_id)
+                updated_ids.extend([publication_id] * (repeats - 1))
+        self.session.commit()
+        return PublicationUpsertResult(
+            created=len(created_ids),
+            updated=len(updated_ids),
+            created_ids=tuple(created_ids),
+            updated_ids=tuple(updated_ids),
+        )
+
+    def _upsert_each(
+        self,
+        publications: Iterable[Publication],
+    ) -> PublicationUpsertResult:
+        created_ids: list[int] = []
+        updated_ids: list[int] = []
+        skipped = 0
+        for publication in publications:
+            try:
+                result = super().upsert_many([publication])
+            except exc.IntegrityError:
+                self.session.rollback()
+                skipped += 1
+                continue
+            created_ids.extend(result.created_ids)
+            updated_ids.extend(result.updated_ids)
+        return PublicationUpsertResult(
+            created=len(created_ids),
+            updated=len(updated_ids),
+            created_ids=tuple(created_ids),
+            updated_ids=tuple(updated_ids),
+            skipped=skipped,
+        )
+
+    def _existing_pubmed_ids(self, rows: list[dict[str, object]]) -> set[str]:
+        pubmed_ids = [row["pubmed_id"] for row in rows if row["pubmed_id"]]
+        if not pubmed_ids:
+            return set()
+        stmt = select(PublicationModel.pubmed_id).where(
+            PublicationModel.pubmed_id.in_(pubmed_ids),
+        )
+        return {
+            pubmed_id for pubmed_id in self.session.execute(stmt).scalars() if pubmed_id
+        }
+
+
+def _group_by_pubmed_id(
+    publications: Iterable[Publication],
+) -> list[list[Publication]]:
+    """
+    Publications grouped by PubMed ID, in first-seen order.
+
+    A single statement may not update the same row twice, so each group
+    becomes one row. Publications without a PubMed ID stay on their own.
+    """
+    groups: list[list[Publication]] = []
+    keyed: dict[str, list[Publication]] = {}
+    for publication in publications:
+        pubmed_id = publication.identifier.pubmed_id
+        if not pubmed_id:
+            groups.append([publication])
+            continue
+        group = keyed.get(pubmed_id)
+        if group is None:
+            group = keyed[pubmed_id] = []
+            groups.append(group)
+        group.append(publication)
+    return groups
+
+
+def _upsert_row(group: list[Publication]) -> dict[str, object]:
+    """Column values the per-row path leaves behind for a PubMed ID group."""
+    first, *repeats = (_column_values(publication) for publication in group)
+    for repeat in repeats:
+        first.update({column: repeat[column] for column in _UPSERT_UPDATE_COLUMNS})
+    return first
+
+
+def _column_values(publication: Publication) -> dict[str, object]:
+    model = PublicationMapper.to_model(publication)
+    return {column: getattr(model, column) for column in _UPSERT_INSERT_COLUMNS}
+
+
+def _upsert_statement(
+    dialect_name: str,
+    rows: list[dict[str, object]],
+) -> postgresql.Insert | sqlite.Insert:
+    """Multi-row insert that refreshes citation fields on ``pubmed_id`` clashes."""
+    if dialect_name == "postgresql":
+        pg_stmt = postgresql.insert(PublicationModel).values(rows)
+        return pg_stmt.on_conflict_do_update(
+            index_elements=[PublicationModel.pubmed_id],
+            set_=_upsert_assignments(pg_stmt.excluded),
+        )
+    sqlite_stmt = sqlite.insert(PublicationModel).values(rows)
+    return sqlite_stmt.on_conflict_do_update(
+        index_elements=[PublicationModel.pubmed_id],
+        set_=_upsert_assignments(sqlite_stmt.excluded),
+    )
+
+
+def _upsert_assignments(
+    excluded: ReadOnlyColumnCollection[str, KeyedColumnElement[object]],
+) -> dict[str, object]:
+    assignments: dict[str, object] = {
+        column: excluded[column] for column in _UPSERT_UPDATE_COLUMNS
+    }
+    assignments["updated_at"] = func.now()
+    return assignments
+
 
 __all__ = ["SqlAlchemyPublicationRepository"]
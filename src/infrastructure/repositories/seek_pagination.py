@@ -0,0 +1,158 @@
+"""
+Keyset ("seek") pagination on a sort column with the primary key as tiebreaker.
+
+Rows are ordered by ``(sort column, id)`` and a page continues after the
+``SeekPosition`` of the previous page's last row with a row-value comparison,
+so the database walks an index to the start of the page instead of counting
+past ``OFFSET`` rows, and page N costs the same as page 1. The sort value in
+the position is only a fallback for rows deleted since it was issued.
+
+NULL sort values order after every other value ascending and before them
+descending, on every dialect, so positions on nullable columns stay valid.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func, inspect, literal, or_, select, tuple_
+from sqlalchemy.orm import ColumnProperty
+
+from src.domain.repositories.base import SeekPosition
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement, Select
+    from sqlalchemy.orm import InstrumentedAttribute, Session
+    from sqlalchemy.sql.elements import UnaryExpression
+
+    from src.domain.repositories.base import SortValue
+    from src.models.database.base import Base
+
+
+def sort_attribute(
+    model: type[Base],
+    sort_by: str | None,
+) -> InstrumentedAttribute[SortValue] | None:
+    """The mapped column ``sort_by`` names on ``model``, if any."""
+    if not sort_by:
+        return None
+    prop = inspect(model).attrs.get(sort_by)
+    if not isinstance(prop, ColumnProperty):
+        return None
+    attribute: InstrumentedAttribute[SortValue] = getattr(model, sort_by)
+    return attribute
+
+
+class SeekOrder:
+    """Order of a keyset-paginated query: the sort column, then the ID."""
+
+    __slots__ = ("_descending", "_id_column", "_nullable", "_sort_column")
+
+    def __init__(
+        self,
+        id_column: InstrumentedAttribute[int],
+        sort_column: InstrumentedAttribute[SortValue] | None = None,
+        *,
+        descending: bool = False,
+    ) -> None:
+        self._id_column = id_column
+        self._sort_column = sort_column
+        self._descending = descending
+        self._nullable = sort_column is not None and any(
+            column.nullable for column in sort_column.property.columns
+        )
+
+    def order_by(self) -> list[UnaryExpression[SortValue] | UnaryExpression[int]]:
+        id_column = self._id_column
+        id_order = id_column.desc() if self._descending else id_column.asc()
+        if self._sort_column is None:
+            return [id_order]
+        if self._descending:
+            sort_order = self._sort_column.desc()
+            if self._nullable:
+                sort_order = sort_order.nulls_first()
+        else:
+            sort_order = self._sort_column.asc()
+            if self._nullable:
+                sort_order = sort_order.nulls_last()
+        return [sort_order, id_order]
+
+    def after(self, position: SeekPosition) -> ColumnElement[bool]:
+        """Rows ordered after ``position``."""
+        sort_column = self._sort_column
+        if sort_column is None:
+            if self._descending:
+                return self._id_column < position.id
+            return self._id_column > position.id
+        if position.sort_value is None:
+            return self._after_null(sort_column, position.id)
+        # Compare against the value as stored when the row still exists:
+        # SQLite keeps timestamps as text in more than one format, so a value
+        # bound from Python may not compare equal to its own row.
+        stored = (
+            select(sort_column)
+            .where(self._id_column == position.id)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        key = tuple_(sort_column, self._id_column)
+        bound = tuple_(
+            func.coalesce(stored, literal(position.sort_value)),
+            literal(position.id),
+        )
+        if self._descending:
+            return key < bound
+        if self._nullable:
+            return or_(key > bound, sort_column.is_(None))
+        return key > bound
+
+    def _after_null(
+        self,
+        sort_column: InstrumentedAttribute[SortValue],
+        after_id: int,
+    ) -> ColumnElement[bool]:
+        # Within the NULL run only the ID moves on; descending, every
+        # non-NULL row is still ahead.
+        if self._descending:
+            return or_(
+                sort_column.is_(None) & (self._id_column < after_id),
+                sort_column.is_not(None),
+            )
+        return sort_column.is_(None) & (self._id_column > after_id)
+
+    def position_of(self, model: Base) -> SeekPosition:
+        """Position of ``model`` in this order."""
+        sort_value: SortValue = (
+            None if self._sort_column is None else getattr(model, self._sort_column.key)
+        )
+        return SeekPosition(sort_value, getattr(model, self._id_column.key))
+
+
+def fetch_seek_page[TModel: Base](  # noqa: PLR0913
+    session: Session,
+    stmt: Select[TModel],
+    order: SeekOrder,
+    *,
+    after: SeekPosition | None,
+    limit: int,
+    offset: int = 0,
+) -> tuple[list[TModel], SeekPosition | None]:
+    """
+    Rows of ``stmt`` after ``after`` in ``order``, and the next page's position.
+
+    ``offset`` skips rows from the start of the window for callers still
+    addressing pages by number; cursor callers leave it at zero.
+    """
+    stmt = stmt.order_by(*order.order_by()).limit(limit + 1)
+    if after is not None:
+        stmt = stmt.where(order.after(after))
+    if offset:
+        stmt = stmt.offset(offset)
+    models = list(session.execute(stmt).scalars())
+    if len(models) <= limit:
+        return models, None
+    del models[limit:]
+    return models, order.position_of(models[-1])
+
+
+__all__ = ["SeekOrder", "fetch_seek_page", "sort_attribute"]
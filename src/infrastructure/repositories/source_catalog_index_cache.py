@@ -0,0 +1,70 @@
+"""Process-wide cache of the in-memory source catalog index."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.domain.services.source_catalog_index import SourceCatalogIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.domain.entities.data_discovery_session import SourceCatalogEntry
+
+DEFAULT_CATALOG_INDEX_TTL_SECONDS = 300.0
+
+
+@dataclass
+class SourceCatalogIndexCache:
+    """
+    Holds the current ``SourceCatalogIndex`` snapshot for the process.
+
+    The catalog is loaded on first use and reloaded after ``ttl_seconds`` so
+    changes made by other processes (such as reseeding) are picked up.
+    Entries saved through this process are applied to the snapshot
+    immediately; a load that overlaps such an update is discarded rather
+    than replacing the newer snapshot.
+    """
+
+    ttl_seconds: float = DEFAULT_CATALOG_INDEX_TTL_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    _index: SourceCatalogIndex | None = None
+    _loaded_at: float = 0.0
+    _version: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get_or_load(
+        self,
+        loader: Callable[[], list[SourceCatalogEntry]],
+    ) -> SourceCatalogIndex:
+        now = self.clock()
+        with self._lock:
+            index, version = self._index, self._version
+            if index is not None and now - self._loaded_at < self.ttl_seconds:
+                return index
+
+        index = SourceCatalogIndex(loader())
+        with self._lock:
+            if self._version == version:
+                self._index = index
+                self._loaded_at = now
+        return index
+
+    def update_entry(self, entry: SourceCatalogEntry) -> None:
+        """Apply a saved entry to the cached snapshot."""
+        with self._lock:
+            self._version += 1
+            if self._index is not None:
+                self._index = self._index.with_entry(entry)
+
+    def invalidate(self) -> None:
+        """Force the next read to reload the catalog."""
+        with self._lock:
+            self._version += 1
+            self._index = None
+
+
+__all__ = ["SourceCatalogIndexCache"]
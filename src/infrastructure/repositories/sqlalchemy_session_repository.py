@@ -10,17 +10,22 @@ from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 from typing import TYPE_CHECKING
 
-from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy import Table, and_, bindparam, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.session import SessionStatus, UserSession
-from src.domain.repositories.session_repository import SessionRepository
+from src.domain.repositories.session_repository import (
+    SessionActivityUpdate,
+    SessionRepository,
+)
 from src.models.database.session import SessionModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from collections.abc import Sequence
     from uuid import UUID
 
 SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+SESSIONS_TABLE: Table = SessionModel.__table__  # type: ignore[assignment]
 
 
 class SqlAlchemySessionRepository(SessionRepository):
@@ -316,6 +321,37 @@ class SqlAlchemySessionRepository(SessionRepository):
             await session.execute(stmt)
             await session.commit()
 
+    async def record_activity(self, updates: Sequence[SessionActivityUpdate]) -> None:
+        """Persist coalesced session activity in one executemany UPDATE."""
+        if not updates:
+            return
+        stmt = (
+            update(SESSIONS_TABLE)
+            .where(
+                and_(
+                    SESSIONS_TABLE.c.id == bindparam("b_session_id"),
+                    SESSIONS_TABLE.c.status == SessionStatus.ACTIVE,
+                ),
+            )
+            .values(
+                last_activity=bindparam("b_last_activity"),
+                expires_at=bindparam("b_expires_at"),
+                refresh_expires_at=bindparam("b_refresh_expires_at"),
+            )
+        )
+        params = [
+            {
+                "b_session_id": item.session_id,
+                "b_last_activity": item.last_activity,
+                "b_expires_at": item.expires_at,
+                "b_refresh_expires_at": item.refresh_expires_at,
+            }
+            for item in updates
+        ]
+        async with self._session() as session:
+            await session.execute(stmt, params)
+            await session.commit()
+
     async def get_recent_sessions(self, limit: int = 50) -> list[UserSession]:
         """Get most recently active sessions."""
         async with self._session() as session:
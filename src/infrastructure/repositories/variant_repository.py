@@ -7,25 +7,49 @@ from typing import TYPE_CHECKING
 from sqlalchemy import and_, asc, desc, func, or_, select
 
 from src.domain.entities.variant import ClinicalSignificance, VariantSummary
+from src.domain.repositories.base import SeekPage
 from src.domain.repositories.variant_repository import (
     VariantRepository as VariantRepositoryInterface,
 )
 from src.infrastructure.mappers.variant_mapper import VariantMapper
+from src.infrastructure.repositories.entity_count_cache import count_matching
+from src.infrastructure.repositories.load_plans import (
+    LoadPlan,
+    variant_load_options,
+)
+from src.infrastructure.repositories.seek_pagination import (
+    SeekOrder,
+    fetch_seek_page,
+    sort_attribute,
+)
 from src.models.database import GeneModel, VariantModel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
+    from collections.abc import Iterable
+
+    from sqlalchemy import ColumnElement, Select
     from sqlalchemy.orm import Session
 
     from src.domain.entities.variant import Variant
-    from src.domain.repositories.base import QuerySpecification
+    from src.domain.repositories.base import (
+        QuerySpecification,
+        SeekPosition,
+        TotalCount,
+    )
+    from src.infrastructure.repositories.entity_count_cache import EntityCountCache
     from src.type_definitions.common import JSONObject, QueryFilters, VariantUpdate
 
 
 class SqlAlchemyVariantRepository(VariantRepositoryInterface):
     """Domain-facing repository adapter for variants backed by SQLAlchemy."""
 
-    def __init__(self, session: Session | None = None) -> None:
+    def __init__(
+        self,
+        session: Session | None = None,
+        count_cache: EntityCountCache | None = None,
+    ) -> None:
         self._session = session
+        self._count_cache = count_cache
 
     @property
     def session(self) -> Session:
@@ -40,33 +64,77 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
     def _to_domain_sequence(self, models: list[VariantModel]) -> list[Variant]:
         return VariantMapper.to_domain_sequence(models)
 
+    @staticmethod
+    def _select(plan: LoadPlan) -> Select[VariantModel]:
+        return select(VariantModel).options(*variant_load_options(plan))
+
+    @staticmethod
+    def _filter_predicates(
+        filters: QueryFilters | None,
+    ) -> list[ColumnElement[bool]]:
+        predicates: list[ColumnElement[bool]] = []
+        for field, value in (filters or {}).items():
+            column = getattr(VariantModel, field, None)
+            if column is not None and value is not None:
+                predicates.append(column == value)
+        return predicates
+
+    def _load(
+        self,
+        variant_id: int,
+        *,
+        refresh: bool = False,
+    ) -> VariantModel | None:
+        stmt = self._select(LoadPlan.DETAIL).where(VariantModel.id == variant_id)
+        if refresh:
+            stmt = stmt.execution_options(populate_existing=True)
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def _reload(self, variant_id: int) -> Variant:
+        """Re-read a variant after a write, relationships included."""
+        model = self._load(variant_id, refresh=True)
+        if model is None:
+            message = f"Variant with id {variant_id} not found"
+            raise ValueError(message)
+        return VariantMapper.to_domain(model)
+
     def create(self, variant: Variant) -> Variant:
         model = VariantMapper.to_model(variant)
         self.session.add(model)
         self.session.commit()
-        self.session.refresh(model)
-        return VariantMapper.to_domain(model)
+        return self._reload(model.id)
 
     def get_by_id(self, variant_id: int) -> Variant | None:
-        return self._to_domain(self.session.get(VariantModel, variant_id))
+        return self._to_domain(self._load(variant_id))
 
     def get_by_id_or_fail(self, variant_id: int) -> Variant:
-        model = self.session.get(VariantModel, variant_id)
+        model = self._load(variant_id)
         if model is None:
             message = f"Variant with id {variant_id} not found"
             raise ValueError(message)
         return VariantMapper.to_domain(model)
 
+    def find_by_ids(self, variant_ids: Iterable[int]) -> list[Variant]:
+        unique_ids = list(dict.fromkeys(variant_ids))
+        if not unique_ids:
+            return []
+        stmt = self._select(LoadPlan.SUMMARY).where(VariantModel.id.in_(unique_ids))
+        return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
+
     def find_by_variant_id(self, variant_id: str) -> Variant | None:
-        stmt = select(VariantModel).where(VariantModel.variant_id == variant_id)
+        stmt = self._select(LoadPlan.DETAIL).where(
+            VariantModel.variant_id == variant_id,
+        )
         return self._to_domain(self.session.execute(stmt).scalar_one_or_none())
 
     def find_by_clinvar_id(self, clinvar_id: str) -> Variant | None:
-        stmt = select(VariantModel).where(VariantModel.clinvar_id == clinvar_id)
+        stmt = self._select(LoadPlan.DETAIL).where(
+            VariantModel.clinvar_id == clinvar_id,
+        )
         return self._to_domain(self.session.execute(stmt).scalar_one_or_none())
 
     def find_by_gene(self, gene_id: int, limit: int | None = None) -> list[Variant]:
-        stmt = select(VariantModel).where(VariantModel.gene_id == gene_id)
+        stmt = self._select(LoadPlan.SUMMARY).where(VariantModel.gene_id == gene_id)
         if limit:
             stmt = stmt.limit(limit)
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
@@ -77,7 +145,7 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
         start_pos: int,
         end_pos: int,
     ) -> list[Variant]:
-        stmt = select(VariantModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             and_(
                 VariantModel.chromosome == chromosome,
                 VariantModel.position >= start_pos,
@@ -99,7 +167,7 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
         limit: int | None = None,
     ) -> list[Variant]:
         normalized = ClinicalSignificance.validate(significance)
-        stmt = select(VariantModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             VariantModel.clinical_significance == normalized,
         )
         if limit:
@@ -107,7 +175,7 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
 
     def find_pathogenic_variants(self, limit: int | None = None) -> list[Variant]:
-        stmt = select(VariantModel).where(
+        stmt = self._select(LoadPlan.SUMMARY).where(
             or_(
                 VariantModel.clinical_significance == ClinicalSignificance.PATHOGENIC,
                 VariantModel.clinical_significance
@@ -119,8 +187,7 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
 
     def find_with_evidence(self, variant_id: int) -> Variant | None:
-        stmt = select(VariantModel).where(VariantModel.id == variant_id)
-        return self._to_domain(self.session.execute(stmt).scalar_one_or_none())
+        return self._to_domain(self._load(variant_id))
 
     def update(self, variant_id: int, updates: VariantUpdate) -> Variant:
         model = self.session.get(VariantModel, variant_id)
@@ -131,8 +198,7 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
             if hasattr(model, field):
                 setattr(model, field, value)
         self.session.commit()
-        self.session.refresh(model)
-        return VariantMapper.to_domain(model)
+        return self._reload(variant_id)
 
     def delete(self, variant_id: int) -> bool:
         model = self.session.get(VariantModel, variant_id)
@@ -164,7 +230,7 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
         limit: int | None = None,
         offset: int | None = None,
     ) -> list[Variant]:
-        stmt = select(VariantModel)
+        stmt = self._select(LoadPlan.SUMMARY)
         if offset:
             stmt = stmt.offset(offset)
         if limit:
@@ -172,7 +238,7 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
         return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
 
     def find_by_criteria(self, spec: QuerySpecification) -> list[Variant]:
-        stmt = select(VariantModel)
+        stmt = self._select(LoadPlan.SUMMARY)
         for field, value in spec.filters.items():
             column = getattr(VariantModel, field, None)
             if column is not None and value is not None:
@@ -185,7 +251,7 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
 
     def find_by_gene_symbol(self, gene_symbol: str) -> list[Variant]:
         stmt = (
-            select(VariantModel)
+            self._select(LoadPlan.SUMMARY)
             .join(VariantModel.gene)
             .where(GeneModel.symbol == gene_symbol.upper())
         )
@@ -205,6 +271,32 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
             for model in models
         ]
 
+    def get_variant_summaries_by_chromosome(
+        self,
+        chromosome: str,
+    ) -> list[VariantSummary]:
+        stmt = (
+            select(
+                VariantModel.variant_id,
+                VariantModel.clinvar_id,
+                VariantModel.chromosome,
+                VariantModel.position,
+                VariantModel.clinical_significance,
+            )
+            .where(VariantModel.chromosome == chromosome)
+            .order_by(asc(VariantModel.position))
+        )
+        return [
+            VariantSummary(
+                variant_id=row.variant_id,
+                clinvar_id=row.clinvar_id,
+                chromosome=row.chromosome,
+                position=row.position,
+                clinical_significance=row.clinical_significance,
+            )
+            for row in self.session.execute(stmt)
+        ]
+
     def paginate_variants(
         self,
         page: int,
@@ -212,13 +304,9 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
         sort_by: str,
         sort_order: str,
         filters: QueryFilters | None = None,
-    ) -> tuple[list[Variant], int]:
-        stmt = select(VariantModel)
-        if filters:
-            for field, value in filters.items():
-                column = getattr(VariantModel, field, None)
-                if column is not None and value is not None:
-                    stmt = stmt.where(column == value)
+    ) -> tuple[list[Variant], TotalCount]:
+        predicates = self._filter_predicates(filters)
+        stmt = self._select(LoadPlan.SUMMARY).where(*predicates)
         offset = max(page - 1, 0) * per_page
         if sort_by:
             column = getattr(VariantModel, sort_by, None)
@@ -228,16 +316,71 @@ class SqlAlchemyVariantRepository(VariantRepositoryInterface):
                 )
         stmt = stmt.offset(offset).limit(per_page)
         models = list(self.session.execute(stmt).scalars())
-        total = self.count()
+        total = count_matching(
+            self.session,
+            VariantModel,
+            predicates,
+            self._count_cache,
+        )
         return self._to_domain_sequence(models), total
 
+    def paginate_variants_keyset(
+        self,
+        after_id: int | None,
+        limit: int,
+        filters: QueryFilters | None = None,
+    ) -> list[Variant]:
+        stmt = (
+            self._select(LoadPlan.SUMMARY).order_by(asc(VariantModel.id)).limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(VariantModel.id > after_id)
+        if filters:
+            for field, value in filters.items():
+                column = getattr(VariantModel, field, None)
+                if column is not None and value is not None:
+                    stmt = stmt.where(column == value)
+        return self._to_domain_sequence(list(self.session.execute(stmt).scalars()))
+
+    def paginate_variants_seek(  # noqa: PLR0913
+        self,
+        after: SeekPosition | None,
+        limit: int,
+        sort_by: str,
+        sort_order: str,
+        *,
+        filters: QueryFilters | None = None,
+        offset: int = 0,
+    ) -> SeekPage[Variant]:
+        predicates = self._filter_predicates(filters)
+        order = SeekOrder(
+            VariantModel.id,
+            sort_attribute(VariantModel, sort_by),
+            descending=sort_order == "desc",
+        )
+        models, next_position = fetch_seek_page(
+            self.session,
+            self._select(LoadPlan.SUMMARY).where(*predicates),
+            order,
+            after=after,
+            limit=limit,
+            offset=offset,
+        )
+        total = count_matching(
+            self.session,
+            VariantModel,
+            predicates,
+            self._count_cache,
+        )
+        return SeekPage(self._to_domain_sequence(models), total, next_position)
+
     def search_variants(
         self,
         query: str,
         limit: int = 10,
         filters: QueryFilters | None = None,
     ) -> list[Variant]:
-        stmt = select(VariantModel).limit(limit)
+        stmt = self._select(LoadPlan.SUMMARY).limit(limit)
         if query:
             pattern = f"%{query}%"
             stmt = stmt.where(
@@ -1,6 +1,7 @@
 import asyncio
+import logging
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
@@ -18,14 +19,18 @@ from src.infrastructure.dependency_injection.container import container
 from src.infrastructure.dependency_injection.dependencies import (
     initialize_legacy_session,
 )
+from src.infrastructure.http import get_host_rate_limiters, get_http_client_registry
+from src.infrastructure.observability.audit_log_buffer import get_audit_log_buffer
 from src.infrastructure.security.cors import get_allowed_origins
 from src.middleware import (
     AuditLoggingMiddleware,
     AuthMiddleware,
+    AuthorizationScopeMiddleware,
     EndpointRateLimitMiddleware,
     JWTAuthMiddleware,
     MaintenanceModeMiddleware,
     RequestContextMiddleware,
+    build_host_rate_backend,
 )
 from src.routes import (
     admin_router,
@@ -49,6 +54,8 @@ from src.routes import (
     variants_router,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def _skip_startup_tasks() -> bool:
     return os.getenv("MED13_SKIP_STARTUP_TASKS") == "1"
@@ -67,6 +74,23 @@ SESSION_CLEANUP_INTERVAL_SECONDS = int(
 )  # Default: 1 hour
 
 
+async def _release_shared_resources() -> None:
+    """Close process-wide resources, carrying on past any step that fails."""
+    steps: list[tuple[str, Callable[[], Awaitable[None]]]] = [
+        ("audit log buffer", get_audit_log_buffer().close),
+        ("session activity recorder", container.close_session_activity_recorder),
+        ("source query client", container.close_source_query_client),
+        ("HTTP client registry", get_http_client_registry().aclose),
+        ("host rate limiters", get_host_rate_limiters().aclose),
+        ("database engine", container.engine.dispose),
+    ]
+    for name, close in steps:
+        try:
+            await close()
+        except Exception:
+            logger.exception("Failed to close the %s during shutdown", name)
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     """Application lifespan context manager."""
@@ -74,6 +98,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     scheduler_task: asyncio.Task[None] | None = None
     session_cleanup_task: asyncio.Task[None] | None = None
     try:
+        get_host_rate_limiters().use_backend(build_host_rate_backend())
         if not _skip_startup_tasks():
             legacy_session = next(get_session())
             initialize_legacy_session(legacy_session)
@@ -107,7 +132,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
                 await session_cleanup_task
         if legacy_session is not None:
             legacy_session.close()
-        await container.engine.dispose()
+        await _release_shared_resources()
 
 
 def create_app() -> FastAPI:
@@ -155,6 +180,9 @@ def create_app() -> FastAPI:
     app.add_middleware(EndpointRateLimitMiddleware)
     app.add_middleware(MaintenanceModeMiddleware)
 
+    # Share authorization lookups across a request's route dependencies
+    app.add_middleware(AuthorizationScopeMiddleware)
+
     app.include_router(health_router)
     app.include_router(root_router)
     app.include_router(resources_router)
@@ -2,6 +2,8 @@
 
 from .audit_logging import AuditLoggingMiddleware
 from .auth import AuthMiddleware
+from .authorization_scope import AuthorizationScopeMiddleware
+from .distributed_rate_limit import build_host_rate_backend
 from .jwt_auth import JWTAuthMiddleware
 from .maintenance_mode import MaintenanceModeMiddleware
 from .rate_limit import EndpointRateLimitMiddleware
@@ -10,8 +12,10 @@ from .request_context import RequestContextMiddleware
 __all__ = [
     "AuditLoggingMiddleware",
     "AuthMiddleware",
+    "AuthorizationScopeMiddleware",
     "EndpointRateLimitMiddleware",
     "JWTAuthMiddleware",
     "MaintenanceModeMiddleware",
     "RequestContextMiddleware",
+    "build_host_rate_backend",
 ]
@@ -5,12 +5,12 @@ from typing import TYPE_CHECKING, Final
 
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
-from src.application.curation.repositories.audit_repository import (
-    SqlAlchemyAuditRepository,
-)
 from src.application.services.audit_service import AuditTrailService
-from src.database.session import SessionLocal
 from src.domain.entities.user import User
+from src.infrastructure.observability.audit_log_buffer import (
+    AuditLogBuffer,
+    get_audit_log_buffer,
+)
 from src.infrastructure.observability.request_context import get_audit_context
 
 if TYPE_CHECKING:  # pragma: no cover - typing helpers only
@@ -36,17 +36,23 @@ HTTP_ERROR_THRESHOLD: Final[int] = 400
 
 
 class AuditLoggingMiddleware(BaseHTTPMiddleware):
-    """Log read access for HIPAA-aligned audit trails."""
+    """
+    Log read access for HIPAA-aligned audit trails.
+
+    Records are handed to the shared ``AuditLogBuffer``, which persists them in
+    batches off the request path and flushes on application shutdown.
+    """
 
     def __init__(
         self,
         app: ASGIApp,
         *,
         exclude_prefixes: tuple[str, ...] = DEFAULT_EXCLUDED_PREFIXES,
+        buffer: AuditLogBuffer | None = None,
     ) -> None:
         super().__init__(app)
         self._exclude_prefixes = exclude_prefixes
-        self._audit_service = AuditTrailService(SqlAlchemyAuditRepository())
+        self._buffer = buffer or get_audit_log_buffer()
 
     async def dispatch(
         self,
@@ -63,16 +69,16 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
         details: JSONObject = {"status_code": response.status_code}
         success = response.status_code < HTTP_ERROR_THRESHOLD
 
-        db = SessionLocal()
         try:
-            self._audit_service.record_action(
-                db,
-                action="phi.read",
-                target=("http_request", request.url.path),
-                actor_id=actor_id,
-                details=details,
-                context=context,
-                success=success,
+            await self._buffer.enqueue(
+                AuditTrailService.build_log(
+                    action="phi.read",
+                    target=("http_request", request.url.path),
+                    actor_id=actor_id,
+                    details=details,
+                    context=context,
+                    success=success,
+                ),
             )
         except (
             Exception
@@ -82,8 +88,6 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
                 request.method,
                 request.url.path,
             )
-        finally:
-            db.close()
 
         return response
 
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.application.services.authorization_service import authorization_scope
+
+if TYPE_CHECKING:  # pragma: no cover - typing helpers only
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class AuthorizationScopeMiddleware:
+    """
+    Open an authorization scope for every HTTP request.
+
+    Route dependencies that check several permissions for the current user
+    then share one user lookup instead of repeating it per check. Implemented
+    as plain ASGI middleware so the scope wraps the whole request, including
+    streamed responses.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with authorization_scope():
+            await self.app(scope, receive, send)
+
+
+__all__ = ["AuthorizationScopeMiddleware"]
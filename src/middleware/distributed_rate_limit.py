@@ -1,24 +1,96 @@
-"""Shared rate limiting backed by Redis."""
+"""
+Shared rate limiting backed by Redis.
+
+Limits are enforced with a sliding-window counter evaluated atomically by a
+server-side Lua script: the previous window's count is weighted by how much
+of it still overlaps the sliding window, so bursts straddling a window edge
+cannot exceed the limit the way a fixed window allows. Each script call is a
+single round trip.
+
+To keep most checks off the network, a process leases a small batch of tokens
+per key and spends them locally until the batch runs out or the lease
+expires; denials are cached locally until their retry time. Unspent leased
+tokens simply lapse, so leasing can only make the global limit stricter.
+When Redis is unreachable the limiter reports every request as allowed for
+a cooldown period, leaving the caller's in-process limiter in charge.
+"""
 
 from __future__ import annotations
 
 import importlib
 import logging
+import math
 import os
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Protocol, TypeGuard
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from types import ModuleType
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_KEY_PREFIX = "ratelimit:sw:"
+HOST_RATE_KEY_PREFIX = "ratelimit:host:"
+DEFAULT_LEASE_FRACTION = 20
+DEFAULT_LEASE_TTL_SECONDS = 1.0
+DEFAULT_MAX_CACHED_KEYS = 100_000
+DEFAULT_FAILURE_COOLDOWN_SECONDS = 5.0
+
+# KEYS[1]: hash holding the current window start and the current/previous
+# window counts. ARGV: capacity, window length (ms), tokens requested.
+# Returns {tokens granted, retry after (ms)}; Redis' own clock is used so
+# every application server agrees on window boundaries.
+SLIDING_WINDOW_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local start = now - (now % window)
+local state = redis.call('HMGET', KEYS[1], 'start', 'current', 'previous')
+local current_start = tonumber(state[1])
+local current = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+if current_start ~= start then
+  if current_start == start - window then
+    previous = current
+  else
+    previous = 0
+  end
+  current = 0
+end
+local elapsed = now - start
+local used = previous * (window - elapsed) / window + current
+local granted = math.min(requested, math.floor(capacity - used))
+if granted >= 1 then
+  current = current + granted
+  redis.call('HSET', KEYS[1], 'start', start, 'current', current,
+    'previous', previous)
+  redis.call('PEXPIRE', KEYS[1], window * 2)
+  return {granted, 0}
+end
+local retry
+if current <= capacity - 1 then
+  retry = window * (1 - (capacity - 1 - current) / previous) - elapsed
+else
+  retry = window - elapsed + window * (1 - (capacity - 1) / current)
+end
+return {0, math.max(1, math.ceil(retry))}
+"""
 
-class RedisClientProtocol(Protocol):
-    async def incr(self, key: str) -> int: ...
 
-    async def expire(self, key: str, seconds: int) -> int | bool: ...
+class RedisScriptProtocol(Protocol):
+    async def __call__(
+        self,
+        keys: Sequence[str] | None = None,
+        args: Sequence[int] | None = None,
+    ) -> Sequence[int]: ...
+
 
-    async def ttl(self, key: str) -> int | None: ...
+class RedisClientProtocol(Protocol):
+    def register_script(self, script: str) -> RedisScriptProtocol: ...
 
     async def close(self) -> None: ...
 
@@ -44,37 +116,159 @@ def _load_redis_factory() -> type[RedisFactory]:
     return factory_obj
 
 
+def _load_redis_errors() -> tuple[type[Exception], ...]:
+    """Exceptions that mean Redis could not answer the check."""
+    errors: tuple[type[Exception], ...] = (OSError, TimeoutError)
+    try:
+        module: ModuleType = importlib.import_module("redis.exceptions")
+    except ImportError:  # pragma: no cover - optional dependency
+        return errors
+    redis_error: object = getattr(module, "RedisError", None)
+    if isinstance(redis_error, type) and issubclass(redis_error, Exception):
+        errors = (*errors, redis_error)
+    return errors
+
+
+class _LocalLease:
+    """Tokens leased from Redis for one key, or a cached denial."""
+
+    __slots__ = ("denied_until", "expires_at", "tokens")
+
+    def __init__(self) -> None:
+        self.tokens: int = 0
+        self.expires_at: float = 0.0
+        self.denied_until: float = 0.0
+
+    def is_stale(self, now: float) -> bool:
+        return self.expires_at <= now and self.denied_until <= now
+
+
 class DistributedRateLimiter:
-    """Simple fixed-window rate limiter backed by Redis."""
+    """Sliding-window rate limiter backed by Redis with local token leases."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - tuning knobs are keyword-only
         self,
         redis_url: str,
         window_seconds: int = 60,
+        *,
+        client: RedisClientProtocol | None = None,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        lease_fraction: int = DEFAULT_LEASE_FRACTION,
+        lease_ttl_seconds: float = DEFAULT_LEASE_TTL_SECONDS,
+        max_cached_keys: int = DEFAULT_MAX_CACHED_KEYS,
+        failure_cooldown_seconds: float = DEFAULT_FAILURE_COOLDOWN_SECONDS,
     ) -> None:
-        redis_factory = _load_redis_factory()
-        self.redis = redis_factory.from_url(redis_url)
+        """
+        Initialize the limiter.
+
+        Args:
+            redis_url: Redis connection URL (ignored when ``client`` is given)
+            window_seconds: Length of the sliding window
+            client: Pre-built Redis client, mainly for tests
+            key_prefix: Namespace for the limiter's Redis keys
+            lease_fraction: Lease ``capacity // lease_fraction`` tokens per call
+            lease_ttl_seconds: How long leased tokens may be spent locally
+            max_cached_keys: Upper bound on locally cached leases
+            failure_cooldown_seconds: How long to skip Redis after an error
+        """
+        self.redis = client or _load_redis_factory().from_url(redis_url)
         self.window_seconds = window_seconds
+        self.key_prefix = key_prefix
+        self.lease_fraction = max(lease_fraction, 1)
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.max_cached_keys = max(max_cached_keys, 1)
+        self.failure_cooldown_seconds = failure_cooldown_seconds
+        self._script = self.redis.register_script(SLIDING_WINDOW_SCRIPT)
+        self._errors = _load_redis_errors()
+        self._leases: OrderedDict[str, _LocalLease] = OrderedDict()
+        self._degraded_until = 0.0
+        self.local_decisions = 0
+        self.remote_calls = 0
+        self.fallbacks = 0
 
     async def allow(self, key: str, capacity: int) -> tuple[bool, int]:
         """
-        Increment usage for the key and return whether the request is allowed.
+        Consume one request for the key and return whether it is allowed.
 
         Returns:
             Tuple[allowed, retry_after_seconds]
         """
-        value = await self.redis.incr(key)
-        if value == 1:
-            await self.redis.expire(key, self.window_seconds)
-        ttl = await self.redis.ttl(key)
-        if ttl is None or ttl < 0:
-            ttl = self.window_seconds
-        return value <= capacity, int(ttl)
+        now = time.monotonic()
+        lease = self._leases.get(key)
+        if lease is not None:
+            if lease.denied_until > now:
+                self.local_decisions += 1
+                return False, math.ceil(lease.denied_until - now)
+            if lease.tokens > 0 and lease.expires_at > now:
+                self.local_decisions += 1
+                lease.tokens -= 1
+                self._leases.move_to_end(key)
+                return True, 0
+
+        if now < self._degraded_until:
+            return True, 0
+
+        try:
+            granted, retry_after_ms = await self._acquire(key, capacity)
+        except self._errors:
+            logger.warning(
+                "Distributed rate limiter unavailable; using local limits for %.0fs",
+                self.failure_cooldown_seconds,
+                exc_info=True,
+            )
+            self.fallbacks += 1
+            self._degraded_until = now + self.failure_cooldown_seconds
+            return True, 0
+
+        lease = self._lease_for(key, now)
+        if granted < 1:
+            retry_after = retry_after_ms / 1000
+            lease.tokens = 0
+            lease.denied_until = now + retry_after
+            return False, max(math.ceil(retry_after), 1)
+
+        if lease.expires_at <= now:
+            lease.tokens = 0
+        lease.tokens += granted - 1
+        lease.expires_at = now + self.lease_ttl_seconds
+        return True, 0
+
+    def metrics(self) -> dict[str, int]:
+        """Counters describing how checks were answered."""
+        return {
+            "cached_keys": len(self._leases),
+            "local_decisions": self.local_decisions,
+            "remote_calls": self.remote_calls,
+            "fallbacks": self.fallbacks,
+        }
 
     async def close(self) -> None:
         """Close the Redis connection."""
         await self.redis.close()
 
+    async def _acquire(self, key: str, capacity: int) -> tuple[int, int]:
+        self.remote_calls += 1
+        lease_size = max(capacity // self.lease_fraction, 1)
+        result = await self._script(
+            keys=[f"{self.key_prefix}{key}"],
+            args=[capacity, self.window_seconds * 1000, lease_size],
+        )
+        return int(result[0]), int(result[1])
+
+    def _lease_for(self, key: str, now: float) -> _LocalLease:
+        lease = self._leases.get(key)
+        if lease is not None:
+            self._leases.move_to_end(key)
+            return lease
+        while self._leases:
+            oldest = next(iter(self._leases.values()))
+            if len(self._leases) < self.max_cached_keys and not oldest.is_stale(now):
+                break
+            self._leases.popitem(last=False)
+        lease = _LocalLease()
+        self._leases[key] = lease
+        return lease
+
 
 def build_distributed_limiter() -> DistributedRateLimiter | None:
     """Create a distributed limiter if configuration is present."""
@@ -91,6 +285,23 @@ def build_distributed_limiter() -> DistributedRateLimiter | None:
     return DistributedRateLimiter(redis_url=redis_url)
 
 
+def build_host_rate_backend() -> DistributedRateLimiter | None:
+    """
+    Create the cross-process backend for outbound per-host request budgets.
+
+    Budgets are per second, so the backend uses a one-second window under its
+    own key prefix. Enabled by ``MED13_HOST_RATE_LIMIT_REDIS_URL``.
+    """
+    redis_url = os.getenv("MED13_HOST_RATE_LIMIT_REDIS_URL")
+    if not redis_url:
+        return None
+    return DistributedRateLimiter(
+        redis_url=redis_url,
+        window_seconds=1,
+        key_prefix=HOST_RATE_KEY_PREFIX,
+    )
+
+
 def _is_redis_factory(obj: object) -> TypeGuard[type[RedisFactory]]:
     if obj is None or not hasattr(obj, "from_url"):
         return False
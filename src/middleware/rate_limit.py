@@ -2,8 +2,9 @@
 
 import logging
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
 from fastapi import HTTPException, Request, status
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -15,8 +16,20 @@ from src.middleware.distributed_rate_limit import build_distributed_limiter
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_MAX_BUCKETS = 100_000
+MIN_BUCKET_TTL_SECONDS = 60.0
+
+
 class TokenBucket:
-    """Token bucket implementation for rate limiting."""
+    """
+    Token bucket implementation for rate limiting.
+
+    Buckets are only touched from the event loop and ``consume`` never
+    awaits, so the token arithmetic needs no lock. Time is measured with
+    ``time.monotonic`` so wall-clock adjustments cannot mint tokens.
+    """
+
+    __slots__ = ("capacity", "last_refill", "refill_rate", "tokens")
 
     def __init__(self, capacity: int, refill_rate: float):
         """
@@ -29,7 +42,7 @@ class TokenBucket:
         self.capacity: int = capacity
         self.refill_rate: float = refill_rate
         self.tokens: float = float(capacity)
-        self.last_refill: float = time.time()
+        self.last_refill: float = time.monotonic()
 
     def consume(self, tokens: int = 1) -> bool:
         """Try to consume tokens. Returns True if successful."""
@@ -41,15 +54,109 @@ class TokenBucket:
 
         return False
 
+    def seconds_until_full(self) -> float:
+        """Seconds until the bucket is back at capacity."""
+        return (self.capacity - self.tokens) / self.refill_rate
+
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_refill
         tokens_to_add = elapsed * self.refill_rate
         self.tokens = min(float(self.capacity), self.tokens + tokens_to_add)
         self.last_refill = now
 
 
+@dataclass(frozen=True)
+class BucketStoreMetrics:
+    """Point-in-time size and eviction counters of a bucket store."""
+
+    buckets: int
+    max_buckets: int
+    expired_evictions: int
+    capacity_evictions: int
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "buckets": self.buckets,
+            "max_buckets": self.max_buckets,
+            "expired_evictions": self.expired_evictions,
+            "capacity_evictions": self.capacity_evictions,
+        }
+
+
+class TokenBucketStore:
+    """
+    Per-client token buckets with bounded memory.
+
+    Buckets are kept in least-recently-used order. Buckets idle for
+    ``ttl_seconds`` are dropped as they reach the front, and the least
+    recently used bucket is evicted once ``max_buckets`` is reached. The
+    default TTL is at least the time an empty bucket needs to refill, so an
+    expired bucket is always full and dropping it forgives nothing.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        refill_rate: float,
+        *,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_buckets = max(max_buckets, 1)
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else max(capacity / refill_rate, MIN_BUCKET_TTL_SECONDS)
+        )
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._expired_evictions = 0
+        self._capacity_evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._buckets
+
+    def get(self, key: str) -> TokenBucket:
+        """Return the bucket for ``key``, creating it if needed."""
+        self._evict_expired(time.monotonic())
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+
+        while len(self._buckets) >= self.max_buckets:
+            self._buckets.popitem(last=False)
+            self._capacity_evictions += 1
+        bucket = TokenBucket(capacity=self.capacity, refill_rate=self.refill_rate)
+        self._buckets[key] = bucket
+        return bucket
+
+    def metrics(self) -> BucketStoreMetrics:
+        return BucketStoreMetrics(
+            buckets=len(self._buckets),
+            max_buckets=self.max_buckets,
+            expired_evictions=self._expired_evictions,
+            capacity_evictions=self._capacity_evictions,
+        )
+
+    def _evict_expired(self, now: float) -> None:
+        # The front holds the least recently used buckets; stop at the first live one.
+        cutoff = now - self.ttl_seconds
+        buckets = self._buckets
+        while buckets:
+            key, bucket = next(iter(buckets.items()))
+            if bucket.last_refill > cutoff:
+                return
+            del buckets[key]
+            self._expired_evictions += 1
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Middleware to enforce rate limiting."""
 
@@ -57,15 +164,15 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self,
         app: ASGIApp,
         exclude_paths: list[str] | None = None,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
     ) -> None:
         super().__init__(app)
         self.exclude_paths: list[str] = exclude_paths or ["/health/"]
-        self.buckets: defaultdict[str, TokenBucket] = defaultdict(
-            lambda: TokenBucket(
-                capacity=100,
-                refill_rate=10,
-            ),  # 100 requests, 10 per second
-        )
+        self.buckets = TokenBucketStore(
+            capacity=100,
+            refill_rate=10,
+            max_buckets=max_buckets,
+        )  # 100 requests, 10 per second
 
     async def dispatch(
         self,
@@ -82,12 +189,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         client_ip = self._get_client_ip(request)
 
         # Get or create token bucket for this client
-        bucket = self.buckets[client_ip]
+        bucket = self.buckets.get(client_ip)
 
         # Try to consume a token
         if not bucket.consume():
             # Rate limit exceeded
-            retry_after = int((bucket.capacity - bucket.tokens) / bucket.refill_rate)
+            retry_after = int(bucket.seconds_until_full())
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded. Please try again later.",
@@ -102,11 +209,15 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         response.headers["X-RateLimit-Remaining"] = str(remaining)
         response.headers["X-RateLimit-Limit"] = str(bucket.capacity)
         response.headers["X-RateLimit-Reset"] = str(
-            int(bucket.last_refill + bucket.capacity / bucket.refill_rate),
+            int(time.time() + bucket.seconds_until_full()),
         )
 
         return response
 
+    def bucket_metrics(self) -> dict[str, int]:
+        """Bucket count and eviction counters for monitoring."""
+        return self.buckets.metrics().as_dict()
+
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP address from request."""
         # Check for forwarded headers (useful behind proxies)
@@ -127,22 +238,34 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 class EndpointRateLimitMiddleware(BaseHTTPMiddleware):
     """More granular rate limiting based on endpoint and HTTP method."""
 
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ) -> None:
         super().__init__(app)
 
         # Different limits for different endpoints
-        self.endpoint_limits: dict[str, defaultdict[str, TokenBucket]] = {
-            "GET": defaultdict(
-                lambda: TokenBucket(capacity=200, refill_rate=20),
+        self.endpoint_limits: dict[str, TokenBucketStore] = {
+            "GET": TokenBucketStore(
+                capacity=200,
+                refill_rate=20,
+                max_buckets=max_buckets,
             ),  # 200 req, 20/sec
-            "POST": defaultdict(
-                lambda: TokenBucket(capacity=50, refill_rate=5),
+            "POST": TokenBucketStore(
+                capacity=50,
+                refill_rate=5,
+                max_buckets=max_buckets,
             ),  # 50 req, 5/sec
-            "PUT": defaultdict(
-                lambda: TokenBucket(capacity=50, refill_rate=5),
+            "PUT": TokenBucketStore(
+                capacity=50,
+                refill_rate=5,
+                max_buckets=max_buckets,
             ),  # 50 req, 5/sec
-            "DELETE": defaultdict(
-                lambda: TokenBucket(capacity=20, refill_rate=2),
+            "DELETE": TokenBucketStore(
+                capacity=20,
+                refill_rate=2,
+                max_buckets=max_buckets,
             ),  # 20 req, 2/sec
         }
         # Paths that should bypass endpoint-specific limits (method -> prefixes)
@@ -173,10 +296,10 @@ class EndpointRateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         client_ip = self._get_client_ip(request)
-        bucket = self.endpoint_limits[method][client_ip]
+        bucket = self.endpoint_limits[method].get(client_ip)
 
         if not bucket.consume():
-            retry_after = int((bucket.capacity - bucket.tokens) / bucket.refill_rate)
+            retry_after = int(bucket.seconds_until_full())
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Rate limit exceeded for {method} requests. Please try again later.",
@@ -211,6 +334,13 @@ class EndpointRateLimitMiddleware(BaseHTTPMiddleware):
 
         return response
 
+    def bucket_metrics(self) -> dict[str, dict[str, int]]:
+        """Per-method bucket count and eviction counters for monitoring."""
+        return {
+            method: store.metrics().as_dict()
+            for method, store in self.endpoint_limits.items()
+        }
+
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP address from request."""
         forwarded_for = request.headers.get("X-Forwarded-For")
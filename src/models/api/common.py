@@ -29,11 +29,19 @@ class PaginatedResponse[T](BaseModel):
 
     items: list[T] = Field(..., description="List of items")
     total: int = Field(..., description="Total number of items")
+    total_is_exact: bool = Field(
+        default=True,
+        description="Whether total is an exact count rather than an estimate",
+    )
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Items per page")
     total_pages: int = Field(..., description="Total number of pages")
     has_next: bool = Field(..., description="Whether there is a next page")
     has_prev: bool = Field(..., description="Whether there is a previous page")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor for the next page; pass it back as cursor",
+    )
 
 
 class ErrorDetail(BaseModel):
@@ -8,6 +8,7 @@ from . import (
     data_source_activation,
     evidence,
     extraction_queue,
+    full_text,
     gene,
     ingestion_job,
     mechanism,
@@ -41,6 +42,9 @@ EvidenceType = evidence.EvidenceType
 ExtractionQueueItemModel = extraction_queue.ExtractionQueueItemModel
 ExtractionStatusEnum = extraction_queue.ExtractionStatusEnum
 
+FULL_TEXT_INDEXES = full_text.FULL_TEXT_INDEXES
+FullTextIndex = full_text.FullTextIndex
+
 GeneModel = gene.GeneModel
 GeneType = gene.GeneType
 
@@ -99,6 +103,8 @@ __all__ = [
     "EvidenceType",
     "ExtractionQueueItemModel",
     "ExtractionStatusEnum",
+    "FULL_TEXT_INDEXES",
+    "FullTextIndex",
     "GeneModel",
     "GeneType",
     "IngestionJobModel",
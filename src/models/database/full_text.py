@@ -0,0 +1,221 @@
+"""
+Full-text search indexes for MED13 Resource Library text tables.
+
+PostgreSQL stores a weighted ``tsvector`` generated column with a GIN index on
+each table; SQLite keeps an external-content FTS5 shadow table in sync with
+triggers. Both are built when ``Base.metadata.create_all`` creates the
+tables, and by the Alembic migration for existing databases.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+
+from .base import Base
+from .evidence import EvidenceModel
+from .phenotype import PhenotypeModel
+from .publication import PublicationModel
+
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+    from sqlalchemy.engine import Connection
+
+TEXT_SEARCH_CONFIG = "english"
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+# Postgres ts_rank weighs D, C, B, A as 0.1, 0.2, 0.4, 1.0 by default; FTS5
+# bm25 column weights keep the same proportions.
+_BM25_WEIGHTS = {"A": 10.0, "B": 4.0, "C": 2.0, "D": 1.0}
+# ``Connection.info`` entry mapping shadow table names to their existence
+_AVAILABLE_KEY = "full_text_shadow_tables"
+
+
+@dataclass(frozen=True)
+class FullTextIndex:
+    """Text columns of a table searched together, each with a rank weight."""
+
+    table: str
+    columns: tuple[tuple[str, str], ...]
+
+    @property
+    def column_names(self) -> list[str]:
+        return [name for name, _ in self.columns]
+
+    @property
+    def fts_table(self) -> str:
+        """Name of the SQLite FTS5 shadow table."""
+        return f"{self.table}_fts"
+
+    def postgresql_statements(self) -> list[str]:
+        """Generated ``tsvector`` column and its GIN index."""
+        vector = " || ".join(
+            f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', "
+            f"coalesce({name}, '')), '{weight}')"
+            for name, weight in self.columns
+        )
+        return [
+            (
+                f"ALTER TABLE {self.table} ADD COLUMN IF NOT EXISTS "
+                f"{SEARCH_VECTOR_COLUMN} tsvector "
+                f"GENERATED ALWAYS AS ({vector}) STORED"
+            ),
+            (
+                "CREATE INDEX IF NOT EXISTS "
+                f"ix_{self.table}_{SEARCH_VECTOR_COLUMN} "
+                f"ON {self.table} USING GIN ({SEARCH_VECTOR_COLUMN})"
+            ),
+        ]
+
+    def sqlite_statements(self) -> list[str]:
+        """FTS5 shadow table, its rank weights and the triggers feeding it."""
+        fts = self.fts_table
+        names = ", ".join(self.column_names)
+        new = ", ".join(f"new.{name}" for name in self.column_names)
+        old = ", ".join(f"old.{name}" for name in self.column_names)
+        weights = ", ".join(str(_BM25_WEIGHTS[weight]) for _, weight in self.columns)
+        insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new});"  # noqa: S608
+        delete_old = (
+            f"INSERT INTO {fts}({fts}, rowid, {names}) "  # noqa: S608
+            f"VALUES ('delete', old.id, {old});"
+        )
+        return [
+            (
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, "
+                f"content='{self.table}', content_rowid='id', "
+                "tokenize='porter unicode61')"
+            ),
+            f"INSERT INTO {fts}({fts}, rank) VALUES ('rank', 'bm25({weights})')",  # noqa: S608
+            (
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {self.table} "
+                f"BEGIN {insert_new} END"
+            ),
+            (
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {self.table} "
+                f"BEGIN {delete_old} END"
+            ),
+            (
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {self.table} "
+                f"BEGIN {delete_old} {insert_new} END"
+            ),
+        ]
+
+    def create(self, connection: Connection, *, rebuild: bool = False) -> None:
+        """
+        Build the index for the dialect of ``connection``.
+
+        ``rebuild`` indexes rows already in the table; PostgreSQL fills the
+        generated column as it adds it. SQLite libraries built without FTS5
+        and other dialects are left without an index.
+        """
+        dialect = connection.dialect.name
+        if dialect == "postgresql":
+            statements = self.postgresql_statements()
+        elif dialect == "sqlite" and sqlite_has_fts5(connection):
+            statements = self.sqlite_statements()
+            if rebuild:
+                fts = self.fts_table
+                statements.append(
+                    f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",  # noqa: S608
+                )
+        else:
+            return
+        for statement in statements:
+            connection.exec_driver_sql(statement)
+        self._remember(connection, available=True)
+
+    def drop(self, connection: Connection) -> None:
+        """Remove the index and the triggers keeping it in sync."""
+        dialect = connection.dialect.name
+        if dialect == "postgresql":
+            connection.exec_driver_sql(
+                f"ALTER TABLE {self.table} DROP COLUMN IF EXISTS "
+                f"{SEARCH_VECTOR_COLUMN}",
+            )
+        elif dialect == "sqlite":
+            for name in ("ai", "ad", "au"):
+                connection.exec_driver_sql(
+                    f"DROP TRIGGER IF EXISTS {self.fts_table}_{name}",
+                )
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {self.fts_table}")
+        self._remember(connection, available=False)
+
+    def is_available(self, connection: Connection) -> bool:
+        """
+        Whether the SQLite shadow table exists on ``connection``'s database.
+
+        The answer is kept on the DBAPI connection, so searches do not look
+        it up again until this index is built or dropped through it.
+        """
+        known = connection.info.setdefault(_AVAILABLE_KEY, {})
+        if self.fts_table not in known:
+            known[self.fts_table] = (
+                connection.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                    (self.fts_table,),
+                ).first()
+                is not None
+            )
+        return bool(known[self.fts_table])
+
+    def _remember(self, connection: Connection, *, available: bool) -> None:
+        connection.info.setdefault(_AVAILABLE_KEY, {})[self.fts_table] = available
+
+
+PUBLICATION_SEARCH = FullTextIndex(
+    PublicationModel.__tablename__,
+    (("title", "A"), ("keywords", "B"), ("abstract", "C"), ("authors", "D")),
+)
+EVIDENCE_SEARCH = FullTextIndex(
+    EvidenceModel.__tablename__,
+    (("description", "A"), ("summary", "B")),
+)
+PHENOTYPE_SEARCH = FullTextIndex(
+    PhenotypeModel.__tablename__,
+    (("name", "A"), ("synonyms", "B"), ("definition", "C")),
+)
+FULL_TEXT_INDEXES = {
+    index.table: index
+    for index in (PUBLICATION_SEARCH, EVIDENCE_SEARCH, PHENOTYPE_SEARCH)
+}
+
+
+def sqlite_has_fts5(connection: Connection) -> bool:
+    """Whether the SQLite library behind ``connection`` was built with FTS5."""
+    return bool(
+        connection.exec_driver_sql(
+            "SELECT sqlite_compileoption_used('ENABLE_FTS5')",
+        ).scalar(),
+    )
+
+
+def _attach(index: FullTextIndex) -> None:
+    def after_create(_table: Table, connection: Connection, **_kw: object) -> None:
+        index.create(connection)
+
+    def before_drop(_table: Table, connection: Connection, **_kw: object) -> None:
+        # The shadow table would outlive its content table on SQLite
+        if connection.dialect.name == "sqlite":
+            index.drop(connection)
+
+    table = Base.metadata.tables[index.table]
+    event.listen(table, "after_create", after_create)
+    event.listen(table, "before_drop", before_drop)
+
+
+for _index in FULL_TEXT_INDEXES.values():
+    _attach(_index)
+
+
+__all__ = [
+    "EVIDENCE_SEARCH",
+    "FULL_TEXT_INDEXES",
+    "PHENOTYPE_SEARCH",
+    "PUBLICATION_SEARCH",
+    "SEARCH_VECTOR_COLUMN",
+    "TEXT_SEARCH_CONFIG",
+    "FullTextIndex",
+    "sqlite_has_fts5",
+]
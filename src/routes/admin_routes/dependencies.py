@@ -64,7 +64,10 @@ def get_activation_service() -> DataSourceActivationService:
     """Instantiate the DataSourceActivationService."""
     session = get_db_session()
     activation_repo = SqlAlchemyDataSourceActivationRepository(session)
-    return DataSourceActivationService(activation_repo)
+    return DataSourceActivationService(
+        activation_repo,
+        rule_cache=container.get_activation_rule_cache(),
+    )
 
 
 async def get_auth_service() -> DataSourceAuthorizationService:
@@ -0,0 +1,116 @@
+"""
+Opaque cursors for keyset-paginated list routes.
+
+A cursor names the sort it was issued for and the ``SeekPosition`` of the
+last row served; clients pass it back unchanged to read the next page.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+from src.domain.repositories.base import SeekPosition
+from src.models.api import PaginatedResponse
+
+if TYPE_CHECKING:
+    from src.domain.repositories.base import SeekPage, SortValue
+    from src.type_definitions.common import JSONObject, JSONValue
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or was issued for another sort."""
+
+
+def encode_cursor(position: SeekPosition, sort_by: str, sort_order: str) -> str:
+    """Opaque cursor continuing after ``position`` in the given sort."""
+    payload: JSONObject = {
+        "s": sort_by,
+        "o": sort_order,
+        "v": _encode_value(position.sort_value),
+        "i": position.id,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> SeekPosition:
+    """Position encoded in ``cursor``, which must match the requested sort."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        message = "Malformed pagination cursor"
+        raise InvalidCursorError(message) from exc
+    if not isinstance(payload, dict) or not isinstance(payload.get("i"), int):
+        message = "Malformed pagination cursor"
+        raise InvalidCursorError(message)
+    if payload.get("s") != sort_by or payload.get("o") != sort_order:
+        message = "Pagination cursor was issued for a different sort order"
+        raise InvalidCursorError(message)
+    return SeekPosition(_decode_value(payload.get("v")), payload["i"])
+
+
+def seek_response[TItem, TEntity](
+    items: list[TItem],
+    result: SeekPage[TEntity],
+    *,
+    page: int,
+    per_page: int,
+    sort_by: str,
+    sort_order: str,
+    resumed: bool,
+) -> PaginatedResponse[TItem]:
+    """Paginated response for a keyset page, with the cursor of the next one."""
+    total_pages = (result.total.value + per_page - 1) // per_page
+    next_position = result.next_position
+    return PaginatedResponse(
+        items=items,
+        total=result.total.value,
+        total_is_exact=result.total.exact,
+        page=page,
+        per_page=per_page,
+        total_pages=total_pages,
+        has_next=next_position is not None,
+        has_prev=resumed or page > 1,
+        next_cursor=(
+            None
+            if next_position is None
+            else encode_cursor(next_position, sort_by, sort_order)
+        ),
+    )
+
+
+def _encode_value(value: SortValue) -> JSONValue:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: JSONValue) -> SortValue:
+    if isinstance(value, dict):
+        try:
+            if isinstance(value.get("dt"), str):
+                return datetime.fromisoformat(value["dt"])
+            if isinstance(value.get("d"), str):
+                return date.fromisoformat(value["d"])
+        except ValueError as exc:
+            message = "Malformed pagination cursor"
+            raise InvalidCursorError(message) from exc
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    message = "Malformed pagination cursor"
+    raise InvalidCursorError(message)
+
+
+__all__ = [
+    "InvalidCursorError",
+    "decode_cursor",
+    "encode_cursor",
+    "seek_response",
+]
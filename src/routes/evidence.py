@@ -17,6 +17,7 @@ from src.models.api import (
     EvidenceUpdate,
     PaginatedResponse,
 )
+from src.routes.cursors import InvalidCursorError, decode_cursor, seek_response
 from src.routes.serializers import serialize_evidence
 from src.type_definitions.common import (
     EvidenceUpdate as EvidenceUpdatePayload,
@@ -39,6 +40,11 @@ class EvidenceQueryParams(BaseModel):
     evidence_type: str | None = Field(None, description="Filter by evidence type")
     reviewed: bool | None = Field(None, description="Filter by review status")
 
+    cursor: str | None = Field(
+        None,
+        description="Cursor from a previous page's next_cursor; overrides page",
+    )
+
     model_config = {"extra": "ignore"}
 
 
@@ -170,27 +176,31 @@ async def get_evidence(
     filter_arg = filters_payload or None
 
     try:
-        evidence_list, total = service.list_evidence(
-            page=params.page,
-            per_page=params.per_page,
-            sort_by=params.sort_by,
-            sort_order=params.sort_order,
-            filters=filter_arg,
+        after = (
+            decode_cursor(params.cursor, params.sort_by, params.sort_order)
+            if params.cursor
+            else None
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        evidence_responses = [
-            serialize_evidence(evidence) for evidence in evidence_list
-        ]
-
-        total_pages = (total + params.per_page - 1) // params.per_page
-        return PaginatedResponse(
-            items=evidence_responses,
-            total=total,
+    try:
+        result = service.list_evidence_seek(
+            after,
+            params.per_page,
+            params.sort_by,
+            params.sort_order,
+            filters=filter_arg,
+            offset=0 if after is not None else (params.page - 1) * params.per_page,
+        )
+        return seek_response(
+            [serialize_evidence(evidence) for evidence in result.items],
+            result,
             page=params.page,
             per_page=params.per_page,
-            total_pages=total_pages,
-            has_next=params.page < total_pages,
-            has_prev=params.page > 1,
+            sort_by=params.sort_by,
+            sort_order=params.sort_order,
+            resumed=after is not None,
         )
     except Exception as e:
         raise HTTPException(
@@ -15,6 +15,7 @@ from src.infrastructure.dependency_injection.dependencies import (
     get_legacy_dependency_container,
 )
 from src.models.api import GeneCreate, GeneResponse, GeneUpdate, PaginatedResponse
+from src.routes.cursors import InvalidCursorError, decode_cursor, seek_response
 from src.routes.serializers import serialize_gene
 from src.type_definitions.common import GeneUpdate as GeneUpdatePayload
 from src.type_definitions.common import JSONObject
@@ -67,36 +68,41 @@ async def get_genes(
     search: str | None = Query(None, description="Search by gene symbol or name"),
     sort_by: str = Query("symbol", description="Sort field"),
     sort_order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
+    cursor: str | None = Query(
+        None,
+        description="Cursor from a previous page's next_cursor; overrides page",
+    ),
     service: "GeneApplicationService" = Depends(get_gene_service),
 ) -> PaginatedResponse[GeneResponse]:
     """
     Retrieve a paginated list of genes.
 
     Supports searching by gene symbol or name, and sorting by various fields.
+    Follow ``next_cursor`` for deep pages; numbered pages skip rows with OFFSET.
     """
+    try:
+        after = decode_cursor(cursor, sort_by, sort_order) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     try:
-        genes, total = service.list_genes(
-            page=page,
-            per_page=per_page,
-            sort_by=sort_by,
-            sort_order=sort_order,
+        result = service.list_genes_seek(
+            after,
+            per_page,
+            sort_by,
+            sort_order,
             search=search,
+            offset=0 if after is not None else (page - 1) * per_page,
         )
 
-        # Convert to response models
-        gene_responses = [serialize_gene(gene) for gene in genes]
-
-        total_pages = (total + per_page - 1) // per_page
-
-        return PaginatedResponse(
-            items=gene_responses,
-            total=total,
+        return seek_response(
+            [serialize_gene(gene) for gene in result.items],
+            result,
             page=page,
             per_page=per_page,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            resumed=after is not None,
         )
 
     except Exception as e:
@@ -27,6 +27,7 @@ from src.models.api import (
     PhenotypeStatisticsResponse,
     PhenotypeUpdate,
 )
+from src.routes.cursors import InvalidCursorError, decode_cursor, seek_response
 from src.routes.serializers import serialize_phenotype
 from src.type_definitions.common import PhenotypeUpdate as PhenotypeUpdatePayload
 
@@ -43,6 +44,11 @@ class PhenotypeListParams(BaseModel):
     category: str | None = Field(None, description="Filter by category")
     is_root_term: bool | None = Field(None, description="Filter by root terms")
 
+    cursor: str | None = Field(
+        None,
+        description="Cursor from a previous page's next_cursor; overrides page",
+    )
+
     model_config = {"extra": "ignore"}
 
 
@@ -122,27 +128,31 @@ async def get_phenotypes(
     filters = {k: v for k, v in filters.items() if v is not None}
 
     try:
-        phenotypes, total = service.list_phenotypes(
-            page=params.page,
-            per_page=params.per_page,
-            sort_by=params.sort_by,
-            sort_order=params.sort_order,
-            filters=filters,
+        after = (
+            decode_cursor(params.cursor, params.sort_by, params.sort_order)
+            if params.cursor
+            else None
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        phenotype_responses = [
-            serialize_phenotype(phenotype) for phenotype in phenotypes
-        ]
-
-        total_pages = (total + params.per_page - 1) // params.per_page
-        return PaginatedResponse(
-            items=phenotype_responses,
-            total=total,
+    try:
+        result = service.list_phenotypes_seek(
+            after,
+            params.per_page,
+            params.sort_by,
+            params.sort_order,
+            filters=filters,
+            offset=0 if after is not None else (params.page - 1) * params.per_page,
+        )
+        return seek_response(
+            [serialize_phenotype(phenotype) for phenotype in result.items],
+            result,
             page=params.page,
             per_page=params.per_page,
-            total_pages=total_pages,
-            has_next=params.page < total_pages,
-            has_prev=params.page > 1,
+            sort_by=params.sort_by,
+            sort_order=params.sort_order,
+            resumed=after is not None,
         )
     except Exception as e:
         raise HTTPException(
@@ -12,16 +12,26 @@ from src.infrastructure.dependency_injection.dependencies import (
     get_legacy_dependency_container,
 )
 from src.models.api import (
+    GeneResponse,
     PaginatedResponse,
     VariantCreate,
     VariantResponse,
+    VariantSummaryResponse,
     VariantUpdate,
 )
-from src.routes.serializers import serialize_variant
+from src.routes.cursors import InvalidCursorError, decode_cursor, seek_response
+from src.routes.serializers import (
+    serialize_gene,
+    serialize_variant,
+    serialize_variant_summary,
+)
 from src.type_definitions.common import JSONObject, QueryFilters
 from src.type_definitions.common import VariantUpdate as VariantUpdatePayload
 
 if TYPE_CHECKING:
+    from src.application.services.genomic_region_service import (
+        GenomicRegionService,
+    )
     from src.application.services.variant_service import VariantApplicationService
 
 router = APIRouter(prefix="/variants", tags=["variants"])
@@ -37,6 +47,14 @@ def get_variant_service(
     return container.create_variant_application_service(db)
 
 
+def get_genomic_region_service(
+    db: Session = Depends(get_session),
+) -> "GenomicRegionService":
+    """Dependency injection for the genomic region query service."""
+    container = get_legacy_dependency_container()
+    return container.create_genomic_region_service(db)
+
+
 class VariantEvidenceSummaryResponse(BaseModel):
     """Response summarizing evidence associated with a variant."""
 
@@ -63,6 +81,17 @@ class VariantSearchResponse(BaseModel):
     filters: QueryFilters | None
 
 
+class GenomicRegionResponse(BaseModel):
+    """Genes overlapping and variants located within a genomic region."""
+
+    chromosome: str
+    start: int
+    end: int
+    genes: list[GeneResponse]
+    variants: list[VariantSummaryResponse]
+    variant_count: int
+
+
 class VariantListParams(BaseModel):
     page: int = Field(1, ge=1, description="Page number")
     per_page: int = Field(20, ge=1, le=100, description="Items per page")
@@ -76,6 +105,11 @@ class VariantListParams(BaseModel):
     )
     variant_type: str | None = Field(None, description="Filter by variant type")
 
+    cursor: str | None = Field(
+        None,
+        description="Cursor from a previous page's next_cursor; overrides page",
+    )
+
     model_config = {"extra": "ignore"}
 
 
@@ -88,6 +122,15 @@ async def get_variants(
     params: VariantListParams = Depends(),
     service: "VariantApplicationService" = Depends(get_variant_service),
 ) -> PaginatedResponse[VariantResponse]:
+    try:
+        after = (
+            decode_cursor(params.cursor, params.sort_by, params.sort_order)
+            if params.cursor
+            else None
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         # Build filters dictionary
         filters_payload: QueryFilters = {}
@@ -100,32 +143,66 @@ async def get_variants(
 
         filters_arg = filters_payload or None
 
-        variants, total = service.list_variants(
+        result = service.list_variants_seek(
+            after,
+            params.per_page,
+            params.sort_by,
+            params.sort_order,
+            filters=filters_arg,
+            offset=0 if after is not None else (params.page - 1) * params.per_page,
+        )
+        return seek_response(
+            [serialize_variant(variant) for variant in result.items],
+            result,
             page=params.page,
             per_page=params.per_page,
             sort_by=params.sort_by,
             sort_order=params.sort_order,
-            filters=filters_arg,
+            resumed=after is not None,
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve variants: {e!s}",
         )
 
-        variant_responses = [serialize_variant(variant) for variant in variants]
 
-        total_pages = (total + params.per_page - 1) // params.per_page
-        return PaginatedResponse(
-            items=variant_responses,
-            total=total,
-            page=params.page,
-            per_page=params.per_page,
-            total_pages=total_pages,
-            has_next=params.page < total_pages,
-            has_prev=params.page > 1,
-        )
+@router.get(
+    "/region",
+    summary="Query a genomic region",
+    response_model=GenomicRegionResponse,
+)
+async def get_genomic_region(
+    chromosome: str = Query(..., description="Chromosome, e.g. chr17 or 17"),
+    start: int = Query(..., ge=1, description="Region start (1-based, inclusive)"),
+    end: int = Query(..., ge=1, description="Region end (1-based, inclusive)"),
+    limit: int = Query(
+        500,
+        ge=1,
+        le=5000,
+        description="Maximum number of variants to return",
+    ),
+    service: "GenomicRegionService" = Depends(get_genomic_region_service),
+) -> GenomicRegionResponse:
+    try:
+        region = service.query_region(chromosome, start, end, variant_limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to retrieve variants: {e!s}",
+            detail=f"Failed to query genomic region: {e!s}",
         )
 
+    return GenomicRegionResponse(
+        chromosome=region.chromosome,
+        start=region.start,
+        end=region.end,
+        genes=[serialize_gene(gene) for gene in region.genes],
+        variants=[serialize_variant_summary(item) for item in region.variants],
+        variant_count=region.variant_count,
+    )
+
 
 @router.get(
     "/{variant_id}",
@@ -6,12 +6,13 @@ across unit, integration, and end-to-end tests.
 """
 
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
 from types import ModuleType
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool, StaticPool
@@ -340,6 +341,45 @@ def clean_database(db_session):
     db_session.rollback()
 
 
+class StatementLog:
+    """SQL statements sent to an engine while a ``count_statements`` block runs."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __call__(self, _conn, _cursor, statement: str, *_args) -> None:
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def count_statements() -> Callable[[Engine], AbstractContextManager[StatementLog]]:
+    """Count the statements an engine executes inside a ``with`` block."""
+
+    @contextmanager
+    def _count(engine: Engine) -> Iterator[StatementLog]:
+        log = StatementLog()
+        event.listen(engine, "before_cursor_execute", log)
+        try:
+            yield log
+        finally:
+            event.remove(engine, "before_cursor_execute", log)
+
+    return _count
+
+
+@pytest.fixture
+def strict_loading(monkeypatch):
+    """Make lazy loads on repository-loaded objects raise instead of querying."""
+    monkeypatch.setattr(
+        "src.infrastructure.repositories.load_plans.RAISE_ON_LAZY_LOAD",
+        True,
+    )
+
+
 # Custom test markers
 @pytest.fixture
 def skip_if_no_database():
@@ -0,0 +1,14 @@
+"""Shared fixtures for ingestor integration tests."""
+
+import pytest
+
+from src.infrastructure.http import HostRateLimiters
+from src.infrastructure.http import rate_limits as rate_limits_module
+
+
+@pytest.fixture(autouse=True)
+def isolated_host_rate_limiters(monkeypatch: pytest.MonkeyPatch) -> HostRateLimiters:
+    """Give each test fresh per-host budgets so tests do not throttle each other."""
+    limiters = HostRateLimiters()
+    monkeypatch.setattr(rate_limits_module, "_host_rate_limiters", limiters)
+    return limiters
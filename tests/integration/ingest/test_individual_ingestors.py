@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pytest
 from httpx import Response
 
+from src.infrastructure.http import ncbi_api_key
 from src.infrastructure.ingest.base_ingestor import IngestionStatus
 from src.infrastructure.ingest.clinvar_ingestor import ClinVarIngestor
 from src.infrastructure.ingest.hpo_ingestor import HPOIngestor
@@ -20,9 +21,9 @@ class TestClinVarIngestor:
     """Test cases for ClinVar ingestor."""
 
     @pytest.fixture
-    def ingestor(self):
+    def ingestor(self, tmp_path):
         """Create ClinVar ingestor instance."""
-        return ClinVarIngestor()
+        return ClinVarIngestor(tmp_path)
 
     @pytest.mark.asyncio
     async def test_fetch_med13_variants_success(self, ingestor):
@@ -33,29 +34,23 @@ class TestClinVarIngestor:
             json={"esearchresult": {"idlist": ["12345", "67890"], "count": "2"}},
         )
 
-        mock_summary_response = Response(
-            200,
-            json={
-                "result": {
-                    "uids": ["12345", "67890"],
-                    "12345": {"title": "Variant 1"},
-                    "67890": {"title": "Variant 2"},
-                },
-            },
-        )
-
         mock_detail_response = Response(
             200,
-            text="<xml>Mock ClinVar XML data</xml>",
+            text=(
+                "<ClinVarResult-Set>"
+                '<VariationArchive VariationID="12345" VariationType="Deletion">'
+                '<GeneList><Gene Symbol="MED13"/></GeneList>'
+                "</VariationArchive>"
+                '<VariationArchive VariationID="67890"/>'
+                "</ClinVarResult-Set>"
+            ),
             headers={"content-type": "text/xml"},
         )
 
         with patch.object(ingestor, "_make_request") as mock_request:
             mock_request.side_effect = [
                 mock_search_response,  # Search
-                mock_summary_response,  # Summary
-                mock_detail_response,  # Detail for first variant
-                mock_detail_response,  # Detail for second variant
+                mock_detail_response,  # One EFetch for the whole batch
             ]
 
             result = await ingestor.ingest()
@@ -66,6 +61,14 @@ class TestClinVarIngestor:
             assert len(result.data) == 2
             assert result.source == "clinvar"
             assert isinstance(result.provenance, Provenance)
+            assert [record["clinvar_id"] for record in result.data] == [
+                "12345",
+                "67890",
+            ]
+            assert result.data[0]["parsed_data"]["gene_symbol"] == "MED13"
+            assert result.data[0]["parsed_data"]["variant_type"] == "Deletion"
+            efetch_params = mock_request.call_args_list[1][1]["params"]
+            assert efetch_params["id"] == "12345,67890"
 
     @pytest.mark.asyncio
     async def test_fetch_with_variant_type_filter(self, ingestor):
@@ -110,8 +113,9 @@ class TestClinVarIngestor:
     @pytest.mark.asyncio
     async def test_rate_limiting(self, ingestor):
         """Test rate limiting functionality."""
-        # Verify rate limiter is configured
-        assert ingestor.rate_limiter.requests_per_minute == 10
+        # Verify the shared NCBI budget is applied
+        expected = 600 if ncbi_api_key() else 180
+        assert ingestor.rate_limiter.requests_per_minute == expected
 
         # Test rate limiter acquire
         assert ingestor.rate_limiter.acquire() is True
@@ -136,9 +140,9 @@ class TestPubMedIngestor:
     """Test cases for PubMed ingestor."""
 
     @pytest.fixture
-    def ingestor(self):
+    def ingestor(self, tmp_path):
         """Create PubMed ingestor instance."""
-        return PubMedIngestor()
+        return PubMedIngestor(tmp_path)
 
     @pytest.mark.asyncio
     async def test_fetch_med13_publications_success(self, ingestor):
@@ -146,7 +150,14 @@ class TestPubMedIngestor:
         # Mock PubMed API responses
         mock_search_response = Response(
             200,
-            json={"esearchresult": {"idlist": ["34567890", "45678901"], "count": "2"}},
+            json={
+                "esearchresult": {
+                    "count": "2",
+                    "webenv": "MCID_history",
+                    "querykey": "1",
+                    "idlist": [],
+                },
+            },
         )
 
         mock_fetch_response = Response(
@@ -184,6 +195,10 @@ class TestPubMedIngestor:
             assert len(result.data) == 1
             assert result.data[0]["pubmed_id"] == "34567890"
             assert "MED13" in result.data[0]["title"]
+            fetch_params = mock_request.call_args_list[1][1]["params"]
+            assert fetch_params["WebEnv"] == "MCID_history"
+            assert fetch_params["query_key"] == "1"
+            assert fetch_params["retstart"] == 0
 
     @pytest.mark.asyncio
     async def test_recent_publications_filter(self, ingestor):
@@ -213,7 +228,14 @@ class TestPubMedIngestor:
         """Test handling of malformed XML responses."""
         mock_search_response = Response(
             200,
-            json={"esearchresult": {"idlist": ["99999999"], "count": "1"}},
+            json={
+                "esearchresult": {
+                    "count": "1",
+                    "webenv": "MCID_history",
+                    "querykey": "1",
+                    "idlist": [],
+                },
+            },
         )
 
         # Malformed XML
@@ -239,9 +261,9 @@ class TestHPOIngestor:
     """Test cases for HPO ingestor."""
 
     @pytest.fixture
-    def ingestor(self):
+    def ingestor(self, tmp_path):
         """Create HPO ingestor instance."""
-        return HPOIngestor()
+        return HPOIngestor(tmp_path)
 
     @pytest.mark.asyncio
     async def test_fetch_hpo_ontology_success(self, ingestor):
@@ -370,9 +392,9 @@ class TestUniProtIngestor:
     """Test cases for UniProt ingestor."""
 
     @pytest.fixture
-    def ingestor(self):
+    def ingestor(self, tmp_path):
         """Create UniProt ingestor instance."""
-        return UniProtIngestor()
+        return UniProtIngestor(tmp_path)
 
     @pytest.mark.asyncio
     async def test_fetch_med13_protein_success(self, ingestor):
@@ -496,11 +518,11 @@ class TestIngestionErrorHandling:
     """Test error handling across all ingestors."""
 
     @pytest.mark.asyncio
-    async def test_network_timeout_handling(self):
+    async def test_network_timeout_handling(self, tmp_path):
         """Test handling of network timeouts."""
         from httpx import TimeoutException
 
-        ingestor = ClinVarIngestor()
+        ingestor = ClinVarIngestor(tmp_path)
 
         with patch.object(
             ingestor,
@@ -514,9 +536,9 @@ class TestIngestionErrorHandling:
             assert "Timeout" in str(result.errors[0])
 
     @pytest.mark.asyncio
-    async def test_rate_limit_handling(self):
+    async def test_rate_limit_handling(self, tmp_path):
         """Test handling of rate limiting."""
-        ingestor = PubMedIngestor()
+        ingestor = PubMedIngestor(tmp_path)
 
         # Mock 429 response (rate limited)
         rate_limit_response = Response(429, text="Rate limit exceeded")
@@ -528,9 +550,9 @@ class TestIngestionErrorHandling:
             assert result.status == IngestionStatus.FAILED
 
     @pytest.mark.asyncio
-    async def test_invalid_response_handling(self):
+    async def test_invalid_response_handling(self, tmp_path):
         """Test handling of invalid API responses."""
-        ingestor = UniProtIngestor()
+        ingestor = UniProtIngestor(tmp_path)
 
         # Mock invalid JSON response
         invalid_response = Response(200, text="Invalid JSON content")
@@ -0,0 +1,139 @@
+"""
+Synthetic benchmark of per-request authentication overhead.
+
+Validates the same access token repeatedly against in-memory repositories
+that simulate a database round trip, once with the original write-through
+path and once with the token cache and write-behind session activity.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.application.services.authentication_cache import (
+    SessionActivityRecorder,
+    TokenValidationCache,
+)
+from src.application.services.authentication_service import AuthenticationService
+from src.domain.entities.session import UserSession
+from src.domain.entities.user import User, UserRole, UserStatus
+from src.domain.repositories.session_repository import SessionActivityUpdate
+from src.infrastructure.security import JWTProvider, PasswordHasher
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+REQUESTS = 5_000 if HEAVY else 500
+SIMULATED_DB_LATENCY_SECONDS = 0.001
+MIN_SPEEDUP = 5
+
+
+class InMemoryUserRepository:
+    def __init__(self, user: User) -> None:
+        self.user = user
+        self.queries = 0
+
+    async def get_by_id(self, _user_id: UUID) -> User:
+        self.queries += 1
+        await asyncio.sleep(SIMULATED_DB_LATENCY_SECONDS)
+        return self.user.model_copy()
+
+
+class InMemorySessionRepository:
+    def __init__(self, session: UserSession) -> None:
+        self.session = session
+        self.queries = 0
+        self.writes = 0
+
+    async def get_by_access_token(self, _token: str) -> UserSession:
+        self.queries += 1
+        await asyncio.sleep(SIMULATED_DB_LATENCY_SECONDS)
+        return self.session.model_copy()
+
+    async def update(self, session: UserSession) -> UserSession:
+        self.writes += 1
+        await asyncio.sleep(SIMULATED_DB_LATENCY_SECONDS)
+        return session
+
+    async def record_activity(self, updates: list[SessionActivityUpdate]) -> None:
+        self.writes += len(updates)
+        await asyncio.sleep(SIMULATED_DB_LATENCY_SECONDS)
+
+
+async def _measure(service: AuthenticationService, token: str) -> float:
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await service.validate_token(token)
+    return (time.perf_counter() - started) / REQUESTS
+
+
+@pytest.mark.performance
+async def test_token_cache_reduces_auth_overhead_per_request() -> None:
+    user = User(
+        id=uuid4(),
+        email="bench@example.com",
+        username="bench",
+        full_name="Bench User",
+        hashed_password="hashed_password_for_testing",
+        role=UserRole.RESEARCHER,
+        status=UserStatus.ACTIVE,
+        email_verified=True,
+    )
+    jwt_provider = JWTProvider(secret_key="benchmark-secret-" + "x" * 32)
+    token = jwt_provider.create_access_token(user.id, user.role.value)
+    now = datetime.now(UTC)
+    session = UserSession(
+        user_id=user.id,
+        session_token=token,
+        refresh_token="refresh",
+        expires_at=now + timedelta(hours=1),
+        refresh_expires_at=now + timedelta(days=7),
+    )
+
+    baseline_users = InMemoryUserRepository(user)
+    baseline_sessions = InMemorySessionRepository(session)
+    baseline = AuthenticationService(
+        user_repository=baseline_users,  # type: ignore[arg-type]
+        session_repository=baseline_sessions,  # type: ignore[arg-type]
+        jwt_provider=jwt_provider,
+        password_hasher=PasswordHasher(),
+    )
+    cached_users = InMemoryUserRepository(user)
+    cached_sessions = InMemorySessionRepository(session)
+    recorder = SessionActivityRecorder(
+        cached_sessions,  # type: ignore[arg-type]
+        flush_interval_seconds=3600,
+    )
+    cached = AuthenticationService(
+        user_repository=cached_users,  # type: ignore[arg-type]
+        session_repository=cached_sessions,  # type: ignore[arg-type]
+        jwt_provider=jwt_provider,
+        password_hasher=PasswordHasher(),
+        token_cache=TokenValidationCache(),
+        activity_recorder=recorder,
+    )
+
+    before = await _measure(baseline, token)
+    after = await _measure(cached, token)
+    await recorder.close()
+
+    logger.info(
+        "requests=%d before=%.1fus/request (%d reads, %d writes) "
+        "after=%.1fus/request (%d reads, %d writes)",
+        REQUESTS,
+        before * 1e6,
+        baseline_users.queries + baseline_sessions.queries,
+        baseline_sessions.writes,
+        after * 1e6,
+        cached_users.queries + cached_sessions.queries,
+        cached_sessions.writes,
+    )
+    assert cached_users.queries == 1
+    assert cached_sessions.queries == 1
+    assert cached_sessions.writes == 1
+    assert before / after >= MIN_SPEEDUP
@@ -0,0 +1,73 @@
+"""
+Synthetic latency benchmark for source catalog search.
+
+Seeds an in-memory SQLite catalog from the shipped seed file and compares
+keystroke-style queries answered by the database with queries answered from
+the in-memory catalog index.
+"""
+
+import json
+import logging
+import os
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database.seed_data import CATALOG_ENTRIES_PATH
+from src.domain.entities.data_discovery_session import SourceCatalogEntry
+from src.infrastructure.repositories.data_discovery_repository_impl import (
+    SQLAlchemySourceCatalogRepository,
+)
+from src.infrastructure.repositories.source_catalog_index_cache import (
+    SourceCatalogIndexCache,
+)
+from src.models.database.base import Base
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+ROUNDS = 200 if HEAVY else 20
+KEYSTROKES = ["c", "cl", "cli", "clin", "clinv", "clinva", "clinvar", "variant"]
+MIN_SPEEDUP = 5
+
+
+def _measure(repo: SQLAlchemySourceCatalogRepository) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for query in KEYSTROKES:
+            repo.search(query)
+    return (time.perf_counter() - started) / (ROUNDS * len(KEYSTROKES))
+
+
+@pytest.mark.performance
+def test_catalog_index_answers_searches_faster_than_the_database() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    payload = json.loads(CATALOG_ENTRIES_PATH.read_text(encoding="utf-8"))
+    seeding_repo = SQLAlchemySourceCatalogRepository(session)
+    for item in payload:
+        seeding_repo.save(SourceCatalogEntry.model_validate(item))
+
+    try:
+        before = _measure(SQLAlchemySourceCatalogRepository(session))
+        after = _measure(
+            SQLAlchemySourceCatalogRepository(
+                session,
+                index_cache=SourceCatalogIndexCache(),
+            ),
+        )
+    finally:
+        session.close()
+        engine.dispose()
+
+    logger.info(
+        "entries=%d queries=%d before=%.1fus/query after=%.1fus/query",
+        len(payload),
+        ROUNDS * len(KEYSTROKES),
+        before * 1e6,
+        after * 1e6,
+    )
+    assert before / after >= MIN_SPEEDUP
@@ -0,0 +1,141 @@
+"""
+Batched EFetch benchmark for ClinVar against a local stub E-utilities server.
+
+The baseline replays the previous request pattern: one ESummary per 50 IDs,
+then one EFetch per variant, sequentially. The batched ingestor fetches 100
+variants per EFetch with a few batches in flight. The stub adds a fixed
+latency to every request; the log also projects both patterns onto NCBI's
+three requests per second.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+
+from src.infrastructure.http import HostBudget, HostRateLimiters
+from src.infrastructure.ingest.clinvar_ingestor import ClinVarIngestor
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+VARIANTS = 1000 if HEAVY else 200
+LATENCY_SECONDS = 0.005
+NCBI_REQUESTS_PER_SECOND = 3
+SUMMARY_BATCH_SIZE = 50
+MIN_SPEEDUP = 5.0
+
+ARCHIVE = (
+    '<VariationArchive VariationID="{vid}" VariationType="Deletion">'
+    '<GeneList><Gene Symbol="MED13"/></GeneList>'
+    "</VariationArchive>"
+)
+
+
+async def _esearch(_request: web.Request) -> web.Response:
+    await asyncio.sleep(LATENCY_SECONDS)
+    ids = [str(vid) for vid in range(1, VARIANTS + 1)]
+    return web.json_response({"esearchresult": {"idlist": ids, "count": len(ids)}})
+
+
+async def _esummary(request: web.Request) -> web.Response:
+    await asyncio.sleep(LATENCY_SECONDS)
+    ids = request.query["id"].split(",")
+    return web.json_response({"result": {"uids": ids}})
+
+
+async def _efetch(request: web.Request) -> web.Response:
+    await asyncio.sleep(LATENCY_SECONDS)
+    archives = "".join(
+        ARCHIVE.format(vid=vid) for vid in request.query["id"].split(",")
+    )
+    return web.Response(
+        text=f"<ClinVarResult-Set>{archives}</ClinVarResult-Set>",
+        content_type="text/xml",
+    )
+
+
+def _ingestor(base_url: str, raw_data_dir: Path) -> ClinVarIngestor:
+    ingestor = ClinVarIngestor(raw_data_dir)
+    ingestor.base_url = base_url
+    # Pacing is not under test; the stub host gets an unlimited budget.
+    ingestor.rate_limiter = HostRateLimiters(
+        {"127.0.0.1": HostBudget(1e6, burst=1_000_000)},
+    ).limiter_for(base_url)
+    return ingestor
+
+
+async def _per_variant_pull(ingestor: ClinVarIngestor) -> int:
+    """Previous pattern: ESummary per 50 IDs, then one EFetch per variant."""
+    response = await ingestor._make_request("GET", "esearch.fcgi")
+    ids: list[str] = response.json()["esearchresult"]["idlist"]
+    requests = 1
+    for start in range(0, len(ids), SUMMARY_BATCH_SIZE):
+        batch = ids[start : start + SUMMARY_BATCH_SIZE]
+        await ingestor._make_request(
+            "GET",
+            "esummary.fcgi",
+            params={"id": ",".join(batch)},
+        )
+        requests += 1
+        for variant_id in batch:
+            await ingestor._make_request(
+                "GET",
+                "efetch.fcgi",
+                params={"id": variant_id},
+            )
+            requests += 1
+    return requests
+
+
+@pytest.mark.performance
+async def test_batched_efetch_pulls_variants_in_few_requests(tmp_path: Path) -> None:
+    app = web.Application()
+    app.router.add_get("/esearch.fcgi", _esearch)
+    app.router.add_get("/esummary.fcgi", _esummary)
+    app.router.add_get("/efetch.fcgi", _efetch)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]  # noqa: SLF001 - ephemeral port
+    base_url = f"http://127.0.0.1:{port}"
+
+    started = time.perf_counter()
+    before_requests = await _per_variant_pull(_ingestor(base_url, tmp_path))
+    before = time.perf_counter() - started
+
+    ingestor = _ingestor(base_url, tmp_path)
+    with patch.object(
+        ingestor,
+        "_make_request",
+        wraps=ingestor._make_request,
+    ) as make_request:
+        started = time.perf_counter()
+        records = await ingestor.fetch_data()
+        after = time.perf_counter() - started
+    after_requests = make_request.call_count
+    await runner.cleanup()
+
+    logger.info(
+        "variants=%d per-variant: %d requests %.0fms (%.0fs at NCBI quota) "
+        "batched: %d requests %.0fms (%.1fs at NCBI quota)",
+        VARIANTS,
+        before_requests,
+        before * 1e3,
+        before_requests / NCBI_REQUESTS_PER_SECOND,
+        after_requests,
+        after * 1e3,
+        after_requests / NCBI_REQUESTS_PER_SECOND,
+    )
+    assert len(records) == VARIANTS
+    parsed = records[-1]["parsed_data"]
+    assert isinstance(parsed, dict)
+    assert parsed["gene_symbol"] == "MED13"
+    assert before_requests / after_requests >= MIN_SPEEDUP * 10
+    assert before / after >= MIN_SPEEDUP
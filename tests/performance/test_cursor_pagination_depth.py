@@ -0,0 +1,103 @@
+"""
+Synthetic benchmark for deep pages of the variant list.
+
+Seeds an in-memory SQLite database and times the last page of the variant
+list sorted by position, reached by page number (OFFSET) and by cursor,
+against the first page.
+"""
+
+import logging
+import os
+import time
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.repositories import (
+    EntityCountCache,
+    SqlAlchemyVariantRepository,
+)
+from src.models.database import Base, GeneModel, VariantModel
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+VARIANTS = 200_000 if HEAVY else 40_000
+PER_PAGE = 50
+ROUNDS = 20
+# Deep cursor pages may not cost more than this multiple of the first page
+MAX_DEPTH_PENALTY = 3
+
+
+def _measure(fetch) -> float:
+    fetch()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fetch()
+    return (time.perf_counter() - started) / ROUNDS
+
+
+@pytest.mark.performance
+def test_deep_cursor_pages_cost_the_same_as_the_first() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    gene = GeneModel(gene_id="GENE001", symbol="MED13")
+    session.add(gene)
+    session.flush()
+    session.execute(
+        insert(VariantModel),
+        [
+            {
+                "gene_id": gene.id,
+                "variant_id": f"chr17:{index}:A>G",
+                "chromosome": "17",
+                "position": index // 3 + 1,
+                "reference_allele": "A",
+                "alternate_allele": "G",
+            }
+            for index in range(VARIANTS)
+        ],
+    )
+    session.commit()
+    # Cached totals leave only the page query in the timings
+    repository = SqlAlchemyVariantRepository(
+        session,
+        count_cache=EntityCountCache(),
+    )
+    deep_offset = VARIANTS - PER_PAGE
+    before_last = repository.paginate_variants_seek(
+        None,
+        deep_offset,
+        "position",
+        "asc",
+    ).next_position
+
+    def page(*, offset: int = 0, after=None) -> None:
+        session.expunge_all()
+        repository.paginate_variants_seek(
+            after,
+            PER_PAGE,
+            "position",
+            "asc",
+            offset=offset,
+        )
+
+    try:
+        first = _measure(page)
+        by_offset = _measure(lambda: page(offset=deep_offset))
+        by_cursor = _measure(lambda: page(after=before_last))
+    finally:
+        session.close()
+        engine.dispose()
+
+    logger.info(
+        "variants=%d first=%.2fms offset=%.2fms cursor=%.2fms",
+        VARIANTS,
+        first * 1e3,
+        by_offset * 1e3,
+        by_cursor * 1e3,
+    )
+    assert by_cursor <= first * MAX_DEPTH_PENALTY
+    assert by_cursor < by_offset
@@ -0,0 +1,116 @@
+"""
+Synthetic benchmark for publication search over a corpus of abstracts.
+
+Seeds an in-memory SQLite database with generated abstracts and times a
+two-word publication search through the FTS5 index against the ``ILIKE``
+scan it replaces.
+"""
+
+import logging
+import os
+import random
+import time
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.repositories import SqlAlchemyPublicationRepository
+from src.models.database import Base, PublicationModel
+from src.models.database.full_text import PUBLICATION_SEARCH
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+ABSTRACTS = 1_000_000 if HEAVY else 20_000
+BATCH = 10_000
+ROUNDS = 5
+WORDS = [
+    "mediator",
+    "complex",
+    "kinase",
+    "module",
+    "transcription",
+    "cardiac",
+    "neurodevelopmental",
+    "variant",
+    "cohort",
+    "patients",
+    "phenotype",
+    "expression",
+    "signalling",
+    "protein",
+    "domain",
+    "missense",
+    "truncating",
+    "de",
+    "novo",
+    "inherited",
+    "syndrome",
+    "disability",
+    "delay",
+    "autism",
+]
+# One abstract in this many mentions the searched condition
+RARE_EVERY = 500
+
+
+def _abstract(rng: random.Random, index: int) -> str:
+    words = rng.choices(WORDS, k=60)
+    if index % RARE_EVERY == 0:
+        words[rng.randrange(60)] = "hypotonia craniofacial"
+    return " ".join(words)
+
+
+def _measure(search) -> float:
+    search()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        search()
+    return (time.perf_counter() - started) / ROUNDS
+
+
+@pytest.mark.performance
+def test_indexed_search_beats_the_substring_scan() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    rng = random.Random(13)  # noqa: S311  # nosec B311
+    for start in range(0, ABSTRACTS, BATCH):
+        session.execute(
+            insert(PublicationModel),
+            [
+                {
+                    "pubmed_id": str(index),
+                    "title": f"Report {index}",
+                    "authors": '["Doe J"]',
+                    "journal": "Journal",
+                    "publication_year": 2000 + index % 25,
+                    "abstract": _abstract(rng, index),
+                }
+                for index in range(start, min(start + BATCH, ABSTRACTS))
+            ],
+        )
+    session.commit()
+    repository = SqlAlchemyPublicationRepository(session)
+
+    def search() -> int:
+        session.expunge_all()
+        return len(repository.search_publications("hypotonia craniofacial", 20))
+
+    try:
+        indexed = _measure(search)
+        assert search() == 20
+        PUBLICATION_SEARCH.drop(session.connection())
+        scanned = _measure(search)
+    finally:
+        session.close()
+        engine.dispose()
+
+    logger.info(
+        "abstracts=%d indexed=%.2fms scanned=%.2fms",
+        ABSTRACTS,
+        indexed * 1e3,
+        scanned * 1e3,
+    )
+    assert indexed < scanned
@@ -0,0 +1,108 @@
+"""
+Pacing benchmark for ingestion rate limiting on a simulated clock.
+
+The baseline reproduces the previous limiter: a bucket that starts with a
+minute's worth of tokens and polls every second once drained. Against NCBI's
+three requests per second it sends 180 requests in the first second, which
+NCBI answers with 429s. The shared host limiter spaces requests evenly, never
+exceeds the quota in any second and still sustains it.
+"""
+
+import logging
+import os
+from collections import Counter
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from src.infrastructure.http import RateLimiter
+from src.infrastructure.http import rate_limits as rate_limits_module
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+SIMULATED_SECONDS = 3600 if HEAVY else 300
+QUOTA_PER_SECOND = 3
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+
+
+class PollingLimiter:
+    """The limiter ingestors used before per-host budgets."""
+
+    def __init__(self, requests_per_minute: int, clock: SimulatedClock) -> None:
+        self.requests_per_second = requests_per_minute / 60.0
+        self.tokens = float(requests_per_minute)
+        self.max_tokens = float(requests_per_minute)
+        self.clock = clock
+        self.last_update = clock()
+
+    def acquire(self) -> bool:
+        now = self.clock()
+        self.tokens = min(
+            self.max_tokens,
+            self.tokens + (now - self.last_update) * self.requests_per_second,
+        )
+        self.last_update = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    async def wait_for_token(self) -> None:
+        while not self.acquire():
+            await self.clock.sleep(1.0)
+
+
+async def _run(
+    wait_for_token: Callable[[], Awaitable[None]],
+    clock: SimulatedClock,
+) -> Counter[int]:
+    per_second: Counter[int] = Counter()
+    while True:
+        await wait_for_token()
+        if clock.now >= SIMULATED_SECONDS:
+            return per_second
+        per_second[int(clock.now)] += 1
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_host_limiter_sustains_the_ncbi_quota(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(rate_limits_module.NCBI_API_KEY_ENV, raising=False)
+    old_clock = SimulatedClock()
+    old = await _run(PollingLimiter(180, old_clock).wait_for_token, old_clock)
+
+    new_clock = SimulatedClock()
+    monkeypatch.setattr(rate_limits_module.asyncio, "sleep", new_clock.sleep)
+    host = rate_limits_module.NCBI_EUTILS_HOST
+    budget = rate_limits_module.default_host_budgets()[host]
+    limiter = RateLimiter(f"host:{host}", budget, clock=new_clock)
+    new = await _run(limiter.wait_for_token, new_clock)
+
+    steady = range(60, SIMULATED_SECONDS)
+    old_rate = sum(old[second] for second in steady) / len(steady)
+    new_rate = sum(new[second] for second in steady) / len(steady)
+    logger.info(
+        "simulated=%ds polling: peak=%d/s steady=%.2f/s; "
+        "host limiter: peak=%d/s steady=%.2f/s",
+        SIMULATED_SECONDS,
+        max(old.values()),
+        old_rate,
+        max(new.values()),
+        new_rate,
+    )
+    assert max(old.values()) > QUOTA_PER_SECOND
+    assert max(new.values()) <= QUOTA_PER_SECOND
+    assert new_rate == pytest.approx(QUOTA_PER_SECOND, rel=0.01)
@@ -0,0 +1,107 @@
+"""
+Connection reuse benchmark for ingestion runs against a local stub server.
+
+Each run builds a fresh ingestor and sends a small batch of requests, as the
+ingestion coordinator does. The baseline gives every run its own client (the
+previous behaviour); the shared registry keeps one pool across runs.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+from src.infrastructure.http import (
+    HostBudget,
+    HostRateLimiters,
+    HttpClientRegistry,
+    origin_of,
+)
+from src.infrastructure.ingest.base_ingestor import BaseIngestor
+from src.type_definitions.common import JSONValue, RawRecord
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+RUNS = 200 if HEAVY else 40
+REQUESTS_PER_RUN = 5
+MIN_SPEEDUP = 1.5
+
+
+class StubIngestor(BaseIngestor):
+    def __init__(
+        self,
+        base_url: str,
+        raw_data_dir: Path,
+        http_clients: HttpClientRegistry,
+    ) -> None:
+        super().__init__(
+            source_name="pubmed",
+            base_url=base_url,
+            raw_data_dir=raw_data_dir,
+            http_clients=http_clients,
+            # Pacing is not under test; the stub host gets an unlimited budget.
+            rate_limiters=HostRateLimiters(
+                {"127.0.0.1": HostBudget(1e6, burst=1_000_000)},
+            ),
+        )
+
+    async def fetch_data(self, **_kwargs: JSONValue) -> list[RawRecord]:
+        records: list[RawRecord] = []
+        for index in range(REQUESTS_PER_RUN):
+            response = await self._make_request("GET", "records", params={"i": index})
+            records.append(self._ensure_raw_record(response.json()))
+        return records
+
+
+async def _stub(_request: web.Request) -> web.Response:
+    return web.json_response({"id": "record"})
+
+
+@pytest.mark.performance
+async def test_shared_registry_reuses_connections_across_runs(tmp_path: Path) -> None:
+    app = web.Application()
+    app.router.add_get("/records", _stub)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]  # noqa: SLF001 - ephemeral port
+    base_url = f"http://127.0.0.1:{port}"
+
+    opened_per_run = 0
+    started = time.perf_counter()
+    for _ in range(RUNS):
+        registry = HttpClientRegistry()
+        async with StubIngestor(base_url, tmp_path, registry) as ingestor:
+            await ingestor.fetch_data()
+        await registry.aclose()
+        opened_per_run += registry.stats()[origin_of(base_url)].connections_opened
+    before = (time.perf_counter() - started) / RUNS
+
+    shared = HttpClientRegistry()
+    started = time.perf_counter()
+    for _ in range(RUNS):
+        async with StubIngestor(base_url, tmp_path, shared) as ingestor:
+            await ingestor.fetch_data()
+    after = (time.perf_counter() - started) / RUNS
+    await shared.aclose()
+    await runner.cleanup()
+
+    stats = shared.stats()[origin_of(base_url)]
+    logger.info(
+        "runs=%d per-run-client=%.0fus/run (%d connections) "
+        "shared=%.0fus/run (%d connections, %.1f%% reused)",
+        RUNS,
+        before * 1e6,
+        opened_per_run,
+        after * 1e6,
+        stats.connections_opened,
+        stats.reuse_ratio * 100,
+    )
+    assert opened_per_run == RUNS
+    assert stats.connections_opened == 1
+    assert before / after >= MIN_SPEEDUP
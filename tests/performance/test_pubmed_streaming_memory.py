@@ -0,0 +1,146 @@
+"""
+Peak memory of a PubMed pull against a local stub E-utilities server.
+
+The baseline replays the previous approach: EFetch by ID in pages of 50,
+parse each whole document with ``fromstring`` and keep every record in a
+list. The streaming ingestor pages through the history server and yields
+records while each page downloads; the consumer here keeps none of them, as
+the ingestion service does between upsert batches.
+"""
+
+import logging
+import os
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from aiohttp import web
+from defusedxml import ElementTree
+
+from src.infrastructure.http import HostBudget, HostRateLimiters
+from src.infrastructure.ingest.pubmed_ingestor import PubMedIngestor
+
+if TYPE_CHECKING:
+    from src.type_definitions.common import RawRecord
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+ARTICLES = 20_000 if HEAVY else 4_000
+ID_PAGE_SIZE = 50
+MIN_MEMORY_RATIO = 3.0
+ABSTRACT = "MED13 haploinsufficiency and neurodevelopmental outcomes. " * 20
+
+
+def _article_set(pmids: range) -> str:
+    articles = "".join(
+        "<PubmedArticle><MedlineCitation>"
+        f"<PMID>{pmid}</PMID>"
+        "<Article><ArticleTitle>MED13 variant study</ArticleTitle>"
+        f"<Abstract><AbstractText>{ABSTRACT}</AbstractText></Abstract>"
+        "<AuthorList><Author><LastName>Smith</LastName></Author></AuthorList>"
+        "</Article></MedlineCitation></PubmedArticle>"
+        for pmid in pmids
+    )
+    return f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+
+
+async def _esearch(request: web.Request) -> web.Response:
+    result: dict[str, object] = {"count": str(ARTICLES)}
+    if request.query.get("usehistory") == "y":
+        result.update({"webenv": "MCID_1", "querykey": "1", "idlist": []})
+    else:
+        result["idlist"] = [str(pmid) for pmid in range(ARTICLES)]
+    return web.json_response({"esearchresult": result})
+
+
+async def _efetch(request: web.Request) -> web.Response:
+    if "WebEnv" in request.query:
+        start = int(request.query["retstart"])
+        pmids = range(start, start + int(request.query["retmax"]))
+    else:
+        ids = [int(pmid) for pmid in request.query["id"].split(",")]
+        pmids = range(ids[0], ids[-1] + 1)
+    return web.Response(text=_article_set(pmids), content_type="text/xml")
+
+
+def _ingestor(base_url: str, raw_data_dir: Path) -> PubMedIngestor:
+    ingestor = PubMedIngestor(raw_data_dir)
+    ingestor.base_url = base_url
+    # Pacing is not under test; the stub host gets an unlimited budget.
+    ingestor.rate_limiter = HostRateLimiters(
+        {"127.0.0.1": HostBudget(1e6, burst=1_000_000)},
+    ).limiter_for(base_url)
+    return ingestor
+
+
+async def _buffered_pull(ingestor: PubMedIngestor) -> int:
+    """Previous approach: whole-document parsing, every record kept."""
+    response = await ingestor._make_request(
+        "GET",
+        "esearch.fcgi",
+        params={"retmax": ARTICLES},
+    )
+    ids: list[str] = response.json()["esearchresult"]["idlist"]
+    records: list[RawRecord] = []
+    for start in range(0, len(ids), ID_PAGE_SIZE):
+        page = await ingestor._make_request(
+            "GET",
+            "efetch.fcgi",
+            params={"id": ",".join(ids[start : start + ID_PAGE_SIZE])},
+        )
+        root = ElementTree.fromstring(page.text)
+        for citation in root.findall(".//MedlineCitation"):
+            record = ingestor._parse_single_citation(citation)
+            if record:
+                records.append(record)
+    return len(records)
+
+
+async def _streamed_pull(ingestor: PubMedIngestor) -> int:
+    count = 0
+    async for _record in ingestor.stream_records(max_results=ARTICLES):
+        count += 1
+    return count
+
+
+async def _peak_memory(pull: Callable[[], Awaitable[int]]) -> tuple[int, int]:
+    tracemalloc.start()
+    try:
+        count = await pull()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return count, peak
+
+
+@pytest.mark.performance
+async def test_streaming_keeps_memory_flat(tmp_path: Path) -> None:
+    app = web.Application()
+    app.router.add_get("/esearch.fcgi", _esearch)
+    app.router.add_get("/efetch.fcgi", _efetch)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]  # noqa: SLF001 - ephemeral port
+    base_url = f"http://127.0.0.1:{port}"
+
+    buffered, before = await _peak_memory(
+        lambda: _buffered_pull(_ingestor(base_url, tmp_path)),
+    )
+    streamed, after = await _peak_memory(
+        lambda: _streamed_pull(_ingestor(base_url, tmp_path)),
+    )
+    await runner.cleanup()
+
+    logger.info(
+        "articles=%d buffered peak=%.1fMiB streamed peak=%.1fMiB",
+        ARTICLES,
+        before / 2**20,
+        after / 2**20,
+    )
+    assert buffered == streamed == ARTICLES
+    assert before / after >= MIN_MEMORY_RATIO
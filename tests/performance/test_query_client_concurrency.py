@@ -0,0 +1,120 @@
+"""
+Concurrency benchmark for API source queries against a local stub server.
+
+Runs the same burst of concurrent queries twice: once opening a fresh HTTP
+client per call (the previous behaviour) and once through the pooled
+``HTTPQueryClient`` with its response cache disabled, so the difference is
+connection and client setup alone. Repeat queries are then served from the
+response cache.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+from aiohttp import web
+
+from src.domain.entities.data_discovery_parameters import QueryParameters
+from src.domain.entities.data_discovery_session import SourceCatalogEntry
+from src.infrastructure.http import HostRateLimiters
+from src.infrastructure.queries.source_query_client import (
+    HTTPQueryClient,
+    QueryResponseCache,
+)
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+QUERIES = 2_000 if HEAVY else 200
+CONCURRENCY = 8
+SIMULATED_UPSTREAM_LATENCY_SECONDS = 0.002
+MIN_SPEEDUP = 2
+
+
+async def _stub(request: web.Request) -> web.Response:
+    await asyncio.sleep(SIMULATED_UPSTREAM_LATENCY_SECONDS)
+    return web.json_response({"gene": request.query.get("gene"), "hits": []})
+
+
+def _entry(endpoint: str) -> SourceCatalogEntry:
+    return SourceCatalogEntry.model_validate(
+        {
+            "id": "stub-api",
+            "name": "Stub API",
+            "category": "Benchmarks",
+            "description": "Local stub upstream",
+            "param_type": "api",
+            "api_endpoint": endpoint,
+        },
+    )
+
+
+def _params(index: int) -> QueryParameters:
+    return QueryParameters(gene_symbol=f"GENE{index}", search_term=None)
+
+
+async def _burst(query: Callable[[int], Awaitable[object]]) -> float:
+    pending = iter(range(QUERIES))
+
+    async def worker() -> None:
+        for index in pending:
+            await query(index)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    return (time.perf_counter() - started) / QUERIES
+
+
+@pytest.mark.performance
+async def test_pooled_client_outperforms_per_call_clients() -> None:
+    app = web.Application()
+    app.router.add_get("/search", _stub)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]  # noqa: SLF001 - ephemeral port
+    endpoint = f"http://127.0.0.1:{port}/search"
+    entry = _entry(endpoint)
+
+    async def per_call(index: int) -> None:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(endpoint, params={"gene": f"GENE{index}"})
+            response.raise_for_status()
+
+    limiters = HostRateLimiters({})
+    uncached = HTTPQueryClient(
+        per_host_concurrency=CONCURRENCY,
+        response_cache=QueryResponseCache(ttl_seconds=0),
+        rate_limiters=limiters,
+    )
+    cached = HTTPQueryClient(per_host_concurrency=CONCURRENCY, rate_limiters=limiters)
+    try:
+        before = await _burst(per_call)
+        after = await _burst(
+            lambda index: uncached.execute_query(entry, _params(index)),
+        )
+        await _burst(lambda index: cached.execute_query(entry, _params(index % 10)))
+        cache_hits = await _burst(
+            lambda index: cached.execute_query(entry, _params(index % 10)),
+        )
+    finally:
+        await uncached.aclose()
+        await cached.aclose()
+        await runner.cleanup()
+
+    logger.info(
+        "queries=%d concurrency=%d per-call=%.0fus/query pooled=%.0fus/query "
+        "cached=%.0fus/query",
+        QUERIES,
+        CONCURRENCY,
+        before * 1e6,
+        after * 1e6,
+        cache_hits * 1e6,
+    )
+    assert before / after >= MIN_SPEEDUP
+    assert cache_hits < after
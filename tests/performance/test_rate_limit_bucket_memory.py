@@ -0,0 +1,63 @@
+"""
+Synthetic memory benchmark for the rate limiter bucket store.
+
+Feeds a stream of distinct client IPs through a capped store and checks that
+traced memory stops growing once the cap is reached.
+"""
+
+import ipaddress
+import logging
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from src.middleware.rate_limit import TokenBucketStore
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+DISTINCT_CLIENTS = 1_000_000 if HEAVY else 200_000
+MAX_BUCKETS = 10_000
+# Allow slack for allocator noise between the two samples.
+MAX_GROWTH_RATIO = 1.1
+
+
+def _client_ips(count: int):
+    base = int(ipaddress.IPv4Address("10.0.0.0"))
+    for offset in range(count):
+        yield str(ipaddress.IPv4Address(base + offset))
+
+
+@pytest.mark.performance
+def test_bucket_store_memory_is_constant_under_distinct_ip_load() -> None:
+    store = TokenBucketStore(capacity=200, refill_rate=20, max_buckets=MAX_BUCKETS)
+    checkpoint = DISTINCT_CLIENTS // 4
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        for index, client_ip in enumerate(_client_ips(DISTINCT_CLIENTS), start=1):
+            store.get(client_ip).consume()
+            if index == checkpoint:
+                after_warmup, _ = tracemalloc.get_traced_memory()
+        after_load, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    elapsed = time.perf_counter() - started
+
+    metrics = store.metrics()
+    logger.info(
+        "clients=%d buckets=%d evictions=%d warmup_bytes=%d final_bytes=%d "
+        "elapsed=%.2fs",
+        DISTINCT_CLIENTS,
+        metrics.buckets,
+        metrics.capacity_evictions,
+        after_warmup,
+        after_load,
+        elapsed,
+    )
+    assert metrics.buckets == MAX_BUCKETS
+    assert metrics.capacity_evictions == DISTINCT_CLIENTS - MAX_BUCKETS
+    assert after_load <= after_warmup * MAX_GROWTH_RATIO
@@ -0,0 +1,155 @@
+"""
+Raw archive size of an ingestion run, before and after the compressed spool.
+
+The baseline replays the previous ``_store_raw_data``: one indented JSON
+document per run, written after every record is in memory. The spool writes
+gzip JSON Lines as records arrive. Records mirror what the ClinVar and PubMed
+ingestors produce: raw VCV XML plus parsed fields, and article metadata with
+abstracts drawn from a fixed sentence pool.
+"""
+
+import json
+import logging
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+from src.domain.transform.raw_spool import RawRecordSpool, iter_raw_snapshot
+from src.type_definitions.common import RawRecord
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+RECORDS = 20_000 if HEAVY else 2_000
+MIN_RATIO = 10.0
+
+VARIATION_ARCHIVE = """<?xml version="1.0"?>
+<ClinVarResult-Set>
+<VariationArchive VariationID="{vid}" VariationName="NM_005121.3(MED13):c.{pos}A&gt;G"
+    VariationType="single nucleotide variant" Accession="VCV{vid:09d}"
+    DateLastUpdated="2024-05-01">
+  <ClassifiedRecord>
+    <SimpleAllele>
+      <GeneList>
+        <Gene Symbol="MED13" FullName="mediator complex subunit 13" GeneID="9969"/>
+      </GeneList>
+      <Location>
+        <SequenceLocation Assembly="GRCh38" Chr="17" start="{start}"
+            stop="{start}" referenceAlleleVCF="A" alternateAlleleVCF="G"/>
+      </Location>
+      <HGVSlist>
+        <HGVS><NucleotideExpression>
+          <Expression>NM_005121.3:c.{pos}A&gt;G</Expression>
+        </NucleotideExpression></HGVS>
+      </HGVSlist>
+    </SimpleAllele>
+    <Classifications>
+      <GermlineClassification>
+        <ReviewStatus>criteria provided, single submitter</ReviewStatus>
+        <Description>{significance}</Description>
+      </GermlineClassification>
+    </Classifications>
+  </ClassifiedRecord>
+</VariationArchive>
+</ClinVarResult-Set>"""
+
+SENTENCES = [
+    "MED13 encodes a subunit of the CDK8 kinase module of the Mediator complex.",
+    "De novo variants were identified by trio exome sequencing.",
+    "Affected individuals presented with intellectual disability and autism.",
+    "Speech delay was reported in most of the cohort.",
+    "Functional studies suggest loss of function as the disease mechanism.",
+    "Missense variants cluster in a conserved degron region.",
+    "We describe the phenotypic spectrum of MED13 haploinsufficiency.",
+    "Congenital heart defects were observed in a subset of patients.",
+]
+SIGNIFICANCE = ["Pathogenic", "Likely pathogenic", "Uncertain significance"]
+
+
+def _clinvar_records(rng: random.Random) -> list[RawRecord]:
+    records: list[RawRecord] = []
+    for vid in range(RECORDS):
+        significance = rng.choice(SIGNIFICANCE)
+        pos = rng.randint(1, 6600)
+        records.append(
+            {
+                "clinvar_id": str(vid),
+                "raw_xml": VARIATION_ARCHIVE.format(
+                    vid=vid,
+                    pos=pos,
+                    start=61942605 + pos,
+                    significance=significance,
+                ),
+                "parsed_data": {
+                    "gene_symbol": "MED13",
+                    "clinical_significance": significance,
+                    "hgvs_notations": [f"NM_005121.3:c.{pos}A>G"],
+                },
+                "source": "clinvar",
+                "fetched_at": "Thu, 01 Aug 2024 12:00:00 GMT",
+            },
+        )
+    return records
+
+
+def _pubmed_records(rng: random.Random) -> list[RawRecord]:
+    return [
+        {
+            "pubmed_id": str(30_000_000 + index),
+            "title": rng.choice(SENTENCES),
+            "abstract": " ".join(rng.choices(SENTENCES, k=8)),
+            "authors": [f"Author{rng.randint(1, 5000)} A" for _ in range(6)],
+            "journal": "American Journal of Human Genetics",
+            "publication_date": f"20{rng.randint(10, 24)}-01-01",
+            "source": "pubmed",
+            "fetched_at": "Thu, 01 Aug 2024 12:00:00 GMT",
+        }
+        for index in range(RECORDS)
+    ]
+
+
+def _indented_json_size(path: Path, records: list[RawRecord]) -> int:
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(
+            {"source": "test", "timestamp": "2024-08-01", "records": records},
+            handle,
+            indent=2,
+            default=str,
+        )
+    return path.stat().st_size
+
+
+def _spool_size(directory: Path, records: list[RawRecord]) -> int:
+    with RawRecordSpool(directory, "run") as spool:
+        for record in records:
+            spool.write(record)
+    assert list(iter_raw_snapshot(directory, "run")) == records
+    return sum(segment.size_bytes for segment in spool.segments)
+
+
+@pytest.mark.performance
+def test_spool_shrinks_raw_archives(tmp_path: Path) -> None:
+    rng = random.Random(13)  # noqa: S311  # nosec B311
+    ratios: dict[str, float] = {}
+    for name, records in (
+        ("clinvar", _clinvar_records(rng)),
+        ("pubmed", _pubmed_records(rng)),
+    ):
+        directory = tmp_path / name
+        directory.mkdir()
+        before = _indented_json_size(directory / "baseline.json", records)
+        after = _spool_size(directory, records)
+        ratios[name] = before / after
+        logger.info(
+            "%s records=%d indented json=%.1fKiB spool=%.1fKiB ratio=%.1fx",
+            name,
+            RECORDS,
+            before / 1024,
+            after / 1024,
+            ratios[name],
+        )
+
+    assert ratios["clinvar"] >= MIN_RATIO
+    assert ratios["pubmed"] >= MIN_RATIO
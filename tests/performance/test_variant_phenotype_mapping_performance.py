@@ -0,0 +1,146 @@
+"""
+Synthetic scaling benchmark for variant-phenotype linking.
+
+Compares the pairwise cross-product loop with indexed candidate generation
+across growing variant (V) and phenotype (P) counts. Any actionable clinical
+significance links a variant to every phenotype, so with a ClinVar-like mix
+most pairs become links and both paths stay O(V x P); the index only skips
+rule evaluation for pairs that cannot link.
+"""
+
+import gc
+import logging
+import os
+import time
+
+import pytest
+
+from src.domain.transform.mappers.variant_phenotype_mapper import (
+    VariantPhenotypeMapper,
+)
+from src.domain.transform.normalizers.phenotype_normalizer import (
+    NormalizedPhenotype,
+    PhenotypeIdentifierType,
+)
+from src.domain.transform.normalizers.variant_normalizer import (
+    NormalizedVariant,
+    VariantIdentifierType,
+)
+
+logger = logging.getLogger(__name__)
+
+HEAVY = os.environ.get("MED13_RUN_HEAVY_PERF_TESTS") == "1"
+SIZES = (
+    [(250, 500), (500, 1_000), (1_000, 2_000)]
+    if HEAVY
+    else [(50, 100), (100, 200), (200, 400)]
+)
+
+# Roughly ClinVar's distribution of submitted significances: mostly VUS and
+# (likely) benign, a small pathogenic share, and a few without a usable call.
+SIGNIFICANCE_MIX = (
+    ["Uncertain significance"] * 9
+    + ["Likely benign"] * 5
+    + ["Benign"] * 2
+    + [
+        "Pathogenic",
+        "Likely pathogenic",
+        "Conflicting interpretations of pathogenicity",
+        "not provided",
+    ]
+)
+
+
+def _build_variants(count: int) -> list[NormalizedVariant]:
+    # Every fifth variant comes from UniProt, which carries no significance.
+    return [
+        NormalizedVariant(
+            primary_id=f"VCV{index:09d}",
+            id_type=VariantIdentifierType.CLINVAR_VCV,
+            genomic_location=None,
+            hgvs_notations={},
+            clinical_significance=(
+                SIGNIFICANCE_MIX[index % len(SIGNIFICANCE_MIX)] if index % 5 else None
+            ),
+            gene_symbol="MED13",
+            cross_references={},
+            source="clinvar" if index % 5 else "uniprot",
+            confidence_score=0.9,
+        )
+        for index in range(count)
+    ]
+
+
+def _build_phenotypes(count: int) -> list[NormalizedPhenotype]:
+    # HPO ontology dominates; only a handful of phenotypes come from ClinVar.
+    return [
+        NormalizedPhenotype(
+            primary_id=f"HP:{index:07d}",
+            id_type=PhenotypeIdentifierType.HPO_ID,
+            name=f"Phenotype {index}",
+            definition=None,
+            synonyms=[],
+            category=None,
+            cross_references={},
+            source="clinvar" if index % 100 == 0 else "hpo",
+            confidence_score=0.9,
+        )
+        for index in range(count)
+    ]
+
+
+def _timed(run):
+    # Both paths allocate one object per link; collect up front and pause the
+    # collector so a generation sweep does not land on one side only.
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = run()
+        return result, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _pairwise(variants, phenotypes):
+    mapper = VariantPhenotypeMapper()
+    return [
+        link
+        for variant in variants
+        for phenotype in phenotypes
+        if (link := mapper.map_variant_phenotype_relationship(variant, phenotype))
+    ]
+
+
+@pytest.mark.performance
+def test_indexed_linking_matches_pairwise_output_faster():
+    """Indexed linking yields the pairwise links and is never slower."""
+    speedups: list[float] = []
+    for variant_count, phenotype_count in SIZES:
+        variants = _build_variants(variant_count)
+        phenotypes = _build_phenotypes(phenotype_count)
+
+        expected, pairwise_seconds = _timed(lambda: _pairwise(variants, phenotypes))
+        actual, indexed_seconds = _timed(
+            lambda: VariantPhenotypeMapper().map_variant_phenotype_relationships(
+                variants,
+                phenotypes,
+            ),
+        )
+
+        assert actual == expected
+        speedup = pairwise_seconds / max(indexed_seconds, 1e-9)
+        speedups.append(speedup)
+        logger.info(
+            "V=%s P=%s links=%s (%.0f%% of pairs) pairwise=%.4fs "
+            "indexed=%.4fs speedup=%.1fx",
+            variant_count,
+            phenotype_count,
+            len(actual),
+            100 * len(actual) / (variant_count * phenotype_count),
+            pairwise_seconds,
+            indexed_seconds,
+            speedup,
+        )
+
+    assert min(speedups) > 1.0
@@ -33,6 +33,7 @@ from src.type_definitions.storage import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
     from src.type_definitions.common import (
@@ -108,12 +109,20 @@ class StubQueueRepository:
 class StubPublicationRepository:
     def __init__(self, publication: Publication) -> None:
         self._publication = publication
+        self.lookups: list[list[int]] = []
 
     def get_by_id(self, publication_id: int) -> Publication | None:
         if self._publication.id == publication_id:
             return self._publication
         return None
 
+    def find_by_ids(self, publication_ids: Iterable[int]) -> list[Publication]:
+        requested = list(publication_ids)
+        self.lookups.append(requested)
+        if self._publication.id in requested:
+            return [self._publication]
+        return []
+
 
 class StubExtractionRepository:
     def __init__(self, existing: PublicationExtraction | None = None) -> None:
@@ -306,3 +315,68 @@ async def test_run_pending_stores_text_payload() -> None:
     assert extraction_repo.created
     assert extraction_repo.created[0].document_reference == stored["key"]
     assert extraction_repo.created[0].text_source == ExtractionTextSource.TITLE_ABSTRACT
+
+
+@pytest.mark.asyncio
+async def test_run_pending_processes_batch_in_worker_pool() -> None:
+    items = [_build_queue_item() for _ in range(4)]
+    publication = _build_publication(items[0].publication_id)
+    queue_repo = StubQueueRepository(items)
+    publication_repo = StubPublicationRepository(publication)
+    extraction_repo = StubExtractionRepository()
+    storage_coordinator = StubStorageCoordinator()
+
+    runner = ExtractionRunnerService(
+        queue_repository=queue_repo,
+        publication_repository=publication_repo,
+        extraction_repository=extraction_repo,
+        processor=StubProcessor(_build_result(ExtractionOutcome.COMPLETED)),
+        storage_coordinator=storage_coordinator,
+        batch_size=4,
+        storage_concurrency=2,
+        processor_workers=3,
+    )
+
+    summary = await runner.run_pending()
+
+    assert summary.completed == len(items)
+    assert publication_repo.lookups == [[item.publication_id for item in items]]
+    assert len(storage_coordinator.stored) == len(items)
+    assert [extraction.queue_item_id for extraction in extraction_repo.created] == [
+        item.id for item in items
+    ]
+    assert summary.to_metadata()["items_per_second"] > 0
+
+
+@dataclass(frozen=True)
+class FailingProcessor:
+    def extract_publication(
+        self,
+        *,
+        queue_item: ExtractionQueueItem,
+        publication: Publication | None,
+        text_payload: ExtractionTextPayload | None = None,
+    ) -> ExtractionProcessorResult:
+        message = "processor crashed"
+        raise RuntimeError(message)
+
+
+@pytest.mark.asyncio
+async def test_run_pending_marks_processor_errors_failed() -> None:
+    item = _build_queue_item()
+    queue_repo = StubQueueRepository([item])
+
+    runner = ExtractionRunnerService(
+        queue_repository=queue_repo,
+        publication_repository=StubPublicationRepository(
+            _build_publication(item.publication_id),
+        ),
+        extraction_repository=StubExtractionRepository(),
+        processor=FailingProcessor(),
+        processor_workers=2,
+    )
+
+    summary = await runner.run_pending()
+
+    assert summary.failed == 1
+    assert queue_repo.failed == ["processor crashed"]
@@ -19,12 +19,15 @@ from src.domain.entities.user_data_source import (
     SourceType,
     UserDataSource,
 )
+from src.domain.repositories.base import TotalCount
 from src.domain.repositories.publication_repository import PublicationRepository
 from src.domain.services.pubmed_ingestion import PubMedGateway
 from src.domain.value_objects.identifiers import PublicationIdentifier
 from src.type_definitions.storage import StorageUseCase
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from src.type_definitions.common import RawRecord
 
 
@@ -39,6 +42,11 @@ class StubGateway(PubMedGateway):
         self.called_with.append(config.model_dump())
         return self.records
 
+    async def stream_records(self, config) -> AsyncIterator[RawRecord]:  # type: ignore[override]
+        self.called_with.append(config.model_dump())
+        for record in self.records:
+            yield record
+
 
 class StubPublicationRepository(PublicationRepository):
     """In-memory publication repository for unit testing."""
@@ -101,8 +109,8 @@ class StubPublicationRepository(PublicationRepository):
         sort_by: str,
         sort_order: str,
         filters=None,
-    ) -> tuple[list[Publication], int]:
-        return ([], 0)
+    ) -> tuple[list[Publication], TotalCount]:
+        return ([], TotalCount(0))
 
     def get_publication_statistics(
         self,
@@ -303,7 +311,7 @@ async def test_ingest_stores_raw_records_if_configured() -> None:
     # Verify call args
     call_args = mock_storage.record_store_operation.call_args
     assert call_args.kwargs["configuration"] == mock_config
-    assert call_args.kwargs["content_type"] == "application/json"
+    assert call_args.kwargs["content_type"] == "application/gzip"
     assert call_args.kwargs["user_id"] == source.owner_id
     assert "raw/" in call_args.kwargs["key"]
 
@@ -8,6 +8,7 @@ Verifies that:
 """
 
 import pathlib
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
@@ -32,6 +33,7 @@ from src.domain.entities.user_data_source import (
     SourceType,
     UserDataSource,
 )
+from src.domain.repositories.publication_repository import PublicationUpsertResult
 from src.domain.services.pubmed_ingestion import PubMedGateway
 from src.type_definitions.storage import (
     StorageOperationRecord,
@@ -57,8 +59,15 @@ def mock_storage_backend() -> Mock:
 
 @pytest.fixture
 def mock_gateway() -> Mock:
+    records = [{"pmid": "123", "title": "Test"}]
+
+    async def stream_records(_config: object) -> AsyncIterator[dict[str, str]]:
+        for record in records:
+            yield record
+
     gateway = Mock(spec=PubMedGateway)
-    gateway.fetch_records.return_value = [{"pmid": "123", "title": "Test"}]
+    gateway.fetch_records.return_value = records
+    gateway.stream_records.side_effect = stream_records
     return gateway
 
 
@@ -66,6 +75,12 @@ def mock_gateway() -> Mock:
 def mock_repo() -> Mock:
     repo = Mock()
     repo.find_by_pmid.return_value = None
+    repo.upsert_many.return_value = PublicationUpsertResult(
+        created=1,
+        updated=0,
+        created_ids=(1,),
+        updated_ids=(),
+    )
     return repo
 
 
@@ -108,7 +123,7 @@ class TestPubMedIngestionStorage:
         call_kwargs = mock_storage_service.record_store_operation.call_args.kwargs
         assert call_kwargs["configuration"] == mock_storage_backend
         assert call_kwargs["key"].startswith(f"pubmed/{source.id}/raw/")
-        assert call_kwargs["content_type"] == "application/json"
+        assert call_kwargs["content_type"] == "application/gzip"
         assert call_kwargs["metadata"]["record_count"] == 1
 
         file_path = call_kwargs["file_path"]
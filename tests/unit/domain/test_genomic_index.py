@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from src.domain.services.genomic_index import (
+    GenomicInterval,
+    GenomicIntervalIndex,
+    GenomicPositionIndex,
+)
+
+
+def test_interval_index_matches_linear_scan() -> None:
+    rng = random.Random(13)  # noqa: S311  # nosec B311
+    intervals = []
+    for payload in range(400):
+        start = rng.randint(1, 50_000)
+        end = start + rng.choice([0, 50, 2_000, 20_000])
+        intervals.append(GenomicInterval("CHR1", start, end, payload))
+    index = GenomicIntervalIndex(intervals)
+
+    for _ in range(200):
+        query_start = rng.randint(-1_000, 60_000)
+        query_end = query_start + rng.randint(0, 3_000)
+        expected = sorted(
+            item.payload
+            for item in intervals
+            if item.start <= query_end and item.end >= query_start
+        )
+        hits = index.overlapping("CHR1", query_start, query_end)
+        assert sorted(hit.payload for hit in hits) == expected
+        assert [hit.start for hit in hits] == sorted(hit.start for hit in hits)
+
+
+def test_interval_index_is_partitioned_by_chromosome() -> None:
+    index: GenomicIntervalIndex[str] = GenomicIntervalIndex()
+    index.add("CHR1", 100, 200, "a")
+    index.add("CHR2", 100, 200, "b")
+
+    assert [hit.payload for hit in index.containing("CHR1", 150)] == ["a"]
+    assert index.containing("CHR3", 150) == []
+    assert index.chromosomes() == ["CHR1", "CHR2"]
+    assert len(index) == 2
+
+
+def test_interval_index_rebuilds_after_add() -> None:
+    index: GenomicIntervalIndex[str] = GenomicIntervalIndex()
+    index.add("CHR1", 100, 200, "a")
+    assert [hit.payload for hit in index.containing("CHR1", 150)] == ["a"]
+
+    index.add("CHR1", 140, 160, "b")
+    assert [hit.payload for hit in index.containing("CHR1", 150)] == ["a", "b"]
+
+
+def test_interval_index_rejects_inverted_interval() -> None:
+    index: GenomicIntervalIndex[str] = GenomicIntervalIndex()
+    with pytest.raises(ValueError):
+        index.add("CHR1", 200, 100, "a")
+
+
+def test_position_index_returns_payloads_in_region() -> None:
+    index = GenomicPositionIndex(
+        [
+            ("CHR1", 500, "c"),
+            ("CHR1", 100, "a"),
+            ("CHR1", 300, "b"),
+            ("CHR2", 300, "z"),
+        ],
+    )
+
+    assert index.in_region("CHR1", 100, 300) == ["a", "b"]
+    assert index.in_region("CHR1", 301, 499) == []
+    assert index.in_region("CHR1", 400, 200) == []
+
+    index.add("CHR1", 200, "d")
+    assert index.in_region("CHR1", 1, 1_000) == ["a", "d", "b", "c"]
@@ -8,6 +8,7 @@ from src.domain.entities.user import UserRole
 from src.domain.value_objects.permission import (
     Permission,
     PermissionChecker,
+    PermissionSet,
     RolePermissions,
 )
 
@@ -46,9 +47,9 @@ class TestPermissionEnum:
         """Test that permission values follow resource:action convention."""
         for permission in Permission:
             value = permission.value
-            assert (
-                ":" in value
-            ), f"Permission {permission.name} doesn't follow convention"
+            assert ":" in value, (
+                f"Permission {permission.name} doesn't follow convention"
+            )
             resource, action = value.split(":", 1)
             assert resource, f"Empty resource in {value}"
             assert action, f"Empty action in {value}"
@@ -338,3 +339,47 @@ class TestRolePermissionIntegration:
                 assert len(current_permissions) > 2  # Multiple permissions
             elif expected_level == 4:  # Admin
                 assert current_permissions == set(Permission)  # All permissions
+
+
+class TestPermissionSet:
+    def test_role_sets_match_role_permissions(self):
+        """Bitsets hold exactly the permissions granted to each role."""
+        for role in UserRole:
+            permission_set = PermissionSet.for_role(role)
+            expected = RolePermissions.get_permissions_for_role(role)
+
+            assert set(permission_set) == set(expected)
+            assert len(permission_set) == len(expected)
+            assert all(permission in permission_set for permission in expected)
+
+    def test_role_sets_are_cached(self):
+        assert PermissionSet.for_role(UserRole.CURATOR) is PermissionSet.for_role(
+            UserRole.CURATOR,
+        )
+
+    def test_set_operations(self):
+        researcher = PermissionSet.for_role(UserRole.RESEARCHER)
+
+        assert researcher.contains_all(
+            [Permission.DATASOURCE_READ, Permission.DATASOURCE_CREATE],
+        )
+        assert not researcher.contains_all(
+            [Permission.DATASOURCE_READ, Permission.DATASOURCE_DELETE],
+        )
+        assert researcher.contains_any(
+            [Permission.SYSTEM_ADMIN, Permission.DATASOURCE_READ],
+        )
+        assert not researcher.contains_any([Permission.SYSTEM_ADMIN])
+        assert researcher.missing(
+            [Permission.USER_DELETE, Permission.DATASOURCE_READ, Permission.AUDIT_READ],
+        ) == [Permission.USER_DELETE, Permission.AUDIT_READ]
+
+    def test_empty_set(self):
+        empty = PermissionSet()
+
+        assert not empty
+        assert Permission.DATASOURCE_READ not in empty
+        assert "not-a-permission" not in empty
+        assert empty.contains_all([])
+        assert not empty.contains_any([])
+        assert PermissionSet.from_permissions([]) == empty
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from src.database.seed_data import CATALOG_ENTRIES_PATH
+from src.domain.entities.data_discovery_session import SourceCatalogEntry
+from src.domain.services.source_catalog_index import SourceCatalogIndex
+
+
+def _entry(entry_id: str, name: str, **overrides: object) -> SourceCatalogEntry:
+    fields: dict[str, object] = {
+        "id": entry_id,
+        "name": name,
+        "category": "Genomic Variant Databases",
+        "description": f"{name} description",
+        "param_type": "gene",
+    }
+    fields.update(overrides)
+    return SourceCatalogEntry.model_validate(fields)
+
+
+@pytest.fixture(scope="module")
+def seeded() -> SourceCatalogIndex:
+    payload = json.loads(CATALOG_ENTRIES_PATH.read_text(encoding="utf-8"))
+    return SourceCatalogIndex(
+        SourceCatalogEntry.model_validate(item) for item in payload
+    )
+
+
+def test_search_finds_everything_the_substring_filter_found(
+    seeded: SourceCatalogIndex,
+) -> None:
+    for query in ["clinvar", "variant", "gene", "expression", "var", "pub"]:
+        expected = {
+            entry.id
+            for entry in seeded.all(active_only=True)
+            if query in entry.name.lower()
+            or query in entry.description.lower()
+            or query in entry.tags
+        }
+        found = {entry.id for entry in seeded.search(query)}
+        assert expected <= found, query
+
+
+def test_search_tolerates_prefixes_and_typos(seeded: SourceCatalogIndex) -> None:
+    assert {"clinvar", "clingen", "clinicaltrials"} <= {
+        entry.id for entry in seeded.search("clin")
+    }
+    assert seeded.search("clinv")[0].id == "clinvar"
+    assert seeded.search("clinvra")[0].id == "clinvar"
+    assert seeded.search("ClinVar")[0].id == "clinvar"
+    assert seeded.search("zzzz") == []
+    assert seeded.search("  ") == []
+
+
+def test_ranking_prefers_name_then_usage() -> None:
+    index = SourceCatalogIndex(
+        [
+            _entry("desc", "Alpha", description="mentions variants"),
+            _entry("name", "Variant Browser"),
+            _entry("tag", "Gamma", tags=["variants"]),
+            _entry("busy", "Variant Atlas", usage_count=10),
+        ],
+    )
+
+    assert [entry.id for entry in index.search("variant")] == [
+        "busy",
+        "name",
+        "tag",
+        "desc",
+    ]
+    assert [entry.id for entry in index.search("variant", limit=1)] == ["busy"]
+
+
+def test_multi_token_queries_require_every_token() -> None:
+    index = SourceCatalogIndex(
+        [
+            _entry("both", "Mouse Phenotype Atlas"),
+            _entry("one", "Mouse Genome"),
+        ],
+    )
+
+    assert [entry.id for entry in index.search("mouse pheno")] == ["both"]
+
+
+def test_filters_inactive_entries_and_categories() -> None:
+    index = SourceCatalogIndex(
+        [
+            _entry("active", "Variant A"),
+            _entry("inactive", "Variant B", is_active=False),
+            _entry("other", "Variant C", category="Other"),
+        ],
+    )
+
+    assert [entry.id for entry in index.search("variant", "Other")] == ["other"]
+    assert "inactive" not in {entry.id for entry in index.search("variant")}
+    assert [entry.id for entry in index.by_category("Genomic Variant Databases")] == [
+        "active",
+    ]
+    assert len(index.all()) == 3
+    assert len(index.all(active_only=True)) == 2
+
+
+def test_with_entry_returns_updated_snapshot() -> None:
+    original = SourceCatalogIndex([_entry("a", "Variant A")])
+
+    stats = original.with_entry(_entry("a", "Variant A", usage_count=5))
+    renamed = stats.with_entry(_entry("a", "Protein A"))
+
+    assert original.get("a").usage_count == 0  # type: ignore[union-attr]
+    assert stats.get("a").usage_count == 5  # type: ignore[union-attr]
+    assert stats.search("variant")[0].usage_count == 5
+    assert renamed.search("variant") == []
+    assert renamed.search("protein")[0].id == "a"
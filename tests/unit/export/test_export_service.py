@@ -43,29 +43,29 @@ class TestBulkExportService:
     def mock_gene_service(self) -> Mock:
         """Create mock gene service for testing."""
         service = Mock()
-        # Mock the list_genes method to return test data
-        service.list_genes.return_value = ([TEST_GENE_MED13, TEST_GENE_TP53], 2)
+        # Mock the keyset listing method to return test data
+        service.list_genes_keyset.return_value = [TEST_GENE_MED13, TEST_GENE_TP53]
         return service
 
     @pytest.fixture
     def mock_variant_service(self) -> Mock:
         """Create mock variant service for testing."""
         service = Mock()
-        service.list_variants.return_value = ([TEST_VARIANT_PATHOGENIC], 1)
+        service.list_variants_keyset.return_value = [TEST_VARIANT_PATHOGENIC]
         return service
 
     @pytest.fixture
     def mock_phenotype_service(self) -> Mock:
         """Create mock phenotype service for testing."""
         service = Mock()
-        service.list_phenotypes.return_value = ([TEST_PHENOTYPE_NEUROLOGICAL], 1)
+        service.list_phenotypes_keyset.return_value = [TEST_PHENOTYPE_NEUROLOGICAL]
         return service
 
     @pytest.fixture
     def mock_evidence_service(self) -> Mock:
         """Create mock evidence service for testing."""
         service = Mock()
-        service.list_evidence.return_value = ([TEST_EVIDENCE_CLINICAL_REPORT], 1)
+        service.list_evidence_keyset.return_value = [TEST_EVIDENCE_CLINICAL_REPORT]
         return service
 
     @pytest.fixture
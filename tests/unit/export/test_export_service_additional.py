@@ -11,6 +11,7 @@ import csv
 import gzip
 import io
 import json
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, NamedTuple
 from unittest.mock import Mock, call
 
@@ -31,6 +32,7 @@ from src.application.export.utils import (
     get_gene_fields,
     get_phenotype_fields,
     get_variants_fields,
+    iter_keyset_batches,
 )
 
 if TYPE_CHECKING:
@@ -63,98 +65,86 @@ class TestBulkExportServiceAdditional:
             evidence_service,
         ) = mock_services
 
-        gene_service.list_genes.return_value = (
-            [
-                {
-                    "id": "gene-1",
-                    "gene_id": "GENE1",
-                    "symbol": "MED13",
-                    "name": "Mediator Complex Subunit 13",
-                    "description": "Test gene",
-                    "gene_type": "protein_coding",
-                    "chromosome": "17",
-                    "start_position": 100,
-                    "end_position": 200,
-                    "ensembl_id": "ENSG000000",
-                    "ncbi_gene_id": 1234,
-                    "uniprot_id": "Q99999",
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-02T00:00:00Z",
-                },
-            ],
-            1,
-        )
-
-        variant_service.list_variants.return_value = (
-            [
-                {
-                    "id": "variant-1",
-                    "variant_id": "VAR1",
-                    "clinvar_id": "CLN1",
-                    "chromosome": "17",
-                    "position": 101,
-                    "reference_allele": "A",
-                    "alternate_allele": "T",
-                    "variant_type": "SNV",
-                    "clinical_significance": "pathogenic",
-                    "gene_symbol": "MED13",
-                    "hgvs_genomic": "g.101A>T",
-                    "hgvs_cdna": "c.101A>T",
-                    "hgvs_protein": "p.Lys34Asn",
-                    "condition": "Test condition",
-                    "review_status": "criteria_provided",
-                    "allele_frequency": 0.01,
-                    "gnomad_af": 0.005,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-02T00:00:00Z",
-                },
-            ],
-            1,
-        )
-
-        phenotype_service.list_phenotypes.return_value = (
-            [
-                {
-                    "id": "phenotype-1",
-                    "identifier": {"hpo_id": "HP:0000001", "hpo_term": "Phenotype"},
-                    "name": "Phenotype Name",
-                    "definition": "Test definition",
-                    "category": "Neurological",
-                    "parent_hpo_id": None,
-                    "is_root_term": False,
-                    "frequency_in_med13": "frequent",
-                    "severity_score": 3,
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-02T00:00:00Z",
-                },
-            ],
-            1,
-        )
-
-        evidence_service.list_evidence.return_value = (
-            [
-                {
-                    "id": "evidence-1",
-                    "variant_id": "variant-1",
-                    "phenotype_id": "phenotype-1",
-                    "description": "Evidence description",
-                    "summary": "Evidence summary",
-                    "evidence_level": "strong",
-                    "evidence_type": "clinical",
-                    "confidence": {"score": 0.9},
-                    "quality_score": 5,
-                    "sample_size": 10,
-                    "study_type": "Case Study",
-                    "statistical_significance": "p<0.05",
-                    "reviewed": True,
-                    "review_date": "2024-01-02",
-                    "reviewer_notes": "Reviewed",
-                    "created_at": "2024-01-01T00:00:00Z",
-                    "updated_at": "2024-01-02T00:00:00Z",
-                },
-            ],
-            1,
-        )
+        gene_service.list_genes_keyset.return_value = [
+            {
+                "id": "gene-1",
+                "gene_id": "GENE1",
+                "symbol": "MED13",
+                "name": "Mediator Complex Subunit 13",
+                "description": "Test gene",
+                "gene_type": "protein_coding",
+                "chromosome": "17",
+                "start_position": 100,
+                "end_position": 200,
+                "ensembl_id": "ENSG000000",
+                "ncbi_gene_id": 1234,
+                "uniprot_id": "Q99999",
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-02T00:00:00Z",
+            },
+        ]
+
+        variant_service.list_variants_keyset.return_value = [
+            {
+                "id": "variant-1",
+                "variant_id": "VAR1",
+                "clinvar_id": "CLN1",
+                "chromosome": "17",
+                "position": 101,
+                "reference_allele": "A",
+                "alternate_allele": "T",
+                "variant_type": "SNV",
+                "clinical_significance": "pathogenic",
+                "gene_symbol": "MED13",
+                "hgvs_genomic": "g.101A>T",
+                "hgvs_cdna": "c.101A>T",
+                "hgvs_protein": "p.Lys34Asn",
+                "condition": "Test condition",
+                "review_status": "criteria_provided",
+                "allele_frequency": 0.01,
+                "gnomad_af": 0.005,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-02T00:00:00Z",
+            },
+        ]
+
+        phenotype_service.list_phenotypes_keyset.return_value = [
+            {
+                "id": "phenotype-1",
+                "identifier": {"hpo_id": "HP:0000001", "hpo_term": "Phenotype"},
+                "name": "Phenotype Name",
+                "definition": "Test definition",
+                "category": "Neurological",
+                "parent_hpo_id": None,
+                "is_root_term": False,
+                "frequency_in_med13": "frequent",
+                "severity_score": 3,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-02T00:00:00Z",
+            },
+        ]
+
+        evidence_service.list_evidence_keyset.return_value = [
+            {
+                "id": "evidence-1",
+                "variant_id": "variant-1",
+                "phenotype_id": "phenotype-1",
+                "description": "Evidence description",
+                "summary": "Evidence summary",
+                "evidence_level": "strong",
+                "evidence_type": "clinical",
+                "confidence": {"score": 0.9},
+                "quality_score": 5,
+                "sample_size": 10,
+                "study_type": "Case Study",
+                "statistical_significance": "p<0.05",
+                "reviewed": True,
+                "review_date": "2024-01-02",
+                "reviewer_notes": "Reviewed",
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-02T00:00:00Z",
+            },
+        ]
 
         return BulkExportService(
             gene_service=gene_service,
@@ -686,39 +676,11 @@ class TestBulkExportServiceAdditional:
             assert "id" in data or "variant_id" in data
 
         def test_export_with_chunking(self, export_service: BulkExportService) -> None:
-            """Test that export properly handles chunked data retrieval."""
-            # This tests the integration of _collect_paginated with export methods
+            """Test that export streams one chunk per keyset batch."""
             gene_service = export_service._gene_service
-            gene_service.list_genes.side_effect = [
-                (
-                    [
-                        gene_service.list_genes.return_value[0][0],
-                    ],
-                    2,
-                ),
-                (
-                    [
-                        {
-                            "id": "gene-2",
-                            "gene_id": "GENE2",
-                            "symbol": "MED13L",
-                            "name": "Mediator Complex Subunit 13 Like",
-                            "description": "Second test gene",
-                            "gene_type": "protein_coding",
-                            "chromosome": "12",
-                            "start_position": 300,
-                            "end_position": 450,
-                            "ensembl_id": "ENSG000001",
-                            "ncbi_gene_id": 5678,
-                            "uniprot_id": "Q88888",
-                            "created_at": "2024-01-03T00:00:00Z",
-                            "updated_at": "2024-01-04T00:00:00Z",
-                        },
-                    ],
-                    2,
-                ),
-                ([], 2),
-            ]
+            first = SimpleNamespace(id=1, gene_id="GENE1", symbol="MED13")
+            second = SimpleNamespace(id=2, gene_id="GENE2", symbol="MED13L")
+            gene_service.list_genes_keyset.side_effect = [[first], [second], []]
 
             result = list(
                 export_service.export_data(
@@ -728,10 +690,16 @@ class TestBulkExportServiceAdditional:
                 ),
             )
 
-            assert len(result) == 1
-            data = json.loads(result[0])
-            assert "genes" in data
-            assert len(data["genes"]) == 2  # Should collect all items
+            assert len(result) == 2
+            data = json.loads("".join(result))
+            assert [gene["symbol"] for gene in data["genes"]] == ["MED13", "MED13L"]
+            gene_service.list_genes_keyset.assert_has_calls(
+                [
+                    call(after_id=None, limit=1, search=None),
+                    call(after_id=1, limit=1, search=None),
+                    call(after_id=2, limit=1, search=None),
+                ],
+            )
 
     class TestErrorHandling:
         """Test error handling in export operations."""
@@ -755,7 +723,7 @@ class TestBulkExportServiceAdditional:
         ) -> None:
             """Test handling of service layer errors."""
             gene_service, _, _, _ = mock_services
-            gene_service.list_genes.side_effect = Exception("Service error")
+            gene_service.list_genes_keyset.side_effect = Exception("Service error")
 
             export_service = BulkExportService(
                 gene_service=gene_service,
@@ -781,7 +749,7 @@ class TestBulkExportServiceAdditional:
         ) -> None:
             """Test exporting when no data is available."""
             gene_service, _, _, _ = mock_services
-            gene_service.list_genes.return_value = ([], 0)
+            gene_service.list_genes_keyset.return_value = []
 
             export_service = BulkExportService(
                 gene_service=gene_service,
@@ -806,27 +774,24 @@ class TestBulkExportServiceAdditional:
             export_service: BulkExportService,
         ) -> None:
             """Test CSV export handles special characters properly."""
-            export_service._gene_service.list_genes.return_value = (
-                [
-                    {
-                        "id": "gene-special",
-                        "gene_id": "GENE-SP",
-                        "symbol": "MED13",
-                        "name": 'Gene, "Quoted"',
-                        "description": "Line\nBreak",
-                        "gene_type": "protein_coding",
-                        "chromosome": "17",
-                        "start_position": 100,
-                        "end_position": 200,
-                        "ensembl_id": "ENSGSPECIAL",
-                        "ncbi_gene_id": 4321,
-                        "uniprot_id": "Q77777",
-                        "created_at": "2024-01-01T00:00:00Z",
-                        "updated_at": "2024-01-02T00:00:00Z",
-                    },
-                ],
-                1,
-            )
+            export_service._gene_service.list_genes_keyset.return_value = [
+                {
+                    "id": "gene-special",
+                    "gene_id": "GENE-SP",
+                    "symbol": "MED13",
+                    "name": 'Gene, "Quoted"',
+                    "description": "Line\nBreak",
+                    "gene_type": "protein_coding",
+                    "chromosome": "17",
+                    "start_position": 100,
+                    "end_position": 200,
+                    "ensembl_id": "ENSGSPECIAL",
+                    "ncbi_gene_id": 4321,
+                    "uniprot_id": "Q77777",
+                    "created_at": "2024-01-01T00:00:00Z",
+                    "updated_at": "2024-01-02T00:00:00Z",
+                },
+            ]
 
             result = list(
                 export_service.export_data(
@@ -841,3 +806,77 @@ class TestBulkExportServiceAdditional:
             rows = list(csv_reader)
             assert len(rows) >= 2  # Header + at least one data row
             assert rows[1][3] == 'Gene, "Quoted"'
+
+    class TestKeysetStreaming:
+        """Test keyset pagination and incremental output."""
+
+        def test_iter_keyset_batches_seeks_by_last_key(self) -> None:
+            """Each batch request resumes after the previous batch's last key."""
+            fetcher = Mock(side_effect=[[1, 2], [3, 4], [5]])
+
+            batches = list(iter_keyset_batches(fetcher, chunk_size=2, key=int))
+
+            assert batches == [[1, 2], [3, 4], [5]]
+            fetcher.assert_has_calls([call(None, 2), call(2, 2), call(4, 2)])
+
+        def test_iter_keyset_batches_respects_limit(self) -> None:
+            """A row cap shrinks the final request instead of over-fetching."""
+            fetcher = Mock(side_effect=[[1, 2], [3]])
+
+            batches = list(
+                iter_keyset_batches(fetcher, chunk_size=2, key=int, limit=3),
+            )
+
+            assert batches == [[1, 2], [3]]
+            fetcher.assert_has_calls([call(None, 2), call(2, 1)])
+
+        def test_gzip_export_streams_incrementally(
+            self,
+            export_service: BulkExportService,
+        ) -> None:
+            """Gzip chunks concatenate into one valid gzip stream."""
+            genes = [
+                SimpleNamespace(id=index, symbol=f"GENE{index}", name="x" * 512)
+                for index in range(1, 201)
+            ]
+            export_service._gene_service.list_genes_keyset.side_effect = [
+                genes[start : start + 50] for start in range(0, 200, 50)
+            ] + [[]]
+
+            result = list(
+                export_service.export_data(
+                    entity_type="genes",
+                    export_format=ExportFormat.JSONL,
+                    compression=CompressionFormat.GZIP,
+                    chunk_size=50,
+                ),
+            )
+
+            assert all(isinstance(chunk, bytes) for chunk in result)
+            lines = gzip.decompress(b"".join(result)).decode("utf-8").split("\n")
+            assert len(lines) == 200
+            assert json.loads(lines[-1])["symbol"] == "GENE200"
+
+        def test_export_applies_limit_filter(
+            self,
+            export_service: BulkExportService,
+        ) -> None:
+            """The route-level ``limit`` filter caps rows and is not forwarded."""
+            variant_service = export_service._variant_service
+            variant_service.list_variants_keyset.return_value = [
+                SimpleNamespace(id=1, variant_id="VAR1"),
+            ]
+
+            list(
+                export_service.export_data(
+                    entity_type="variants",
+                    export_format=ExportFormat.JSONL,
+                    filters={"limit": 1, "chromosome": "17"},
+                ),
+            )
+
+            variant_service.list_variants_keyset.assert_called_once_with(
+                after_id=None,
+                limit=1,
+                filters={"chromosome": "17"},
+            )
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pickle
+from uuid import uuid4
+
+from src.domain.entities.extraction_queue_item import ExtractionQueueItem
+from src.domain.entities.publication import Publication
+from src.domain.value_objects.identifiers import PublicationIdentifier
+from src.infrastructure.extraction.dictionary_matcher import (
+    DictionaryMatcher,
+    DictionaryTerm,
+    ExtractionVocabulary,
+    get_dictionary_matcher,
+)
+from src.infrastructure.extraction.rule_based_pubmed_extraction_processor import (
+    RuleBasedPubMedExtractionProcessor,
+)
+
+
+def _vocabulary(version: str = "test-v1") -> ExtractionVocabulary:
+    return ExtractionVocabulary.from_sources(
+        version,
+        gene_symbols={"MED13": "HGNC:22474", "MED13L": "HGNC:22962"},
+        gene_aliases={"MED13": ["THRAP1", "TRAP240"], "MED13L": ["PROSIT240"]},
+        phenotype_labels={
+            "HP:0001249": ["Intellectual disability", "Mental retardation"],
+            "HP:0001250": ["Seizure"],
+        },
+    )
+
+
+def test_matcher_finds_overlapping_terms_in_one_pass() -> None:
+    matcher = DictionaryMatcher(
+        ExtractionVocabulary(
+            "overlap",
+            (
+                DictionaryTerm("he", "gene", "1"),
+                DictionaryTerm("she", "gene", "2"),
+                DictionaryTerm("hers", "gene", "3"),
+            ),
+        ),
+    )
+
+    matches = matcher.find_all("she hers he")
+
+    assert [(match.text, match.start) for match in matches] == [
+        ("she", 0),
+        ("hers", 4),
+        ("he", 9),
+    ]
+
+
+def test_matcher_applies_word_boundary_and_case_rules() -> None:
+    matcher = DictionaryMatcher(_vocabulary())
+
+    text = "med13l and MED13 carriers (thrap1, TRAP240) had seizures; Seizure noted."
+    found = {(match.term.normalized_id, match.text) for match in matcher.find_all(text)}
+
+    assert found == {
+        ("HGNC:22962", "med13l"),
+        ("HGNC:22474", "MED13"),
+        ("HGNC:22474", "TRAP240"),
+        ("HP:0001250", "Seizure"),
+    }
+
+
+def test_matchers_are_shared_per_vocabulary_version() -> None:
+    first = get_dictionary_matcher(_vocabulary("shared-v1"))
+
+    assert get_dictionary_matcher(_vocabulary("shared-v1")) is first
+    assert get_dictionary_matcher(_vocabulary("shared-v2")) is not first
+
+
+def test_processor_reports_normalized_dictionary_facts() -> None:
+    processor = RuleBasedPubMedExtractionProcessor(vocabulary=_vocabulary())
+    publication = Publication(
+        identifier=PublicationIdentifier(pubmed_id="123456"),
+        title="TRAP240 variants cause mental retardation",
+        authors=("Doe J",),
+        journal="Test Journal",
+        publication_year=2024,
+    )
+    queue_item = ExtractionQueueItem(
+        id=uuid4(),
+        publication_id=1,
+        pubmed_id="123456",
+        source_id=uuid4(),
+        ingestion_job_id=uuid4(),
+    )
+
+    restored = pickle.loads(pickle.dumps(processor))  # noqa: S301 - own payload
+    result = restored.extract_publication(
+        queue_item=queue_item,
+        publication=publication,
+    )
+
+    assert result.facts == [
+        {
+            "fact_type": "gene",
+            "value": "MED13",
+            "normalized_id": "HGNC:22474",
+            "source": "title_abstract",
+            "attributes": {"matched_text": "TRAP240"},
+        },
+        {
+            "fact_type": "phenotype",
+            "value": "Intellectual disability",
+            "normalized_id": "HP:0001249",
+            "source": "title_abstract",
+            "attributes": {"matched_text": "mental retardation"},
+        },
+    ]
+    assert result.metadata["vocabulary_version"] == "test-v1"
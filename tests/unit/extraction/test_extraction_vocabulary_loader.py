@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.extraction_queue_item import ExtractionQueueItem
+from src.domain.entities.publication import Publication
+from src.domain.value_objects.identifiers import PublicationIdentifier
+from src.infrastructure.data_sources import PubMedSourceGateway
+from src.infrastructure.dependency_injection.container import DependencyContainer
+from src.infrastructure.extraction import load_extraction_vocabulary
+from src.infrastructure.factories import ingestion_scheduler_factory
+from src.infrastructure.factories.ingestion_scheduler_factory import (
+    build_ingestion_scheduling_service,
+)
+from src.infrastructure.ingest.pubmed_ingestor import PubMedIngestor
+from src.models.database import Base, GeneModel, PhenotypeModel
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db_session = sessionmaker(bind=engine)()
+    db_session.add_all(
+        [
+            GeneModel(gene_id="HGNC:22962", symbol="MED13L"),
+            PhenotypeModel(
+                hpo_id="HP:0001249",
+                hpo_term="Intellectual disability",
+                name="Intellectual disability",
+                synonyms=json.dumps(["Mental retardation"]),
+            ),
+        ],
+    )
+    db_session.commit()
+    try:
+        yield db_session
+    finally:
+        db_session.close()
+
+
+def _extract(processor):
+    publication = Publication(
+        identifier=PublicationIdentifier(pubmed_id="123456"),
+        title="MED13L and MED13 variants cause mental retardation",
+        authors=("Doe J",),
+        journal="Test Journal",
+        publication_year=2024,
+    )
+    queue_item = ExtractionQueueItem(
+        id=uuid4(),
+        publication_id=1,
+        pubmed_id="123456",
+        source_id=uuid4(),
+        ingestion_job_id=uuid4(),
+    )
+    result = processor.extract_publication(
+        queue_item=queue_item,
+        publication=publication,
+    )
+    return {(fact["fact_type"], fact.get("normalized_id")) for fact in result.facts}
+
+
+EXPECTED_FACTS = {
+    ("gene", "HGNC:22962"),
+    ("gene", "MED13"),
+    ("phenotype", "HP:0001249"),
+}
+
+
+def test_vocabulary_version_tracks_table_contents(session) -> None:
+    first = load_extraction_vocabulary(session)
+    assert load_extraction_vocabulary(session).version == first.version
+
+    session.add(GeneModel(gene_id="HGNC:1100", symbol="BRCA1"))
+    session.commit()
+
+    assert load_extraction_vocabulary(session).version != first.version
+
+
+def test_scheduler_factory_processor_uses_stored_vocabulary(
+    session,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    # The PubMed gateway's ingestor creates its raw data directory on start.
+    monkeypatch.setattr(
+        ingestion_scheduler_factory,
+        "PubMedSourceGateway",
+        lambda: PubMedSourceGateway(PubMedIngestor(raw_data_dir=tmp_path)),
+    )
+    service = build_ingestion_scheduling_service(session=session)
+
+    processor = service._extraction_runner_service._processor
+
+    assert _extract(processor) == EXPECTED_FACTS
+
+
+def test_container_runner_processor_uses_stored_vocabulary(session) -> None:
+    container = DependencyContainer(database_url="sqlite+aiosqlite:///:memory:")
+
+    runner = container.create_extraction_runner_service(session)
+
+    assert _extract(runner._processor) == EXPECTED_FACTS
@@ -0,0 +1,133 @@
+"""Tests for the batched audit log buffer."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.application.services.audit_service import AuditTrailService
+from src.infrastructure.observability.audit_log_buffer import (
+    AuditBufferSettings,
+    AuditLogBuffer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.orm import Session
+
+    from src.models.database.audit import AuditLog
+
+
+class StubSession:
+    def rollback(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class RecordingAuditRepository:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def record(self, db: Session, log: AuditLog) -> AuditLog:  # pragma: no cover
+        self.record_many(db, [log])
+        return log
+
+    def record_many(self, db: Session, logs: Sequence[AuditLog]) -> None:
+        self.batches.append([log.entity_id for log in logs])
+
+
+def _log(index: int) -> AuditLog:
+    return AuditTrailService.build_log(
+        action="phi.read",
+        target=("http_request", f"/resource/{index}"),
+        actor_id=None,
+    )
+
+
+def _buffer(
+    repository: RecordingAuditRepository,
+    **settings: float,
+) -> AuditLogBuffer:
+    return AuditLogBuffer(
+        session_factory=StubSession,  # type: ignore[arg-type]
+        repository=repository,
+        settings=AuditBufferSettings(**settings),  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_in_batches_and_on_close() -> None:
+    repository = RecordingAuditRepository()
+    buffer = _buffer(repository, flush_interval_ms=10_000, max_batch_size=3)
+
+    for index in range(5):
+        await buffer.enqueue(_log(index))
+    await asyncio.sleep(0.05)
+
+    assert repository.batches == [[f"/resource/{index}" for index in range(3)]]
+
+    await buffer.close()
+
+    assert repository.batches[1] == ["/resource/3", "/resource/4"]
+    assert buffer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_after_interval() -> None:
+    repository = RecordingAuditRepository()
+    buffer = _buffer(repository, flush_interval_ms=20, max_batch_size=100)
+
+    await buffer.enqueue(_log(1))
+    await asyncio.sleep(0.2)
+
+    assert repository.batches == [["/resource/1"]]
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_writes_directly_instead_of_dropping() -> None:
+    repository = RecordingAuditRepository()
+    buffer = _buffer(
+        repository,
+        flush_interval_ms=10_000,
+        max_batch_size=100,
+        max_pending=1,
+        enqueue_timeout_seconds=0.01,
+    )
+
+    await buffer.enqueue(_log(1))
+    await buffer.enqueue(_log(2))
+    await buffer.close()
+
+    written = [entity for batch in repository.batches for entity in batch]
+    assert sorted(written) == ["/resource/1", "/resource/2"]
+    assert buffer.direct_writes <= 1
+
+
+def test_close_from_another_loop_persists_the_queue() -> None:
+    repository = RecordingAuditRepository()
+    buffer = _buffer(repository, flush_interval_ms=10_000, max_batch_size=2)
+
+    async def enqueue_all() -> None:
+        for index in range(5):
+            await buffer.enqueue(_log(index))
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(enqueue_all())
+        # Closing on a different loop must not await the other loop's flusher
+        asyncio.run(buffer.close())
+    finally:
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
+
+    assert ["/resource/2", "/resource/3", "/resource/4"] in repository.batches
+    assert buffer.pending == 0
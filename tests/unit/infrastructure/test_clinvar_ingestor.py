@@ -0,0 +1,146 @@
+"""Tests for batched ClinVar EFetch and VCV parsing."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from httpx import Response
+
+from src.domain.transform.parsers.clinvar_parser import ClinVarParser
+from src.infrastructure.ingest.clinvar_ingestor import (
+    EFETCH_BATCH_SIZE,
+    ClinVarIngestor,
+)
+
+VARIATION_ARCHIVE = """
+<VariationArchive VariationID="{vid}" VariationName="NM_005121.3(MED13):c.{vid}A&gt;G"
+    VariationType="single nucleotide variant" Accession="VCV{vid:09d}"
+    DateLastUpdated="2024-05-01">
+  <ClassifiedRecord>
+    <SimpleAllele>
+      <GeneList>
+        <Gene Symbol="MED13" FullName="mediator complex subunit 13" GeneID="9969"/>
+      </GeneList>
+      <Location>
+        <SequenceLocation Assembly="GRCh38" Chr="17" start="61942605"
+            stop="61942605" referenceAlleleVCF="A" alternateAlleleVCF="G"/>
+      </Location>
+      <HGVSlist>
+        <HGVS><NucleotideExpression>
+          <Expression>NM_005121.3:c.{vid}A&gt;G</Expression>
+        </NucleotideExpression></HGVS>
+        <HGVS><NucleotideExpression>
+          <Expression>NM_005121.3:c.{vid}A&gt;G</Expression>
+        </NucleotideExpression></HGVS>
+      </HGVSlist>
+    </SimpleAllele>
+    <Classifications>
+      <GermlineClassification>
+        <ReviewStatus>criteria provided, single submitter</ReviewStatus>
+        <Description>Pathogenic</Description>
+        <ConditionList>
+          <TraitSet>
+            <Trait><Name>
+              <ElementValue Type="Preferred">Intellectual disability</ElementValue>
+            </Name></Trait>
+          </TraitSet>
+        </ConditionList>
+      </GermlineClassification>
+    </Classifications>
+  </ClassifiedRecord>
+</VariationArchive>
+"""
+
+
+def _vcv_response(variant_ids: list[int]) -> Response:
+    archives = "".join(VARIATION_ARCHIVE.format(vid=vid) for vid in variant_ids)
+    return Response(
+        200,
+        text=f"<ClinVarResult-Set>{archives}</ClinVarResult-Set>",
+        headers={"content-type": "text/xml", "date": "Thu, 01 Aug 2024"},
+    )
+
+
+async def test_batch_is_fetched_in_one_request(tmp_path: Path) -> None:
+    ingestor = ClinVarIngestor(tmp_path)
+
+    with patch.object(
+        ingestor,
+        "_make_request",
+        return_value=_vcv_response([101, 102, 103]),
+    ) as mock_request:
+        records = await ingestor._fetch_variant_details(["101", "102", "103"])
+
+    assert mock_request.call_count == 1
+    assert mock_request.call_args[1]["params"]["id"] == "101,102,103"
+    assert [record["clinvar_id"] for record in records] == ["101", "102", "103"]
+    assert records[0]["fetched_at"] == "Thu, 01 Aug 2024"
+    assert records[0]["parsed_data"] == {
+        "accession": "VCV000000101",
+        "variation_name": "NM_005121.3(MED13):c.101A>G",
+        "gene_symbol": "MED13",
+        "variant_type": "single nucleotide variant",
+        "clinical_significance": "Pathogenic",
+        "hgvs_notations": ["NM_005121.3:c.101A>G"],
+        "conditions": ["Intellectual disability"],
+        "review_status": "criteria provided, single submitter",
+    }
+
+
+async def test_records_remain_readable_by_the_clinvar_parser(tmp_path: Path) -> None:
+    ingestor = ClinVarIngestor(tmp_path)
+
+    with patch.object(
+        ingestor,
+        "_make_request",
+        return_value=_vcv_response([101, 102]),
+    ):
+        records = await ingestor._fetch_variant_details(["101", "102"])
+
+    variant = ClinVarParser().parse_raw_data(records[1])
+    assert variant is not None
+    assert variant.variant_id == "102"
+    assert variant.gene_symbol == "MED13"
+    assert variant.chromosome == "17"
+    assert variant.raw_xml.count("<VariationArchive") == 1
+
+
+async def test_unparseable_batch_is_skipped(tmp_path: Path) -> None:
+    ingestor = ClinVarIngestor(tmp_path)
+
+    with patch.object(
+        ingestor,
+        "_make_request",
+        return_value=Response(200, text="<ClinVarResult-Set><Variation"),
+    ):
+        assert await ingestor._fetch_variant_details(["101"]) == []
+
+
+async def test_fetch_data_splits_ids_into_efetch_batches(tmp_path: Path) -> None:
+    ingestor = ClinVarIngestor(tmp_path)
+    variant_ids = list(range(1, 2 * EFETCH_BATCH_SIZE + 11))
+    search = Response(
+        200,
+        json={
+            "esearchresult": {
+                "idlist": [str(vid) for vid in variant_ids],
+                "count": str(len(variant_ids)),
+            },
+        },
+    )
+
+    async def respond(
+        _method: str,
+        endpoint: str,
+        params: dict[str, str],
+    ) -> Response:
+        if endpoint == "esearch.fcgi":
+            return search
+        return _vcv_response([int(vid) for vid in params["id"].split(",")])
+
+    with patch.object(ingestor, "_make_request", side_effect=respond) as mock_request:
+        records = await ingestor.fetch_data()
+
+    assert mock_request.call_count == 4
+    assert [record["clinvar_id"] for record in records] == [
+        str(vid) for vid in variant_ids
+    ]
@@ -4,17 +4,25 @@ from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.database.seed import DEFAULT_RESEARCH_SPACE_ID
+from src.domain.entities.data_discovery_session import (
+    QueryParameterType,
+    SourceCatalogEntry,
+)
 from src.infrastructure.repositories.data_discovery_repository_impl import (
     SQLAlchemyDataDiscoverySessionRepository,
     SQLAlchemyQueryTestResultRepository,
+    SQLAlchemySourceCatalogRepository,
 )
 from src.infrastructure.repositories.data_discovery_repository_utils import (
     owner_identifier_candidates,
 )
+from src.infrastructure.repositories.source_catalog_index_cache import (
+    SourceCatalogIndexCache,
+)
 from src.models.database.base import Base
 from src.models.database.data_discovery import (
     DataDiscoverySessionModel,
@@ -155,3 +163,40 @@ def test_owner_identifier_candidates_include_numeric_with_legacy_enabled() -> No
 
     assert str(owner_uuid) in candidates
     assert "1" in candidates
+
+
+def test_catalog_reads_are_served_from_the_index(sa_session: Session) -> None:
+    """Catalog queries hit the database once, and writes update the index."""
+    cache = SourceCatalogIndexCache()
+    repo = SQLAlchemySourceCatalogRepository(sa_session, index_cache=cache)
+    repo.save(
+        SourceCatalogEntry.model_validate(
+            {
+                "id": "clinvar",
+                "name": "ClinVar",
+                "category": "Genomic Variant Databases",
+                "description": "Clinical variant interpretations",
+                "param_type": QueryParameterType.GENE,
+            },
+        ),
+    )
+    statements: list[str] = []
+    event.listen(
+        sa_session.get_bind(),
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    assert [entry.id for entry in repo.search("clinvr")] == ["clinvar"]
+    assert repo.find_by_id("clinvar") is not None
+    assert len(repo.find_by_category("Genomic Variant Databases")) == 1
+    assert len(statements) == 1
+
+    assert repo.update_usage_stats("clinvar", success=True)
+    other_repo = SQLAlchemySourceCatalogRepository(sa_session, index_cache=cache)
+    statements.clear()
+    entry = other_repo.find_by_id("clinvar")
+
+    assert entry is not None
+    assert entry.usage_count == 1
+    assert statements == []
@@ -0,0 +1,171 @@
+"""Tests for cached, filter-aware totals of paginated entity lists."""
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.domain.repositories.base import TotalCount
+from src.infrastructure.repositories import (
+    EntityCountCache,
+    SqlAlchemyGeneRepository,
+    SqlAlchemyVariantRepository,
+)
+from src.models.database import Base, GeneModel, VariantModel
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def session_factory() -> Iterator[sessionmaker[Session]]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        _seed(db)
+    try:
+        yield factory
+    finally:
+        engine.dispose()
+
+
+def _seed(db: Session) -> None:
+    gene = GeneModel(gene_id="GENE001", symbol="MED13", name="mediator 13")
+    db.add_all(
+        [
+            gene,
+            GeneModel(gene_id="GENE002", symbol="MED12", name="mediator 12"),
+            GeneModel(gene_id="GENE003", symbol="CDK8", name="cyclin kinase 8"),
+        ],
+    )
+    db.flush()
+    db.add_all(
+        VariantModel(
+            gene_id=gene.id,
+            variant_id=f"chr17:{index + 1}:A>G",
+            chromosome="17",
+            position=index + 1,
+            reference_allele="A",
+            alternate_allele="G",
+            clinical_significance="pathogenic" if index < 3 else "benign",
+        )
+        for index in range(10)
+    )
+    db.commit()
+
+
+def _add_gene(db: Session, symbol: str) -> None:
+    db.add(GeneModel(gene_id=f"GENE-{symbol}", symbol=symbol, name=symbol))
+    db.flush()
+
+
+def _count_queries(statements: list[str]) -> int:
+    return sum("count(" in statement.lower() for statement in statements)
+
+
+def test_total_matches_the_filtered_page(
+    session_factory: sessionmaker[Session],
+) -> None:
+    cache = EntityCountCache()
+    with session_factory() as db:
+        repository = SqlAlchemyVariantRepository(db, count_cache=cache)
+
+        page, total = repository.paginate_variants(
+            1,
+            2,
+            "position",
+            "asc",
+            filters={"clinical_significance": "pathogenic"},
+        )
+        _, unfiltered = repository.paginate_variants(1, 2, "position", "asc")
+
+    assert len(page) == 2
+    assert total == TotalCount(3)
+    assert unfiltered == TotalCount(10)
+
+
+def test_repeated_totals_are_served_from_the_cache(
+    session_factory: sessionmaker[Session],
+    count_statements,
+) -> None:
+    cache = EntityCountCache()
+    with session_factory() as db:
+        repository = SqlAlchemyGeneRepository(db, count_cache=cache)
+        with count_statements(db.get_bind()) as log:
+            first = repository.paginate_genes(1, 10, "symbol", "asc", search="MED")
+            second = repository.paginate_genes(1, 10, "symbol", "asc", search="MED")
+            other = repository.paginate_genes(1, 10, "symbol", "asc", search="CDK")
+
+    assert first[1] == second[1] == TotalCount(2)
+    assert other[1] == TotalCount(1)
+    # One count per distinct filter
+    assert _count_queries(log.statements) == 2
+
+
+def test_committed_writes_invalidate_cached_totals(
+    session_factory: sessionmaker[Session],
+) -> None:
+    cache = EntityCountCache()
+    with session_factory() as reader, session_factory() as writer:
+        repository = SqlAlchemyGeneRepository(reader, count_cache=cache)
+        assert repository.paginate_genes(1, 10, "symbol", "asc")[1].value == 3
+
+        _add_gene(writer, "MED12L")
+        writer.commit()
+        reader.rollback()
+
+        assert repository.paginate_genes(1, 10, "symbol", "asc")[1].value == 4
+
+
+def test_uncommitted_writes_bypass_the_cache(
+    session_factory: sessionmaker[Session],
+) -> None:
+    cache = EntityCountCache()
+    with session_factory() as writer, session_factory() as reader:
+        writing = SqlAlchemyGeneRepository(writer, count_cache=cache)
+        _add_gene(writer, "MED12L")
+
+        # The writer sees its own pending row; nobody else may see it cached
+        assert writing.paginate_genes(1, 10, "symbol", "asc")[1].value == 4
+        writer.rollback()
+        reading = SqlAlchemyGeneRepository(reader, count_cache=cache)
+        assert reading.paginate_genes(1, 10, "symbol", "asc")[1].value == 3
+
+
+def test_cached_totals_expire_after_the_ttl(
+    session_factory: sessionmaker[Session],
+) -> None:
+    clock = FakeClock()
+    cache = EntityCountCache(ttl_seconds=30.0, clock=clock)
+    with session_factory() as db:
+        assert cache.count(db, GeneModel).value == 3
+        # A write from another process never reaches the invalidation hooks
+        db.connection().exec_driver_sql(
+            "INSERT INTO genes (gene_id, symbol, gene_type) "
+            "VALUES ('GENE-X', 'MEDX', 'protein_coding')",
+        )
+
+        clock.now = 29.0
+        assert cache.count(db, GeneModel).value == 3
+        clock.now = 31.0
+        assert cache.count(db, GeneModel).value == 4
+
+
+def test_sqlite_totals_are_always_exact(
+    session_factory: sessionmaker[Session],
+) -> None:
+    cache = EntityCountCache(estimate_above=0)
+    with session_factory() as db:
+        assert cache.count(db, VariantModel) == TotalCount(10, exact=True)
@@ -0,0 +1,177 @@
+"""Tests for ranked full-text search in the entity repositories."""
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.infrastructure.repositories import (
+    SqlAlchemyEvidenceRepository,
+    SqlAlchemyPhenotypeRepository,
+    SqlAlchemyPublicationRepository,
+)
+from src.infrastructure.repositories.full_text_search import full_text_search
+from src.models.database import (
+    Base,
+    EvidenceModel,
+    GeneModel,
+    PhenotypeModel,
+    PublicationModel,
+    VariantModel,
+)
+from src.models.database.full_text import PUBLICATION_SEARCH
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def _publication(
+    pubmed_id: str,
+    title: str,
+    abstract: str | None = None,
+) -> PublicationModel:
+    return PublicationModel(
+        pubmed_id=pubmed_id,
+        title=title,
+        authors='["Doe J"]',
+        journal="Journal",
+        publication_year=2024,
+        abstract=abstract,
+    )
+
+
+def test_publications_are_ranked_by_weighted_matches(session: Session) -> None:
+    session.add_all(
+        [
+            _publication("1", "Cohort study", "MED13 variants cause seizures"),
+            _publication("2", "Seizures in MED13 syndrome"),
+            _publication("3", "Unrelated gene report", "Nothing to see"),
+        ],
+    )
+    session.commit()
+    repository = SqlAlchemyPublicationRepository(session)
+
+    results = repository.search_publications("seizure")
+
+    # Stemmed matches only, with a title match above an abstract match
+    assert [publication.title for publication in results] == [
+        "Seizures in MED13 syndrome",
+        "Cohort study",
+    ]
+    assert len(repository.search_publications("MED13 syndrome")) == 1
+    assert len(repository.search_publications("")) == 3
+
+
+def test_query_syntax_is_matched_as_plain_words(session: Session) -> None:
+    session.add(_publication("1", "Heart defects", "NEAR the septum"))
+    session.commit()
+    repository = SqlAlchemyPublicationRepository(session)
+
+    assert len(repository.search_publications('heart" OR NEAR(')) == 0
+    assert len(repository.search_publications('"heart" -defects*')) == 1
+
+
+def test_shadow_table_follows_updates_and_deletes(session: Session) -> None:
+    phenotype = PhenotypeModel(
+        hpo_id="HP:0001250",
+        hpo_term="Seizure",
+        name="Seizure",
+        synonyms='["Epileptic seizure"]',
+    )
+    session.add(phenotype)
+    session.commit()
+    repository = SqlAlchemyPhenotypeRepository(session)
+    assert [p.name for p in repository.search_phenotypes("epileptic")] == ["Seizure"]
+
+    phenotype.synonyms = '["Convulsion"]'
+    session.commit()
+    assert repository.search_phenotypes("epileptic") == []
+    assert len(repository.search_phenotypes("convulsions")) == 1
+
+    session.delete(phenotype)
+    session.commit()
+    assert repository.search_phenotypes("convulsion") == []
+
+
+def test_evidence_search_keeps_filters(session: Session) -> None:
+    gene = GeneModel(gene_id="GENE001", symbol="MED13")
+    session.add(gene)
+    session.flush()
+    variant = VariantModel(
+        gene_id=gene.id,
+        variant_id="chr17:1:A>G",
+        chromosome="17",
+        position=1,
+        reference_allele="A",
+        alternate_allele="G",
+    )
+    phenotype = PhenotypeModel(hpo_id="HP:0001250", hpo_term="Seizure", name="Seizure")
+    session.add_all([variant, phenotype])
+    session.flush()
+    for level in ("strong", "supporting"):
+        session.add(
+            EvidenceModel(
+                variant_id=variant.id,
+                phenotype_id=phenotype.id,
+                description=f"Recurrent seizures reported ({level})",
+                evidence_level=level,
+                evidence_type="clinical_report",
+                confidence_score=0.5,
+            ),
+        )
+    session.commit()
+    repository = SqlAlchemyEvidenceRepository(session)
+
+    results = repository.search_evidence(
+        "recurrent seizure",
+        filters={"evidence_level": "strong"},
+    )
+
+    assert [evidence.description for evidence in results] == [
+        "Recurrent seizures reported (strong)",
+    ]
+
+
+def test_existing_rows_are_indexed_when_the_index_is_built(session: Session) -> None:
+    connection = session.connection()
+    PUBLICATION_SEARCH.drop(connection)
+    session.add(_publication("1", "Mediator complex review"))
+    session.flush()
+    repository = SqlAlchemyPublicationRepository(session)
+    # Without the shadow table the substring match still answers
+    assert len(repository.search_publications("complex rev")) == 1
+
+    PUBLICATION_SEARCH.create(connection, rebuild=True)
+
+    assert len(repository.search_publications("mediator")) == 1
+    assert repository.search_publications("complex rev") == []
+
+
+def test_postgres_search_ranks_the_generated_vector() -> None:
+    bind = SimpleNamespace(dialect=postgresql.dialect())
+    postgres_session = SimpleNamespace(get_bind=lambda: bind)
+
+    stmt = full_text_search(
+        postgres_session,
+        select(PublicationModel),
+        PublicationModel,
+        "Seizures, MED13",
+        fallback=[PublicationModel.title],
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "publications.search_vector @@ plainto_tsquery" in sql
+    assert "ORDER BY ts_rank(publications.search_vector, plainto_tsquery" in sql
+    assert "ILIKE" not in sql
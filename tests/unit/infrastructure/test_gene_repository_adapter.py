@@ -59,6 +59,6 @@ def test_paginate_genes_returns_domain_entities(test_session):
         sort_order="asc",
     )
 
-    assert total == 3
+    assert total.value == 3
     assert len(results) == 2
     assert all(isinstance(gene, Gene) for gene in results)
@@ -0,0 +1,151 @@
+"""Tests for the shared per-host rate limiters."""
+
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.http import HostBudget, HostRateLimiters, RateLimiter
+from src.infrastructure.http import rate_limits as rate_limits_module
+from src.infrastructure.ingest.clinvar_ingestor import ClinVarIngestor
+
+NCBI_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeBackend:
+    window_seconds = 1
+
+    def __init__(self, denials: int) -> None:
+        self.denials = denials
+        self.calls: list[tuple[str, int]] = []
+        self.closed = False
+
+    async def allow(self, key: str, capacity: int) -> tuple[bool, int]:
+        self.calls.append((key, capacity))
+        if self.denials:
+            self.denials -= 1
+            return False, 1
+        return True, 0
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(rate_limits_module.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+async def test_waits_exactly_for_the_next_token(sleeps: list[float]) -> None:
+    clock = FakeClock()
+    limiter = RateLimiter("host:x", HostBudget(10, burst=2), clock=clock)
+
+    for _ in range(4):
+        await limiter.wait_for_token()
+        clock.now += sleeps[-1] if sleeps else 0.0
+
+    assert sleeps == pytest.approx([0.1, 0.1])
+    assert limiter.waits == 2
+    assert limiter.waited_seconds == pytest.approx(0.2)
+
+
+async def test_concurrent_callers_reserve_tokens_in_order(
+    sleeps: list[float],
+) -> None:
+    limiter = RateLimiter("host:x", HostBudget(10, burst=1), clock=FakeClock())
+
+    for _ in range(3):
+        await limiter.wait_for_token()
+
+    assert sleeps == pytest.approx([0.1, 0.2])
+
+
+def test_acquire_does_not_wait() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter("host:x", HostBudget(2, burst=1), clock=clock)
+
+    assert limiter.acquire()
+    assert not limiter.acquire()
+    clock.now += 0.5
+    assert limiter.acquire()
+
+
+def test_limiters_are_shared_per_host() -> None:
+    limiters = HostRateLimiters({})
+
+    first = limiters.limiter_for("https://rest.uniprot.org/uniprotkb/search", 120)
+    second = limiters.limiter_for("https://rest.uniprot.org/uniprotkb/P12345", 600)
+
+    assert first is second
+    assert first.requests_per_minute == pytest.approx(120)
+    assert limiters.limiter_for("https://hpo.jax.org/api") is not first
+
+
+def test_unknown_host_uses_the_strictest_declared_rate() -> None:
+    limiters = HostRateLimiters({})
+
+    limiter = limiters.limiter_for("https://example.org/a", 600)
+    limiters.limiter_for("https://example.org/b", 30)
+
+    assert limiter.requests_per_minute == pytest.approx(30)
+
+
+def test_known_host_ignores_declared_rate() -> None:
+    limiters = HostRateLimiters({"eutils.ncbi.nlm.nih.gov": HostBudget(3, burst=3)})
+
+    limiter = limiters.limiter_for(NCBI_URL, 6000)
+    limiters.limiter_for(NCBI_URL, 10)
+
+    assert limiter.budget == HostBudget(3, burst=3)
+
+
+def test_only_budgeted_hosts_have_a_budgeted_limiter() -> None:
+    limiters = HostRateLimiters({"eutils.ncbi.nlm.nih.gov": HostBudget(3, burst=3)})
+
+    assert limiters.budgeted_limiter_for("https://example.org/a") is None
+    declared = limiters.limiter_for("https://example.org/b", 30)
+
+    assert limiters.budgeted_limiter_for("https://example.org/a") is declared
+    assert limiters.budgeted_limiter_for(NCBI_URL) is limiters.limiter_for(NCBI_URL)
+
+
+def test_ncbi_quota_follows_the_api_key(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.delenv("NCBI_API_KEY", raising=False)
+    without_key = HostRateLimiters().limiter_for(NCBI_URL)
+    monkeypatch.setenv("NCBI_API_KEY", "secret")
+    with_key = HostRateLimiters().limiter_for(NCBI_URL)
+
+    assert without_key.budget.requests_per_second == 3
+    assert with_key.budget.requests_per_second == 10
+    assert ClinVarIngestor(tmp_path).default_params["api_key"] == "secret"
+
+
+async def test_shared_backend_is_consulted(sleeps: list[float]) -> None:
+    backend = FakeBackend(denials=1)
+    limiters = HostRateLimiters({}, clock=FakeClock())
+    limiters.use_backend(backend)
+
+    await limiters.acquire("https://example.org/a", 120)
+
+    assert backend.calls == [("host:example.org", 2), ("host:example.org", 2)]
+    assert sleeps == [1]
+
+    await limiters.aclose()
+    assert backend.closed
+    assert limiters.limiter_for("https://example.org/a").backend is None
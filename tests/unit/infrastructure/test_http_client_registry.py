@@ -0,0 +1,123 @@
+"""Tests for the shared, per-origin HTTP client registry."""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+from aiohttp import web
+
+from src.domain.entities.user_data_source import SourceConfiguration
+from src.infrastructure.data_sources import HttpxAPISourceGateway
+from src.infrastructure.http import (
+    HostRateLimiters,
+    HttpClientRegistry,
+    HttpPoolSettings,
+    origin_of,
+)
+from src.infrastructure.ingest.clinvar_ingestor import ClinVarIngestor
+from src.infrastructure.ingest.pubmed_ingestor import PubMedIngestor
+
+
+def _mock_registry() -> HttpClientRegistry:
+    return HttpClientRegistry(
+        transport=httpx.MockTransport(lambda _request: httpx.Response(200)),
+    )
+
+
+@pytest.fixture
+async def stub_url() -> AsyncIterator[str]:
+    async def handler(_request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/ping", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]  # noqa: SLF001 - ephemeral port
+    yield f"http://127.0.0.1:{port}/ping"
+    await runner.cleanup()
+
+
+def test_origin_ignores_path_and_query() -> None:
+    assert origin_of("https://eutils.ncbi.nlm.nih.gov/entrez/eutils?db=x") == (
+        "https://eutils.ncbi.nlm.nih.gov"
+    )
+    assert origin_of("http://localhost:8080/a") == "http://localhost:8080"
+
+
+async def test_clients_are_shared_per_origin() -> None:
+    registry = _mock_registry()
+
+    first = registry.client_for("https://rest.uniprot.org/uniprotkb/search")
+    second = registry.client_for("https://rest.uniprot.org/uniprotkb/P12345")
+    other = registry.client_for("https://eutils.ncbi.nlm.nih.gov/entrez/eutils")
+
+    assert first is second
+    assert first is not other
+    assert len(registry) == 2
+    await registry.aclose()
+    assert first.is_closed
+    assert len(registry) == 0
+
+
+async def test_closed_clients_are_replaced() -> None:
+    registry = _mock_registry()
+    client = registry.client_for("https://hpo.jax.org/api")
+    await client.aclose()
+
+    assert registry.client_for("https://hpo.jax.org/api") is not client
+    await registry.aclose()
+
+
+async def test_stats_count_connection_reuse(stub_url: str) -> None:
+    registry = HttpClientRegistry(HttpPoolSettings(http2=False))
+    client = registry.client_for(stub_url)
+
+    for _ in range(5):
+        response = await client.get(stub_url)
+        assert response.status_code == 200
+    await registry.aclose()
+
+    stats = registry.stats()[origin_of(stub_url)]
+    assert stats.requests == 5
+    assert stats.connections_opened == 1
+    assert stats.reused == 4
+    assert stats.reuse_ratio == pytest.approx(0.8)
+
+
+async def test_ingestors_for_a_host_share_one_client(tmp_path: Path) -> None:
+    registry = _mock_registry()
+    clinvar = ClinVarIngestor(tmp_path / "clinvar")
+    pubmed = PubMedIngestor(tmp_path / "pubmed")
+    clinvar.http_clients = registry
+    pubmed.http_clients = registry
+
+    async with clinvar, pubmed:
+        assert clinvar.client is pubmed.client
+
+    assert not clinvar.client.is_closed
+    await registry.aclose()
+
+
+async def test_gateway_reuses_connections_across_calls(stub_url: str) -> None:
+    registry = HttpClientRegistry(HttpPoolSettings(http2=False))
+    gateway = HttpxAPISourceGateway(
+        http_clients=registry,
+        rate_limiters=HostRateLimiters({}),
+    )
+    configuration = SourceConfiguration.model_validate(
+        {"url": stub_url, "requests_per_minute": 1000},
+    )
+
+    connection = await gateway.test_connection(configuration)
+    fetched = await gateway.fetch_data(configuration)
+    await registry.aclose()
+
+    assert connection.success
+    assert fetched.success
+    stats = registry.stats()[origin_of(stub_url)]
+    assert stats.connections_opened == 1
+    assert stats.requests >= 2
@@ -37,3 +37,66 @@ def test_publication_repository_roundtrip(test_session):
 
     search_results = repository.search_publications("MED13")
     assert any(result.identifier.pubmed_id == "12345678" for result in search_results)
+
+
+def _publication(
+    pmid: str | None,
+    title: str,
+    doi: str | None = None,
+) -> Publication:
+    return Publication(
+        identifier=PublicationIdentifier(pubmed_id=pmid, doi=doi),
+        title=title,
+        authors=("Doe J",),
+        journal="Genome Research",
+        publication_year=2022,
+    )
+
+
+def test_publication_repository_upsert_many(test_session):
+    repository = SqlAlchemyPublicationRepository(test_session)
+    existing = repository.create(_publication("100", "Original title"))
+
+    result = repository.upsert_many(
+        [
+            _publication("100", "Updated title"),
+            _publication("200", "First draft"),
+            _publication("200", "New article"),
+            _publication(None, "Unindexed article"),
+        ],
+        batch_size=2,
+    )
+
+    assert result.created == 2
+    assert result.updated == 2
+    assert repository.count() == 3
+    updated = repository.find_by_pmid("100")
+    assert updated is not None
+    assert updated.title == "Updated title"
+    created = repository.find_by_pmid("200")
+    assert created is not None
+    assert created.id in result.created_ids
+    assert sorted(result.updated_ids) == sorted([existing.id, created.id])
+    assert created.title == "New article"
+
+
+def test_publication_repository_upsert_many_skips_doi_clashes(test_session):
+    repository = SqlAlchemyPublicationRepository(test_session)
+    holder = repository.create(_publication("100", "DOI holder", doi="10.1000/med13"))
+
+    result = repository.upsert_many(
+        [
+            _publication("200", "Clashing article", doi="10.1000/med13"),
+            _publication("300", "Unrelated article"),
+            _publication("100", "DOI holder, revised", doi="10.1000/med13"),
+        ],
+    )
+
+    assert result.skipped == 1
+    assert result.created == 1
+    assert result.updated_ids == (holder.id,)
+    assert repository.find_by_pmid("200") is None
+    assert repository.find_by_pmid("300") is not None
+    revised = repository.find_by_pmid("100")
+    assert revised is not None
+    assert revised.title == "DOI holder, revised"
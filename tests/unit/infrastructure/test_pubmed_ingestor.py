@@ -0,0 +1,154 @@
+"""Tests for PubMed history-server paging and streaming XML parsing."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+from defusedxml import EntitiesForbidden
+
+from src.domain.transform.raw_spool import iter_raw_records
+from src.infrastructure.http import HostBudget, HostRateLimiters, HttpClientRegistry
+from src.infrastructure.ingest.pubmed_ingestor import (
+    EFETCH_PAGE_SIZE,
+    CitationStream,
+    PubMedIngestor,
+)
+
+DOCTYPE = (
+    '<?xml version="1.0" ?>\n'
+    '<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle, 1st January '
+    '2024//EN" "https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_240101.dtd">\n'
+)
+
+
+def _article(pmid: int) -> str:
+    return (
+        "<PubmedArticle><MedlineCitation>"
+        f"<PMID>{pmid}</PMID>"
+        "<Article><ArticleTitle>MED13 variant study</ArticleTitle>"
+        "<Abstract><AbstractText>MED13 haploinsufficiency</AbstractText></Abstract>"
+        "</Article>"
+        "</MedlineCitation><PubmedData/></PubmedArticle>"
+    )
+
+
+def _article_set(pmids: range) -> str:
+    articles = "".join(_article(pmid) for pmid in pmids)
+    return f"{DOCTYPE}<PubmedArticleSet>{articles}</PubmedArticleSet>"
+
+
+def _ingestor(transport: httpx.MockTransport, raw_data_dir: Path) -> PubMedIngestor:
+    ingestor = PubMedIngestor(raw_data_dir)
+    ingestor.http_clients = HttpClientRegistry(transport=transport)
+    ingestor.rate_limiter = HostRateLimiters(
+        {"eutils.ncbi.nlm.nih.gov": HostBudget(1_000, burst=1_000)},
+    ).limiter_for(ingestor.base_url)
+    return ingestor
+
+
+def _history_transport(
+    count: int,
+    efetch_calls: list[httpx.QueryParams],
+) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if request.url.path.endswith("esearch.fcgi"):
+            assert params["usehistory"] == "y"
+            return httpx.Response(
+                200,
+                json={
+                    "esearchresult": {
+                        "count": str(count),
+                        "webenv": "MCID_1",
+                        "querykey": "1",
+                        "idlist": [],
+                    },
+                },
+            )
+        efetch_calls.append(params)
+        start = int(params["retstart"])
+        return httpx.Response(
+            200,
+            text=_article_set(range(start, start + int(params["retmax"]))),
+            headers={"date": "Thu, 01 Aug 2024"},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_citation_stream_parses_byte_chunks() -> None:
+    document = _article_set(range(1, 6)).encode()
+    stream = CitationStream()
+
+    pmids: list[str | None] = []
+    for offset in range(0, len(document), 7):
+        pmids.extend(
+            citation.findtext("PMID")
+            for citation in stream.feed(document[offset : offset + 7])
+        )
+        # Finished articles are dropped from the tree as parsing proceeds
+        assert stream._root is None or len(stream._root) <= 1
+    pmids.extend(citation.findtext("PMID") for citation in stream.close())
+
+    assert pmids == ["1", "2", "3", "4", "5"]
+
+
+def test_citation_stream_rejects_entity_declarations() -> None:
+    document = (
+        b'<!DOCTYPE PubmedArticleSet [<!ENTITY boom "boom">]>'
+        b"<PubmedArticleSet>&boom;</PubmedArticleSet>"
+    )
+
+    with pytest.raises(EntitiesForbidden):
+        list(CitationStream().feed(document))
+
+
+async def test_pages_through_the_history_server(tmp_path: Path) -> None:
+    efetch_calls: list[httpx.QueryParams] = []
+    total = 2 * EFETCH_PAGE_SIZE + 50
+    ingestor = _ingestor(_history_transport(total, efetch_calls), tmp_path)
+
+    records = [record async for record in ingestor.stream_records(max_results=10_000)]
+
+    assert len(records) == total
+    assert records[0]["pubmed_id"] == "0"
+    assert records[0]["fetched_at"] == "Thu, 01 Aug 2024"
+    assert [call["retstart"] for call in efetch_calls] == ["0", "200", "400"]
+    assert [call["retmax"] for call in efetch_calls] == ["200", "200", "50"]
+    assert all(call["WebEnv"] == "MCID_1" for call in efetch_calls)
+    await ingestor.http_clients.aclose()
+
+
+async def test_max_results_caps_the_pages_fetched(tmp_path: Path) -> None:
+    efetch_calls: list[httpx.QueryParams] = []
+    ingestor = _ingestor(_history_transport(5_000, efetch_calls), tmp_path)
+
+    records = await ingestor.fetch_data(max_results=250)
+
+    assert len(records) == 250
+    assert [call["retmax"] for call in efetch_calls] == ["200", "50"]
+    await ingestor.http_clients.aclose()
+
+
+async def test_empty_search_fetches_nothing(tmp_path: Path) -> None:
+    efetch_calls: list[httpx.QueryParams] = []
+    ingestor = _ingestor(_history_transport(0, efetch_calls), tmp_path)
+
+    assert await ingestor.fetch_data() == []
+    assert efetch_calls == []
+    await ingestor.http_clients.aclose()
+
+
+async def test_ingest_spools_a_replayable_raw_snapshot(tmp_path: Path) -> None:
+    efetch_calls: list[httpx.QueryParams] = []
+    ingestor = _ingestor(
+        _history_transport(EFETCH_PAGE_SIZE + 5, efetch_calls),
+        tmp_path,
+    )
+
+    result = await ingestor.ingest(max_results=10_000)
+
+    assert result.records_processed == EFETCH_PAGE_SIZE + 5
+    assert [path.suffixes[-2:] for path in result.raw_snapshot] == [[".jsonl", ".gz"]]
+    assert list(iter_raw_records(result.raw_snapshot)) == result.data
+    await ingestor.http_clients.aclose()
@@ -0,0 +1,207 @@
+"""Tests for eager-loading plans in the SQLAlchemy entity repositories."""
+
+from collections.abc import Callable, Iterator
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.domain.entities.variant import Variant
+from src.domain.value_objects.identifiers import GeneIdentifier
+from src.infrastructure.mappers.variant_mapper import VariantMapper
+from src.infrastructure.repositories import (
+    SqlAlchemyEvidenceRepository,
+    SqlAlchemyGeneRepository,
+    SqlAlchemyVariantRepository,
+)
+from src.models.database import (
+    Base,
+    EvidenceModel,
+    GeneModel,
+    PhenotypeModel,
+    PublicationModel,
+    VariantModel,
+)
+
+VARIANTS_PER_GENE = 6
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        _seed(db)
+        db.expunge_all()
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def _seed(db: Session) -> None:
+    phenotype = PhenotypeModel(
+        hpo_id="HP:0001249",
+        hpo_term="Intellectual disability",
+        name="Intellectual disability",
+        category="other",
+    )
+    publication = PublicationModel(
+        pubmed_id="31155615",
+        title="MED13 variants cause a neurodevelopmental disorder",
+        authors="Snijders Blok L",
+        journal="Am J Hum Genet",
+        publication_year=2018,
+    )
+    db.add_all([phenotype, publication])
+    for gene_index in range(3):
+        gene = GeneModel(
+            gene_id=f"GENE{gene_index:03d}",
+            symbol=f"MED{13 + gene_index}",
+            name=f"mediator complex subunit {13 + gene_index}",
+        )
+        db.add(gene)
+        db.flush()
+        for index in range(VARIANTS_PER_GENE):
+            variant = VariantModel(
+                gene_id=gene.id,
+                variant_id=f"chr17:{gene_index}{index + 1:04d}:A>G",
+                chromosome="17",
+                position=gene_index * 1_000 + index + 1,
+                reference_allele="A",
+                alternate_allele="G",
+            )
+            db.add(variant)
+            db.flush()
+            db.add_all(
+                EvidenceModel(
+                    variant_id=variant.id,
+                    phenotype_id=phenotype.id,
+                    publication_id=publication.id,
+                    description=f"Case report {offset}",
+                    evidence_level="supporting",
+                    evidence_type="clinical_report",
+                    confidence_score=0.6,
+                )
+                for offset in range(2)
+            )
+    db.commit()
+
+
+VARIANT_LIST_PATHS: dict[str, Callable[[SqlAlchemyVariantRepository, int], object]] = {
+    "find_all": lambda repo, limit: repo.find_all(limit=limit),
+    "paginate": lambda repo, limit: repo.paginate_variants(1, limit, "position", "asc"),
+    "keyset": lambda repo, limit: repo.paginate_variants_keyset(None, limit),
+    "search": lambda repo, limit: repo.search_variants("chr17", limit=limit),
+    "by_gene_symbol": lambda repo, _limit: repo.find_by_gene_symbol("MED13"),
+}
+
+
+@pytest.mark.usefixtures("strict_loading")
+@pytest.mark.parametrize("path", VARIANT_LIST_PATHS)
+def test_variant_list_paths_do_not_grow_with_page_size(
+    session: Session,
+    count_statements,
+    path: str,
+) -> None:
+    repository = SqlAlchemyVariantRepository(session)
+    engine = session.get_bind()
+
+    counts = []
+    for limit in (2, 12):
+        session.expunge_all()
+        with count_statements(engine) as log:
+            VARIANT_LIST_PATHS[path](repository, limit)
+        counts.append(log.count)
+
+    assert counts[0] == counts[1]
+
+
+@pytest.mark.usefixtures("strict_loading")
+def test_variant_summaries_carry_gene_and_evidence(
+    session: Session,
+    count_statements,
+) -> None:
+    repository = SqlAlchemyVariantRepository(session)
+
+    with count_statements(session.get_bind()) as log:
+        variants = repository.find_all(limit=10)
+
+    # Variants joined to their gene, then one IN query for all evidence
+    assert log.count == 2
+    assert len(variants) == 10
+    assert {variant.gene_identifier.symbol for variant in variants} == {
+        "MED13",
+        "MED14",
+    }
+    assert {variant.evidence_count for variant in variants} == {2}
+
+
+@pytest.mark.usefixtures("strict_loading")
+def test_evidence_list_carries_identifiers_in_one_statement(
+    session: Session,
+    count_statements,
+) -> None:
+    repository = SqlAlchemyEvidenceRepository(session)
+
+    with count_statements(session.get_bind()) as log:
+        evidence, total = repository.paginate_evidence(1, 20, "id", "asc")
+        searched = repository.search_evidence("Case report", limit=20)
+
+    # One page query and one total count, one search query
+    assert log.count == 3
+    assert total.value == 36
+    assert len(searched) == 20
+    first = evidence[0]
+    assert first.variant_summary is not None
+    assert first.phenotype_identifier.hpo_id == "HP:0001249"
+    assert first.publication_identifier.pubmed_id == "31155615"
+
+
+@pytest.mark.usefixtures("strict_loading")
+def test_gene_list_loads_variant_summaries_in_one_query(
+    session: Session,
+    count_statements,
+) -> None:
+    repository = SqlAlchemyGeneRepository(session)
+
+    with count_statements(session.get_bind()) as log:
+        genes, total = repository.paginate_genes(1, 10, "symbol", "asc")
+
+    # Genes, their total, one IN query for every gene's variants
+    assert log.count == 3
+    assert total.value == 3
+    assert [len(gene.variants) for gene in genes] == [VARIANTS_PER_GENE] * 3
+
+
+def test_mapper_never_lazy_loads(session: Session, count_statements) -> None:
+    model = session.execute(select(VariantModel).limit(1)).scalar_one()
+
+    with count_statements(session.get_bind()) as log:
+        variant = VariantMapper.to_domain(model)
+
+    assert log.count == 0
+    assert variant.gene_identifier is None
+    assert variant.evidence_count == 0
+
+
+def test_written_variants_come_back_with_detail(session: Session) -> None:
+    repository = SqlAlchemyVariantRepository(session)
+    gene = session.execute(select(GeneModel).limit(1)).scalar_one()
+
+    created = repository.create(
+        Variant.create(
+            chromosome="17",
+            position=61942605,
+            reference_allele="C",
+            alternate_allele="T",
+            gene_database_id=gene.id,
+            gene_identifier=GeneIdentifier(gene_id=gene.gene_id, symbol=gene.symbol),
+        ),
+    )
+    updated = repository.update(created.id, {"condition": "MED13 syndrome"})
+
+    assert created.gene_identifier.symbol == gene.symbol
+    assert updated.condition == "MED13 syndrome"
+    assert updated.gene_identifier.symbol == gene.symbol
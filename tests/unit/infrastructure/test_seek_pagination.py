@@ -0,0 +1,302 @@
+"""Tests for cursor (keyset) pagination in the entity repositories."""
+
+from collections.abc import Callable, Iterator
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.domain.repositories.base import SeekPage, SeekPosition
+from src.infrastructure.repositories import (
+    SqlAlchemyEvidenceRepository,
+    SqlAlchemyGeneRepository,
+    SqlAlchemyPhenotypeRepository,
+    SqlAlchemyVariantRepository,
+)
+from src.models.database import (
+    Base,
+    EvidenceModel,
+    GeneModel,
+    PhenotypeModel,
+    VariantModel,
+)
+from src.routes.cursors import decode_cursor, encode_cursor
+
+GENES = 9
+VARIANTS = 25
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        _seed(db)
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def _seed(db: Session) -> None:
+    # Repeated and missing sort values, so ties and NULLs are crossed by pages
+    genes = [
+        GeneModel(
+            gene_id=f"GENE{index:03d}",
+            symbol=f"MED{index}",
+            name=None if index % 3 == 0 else f"mediator {index % 2}",
+            chromosome=None if index % 4 == 0 else str(17 + index % 2),
+        )
+        for index in range(GENES)
+    ]
+    phenotypes = [
+        PhenotypeModel(
+            hpo_id=f"HP:{index:07d}",
+            hpo_term=f"Term {index}",
+            name=f"Phenotype {index % 3}",
+            category=("neurological", "other")[index % 2],
+        )
+        for index in range(7)
+    ]
+    db.add_all([*genes, *phenotypes])
+    db.flush()
+    for index in range(VARIANTS):
+        variant = VariantModel(
+            gene_id=genes[index % 3].id,
+            variant_id=f"chr17:{index}:A>G",
+            chromosome="17",
+            position=1_000 + index % 7,
+            reference_allele="A",
+            alternate_allele="G",
+            clinical_significance=("pathogenic", "benign")[index % 2],
+            allele_frequency=None if index % 5 == 0 else (index % 4) / 10,
+        )
+        db.add(variant)
+        db.flush()
+        db.add(
+            EvidenceModel(
+                variant_id=variant.id,
+                phenotype_id=phenotypes[index % 7].id,
+                description=f"Report {index}",
+                evidence_level=("strong", "supporting")[index % 2],
+                evidence_type="clinical_report",
+                confidence_score=(index % 3) / 2,
+                review_date=None if index % 2 else date(2024, 1, 1 + index % 4),
+            ),
+        )
+    db.commit()
+
+
+SeekFetch = Callable[[SeekPosition | None, int], SeekPage[object]]
+
+
+def _walk(fetch: SeekFetch, sort_by: str, sort_order: str) -> list[int]:
+    """IDs of every row, following encoded cursors three rows at a time."""
+    ids: list[int] = []
+    after = None
+    while True:
+        page = fetch(after, 3)
+        ids.extend(item.id for item in page.items)
+        if page.next_position is None:
+            return ids
+        cursor = encode_cursor(page.next_position, sort_by, sort_order)
+        after = decode_cursor(cursor, sort_by, sort_order)
+
+
+def _expected(
+    db: Session,
+    model: type[Base],
+    sort_by: str | None,
+    sort_order: str,
+) -> list[int]:
+    """IDs in ``(sort_by, id)`` order with NULLs last ascending."""
+    column = getattr(model, sort_by) if sort_by else None
+    rows = db.execute(select(model.id, column if column is not None else model.id))
+
+    def key(row: tuple[int, object]) -> tuple[bool, object, int]:
+        return (row[1] is None, row[1] if row[1] is not None else 0, row[0])
+
+    ordered = sorted(rows, key=key)
+    if sort_order == "desc":
+        ordered.reverse()
+    return [row[0] for row in ordered]
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+@pytest.mark.parametrize(
+    "sort_by",
+    ["symbol", "name", "gene_type", "chromosome", "created_at"],
+)
+def test_gene_cursor_walk_visits_every_row_once(
+    session: Session,
+    sort_by: str,
+    sort_order: str,
+) -> None:
+    repository = SqlAlchemyGeneRepository(session)
+
+    ids = _walk(
+        lambda after, limit: repository.paginate_genes_seek(
+            after,
+            limit,
+            sort_by,
+            sort_order,
+        ),
+        sort_by,
+        sort_order,
+    )
+
+    assert ids == _expected(session, GeneModel, sort_by, sort_order)
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+@pytest.mark.parametrize(
+    "sort_by",
+    ["variant_id", "position", "allele_frequency", "created_at", "gene"],
+)
+def test_variant_cursor_walk_follows_the_sort(
+    session: Session,
+    sort_by: str,
+    sort_order: str,
+) -> None:
+    repository = SqlAlchemyVariantRepository(session)
+
+    ids = _walk(
+        lambda after, limit: repository.paginate_variants_seek(
+            after,
+            limit,
+            sort_by,
+            sort_order,
+            filters={"clinical_significance": "pathogenic"},
+        ),
+        sort_by,
+        sort_order,
+    )
+
+    # Relationships are not sort keys; those pages follow the ID alone
+    column = None if sort_by == "gene" else sort_by
+    expected = _expected(session, VariantModel, column, sort_order)
+    pathogenic = set(
+        session.scalars(
+            select(VariantModel.id).where(
+                VariantModel.clinical_significance == "pathogenic",
+            ),
+        ),
+    )
+    assert ids == [row_id for row_id in expected if row_id in pathogenic]
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+@pytest.mark.parametrize("sort_by", ["review_date", "confidence_score"])
+def test_evidence_cursor_walk_handles_dates_and_nulls(
+    session: Session,
+    sort_by: str,
+    sort_order: str,
+) -> None:
+    repository = SqlAlchemyEvidenceRepository(session)
+
+    ids = _walk(
+        lambda after, limit: repository.paginate_evidence_seek(
+            after,
+            limit,
+            sort_by,
+            sort_order,
+        ),
+        sort_by,
+        sort_order,
+    )
+
+    assert ids == _expected(session, EvidenceModel, sort_by, sort_order)
+
+
+def test_phenotype_cursor_walk_ignores_unsortable_fields(session: Session) -> None:
+    repository = SqlAlchemyPhenotypeRepository(session)
+
+    by_name = _walk(
+        lambda after, limit: repository.paginate_phenotypes_seek(
+            after,
+            limit,
+            "name",
+            "asc",
+        ),
+        "name",
+        "asc",
+    )
+    by_definition = _walk(
+        lambda after, limit: repository.paginate_phenotypes_seek(
+            after,
+            limit,
+            "definition",
+            "asc",
+        ),
+        "definition",
+        "asc",
+    )
+
+    assert by_name == _expected(session, PhenotypeModel, "name", "asc")
+    assert by_definition == _expected(session, PhenotypeModel, None, "asc")
+
+
+def test_offset_pages_match_cursor_pages(session: Session) -> None:
+    repository = SqlAlchemyVariantRepository(session)
+
+    first = repository.paginate_variants_seek(None, 10, "position", "asc")
+    by_cursor = repository.paginate_variants_seek(
+        first.next_position,
+        10,
+        "position",
+        "asc",
+    )
+    by_offset = repository.paginate_variants_seek(
+        None,
+        10,
+        "position",
+        "asc",
+        offset=10,
+    )
+
+    assert [v.id for v in by_cursor.items] == [v.id for v in by_offset.items]
+    assert by_cursor.total.value == VARIANTS
+
+
+def test_deep_cursor_pages_seek_instead_of_skipping(
+    session: Session,
+    count_statements,
+) -> None:
+    repository = SqlAlchemyVariantRepository(session)
+    engine = session.get_bind()
+    with count_statements(engine) as first_log:
+        first = repository.paginate_variants_seek(None, 5, "position", "asc")
+    last = repository.paginate_variants_seek(None, VARIANTS - 2, "position", "asc")
+
+    with count_statements(engine) as log:
+        page = repository.paginate_variants_seek(
+            last.next_position,
+            5,
+            "position",
+            "asc",
+        )
+
+    assert len(first.items) == 5
+    assert len(page.items) == 2
+    assert page.next_position is None
+    assert log.count == first_log.count
+    assert "(variants.position, variants.id) > (" in log.statements[0]
+
+
+def test_cursor_survives_deletion_of_its_row(session: Session) -> None:
+    repository = SqlAlchemyGeneRepository(session)
+    first = repository.paginate_genes_seek(None, 4, "symbol", "asc")
+    assert first.next_position is not None
+
+    session.delete(session.get(GeneModel, first.next_position.id))
+    session.commit()
+    rest = repository.paginate_genes_seek(first.next_position, 20, "symbol", "asc")
+
+    assert [gene.id for gene in first.items[:3] + rest.items] == _expected(
+        session,
+        GeneModel,
+        "symbol",
+        "asc",
+    )
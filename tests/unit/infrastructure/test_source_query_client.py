@@ -0,0 +1,233 @@
+"""Tests for the pooled, retrying HTTP source query client."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Coroutine
+
+import httpx
+import pytest
+
+from src.domain.entities.data_discovery_parameters import QueryParameters
+from src.domain.entities.data_discovery_session import SourceCatalogEntry
+from src.infrastructure.http import HostBudget, HostRateLimiters
+from src.infrastructure.queries.source_query_client import (
+    HTTPQueryClient,
+    QueryExecutionError,
+    QueryResponseCache,
+)
+
+Handler = Callable[[httpx.Request], Coroutine[None, None, httpx.Response]]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _entry(entry_id: str = "clinvar-api") -> SourceCatalogEntry:
+    return SourceCatalogEntry.model_validate(
+        {
+            "id": entry_id,
+            "name": "ClinVar API",
+            "category": "Genomic Variant Databases",
+            "description": "ClinVar programmatic access",
+            "param_type": "api",
+            "api_endpoint": "https://api.example.org/clinvar",
+        },
+    )
+
+
+def _params(gene_symbol: str) -> QueryParameters:
+    return QueryParameters(gene_symbol=gene_symbol, search_term=None)
+
+
+def _client(handler: Handler, **kwargs: object) -> HTTPQueryClient:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return HTTPQueryClient(
+        client=http_client,
+        backoff_base_seconds=0,
+        rate_limiters=HostRateLimiters({}),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+@pytest.fixture
+def requests_seen() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+async def flaky_client(
+    requests_seen: list[httpx.Request],
+) -> AsyncIterator[HTTPQueryClient]:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if len(requests_seen) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"gene": request.url.params["gene"]})
+
+    client = _client(handler)
+    yield client
+    await client.aclose()
+
+
+async def test_transient_failures_are_retried(
+    flaky_client: HTTPQueryClient,
+    requests_seen: list[httpx.Request],
+) -> None:
+    result = await flaky_client.execute_query(
+        _entry(),
+        _params("MED13"),
+    )
+
+    assert len(requests_seen) == 3
+    assert result["status_code"] == 200
+    assert result["data"] == {"gene": "MED13"}
+
+
+async def test_successful_results_are_cached_per_normalized_params(
+    flaky_client: HTTPQueryClient,
+    requests_seen: list[httpx.Request],
+) -> None:
+    first = await flaky_client.execute_query(
+        _entry(),
+        _params("MED13"),
+    )
+    first["data"] = "mutated by caller"
+    second = await flaky_client.execute_query(
+        _entry(),
+        _params("MED13"),
+    )
+    await flaky_client.execute_query(_entry(), _params("MED12"))
+
+    assert second["data"] == {"gene": "MED13"}
+    assert len(requests_seen) == 4
+
+
+async def test_cache_entries_expire() -> None:
+    clock = FakeClock()
+    cache = QueryResponseCache(ttl_seconds=10, clock=clock)
+    calls = 0
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client(handler, response_cache=cache)
+    params = _params("MED13")
+    await client.execute_query(_entry(), params)
+    await client.execute_query(_entry(), params)
+    clock.now += 11
+    await client.execute_query(_entry(), params)
+    await client.aclose()
+
+    assert calls == 2
+
+
+async def test_exhausted_retries_surface_status_code() -> None:
+    calls = 0
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(502)
+
+    client = _client(handler, max_retries=2)
+    with pytest.raises(QueryExecutionError) as excinfo:
+        await client.execute_query(_entry(), _params("MED13"))
+    await client.aclose()
+
+    assert calls == 3
+    assert excinfo.value.status_code == 502
+    assert excinfo.value.source_id == "clinvar-api"
+    assert len(client.response_cache) == 0
+
+
+async def test_client_errors_are_not_retried() -> None:
+    calls = 0
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(404)
+
+    client = _client(handler)
+    with pytest.raises(QueryExecutionError, match="HTTP error"):
+        await client.execute_query(_entry(), _params("MED13"))
+    await client.aclose()
+
+    assert calls == 1
+
+
+async def test_timeouts_are_reported_after_retries() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        msg = "slow upstream"
+        raise httpx.ReadTimeout(msg, request=request)
+
+    client = _client(handler, max_retries=1)
+    with pytest.raises(QueryExecutionError, match="Timeout error"):
+        await client.execute_query(_entry(), _params("MED13"))
+    await client.aclose()
+
+
+async def test_concurrency_is_capped_per_host() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    client = _client(
+        handler,
+        per_host_concurrency=2,
+        response_cache=QueryResponseCache(ttl_seconds=0),
+    )
+    await asyncio.gather(
+        *(client.execute_query(_entry(), _params(f"G{index}")) for index in range(8)),
+    )
+    await client.aclose()
+
+    assert peak == 2
+
+
+def test_retry_after_header_is_capped() -> None:
+    client = HTTPQueryClient(backoff_max_seconds=5)
+
+    assert client._retry_after(httpx.Response(429, headers={"Retry-After": "2"})) == 2
+    assert client._retry_after(httpx.Response(429, headers={"Retry-After": "90"})) == 5
+    assert client._retry_after(httpx.Response(429)) is None
+
+
+async def test_requests_draw_from_the_host_budget() -> None:
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    limiters = HostRateLimiters({"api.example.org": HostBudget(20, burst=1)})
+    client = _client(handler, response_cache=QueryResponseCache(ttl_seconds=0))
+    client.rate_limiters = limiters
+    for index in range(3):
+        await client.execute_query(_entry(), _params(f"G{index}"))
+    await client.aclose()
+
+    limiter = limiters.limiter_for("https://api.example.org")
+    assert limiter.waits == 2
+
+
+async def test_hosts_without_a_budget_are_not_paced() -> None:
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    client = _client(handler, response_cache=QueryResponseCache(ttl_seconds=0))
+    for index in range(3):
+        await client.execute_query(_entry(), _params(f"G{index}"))
+    await client.aclose()
+
+    assert client.rate_limiters.budgeted_limiter_for("https://api.example.org") is None
@@ -0,0 +1,69 @@
+"""Tests for the UniProt ingestor's redirect-free request override."""
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.infrastructure.http import HostBudget, HostRateLimiters, HttpClientRegistry
+from src.infrastructure.ingest.base_ingestor import IngestionError
+from src.infrastructure.ingest.uniprot_ingestor import UniProtIngestor
+
+
+def _ingestor(handler, raw_data_dir: Path) -> UniProtIngestor:
+    ingestor = UniProtIngestor(raw_data_dir)
+    ingestor.max_retries = 1
+    ingestor.http_clients = HttpClientRegistry(
+        transport=httpx.MockTransport(handler),
+    )
+    ingestor.rate_limiter = HostRateLimiters(
+        {"www.ebi.ac.uk": HostBudget(1_000, burst=1_000)},
+    ).limiter_for(ingestor.base_url)
+    return ingestor
+
+
+async def _chunks() -> AsyncIterator[bytes]:
+    yield b"<uniprot>"
+    yield b"</uniprot>"
+
+
+@pytest.mark.asyncio
+async def test_stream_request_leaves_the_body_to_the_caller(tmp_path: Path) -> None:
+    ingestor = _ingestor(
+        lambda _request: httpx.Response(200, content=_chunks()),
+        tmp_path,
+    )
+
+    async with ingestor._stream_request("GET", "proteins") as response:
+        assert not response.is_stream_consumed
+        body = b"".join([chunk async for chunk in response.aiter_bytes()])
+
+    assert body == b"<uniprot></uniprot>"
+    assert response.is_closed
+
+
+@pytest.mark.asyncio
+async def test_redirects_are_not_followed(tmp_path: Path) -> None:
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(302, headers={"location": "https://example.org/"})
+
+    ingestor = _ingestor(handler, tmp_path)
+
+    with pytest.raises(IngestionError, match="HTTP 302"):
+        await ingestor._make_request("GET", "proteins")
+    assert requested == ["https://www.ebi.ac.uk/proteins/api/proteins"]
+
+
+@pytest.mark.asyncio
+async def test_error_bodies_are_read_into_the_message(tmp_path: Path) -> None:
+    ingestor = _ingestor(
+        lambda _request: httpx.Response(404, text="no such entry"),
+        tmp_path,
+    )
+
+    with pytest.raises(IngestionError, match="no such entry"):
+        await ingestor._make_request("GET", "proteins", stream=True)
@@ -74,3 +74,30 @@ def test_variant_repository_finds_pathogenic_variants(test_session, persisted_ge
 
     assert len(variants) == 1
     assert variants[0].clinical_significance == ClinicalSignificance.PATHOGENIC
+
+
+def test_variant_repository_keyset_pagination_seeks_by_id(
+    test_session,
+    persisted_gene,
+):
+    for position in range(1, 6):
+        test_session.add(
+            VariantModel(
+                gene_id=persisted_gene.id,
+                variant_id=f"chr1:{position}:A>T",
+                chromosome="chr1",
+                position=position,
+                reference_allele="A",
+                alternate_allele="T",
+            ),
+        )
+    test_session.commit()
+
+    repository = SqlAlchemyVariantRepository(test_session)
+    first_batch = repository.paginate_variants_keyset(None, 2)
+    second_batch = repository.paginate_variants_keyset(first_batch[-1].id, 2)
+    filtered = repository.paginate_variants_keyset(None, 10, {"position": 5})
+
+    assert [variant.position for variant in first_batch] == [1, 2]
+    assert [variant.position for variant in second_batch] == [3, 4]
+    assert [variant.position for variant in filtered] == [5]
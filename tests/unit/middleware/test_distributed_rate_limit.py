@@ -0,0 +1,202 @@
+"""Tests for the Redis-backed sliding-window rate limiter."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.middleware import distributed_rate_limit
+from src.middleware.distributed_rate_limit import (
+    SLIDING_WINDOW_SCRIPT,
+    DistributedRateLimiter,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LocalRedis:
+    """
+    In-memory stand-in for Redis that evaluates the sliding-window script.
+
+    The script logic is mirrored in Python against the shared fake clock, so
+    tests can count round trips and move time without a Redis server.
+    """
+
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.calls = 0
+        self.fail = False
+        self.closed = False
+
+    def register_script(self, script: str) -> LocalScript:
+        assert script == SLIDING_WINDOW_SCRIPT
+        return LocalScript(self)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class LocalScript:
+    def __init__(self, server: LocalRedis) -> None:
+        self.server = server
+
+    async def __call__(
+        self,
+        keys: Sequence[str] | None = None,
+        args: Sequence[int] | None = None,
+    ) -> Sequence[int]:
+        self.server.calls += 1
+        if self.server.fail:
+            msg = "connection refused"
+            raise ConnectionError(msg)
+        assert keys is not None
+        assert args is not None
+        capacity, window, requested = args
+        now = int(self.server.clock.now * 1000)
+        start = now - now % window
+        state = self.server.hashes.get(keys[0], {})
+        current = state.get("current", 0)
+        previous = state.get("previous", 0)
+        if state.get("start") != start:
+            previous = current if state.get("start") == start - window else 0
+            current = 0
+        elapsed = now - start
+        used = previous * (window - elapsed) / window + current
+        granted = min(requested, math.floor(capacity - used))
+        if granted >= 1:
+            self.server.hashes[keys[0]] = {
+                "start": start,
+                "current": current + granted,
+                "previous": previous,
+            }
+            return [granted, 0]
+        if current <= capacity - 1:
+            retry = window * (1 - (capacity - 1 - current) / previous) - elapsed
+        else:
+            retry = window - elapsed + window * (1 - (capacity - 1) / current)
+        return [0, max(1, math.ceil(retry))]
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(distributed_rate_limit.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def redis(clock: FakeClock) -> LocalRedis:
+    return LocalRedis(clock)
+
+
+def _limiter(redis: LocalRedis, **kwargs: float) -> DistributedRateLimiter:
+    return DistributedRateLimiter(
+        "redis://stand-in",
+        window_seconds=10,
+        client=redis,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+async def test_leased_tokens_absorb_checks_without_round_trips(
+    redis: LocalRedis,
+) -> None:
+    limiter = _limiter(redis, lease_fraction=10)
+
+    results = [await limiter.allow("GET:/genes:10.0.0.1", 100) for _ in range(100)]
+
+    assert all(allowed for allowed, _ in results)
+    assert redis.calls == 10
+    assert limiter.metrics()["local_decisions"] == 90
+    assert await limiter.allow("GET:/genes:10.0.0.1", 100) == (False, 11)
+
+
+async def test_denials_are_cached_until_retry_time(
+    redis: LocalRedis,
+    clock: FakeClock,
+) -> None:
+    limiter = _limiter(redis, lease_fraction=1)
+    await limiter.allow("key", 1)
+
+    allowed, retry_after = await limiter.allow("key", 1)
+    calls = redis.calls
+    assert not allowed
+    assert await limiter.allow("key", 1) == (False, retry_after)
+    assert redis.calls == calls
+
+    clock.now += retry_after
+    assert (await limiter.allow("key", 1))[0]
+
+
+async def test_window_edge_does_not_double_the_limit(
+    redis: LocalRedis,
+    clock: FakeClock,
+) -> None:
+    limiter = _limiter(redis, lease_fraction=100, lease_ttl_seconds=0)
+    clock.now = 1_009.0  # one second before a window boundary
+
+    before = [await limiter.allow("key", 10) for _ in range(10)]
+    clock.now += 1.5
+    after = [await limiter.allow("key", 10) for _ in range(10)]
+
+    assert all(allowed for allowed, _ in before)
+    assert not any(allowed for allowed, _ in after)
+
+
+async def test_unspent_lease_lapses(redis: LocalRedis, clock: FakeClock) -> None:
+    limiter = _limiter(redis, lease_fraction=2, lease_ttl_seconds=1)
+
+    await limiter.allow("key", 10)
+    clock.now += 2
+    await limiter.allow("key", 10)
+
+    assert redis.calls == 2
+    assert redis.hashes["ratelimit:sw:key"]["current"] == 10
+
+
+async def test_redis_outage_degrades_to_local_limits(
+    redis: LocalRedis,
+    clock: FakeClock,
+) -> None:
+    limiter = _limiter(redis, lease_fraction=1, failure_cooldown_seconds=5)
+    redis.fail = True
+
+    assert await limiter.allow("key", 1) == (True, 0)
+    assert await limiter.allow("key", 1) == (True, 0)
+    assert redis.calls == 1
+    assert limiter.metrics()["fallbacks"] == 1
+
+    redis.fail = False
+    clock.now += 5
+    assert await limiter.allow("key", 1) == (True, 0)
+    assert (await limiter.allow("key", 1))[0] is False
+    assert redis.calls == 3
+
+
+async def test_cached_leases_are_bounded(redis: LocalRedis) -> None:
+    limiter = _limiter(redis, lease_fraction=1, max_cached_keys=3)
+
+    for index in range(10):
+        await limiter.allow(f"client-{index}", 10)
+
+    assert limiter.metrics()["cached_keys"] == 3
+
+
+async def test_close_closes_client(redis: LocalRedis) -> None:
+    limiter = _limiter(redis)
+
+    await limiter.close()
+
+    assert redis.closed
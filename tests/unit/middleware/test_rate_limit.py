@@ -0,0 +1,68 @@
+"""Tests for the bounded token bucket store used by the rate limit middleware."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.middleware import rate_limit
+from src.middleware.rate_limit import TokenBucketStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake)
+    return fake
+
+
+def test_store_evicts_least_recently_used_bucket(clock: FakeClock) -> None:
+    store = TokenBucketStore(capacity=5, refill_rate=1, max_buckets=2)
+
+    first = store.get("10.0.0.1")
+    store.get("10.0.0.2")
+    assert store.get("10.0.0.1") is first
+    store.get("10.0.0.3")
+
+    assert "10.0.0.1" in store
+    assert "10.0.0.2" not in store
+    assert store.metrics().as_dict() == {
+        "buckets": 2,
+        "max_buckets": 2,
+        "expired_evictions": 0,
+        "capacity_evictions": 1,
+    }
+
+
+def test_store_drops_idle_buckets_after_ttl(clock: FakeClock) -> None:
+    store = TokenBucketStore(capacity=5, refill_rate=1, ttl_seconds=30)
+
+    store.get("10.0.0.1")
+    clock.now += 10
+    store.get("10.0.0.2")
+    clock.now += 25
+    store.get("10.0.0.3")
+
+    assert "10.0.0.1" not in store
+    assert "10.0.0.2" in store
+    assert store.metrics().expired_evictions == 1
+
+
+def test_bucket_refills_on_monotonic_clock(clock: FakeClock) -> None:
+    store = TokenBucketStore(capacity=2, refill_rate=1)
+    bucket = store.get("10.0.0.1")
+
+    assert bucket.consume()
+    assert bucket.consume()
+    assert not bucket.consume()
+    assert bucket.seconds_until_full() == pytest.approx(2.0)
+
+    clock.now += 1
+    assert bucket.consume()
@@ -0,0 +1,84 @@
+from datetime import UTC, date, datetime
+
+import pytest
+
+from src.domain.repositories.base import SeekPage, SeekPosition, TotalCount
+from src.routes.cursors import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    seek_response,
+)
+
+
+@pytest.mark.parametrize(
+    "sort_value",
+    [
+        "MED13",
+        17,
+        0.1,
+        True,
+        None,
+        date(2024, 2, 29),
+        datetime(2024, 2, 29, 13, 5, 7, 123456, tzinfo=UTC),
+    ],
+)
+def test_cursor_round_trips_every_sort_value_type(sort_value: object) -> None:
+    position = SeekPosition(sort_value, 42)
+
+    cursor = encode_cursor(position, "symbol", "desc")
+
+    assert decode_cursor(cursor, "symbol", "desc") == position
+    assert "=" not in cursor
+
+
+def test_cursor_is_bound_to_its_sort() -> None:
+    cursor = encode_cursor(SeekPosition("MED13", 1), "symbol", "asc")
+
+    with pytest.raises(InvalidCursorError, match="different sort"):
+        decode_cursor(cursor, "symbol", "desc")
+    with pytest.raises(InvalidCursorError, match="different sort"):
+        decode_cursor(cursor, "name", "asc")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        "e30",
+        "eyJpIjoiMSJ9",
+        "eyJzIjoicyIsIm8iOiJhc2MiLCJpIjoxLCJ2IjpbXX0",
+    ],
+)
+def test_malformed_cursors_are_rejected(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, "s", "asc")
+
+
+def test_seek_response_carries_the_next_cursor() -> None:
+    page = SeekPage(["a", "b"], TotalCount(5, exact=False), SeekPosition("b", 2))
+
+    response = seek_response(
+        page.items,
+        page,
+        page=1,
+        per_page=2,
+        sort_by="name",
+        sort_order="asc",
+        resumed=False,
+    )
+    last = seek_response(
+        ["e"],
+        SeekPage(["e"], TotalCount(5), None),
+        page=1,
+        per_page=2,
+        sort_by="name",
+        sort_order="asc",
+        resumed=True,
+    )
+
+    assert response.total_pages == 3
+    assert response.total_is_exact is False
+    assert (response.has_next, response.has_prev) == (True, False)
+    assert decode_cursor(response.next_cursor, "name", "asc") == SeekPosition("b", 2)
+    assert (last.has_next, last.has_prev, last.next_cursor) == (False, True, None)
@@ -0,0 +1,263 @@
+"""Tests for the token validation cache and write-behind session activity."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.services.authentication_cache import (
+    SessionActivityRecorder,
+    TokenValidationCache,
+)
+from src.application.services.authentication_service import (
+    AuthenticationError,
+    AuthenticationService,
+)
+from src.domain.entities.session import UserSession
+from src.domain.entities.user import User, UserRole, UserStatus
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _user() -> User:
+    return User(
+        id=uuid4(),
+        email="cached@example.com",
+        username="cached",
+        full_name="Cached User",
+        hashed_password="hashed_password_for_testing",
+        role=UserRole.RESEARCHER,
+        status=UserStatus.ACTIVE,
+        email_verified=True,
+    )
+
+
+def _session(user: User, token: str) -> UserSession:
+    now = datetime.now(UTC)
+    return UserSession(
+        user_id=user.id,
+        session_token=token,
+        refresh_token="refresh_token",
+        expires_at=now + timedelta(minutes=60),
+        refresh_expires_at=now + timedelta(days=7),
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> TokenValidationCache:
+    return TokenValidationCache(ttl_seconds=30, clock=clock, wall_clock=clock)
+
+
+def test_cache_entries_expire_with_ttl_or_token(
+    cache: TokenValidationCache,
+    clock: FakeClock,
+) -> None:
+    user = _user()
+    cache.put("long-lived", user, None)
+    cache.put("short-lived", user, None, token_expires_at=clock.now + 5)
+    cache.put("expired", user, None, token_expires_at=clock.now - 1)
+
+    clock.now += 10
+    assert cache.get("long-lived") is not None
+    assert cache.get("short-lived") is None
+    assert cache.get("expired") is None
+
+    clock.now += 30
+    assert cache.get("long-lived") is None
+
+
+def test_cache_invalidates_by_token_session_and_user(
+    cache: TokenValidationCache,
+) -> None:
+    alice, bob = _user(), _user()
+    alice_session = _session(alice, "alice-1")
+    cache.put("alice-1", alice, alice_session)
+    cache.put("alice-2", alice, None)
+    cache.put("bob-1", bob, None)
+    cache.put("bob-2", bob, None)
+
+    cache.invalidate_session(alice_session.id)
+    assert cache.get("alice-1") is None
+    assert cache.get("alice-2") is not None
+
+    cache.invalidate_user(alice.id)
+    assert cache.get("alice-2") is None
+
+    cache.invalidate_token("bob-1")
+    assert cache.get("bob-1") is None
+    assert cache.get("bob-2") is not None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_is_bounded(clock: FakeClock) -> None:
+    cache = TokenValidationCache(max_entries=2, clock=clock, wall_clock=clock)
+    user = _user()
+    for index in range(5):
+        cache.put(f"token-{index}", user, None)
+
+    assert len(cache) == 2
+    assert cache.get("token-4") is not None
+
+
+async def test_recorder_coalesces_activity_per_session() -> None:
+    repository = AsyncMock()
+    recorder = SessionActivityRecorder(repository, flush_interval_seconds=3600)
+    user = _user()
+    first, second = _session(user, "first"), _session(user, "second")
+
+    for _ in range(50):
+        first.update_activity()
+        recorder.record(first)
+    recorder.record(second)
+    await recorder.close()
+
+    repository.record_activity.assert_awaited_once()
+    (updates,) = repository.record_activity.await_args.args
+    assert {update.session_id for update in updates} == {first.id, second.id}
+    latest = next(update for update in updates if update.session_id == first.id)
+    assert latest.last_activity == first.last_activity
+    assert recorder.pending == 0
+
+
+async def test_recorder_keeps_activity_when_flush_fails() -> None:
+    repository = AsyncMock()
+    repository.record_activity.side_effect = [ConnectionError("db down"), None]
+    recorder = SessionActivityRecorder(repository, flush_interval_seconds=3600)
+    session = _session(_user(), "token")
+    recorder.record(session)
+
+    with pytest.raises(ConnectionError):
+        await recorder.flush()
+    assert recorder.pending == 1
+
+    await recorder.close()
+    assert recorder.pending == 0
+
+
+async def test_recorder_flushes_in_background() -> None:
+    repository = AsyncMock()
+    recorder = SessionActivityRecorder(repository, flush_interval_seconds=0.01)
+    recorder.record(_session(_user(), "token"))
+
+    for _ in range(100):
+        if repository.record_activity.await_count:
+            break
+        await asyncio.sleep(0.01)
+    await recorder.close()
+
+    repository.record_activity.assert_awaited_once()
+
+
+class TestCachedValidation:
+    """validate_token with the cache and write-behind recorder enabled."""
+
+    @pytest.fixture
+    def user(self) -> User:
+        return _user()
+
+    @pytest.fixture
+    def repositories(self, user: User) -> tuple[AsyncMock, AsyncMock]:
+        user_repository = AsyncMock()
+        user_repository.get_by_id.return_value = user
+        session_repository = AsyncMock()
+        session_repository.get_by_access_token.return_value = _session(user, "t")
+        return user_repository, session_repository
+
+    @pytest.fixture
+    async def service(
+        self,
+        user: User,
+        repositories: tuple[AsyncMock, AsyncMock],
+    ) -> AsyncIterator[AuthenticationService]:
+        user_repository, session_repository = repositories
+        jwt_provider = MagicMock()
+        jwt_provider.decode_token.return_value = {
+            "sub": str(user.id),
+            "type": "access",
+        }
+        recorder = SessionActivityRecorder(
+            session_repository,
+            flush_interval_seconds=3600,
+        )
+        yield AuthenticationService(
+            user_repository=user_repository,
+            session_repository=session_repository,
+            jwt_provider=jwt_provider,
+            password_hasher=MagicMock(),
+            token_cache=TokenValidationCache(),
+            activity_recorder=recorder,
+        )
+        await recorder.close()
+
+    async def test_repeat_validation_skips_repositories(
+        self,
+        service: AuthenticationService,
+        repositories: tuple[AsyncMock, AsyncMock],
+        user: User,
+    ) -> None:
+        user_repository, session_repository = repositories
+
+        for _ in range(10):
+            assert (await service.validate_token("t")).id == user.id
+
+        user_repository.get_by_id.assert_awaited_once()
+        session_repository.get_by_access_token.assert_awaited_once()
+        session_repository.update.assert_not_awaited()
+        assert service.activity_recorder is not None
+        assert service.activity_recorder.pending == 1
+
+    async def test_logout_invalidates_cached_validation(
+        self,
+        service: AuthenticationService,
+        repositories: tuple[AsyncMock, AsyncMock],
+    ) -> None:
+        user_repository, _ = repositories
+        await service.validate_token("t")
+
+        await service.logout("t")
+        await service.validate_token("t")
+
+        assert user_repository.get_by_id.await_count == 2
+
+    async def test_revoking_user_sessions_invalidates_cache(
+        self,
+        service: AuthenticationService,
+        repositories: tuple[AsyncMock, AsyncMock],
+        user: User,
+    ) -> None:
+        user_repository, _ = repositories
+        await service.validate_token("t")
+
+        await service.revoke_all_user_sessions(user.id)
+        user.status = UserStatus.SUSPENDED
+        with pytest.raises(AuthenticationError, match="not active"):
+            await service.validate_token("t")
+
+        assert user_repository.get_by_id.await_count == 2
+
+    async def test_cached_user_is_not_shared_with_callers(
+        self,
+        service: AuthenticationService,
+    ) -> None:
+        first = await service.validate_token("t")
+        first.full_name = "Mutated"
+
+        second = await service.validate_token("t")
+
+        assert second.full_name == "Cached User"
@@ -0,0 +1,121 @@
+"""Tests for AuthorizationService principal resolution."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.services.authorization_service import (
+    AuthorizationService,
+    InsufficientPermissionsError,
+    authorization_scope,
+)
+from src.domain.entities.user import User, UserRole, UserStatus
+from src.domain.value_objects.permission import Permission
+
+
+def _user(role: UserRole) -> User:
+    return User(
+        id=uuid4(),
+        email="authz@example.com",
+        username="authz",
+        full_name="Authz User",
+        hashed_password="hashed_password_for_testing",
+        role=role,
+        status=UserStatus.ACTIVE,
+        email_verified=True,
+    )
+
+
+@pytest.fixture
+def curator() -> User:
+    return _user(UserRole.CURATOR)
+
+
+@pytest.fixture
+def repository(curator: User) -> AsyncMock:
+    repository = AsyncMock()
+    repository.get_by_id.return_value = curator
+    return repository
+
+
+@pytest.fixture
+def service(repository: AsyncMock) -> AuthorizationService:
+    return AuthorizationService(repository)
+
+
+async def test_require_all_permissions_loads_user_once(
+    service: AuthorizationService,
+    repository: AsyncMock,
+    curator: User,
+) -> None:
+    with pytest.raises(InsufficientPermissionsError, match="user:delete"):
+        await service.require_all_permissions(
+            curator.id,
+            [Permission.CURATION_REVIEW, Permission.USER_DELETE],
+        )
+
+    repository.get_by_id.assert_awaited_once_with(curator.id)
+
+
+async def test_scope_shares_principal_across_checks(
+    service: AuthorizationService,
+    repository: AsyncMock,
+    curator: User,
+) -> None:
+    with authorization_scope():
+        await service.require_permission(curator.id, Permission.CURATION_REVIEW)
+        await service.require_any_permission(
+            curator.id,
+            [Permission.SYSTEM_ADMIN, Permission.DATASOURCE_UPDATE],
+        )
+        assert await service.has_all_permissions(
+            curator.id,
+            [Permission.CURATION_APPROVE, Permission.CURATION_REJECT],
+        )
+        assert await service.get_missing_permissions(
+            curator.id,
+            [Permission.AUDIT_READ],
+        ) == [Permission.AUDIT_READ]
+        access = await service.get_accessible_resources(
+            curator.id,
+            "curation",
+            "approve",
+        )
+
+    assert access["has_access"] is True
+    repository.get_by_id.assert_awaited_once()
+
+
+async def test_scopes_do_not_leak_between_units_of_work(
+    service: AuthorizationService,
+    repository: AsyncMock,
+    curator: User,
+) -> None:
+    with authorization_scope():
+        assert not await service.has_permission(curator.id, Permission.USER_READ)
+
+    repository.get_by_id.return_value = _user(UserRole.ADMIN)
+    with authorization_scope():
+        assert await service.has_permission(curator.id, Permission.USER_READ)
+
+    assert repository.get_by_id.await_count == 2
+
+
+async def test_unknown_user_has_no_permissions(
+    service: AuthorizationService,
+    repository: AsyncMock,
+) -> None:
+    repository.get_by_id.return_value = None
+    user_id = uuid4()
+
+    with authorization_scope():
+        assert await service.get_user_permissions(user_id) == []
+        assert not await service.has_any_permission(
+            user_id,
+            [Permission.DATASOURCE_READ],
+        )
+        access = await service.get_accessible_resources(user_id, "user", "read")
+
+    assert access == {"has_access": False, "reason": "User not found"}
+    repository.get_by_id.assert_awaited_once()
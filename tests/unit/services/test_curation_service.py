@@ -0,0 +1,178 @@
+"""Tests for batched review queue enrichment in CurationService."""
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.application.curation.repositories.review_repository import (
+    SqlAlchemyReviewRepository,
+)
+from src.application.curation.services.curation_service import CurationService
+from src.application.services import (
+    EvidenceApplicationService,
+    PhenotypeApplicationService,
+    VariantApplicationService,
+)
+from src.domain.services.evidence_domain_service import EvidenceDomainService
+from src.domain.services.variant_domain_service import VariantDomainService
+from src.infrastructure.repositories import (
+    SqlAlchemyEvidenceRepository,
+    SqlAlchemyPhenotypeRepository,
+    SqlAlchemyVariantRepository,
+)
+from src.models.database import (
+    Base,
+    EvidenceModel,
+    GeneModel,
+    PhenotypeModel,
+    VariantModel,
+)
+from src.models.database.review import ReviewRecord
+
+# Review page, variants + their evidence, card evidence, card phenotypes
+QUEUE_PAGE_STATEMENTS = 5
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def _seed(db: Session, variants: int) -> None:
+    gene = GeneModel(gene_id="GENE001", symbol="MED13")
+    phenotypes = [
+        PhenotypeModel(
+            hpo_id=f"HP:{index:07d}",
+            hpo_term=f"Phenotype {index}",
+            name=f"Phenotype {index}",
+            category="other",
+            is_root_term=False,
+        )
+        for index in range(5)
+    ]
+    db.add_all([gene, *phenotypes])
+    db.flush()
+    for index in range(variants):
+        variant = VariantModel(
+            gene_id=gene.id,
+            variant_id=f"chr17:{61942600 + index}:A>G",
+            chromosome="17",
+            position=61942600 + index,
+            reference_allele="A",
+            alternate_allele="G",
+            clinical_significance="pathogenic" if index % 2 else "benign",
+        )
+        db.add(variant)
+        db.flush()
+        db.add_all(
+            EvidenceModel(
+                variant_id=variant.id,
+                phenotype_id=phenotypes[(index + offset) % len(phenotypes)].id,
+                description=f"Evidence {offset} for variant {index}",
+                evidence_level="strong" if offset == 0 else "supporting",
+                evidence_type="clinical_report",
+                confidence_score=0.8,
+            )
+            for offset in range(4)
+        )
+        db.add(
+            ReviewRecord(
+                entity_type="variants",
+                entity_id=str(variant.id),
+                status="pending",
+                priority="high",
+            ),
+        )
+    # A review pointing at a variant that no longer exists is skipped
+    db.add(
+        ReviewRecord(
+            entity_type="variants",
+            entity_id="999999",
+            status="pending",
+        ),
+    )
+    db.commit()
+
+
+def _service(db: Session) -> CurationService:
+    return CurationService(
+        review_repository=SqlAlchemyReviewRepository(),
+        variant_service=VariantApplicationService(
+            variant_repository=SqlAlchemyVariantRepository(db),
+            variant_domain_service=VariantDomainService(),
+            evidence_repository=SqlAlchemyEvidenceRepository(db),
+        ),
+        evidence_service=EvidenceApplicationService(
+            evidence_repository=SqlAlchemyEvidenceRepository(db),
+            evidence_domain_service=EvidenceDomainService(),
+        ),
+        phenotype_service=PhenotypeApplicationService(
+            phenotype_repository=SqlAlchemyPhenotypeRepository(db),
+        ),
+    )
+
+
+@pytest.mark.usefixtures("strict_loading")
+def test_queue_page_uses_a_constant_number_of_statements(
+    session: Session,
+    count_statements,
+) -> None:
+    _seed(session, variants=60)
+
+    def page(limit: int) -> tuple[int, int]:
+        session.expunge_all()
+        with count_statements(session.get_bind()) as log:
+            _, total = _service(session).get_enriched_review_queue(
+                session,
+                CurationService.ReviewQueueQuery(limit=limit),
+            )
+        return log.count, total
+
+    small, small_total = page(5)
+    full, full_total = page(50)
+
+    assert (small_total, full_total) == (5, 50)
+    assert small == full == QUEUE_PAGE_STATEMENTS
+
+
+def test_cards_carry_variant_evidence_and_phenotypes(session: Session) -> None:
+    _seed(session, variants=3)
+
+    cards, total = _service(session).get_enriched_review_queue(
+        session,
+        CurationService.ReviewQueueQuery(),
+    )
+
+    assert total == 3
+    first = cards[0]
+    assert first["gene_symbol"] == "MED13"
+    assert first["evidence_count"] == 4
+    assert sorted(first["evidence_levels"]) == ["strong", "supporting"]
+    assert [phenotype["name"] for phenotype in first["phenotypes"]] == [
+        "Phenotype 0",
+        "Phenotype 1",
+        "Phenotype 2",
+    ]
+
+
+def test_clinical_filters_drop_cards(session: Session) -> None:
+    _seed(session, variants=4)
+
+    cards, total = _service(session).get_enriched_review_queue(
+        session,
+        CurationService.ReviewQueueQuery(
+            clinical_filters={"clinical_significance": ["pathogenic"]},
+        ),
+    )
+
+    assert total == 2
+    assert {card["clinical_significance"] for card in cards} == {"pathogenic"}
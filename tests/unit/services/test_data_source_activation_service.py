@@ -8,6 +8,7 @@ from uuid import UUID, uuid4
 import pytest
 
 from src.application.services.data_source_activation_service import (
+    ActivationRuleCache,
     DataSourceActivationService,
 )
 from src.domain.entities.data_source_activation import (
@@ -28,6 +29,7 @@ class InMemoryActivationRepository(DataSourceActivationRepository):
             tuple[str, ActivationScope, UUID | None],
             DataSourceActivation,
         ] = {}
+        self.scope_queries = 0
 
     def _key(
         self,
@@ -63,6 +65,18 @@ class InMemoryActivationRepository(DataSourceActivationRepository):
                 rules_by_source[catalog_entry_id].append(rule)
         return rules_by_source
 
+    def list_rules_for_scope(
+        self,
+        research_space_id: UUID | None = None,
+    ) -> list[DataSourceActivation]:
+        self.scope_queries += 1
+        return [
+            rule
+            for (_entry_id, scope, space_id), rule in self._rules.items()
+            if scope == ActivationScope.GLOBAL
+            or (research_space_id is not None and space_id == research_space_id)
+        ]
+
     def set_rule(
         self,
         *,
@@ -197,3 +211,78 @@ def test_bulk_summary_preserves_order(
     assert [summary.catalog_entry_id for summary in summaries] == [ids[1], ids[0]]
     assert summaries[0].effective_is_active is False
     assert summaries[1].effective_is_active is False
+
+
+def test_bulk_levels_resolve_rules_with_one_query() -> None:
+    repository = InMemoryActivationRepository()
+    service = DataSourceActivationService(repository)
+    space_id = uuid4()
+    admin_id = uuid4()
+    service.set_global_activation(
+        catalog_entry_id="clinvar",
+        permission_level=PermissionLevel.AVAILABLE,
+        updated_by=admin_id,
+    )
+    service.set_global_activation(
+        catalog_entry_id="omim",
+        permission_level=PermissionLevel.VISIBLE,
+        updated_by=admin_id,
+    )
+    service.set_project_activation(
+        catalog_entry_id="clinvar",
+        research_space_id=space_id,
+        permission_level=PermissionLevel.BLOCKED,
+        updated_by=admin_id,
+    )
+    ids = ["pubmed", "clinvar", "omim", "unknown"]
+
+    levels = service.get_effective_permission_levels(ids, space_id)
+
+    assert repository.scope_queries == 1
+    assert levels == {
+        entry_id: service.get_effective_permission_level(entry_id, space_id)
+        for entry_id in ids
+    }
+    assert levels["clinvar"] == PermissionLevel.BLOCKED
+    assert service.get_effective_permission_levels(ids)["clinvar"] == (
+        PermissionLevel.AVAILABLE
+    )
+
+
+def test_rule_cache_serves_repeat_lookups_until_rules_change() -> None:
+    repository = InMemoryActivationRepository()
+    cache = ActivationRuleCache()
+    service = DataSourceActivationService(repository, rule_cache=cache)
+    other = DataSourceActivationService(repository, rule_cache=cache)
+    space_id = uuid4()
+
+    for _ in range(5):
+        assert not service.is_source_active("clinvar", space_id)
+    assert repository.scope_queries == 1
+
+    other.set_project_activation(
+        catalog_entry_id="clinvar",
+        research_space_id=space_id,
+        permission_level=PermissionLevel.AVAILABLE,
+        updated_by=uuid4(),
+    )
+    assert cache.version == 1
+    assert service.is_source_active("clinvar", space_id)
+    assert not service.is_source_active("clinvar")
+    assert repository.scope_queries == 3
+
+
+def test_rule_cache_discards_loads_that_race_an_invalidation() -> None:
+    cache = ActivationRuleCache()
+    loads: list[int] = []
+
+    def racing_loader() -> list[DataSourceActivation]:
+        loads.append(cache.version)
+        if len(loads) == 1:
+            cache.invalidate()
+        return []
+
+    for _ in range(3):
+        cache.get_or_load(None, racing_loader)
+
+    assert loads == [0, 1]
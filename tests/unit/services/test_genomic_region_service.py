@@ -0,0 +1,183 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.gene_service import GeneApplicationService
+from src.application.services.genomic_region_service import (
+    GenomicIndexCache,
+    GenomicRegionService,
+)
+from src.application.services.variant_service import VariantApplicationService
+from src.domain.services.gene_domain_service import GeneDomainService
+from src.domain.services.variant_domain_service import VariantDomainService
+from src.infrastructure.repositories import (
+    SqlAlchemyEvidenceRepository,
+    SqlAlchemyGeneRepository,
+    SqlAlchemyVariantRepository,
+)
+from src.models.database import Base, GeneModel, VariantModel
+from src.routes.variants import get_genomic_region_service, router
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session_local = sessionmaker(bind=engine)
+    db_session = session_local()
+    try:
+        yield db_session
+    finally:
+        db_session.close()
+
+
+def seed_region(db_session) -> None:
+    med13 = GeneModel(
+        gene_id="GENE001",
+        symbol="MED13",
+        chromosome="CHR17",
+        start_position=1_000,
+        end_position=5_000,
+    )
+    neighbour = GeneModel(
+        gene_id="GENE002",
+        symbol="NEIGHBOUR",
+        chromosome="CHR17",
+        start_position=4_000,
+        end_position=9_000,
+    )
+    db_session.add_all([med13, neighbour])
+    db_session.flush()
+    for position in (500, 1_500, 4_500, 8_000):
+        db_session.add(
+            VariantModel(
+                gene_id=med13.id,
+                variant_id=f"chr17:{position}:A>T",
+                chromosome="CHR17",
+                position=position,
+                reference_allele="A",
+                alternate_allele="T",
+                clinical_significance="pathogenic",
+            ),
+        )
+    db_session.commit()
+
+
+def build_service(db_session, cache: GenomicIndexCache) -> GenomicRegionService:
+    return GenomicRegionService(
+        gene_repository=SqlAlchemyGeneRepository(db_session),
+        variant_repository=SqlAlchemyVariantRepository(db_session),
+        index_cache=cache,
+    )
+
+
+def test_query_region_returns_overlapping_genes_and_variants(session) -> None:
+    seed_region(session)
+    service = build_service(session, GenomicIndexCache())
+
+    region = service.query_region("17", 1_200, 4_600)
+
+    assert region.chromosome == "CHR17"
+    assert [gene.symbol for gene in region.genes] == ["MED13", "NEIGHBOUR"]
+    assert [variant.position for variant in region.variants] == [1_500, 4_500]
+    assert region.variant_count == 2
+
+
+def test_query_region_truncates_variants_but_reports_total(session) -> None:
+    seed_region(session)
+    service = build_service(session, GenomicIndexCache())
+
+    region = service.query_region("chr17", 1, 10_000, variant_limit=1)
+
+    assert [variant.position for variant in region.variants] == [500]
+    assert region.variant_count == 4
+
+
+def test_index_cache_reloads_after_ttl(session) -> None:
+    now = [0.0]
+    cache = GenomicIndexCache(ttl_seconds=10.0, clock=lambda: now[0])
+    service = build_service(session, cache)
+
+    assert service.query_region("17", 1, 10_000).genes == []
+
+    seed_region(session)
+    assert service.query_region("17", 1, 10_000).genes == []
+
+    now[0] = 11.0
+    assert len(service.query_region("17", 1, 10_000).genes) == 2
+
+
+def test_application_service_writes_invalidate_cached_indexes(session) -> None:
+    seed_region(session)
+    cache = GenomicIndexCache(ttl_seconds=3600.0)
+    service = build_service(session, cache)
+    gene_service = GeneApplicationService(
+        gene_repository=SqlAlchemyGeneRepository(session),
+        gene_domain_service=GeneDomainService(),
+        variant_repository=SqlAlchemyVariantRepository(session),
+        index_cache=cache,
+    )
+    variant_service = VariantApplicationService(
+        variant_repository=SqlAlchemyVariantRepository(session),
+        variant_domain_service=VariantDomainService(),
+        evidence_repository=SqlAlchemyEvidenceRepository(session),
+        index_cache=cache,
+    )
+    assert len(service.query_region("17", 1, 10_000).genes) == 2
+
+    created = gene_service.create_gene(
+        {
+            "symbol": "LATE",
+            "chromosome": "17",
+            "start_position": 6_000,
+            "end_position": 7_000,
+        },
+    )
+    assert "LATE" in [
+        gene.symbol for gene in service.query_region("17", 1, 10_000).genes
+    ]
+
+    moved = session.query(VariantModel).filter_by(position=8_000).one()
+    variant_service.update_variant(moved.id, {"position": 9_500})
+    assert service.query_region("17", 8_000, 8_000).variants == []
+
+    gene_service.delete_gene(created.gene_id)
+    assert len(service.query_region("17", 1, 10_000).genes) == 2
+
+
+def test_query_region_rejects_invalid_bounds(session) -> None:
+    service = build_service(session, GenomicIndexCache())
+
+    with pytest.raises(ValueError):
+        service.query_region("17", 500, 100)
+    with pytest.raises(ValueError):
+        service.query_region("chrQ", 1, 100)
+
+
+def test_region_route_is_not_shadowed_by_variant_lookup(session) -> None:
+    seed_region(session)
+    service = build_service(session, GenomicIndexCache())
+    # Warm the index here so the request thread never touches the SQLite session.
+    service.query_region("17", 1, 1)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_genomic_region_service] = lambda: service
+    client = TestClient(app)
+
+    response = client.get(
+        "/variants/region",
+        params={"chromosome": "17", "start": 4_400, "end": 8_500},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [gene["symbol"] for gene in payload["genes"]] == ["MED13", "NEIGHBOUR"]
+    assert [item["position"] for item in payload["variants"]] == [4_500, 8_000]
+
+    bad = client.get(
+        "/variants/region",
+        params={"chromosome": "17", "start": 900, "end": 100},
+    )
+    assert bad.status_code == 400
@@ -0,0 +1,227 @@
+"""
+Tests for the parallel and incremental transformation pipeline modes.
+
+Both modes must produce the same normalized entities and relationships as a
+sequential run over the same input.
+"""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.transform.transformers.incremental_state import (
+    STATE_DIRNAME,
+    record_fingerprint,
+)
+from src.domain.transform.transformers.transformation_pipeline import (
+    PipelineConfig,
+    PipelineMode,
+    TransformationPipeline,
+)
+from src.type_definitions.common import RawRecord
+
+COMPARED_STAGES = ("parsed", "normalized", "mapped")
+
+
+def _clinvar_record(index: int, gene: str, significance: str = "Pathogenic"):
+    return {
+        "clinvar_id": f"VCV{index}",
+        "raw_xml": f"""<?xml version="1.0"?>
+<ClinVarResult-Set>
+<VariationArchive VariationID="{index}" VariationName="TEST:c.{index}A>G">
+<Species>Homo sapiens</Species>
+<ClassifiedRecord>
+<SimpleAllele VariationID="{index}">
+<GeneList><Gene Symbol="{gene}" GeneID="{index}"/></GeneList>
+</SimpleAllele>
+<Classifications><GermlineClassification>
+<Description>{significance}</Description>
+</GermlineClassification></Classifications>
+</ClassifiedRecord>
+</VariationArchive>
+</ClinVarResult-Set>""",
+    }
+
+
+def _hpo_record(index: int) -> RawRecord:
+    return {
+        "hpo_id": f"HP:{index:07d}",
+        "name": f"Phenotype {index}",
+        "definition": "A test phenotype.",
+        "format": "sample",
+    }
+
+
+def _uniprot_record(index: int, gene: str) -> RawRecord:
+    return {
+        "primaryAccession": f"P{index:05d}",
+        "uniProtkbId": "TEST_HUMAN",
+        "proteinDescription": {
+            "recommendedName": {"fullName": {"value": "Test protein"}},
+        },
+        "genes": [{"geneName": {"value": gene}}],
+        "organism": {"scientificName": "Homo sapiens", "taxonId": "9606"},
+        "sequence": {"length": 100, "mass": 11000},
+    }
+
+
+def _raw_data() -> dict[str, list[RawRecord]]:
+    return {
+        "clinvar": [_clinvar_record(i, f"GENE{i % 4}") for i in range(1, 13)],
+        "hpo": [_hpo_record(i) for i in range(1, 9)],
+        "uniprot": [_uniprot_record(i, f"GENE{i % 3}") for i in range(1, 5)],
+        "unknown_source": [{"id": 1}],
+    }
+
+
+def _pipeline(
+    output_dir: Path,
+    mode: PipelineMode = PipelineMode.SEQUENTIAL,
+    **config_overrides: int,
+) -> TransformationPipeline:
+    return TransformationPipeline(
+        PipelineConfig(mode=mode, output_dir=output_dir, **config_overrides),
+    )
+
+
+async def _run(
+    raw_data: dict[str, list[RawRecord]],
+    pipeline: TransformationPipeline,
+):
+    return await pipeline.execute_pipeline(raw_data)
+
+
+def _assert_same_output(actual, expected) -> None:
+    for stage in COMPARED_STAGES:
+        assert actual.transformed_data[stage] == expected.transformed_data[stage]
+    assert actual.errors == expected.errors
+
+
+class TestParallelMode:
+    @pytest.mark.asyncio
+    async def test_parallel_run_matches_sequential_output(self, tmp_path):
+        raw_data = _raw_data()
+        sequential = await _run(raw_data, _pipeline(tmp_path / "sequential"))
+
+        parallel = await _run(
+            raw_data,
+            _pipeline(
+                tmp_path / "parallel",
+                PipelineMode.PARALLEL,
+                max_concurrent_sources=2,
+                batch_size=5,
+            ),
+        )
+
+        assert parallel.success
+        _assert_same_output(parallel, sequential)
+
+    @pytest.mark.asyncio
+    async def test_single_worker_runs_in_process(self, tmp_path):
+        raw_data = _raw_data()
+        sequential = await _run(raw_data, _pipeline(tmp_path / "sequential"))
+
+        parallel = await _run(
+            raw_data,
+            _pipeline(
+                tmp_path / "parallel",
+                PipelineMode.PARALLEL,
+                max_concurrent_sources=1,
+                batch_size=3,
+            ),
+        )
+
+        _assert_same_output(parallel, sequential)
+
+
+class TestIncrementalMode:
+    @pytest.mark.asyncio
+    async def test_only_new_or_changed_records_are_transformed(self, tmp_path):
+        pipeline = _incremental_pipeline(tmp_path)
+        raw_data = _raw_data()
+        first = await _run(raw_data, pipeline)
+        assert (
+            first.transformed_data["metadata"]["incremental"]["transformed_records"]
+            == sum(len(records) for records in raw_data.values()) - 1
+        )
+
+        updated = copy.deepcopy(raw_data)
+        updated["clinvar"][2] = _clinvar_record(3, "GENE0", "Benign")
+        updated["clinvar"].append(_clinvar_record(99, "GENE9"))
+        del updated["hpo"][0]
+
+        second = await _run(updated, pipeline)
+
+        assert second.transformed_data["metadata"]["incremental"] == {
+            "reused_records": 22,
+            "transformed_records": 2,
+            "removed_records": 2,
+            "cached_records": 24,
+        }
+        sequential = await _run(updated, _pipeline(tmp_path / "sequential"))
+        _assert_same_output(second, sequential)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_input_reuses_previous_mapping(self, tmp_path):
+        pipeline = _incremental_pipeline(tmp_path)
+        raw_data = _raw_data()
+        await _run(raw_data, pipeline)
+        previous_mapping = pipeline.incremental_state.mapped
+
+        rerun = await _run(raw_data, pipeline)
+
+        assert (
+            rerun.transformed_data["metadata"]["incremental"]["transformed_records"]
+            == 0
+        )
+        assert pipeline.transformer.last_mapped_data is previous_mapping
+        sequential = await _run(raw_data, _pipeline(tmp_path / "sequential"))
+        _assert_same_output(rerun, sequential)
+
+    @pytest.mark.asyncio
+    async def test_cache_carries_over_to_a_new_pipeline(self, tmp_path):
+        raw_data = _raw_data()
+        await _run(raw_data, _incremental_pipeline(tmp_path))
+        updated = copy.deepcopy(raw_data)
+        updated["hpo"].append(_hpo_record(50))
+
+        # A new instance, as in the next nightly run's process
+        second = await _run(updated, _incremental_pipeline(tmp_path))
+
+        assert second.transformed_data["metadata"]["incremental"] == {
+            "reused_records": 24,
+            "transformed_records": 1,
+            "removed_records": 0,
+            "cached_records": 25,
+        }
+        sequential = await _run(updated, _pipeline(tmp_path / "sequential"))
+        _assert_same_output(second, sequential)
+
+    @pytest.mark.asyncio
+    async def test_mismatched_state_files_are_ignored(self, tmp_path):
+        raw_data = _raw_data()
+        await _run(raw_data, _incremental_pipeline(tmp_path))
+        state_dir = tmp_path / STATE_DIRNAME
+        saved = json.loads((state_dir / "fingerprints.json").read_text())
+        saved["cached"]["hpo"].pop()
+        (state_dir / "fingerprints.json").write_text(json.dumps(saved))
+
+        rerun = await _run(raw_data, _incremental_pipeline(tmp_path))
+
+        assert (
+            rerun.transformed_data["metadata"]["incremental"]["transformed_records"]
+            == sum(len(records) for records in raw_data.values()) - 1
+        )
+
+
+def _incremental_pipeline(output_dir: Path) -> TransformationPipeline:
+    return _pipeline(output_dir, PipelineMode.INCREMENTAL, max_concurrent_sources=1)
+
+
+def test_record_fingerprint_ignores_key_order():
+    assert record_fingerprint({"a": 1, "b": [1, 2]}) == record_fingerprint(
+        {"b": [1, 2], "a": 1},
+    )
+    assert record_fingerprint({"a": 1}) != record_fingerprint({"a": 2})
@@ -0,0 +1,102 @@
+"""Tests for the compressed, append-only raw record spool."""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from src.domain.transform.raw_spool import (
+    RawRecordSpool,
+    RawSpoolIntegrityError,
+    iter_raw_records,
+    iter_raw_snapshot,
+    snapshot_segments,
+)
+from src.type_definitions.common import RawRecord
+
+
+def _records(count: int) -> list[RawRecord]:
+    return [
+        {"pubmed_id": str(index), "title": f"MED13 study {index}", "year": 2024}
+        for index in range(count)
+    ]
+
+
+def test_records_round_trip_through_the_snapshot(tmp_path: Path) -> None:
+    records = _records(50)
+
+    with RawRecordSpool(tmp_path, "pubmed_20240801_120000") as spool:
+        spool.write_many(records)
+
+    assert spool.record_count == 50
+    assert len(spool.segments) == 1
+    assert not list(tmp_path.glob("*.partial"))
+    assert list(iter_raw_snapshot(tmp_path, "pubmed_20240801_120000")) == records
+
+
+def test_segments_rotate_by_size(tmp_path: Path) -> None:
+    records = _records(2_000)
+    spool = RawRecordSpool(tmp_path, "run", max_segment_bytes=4_096)
+
+    sealed = spool.write_many(records)
+    last = spool.close()
+
+    assert last is not None
+    assert sealed
+    assert spool.segments == [*sealed, last]
+    assert sum(segment.record_count for segment in spool.segments) == 2_000
+    assert snapshot_segments(tmp_path, "run") == [
+        segment.path for segment in spool.segments
+    ]
+    assert list(iter_raw_snapshot(tmp_path, "run")) == records
+
+
+def test_segment_names_carry_the_content_hash(tmp_path: Path) -> None:
+    first = RawRecordSpool(tmp_path / "a", "run")
+    second = RawRecordSpool(tmp_path / "b", "run")
+    for spool in (first, second):
+        spool.directory.mkdir()
+        spool.write_many(_records(10))
+        spool.close()
+
+    a, b = first.segments[0], second.segments[0]
+    assert a.sha256 == b.sha256
+    assert a.path.name == b.path.name
+    assert a.sha256[:16] in a.path.name
+    assert a.path.read_bytes() == b.path.read_bytes()
+
+
+def test_tampered_segment_fails_verification(tmp_path: Path) -> None:
+    spool = RawRecordSpool(tmp_path, "run")
+    spool.write_many(_records(3))
+    segment = spool.close()
+    assert segment is not None
+    with gzip.open(segment.path, "wb") as handle:
+        handle.write(b'{"pubmed_id":"999"}\n')
+
+    with pytest.raises(RawSpoolIntegrityError):
+        list(iter_raw_records([segment.path]))
+    assert list(iter_raw_records([segment.path], verify=False)) == [
+        {"pubmed_id": "999"},
+    ]
+
+
+def _fail_midway(directory: Path) -> None:
+    message = "source went away"
+    with RawRecordSpool(directory, "run", max_segment_bytes=1_024) as spool:
+        spool.write_many(_records(500))
+        raise RuntimeError(message)
+
+
+def test_failed_run_leaves_no_files(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError):
+        _fail_midway(tmp_path)
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_empty_run_seals_nothing(tmp_path: Path) -> None:
+    spool = RawRecordSpool(tmp_path, "run")
+
+    assert spool.close() is None
+    assert not list(tmp_path.iterdir())
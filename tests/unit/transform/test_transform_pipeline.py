@@ -9,19 +9,31 @@ import pytest
 from src.domain.transform.mappers.gene_variant_mapper import (
     GeneVariantLink,
     GeneVariantMapper,
+    GeneVariantRelationship,
+)
+from src.domain.transform.mappers.variant_phenotype_mapper import (
+    VariantPhenotypeMapper,
 )
 from src.domain.transform.normalizers.gene_normalizer import (
     GeneIdentifierType,
     GeneNormalizer,
     NormalizedGene,
 )
+from src.domain.transform.normalizers.phenotype_normalizer import (
+    NormalizedPhenotype,
+    PhenotypeIdentifierType,
+)
 from src.domain.transform.normalizers.variant_normalizer import (
+    GenomicLocation,
     NormalizedVariant,
+    VariantIdentifierType,
     VariantNormalizer,
 )
 from src.domain.transform.parsers.clinvar_parser import ClinVarParser, ClinVarVariant
 from src.domain.transform.parsers.pubmed_parser import PubMedParser, PubMedPublication
 from src.domain.transform.transformers.etl_transformer import ETLTransformer
+from src.domain.transform.transformers.stage_handlers import MappingStageRunner
+from src.domain.transform.transformers.stage_models import NormalizedDataBundle
 from src.domain.transform.transformers.transformation_pipeline import (
     PipelineConfig,
     PipelineMode,
@@ -291,6 +303,182 @@ class TestGeneVariantMapper:
         errors = self.mapper.validate_mapping(link)
         assert len(errors) == 0  # Should be valid
 
+    def test_map_variant_to_genes_uses_padded_gene_windows(self):
+        """Indexed lookup links overlapping and flanking genes only."""
+        self.mapper.load_gene_coordinates(
+            [
+                ("KCNT1", "9", 10_000, 20_000),
+                ("NEAR", "9", 21_000, 30_000),
+                ("FAR", "9", 50_000, 60_000),
+                ("OTHER", "10", 10_000, 20_000),
+            ],
+        )
+        variant = Mock()
+        variant.primary_id = "v1"
+        variant.source = "clinvar"
+        variant.genomic_location = Mock(chromosome="9", position=20_300)
+
+        links = self.mapper.map_variant_to_genes(variant)
+
+        assert [(link.gene_id, link.relationship_type) for link in links] == [
+            ("KCNT1", GeneVariantRelationship.DOWNSTREAM),
+            ("NEAR", GeneVariantRelationship.UPSTREAM),
+        ]
+        assert [link.genomic_distance for link in links] == [300, 700]
+        assert self.mapper.find_genes_near("9", 40_000) == []
+
+
+def _variant(primary_id, significance, source):
+    return NormalizedVariant(
+        primary_id=primary_id,
+        id_type=VariantIdentifierType.CLINVAR_VCV,
+        genomic_location=None,
+        hgvs_notations={},
+        clinical_significance=significance,
+        gene_symbol="MED13",
+        cross_references={},
+        source=source,
+        confidence_score=0.9,
+    )
+
+
+def _phenotype(primary_id, source, id_type=PhenotypeIdentifierType.HPO_ID):
+    return NormalizedPhenotype(
+        primary_id=primary_id,
+        id_type=id_type,
+        name=primary_id,
+        definition=None,
+        synonyms=[],
+        category=None,
+        cross_references={},
+        source=source,
+        confidence_score=0.9,
+    )
+
+
+class TestVariantPhenotypeMapper:
+    """Test indexed variant-phenotype linking."""
+
+    def test_indexed_linking_matches_pairwise_linking(self):
+        """Indexed candidate generation yields the pairwise links exactly."""
+        variants = [
+            _variant("V1", "Pathogenic", "clinvar"),
+            _variant("V2", "Likely benign", "uniprot"),
+            _variant("V3", None, "clinvar"),
+            _variant("V4", "not provided", "clinvar"),
+            _variant("V5", None, "uniprot"),
+            _variant("V6", "risk factor", "hpo"),
+        ]
+        phenotypes = [
+            _phenotype("HP:0000001", "hpo"),
+            _phenotype("HP:0000002", "clinvar"),
+            _phenotype("OMIM:100", "clinvar", PhenotypeIdentifierType.OMIM_ID),
+            _phenotype("HP:0000003", "uniprot"),
+        ]
+
+        pairwise = VariantPhenotypeMapper()
+        expected = [
+            link
+            for variant in variants
+            for phenotype in phenotypes
+            if (
+                link := pairwise.map_variant_phenotype_relationship(
+                    variant,
+                    phenotype,
+                )
+            )
+        ]
+
+        indexed = VariantPhenotypeMapper()
+        actual = indexed.map_variant_phenotype_relationships(variants, phenotypes)
+
+        assert actual == expected
+        assert indexed.variant_to_phenotypes == pairwise.variant_to_phenotypes
+        assert indexed.phenotype_to_variants == pairwise.phenotype_to_variants
+
+    def test_indexed_linking_skips_unlinkable_pairs(self):
+        """Variants without significance only see same-source candidates."""
+        mapper = VariantPhenotypeMapper()
+        variants = [_variant("V1", None, "clinvar"), _variant("V2", None, "hpo")]
+        phenotypes = [_phenotype("HP:1", "hpo"), _phenotype("HP:2", "clinvar")]
+
+        with patch.object(
+            mapper,
+            "_calculate_confidence",
+            wraps=mapper._calculate_confidence,
+        ) as scorer:
+            links = mapper.map_variant_phenotype_relationships(variants, phenotypes)
+
+        assert [(link.variant_id, link.phenotype_id) for link in links] == [
+            ("V1", "HP:2"),
+        ]
+        assert scorer.call_count == 1
+
+
+def _located_variant(primary_id, gene_symbol, chromosome, position):
+    return NormalizedVariant(
+        primary_id=primary_id,
+        id_type=VariantIdentifierType.CLINVAR_VCV,
+        genomic_location=GenomicLocation(
+            chromosome=chromosome,
+            position=position,
+            reference_allele="A",
+            alternate_allele="T",
+        ),
+        hgvs_notations={},
+        clinical_significance=None,
+        gene_symbol=gene_symbol,
+        cross_references={},
+        source="clinvar",
+        confidence_score=0.9,
+    )
+
+
+class TestMappingStageRunner:
+    """Test gene-variant linking in the mapping stage."""
+
+    def setup_method(self):
+        gene = NormalizedGene(
+            primary_id="HGNC:22474",
+            id_type=GeneIdentifierType.HGNC_ID,
+            symbol="MED13",
+            name=None,
+            synonyms=[],
+            cross_references={},
+            source="clinvar",
+            confidence_score=0.9,
+        )
+        self.bundle = NormalizedDataBundle(
+            genes=[gene],
+            variants=[
+                _located_variant("V1", "MED13", "17", 61_900_000),
+                _located_variant("V2", "med13", "17", 62_000_000),
+                _located_variant("V3", "MED13", "X", 1_000),
+                _located_variant("V4", "OTHER", "17", 61_950_000),
+            ],
+        )
+
+    def test_links_variants_to_the_gene_their_record_names(self):
+        """Without coordinates every named variant links, on any chromosome."""
+        mapped, _result = MappingStageRunner().run(self.bundle)
+
+        assert [
+            (link.gene_id, link.variant_id) for link in mapped.gene_variant_links
+        ] == [("HGNC:22474", "V1"), ("HGNC:22474", "V2"), ("HGNC:22474", "V3")]
+
+    def test_supplied_coordinates_link_by_location(self):
+        """Annotation coordinates replace symbol linking with window lookups."""
+        runner = MappingStageRunner(
+            gene_coordinates=[("HGNC:22474", "17", 61_942_000, 62_065_000)],
+        )
+
+        mapped, _result = runner.run(self.bundle)
+
+        assert [link.variant_id for link in mapped.gene_variant_links] == [
+            "V2",
+            "V4",
+        ]
+
 
 class TestDataQualityValidator:
     """Test data quality validation."""
@@ -354,8 +542,9 @@ class TestDataQualityValidator:
 class TestETLTransformer:
     """Test ETL transformation orchestrator."""
 
-    def setup_method(self):
-        self.transformer = ETLTransformer()
+    @pytest.fixture(autouse=True)
+    def _transformer(self, tmp_path):
+        self.transformer = ETLTransformer(tmp_path)
 
     @patch(
         "src.domain.transform.transformers.etl_transformer.ETLTransformer._parse_all_sources",
@@ -426,8 +615,9 @@ class TestETLTransformer:
 class TestTransformationPipeline:
     """Test transformation pipeline orchestrator."""
 
-    def setup_method(self):
-        self.pipeline = TransformationPipeline()
+    @pytest.fixture(autouse=True)
+    def _pipeline(self, tmp_path):
+        self.pipeline = TransformationPipeline(PipelineConfig(output_dir=tmp_path))
 
     def test_pipeline_initialization(self):
         """Test pipeline initialization."""
@@ -436,14 +626,18 @@ class TestTransformationPipeline:
         assert self.pipeline.current_progress == 0.0
 
     @pytest.mark.asyncio
-    async def test_pipeline_config_validation(self):
+    async def test_pipeline_config_validation(self, tmp_path):
         """Test pipeline configuration validation."""
         # Valid config should pass
-        config = PipelineConfig(max_concurrent_sources=2, batch_size=100)
+        config = PipelineConfig(
+            max_concurrent_sources=2,
+            batch_size=100,
+            output_dir=tmp_path,
+        )
         pipeline = TransformationPipeline(config)
 
         # Test with invalid config
-        config = PipelineConfig(max_concurrent_sources=0)
+        config = PipelineConfig(max_concurrent_sources=0, output_dir=tmp_path)
         pipeline = TransformationPipeline(config)
 
         errors = await pipeline.validate_pipeline_config()
@@ -465,11 +659,13 @@ class TestTransformationPipeline:
 class TestTransformationIntegration:
     """Integration tests for transformation pipeline."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _pipeline(self, tmp_path):
         self.pipeline = TransformationPipeline(
             PipelineConfig(
                 mode=PipelineMode.SEQUENTIAL,
                 enable_validation=False,  # Skip for faster testing
+                output_dir=tmp_path,
             ),
         )
 